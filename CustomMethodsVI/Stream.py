@@ -1,14 +1,35 @@
 from __future__ import annotations
 
+import array
+import asyncio
+import bz2
 import collections.abc
+import concurrent.futures
+import contextlib
 import dill
+import functools
+import heapq
 import io
+import itertools
+import json
+import lzma
 import math
+import mmap
 import multiprocessing
+import multiprocessing.context
+import multiprocessing.shared_memory
+import numpy
+import operator
+import os
 import pickle
+import queue
 import sys
+import tempfile
 import threading
+import time
+import traceback
 import typing
+import weakref
 import zlib
 
 from . import Exceptions
@@ -27,2462 +48,8096 @@ class StreamEmptyError(StreamError):
 	pass
 
 
-class Stream[T](io.BufferedIOBase):
+class ByteRingBuffer(typing.Sized):
 	"""
-	Base class for CustomMethodsVI Streams
+	Growable contiguous byte ring buffer used as backing storage for byte streams
 	"""
 
-	def __init__(self):
+	def __init__(self, capacity: int = 64):
 		"""
-		Base class for CustomMethodsVI Streams
+		Growable contiguous byte ring buffer used as backing storage for byte streams
 		- Constructor -
+		:param capacity: The initial capacity in bytes
+		:raises InvalidArgumentException: If 'capacity' is not an integer
+		:raises ValueError: If 'capacity' is smaller than 1
 		"""
 
-		self.__state__: bool = True
-		self.__pipes__: dict[io.BufferedIOBase, bool] = {}
-		self.__buffer_writer__: list[typing.Callable] = []
-		self.__buffer_reader__: list[typing.Callable] = []
+		Misc.raise_ifn(isinstance(capacity, int), Exceptions.InvalidArgumentException(ByteRingBuffer.__init__, 'capacity', type(capacity), (int,)))
+		Misc.raise_ifn((capacity := int(capacity)) >= 1, ValueError('Capacity cannot be smaller than 1'))
+		self.__buffer__: bytearray = bytearray(capacity)
+		self.__head__: int = 0
+		self.__size__: int = 0
 
 	def __len__(self) -> int:
 		"""
-		:return: The number of items remaining in this stream
+		:return: The number of bytes stored in this buffer
 		"""
 
-		return 0
-
-	def __enter__(self) -> Stream:
-		return self
-
-	def __exit__(self, exc_type, exc_val: typing.Any, exc_tb) -> None:
-		if self.__state__:
-			self.close()
-
-	def __del__(self) -> None:
-		if self.__state__:
-			self.close()
-
-	def __eq__(self, other) -> bool:
-		return type(other) is type(self) and id(other) == id(self)
-
-	def __hash__(self) -> int:
-		return id(self)
+		return self.__size__
 
-	def __iter__(self) -> Stream[T]:
-		return self
+	def __bytes__(self) -> bytes:
+		return self.peek_front(self.__size__)
 
-	def __next__(self) -> T:
+	def __reserve__(self, count: int) -> None:
 		"""
-		Alias for 'Stream::read(1)'
-		:return: The read item
-		:raises StopIteration: If the stream is not seekable or the stream is exhausted
-		:raises StreamError: If stream is closed or not readable
+		INTERNAL METHOD
+		Grows the underlying bytearray so that 'count' more bytes can be stored
+		A new bytearray is always allocated so outstanding memoryviews of the old buffer remain valid
+		:param count: The number of bytes to reserve
 		"""
 
-		if not self.__state__:
-			raise StreamError('Stream is closed')
-		elif not self.readable():
-			raise StreamError('Stream is not readable')
-
-		if not self.seekable():
-			raise StopIteration
-
-		pos: int = self.tell()
-		self.seek(0, 2)
-		end: int = self.tell()
-		self.seek(pos, 0)
+		capacity: int = len(self.__buffer__)
 
-		if pos >= end:
-			raise StopIteration
+		if self.__size__ + count <= capacity:
+			return
 
-		return self.read(1)
+		new_capacity: int = max(capacity * 2, self.__size__ + count)
+		buffer: bytearray = bytearray(new_capacity)
+		buffer[:self.__size__] = self.__slice__(self.__head__, self.__size__)
+		self.__buffer__ = buffer
+		self.__head__ = 0
 
-	def __reader_stack__(self, __data: tuple[T, ...]) -> T | typing.Iterable[T]:
+	def __slice__(self, start: int, count: int) -> bytes:
 		"""
 		INTERNAL METHOD
-		Executes the reader callback stack on read data
-		:param __data: The input data to transform
-		:return: The resulting data
+		Copies 'count' bytes starting at the absolute buffer position 'start', wrapping if needed
+		:param start: The absolute start position within the underlying bytearray
+		:param count: The number of bytes to copy
+		:return: The copied bytes
 		"""
 
-		items: list = [__data]
-
-		for callback in self.__buffer_reader__:
-			if callable(callback):
-				results: list = []
+		capacity: int = len(self.__buffer__)
+		start %= capacity
+		end: int = start + count
 
-				for data in items:
-					results.extend(callback(data))
+		view: memoryview = memoryview(self.__buffer__)
 
-				items = results
+		if end <= capacity:
+			return bytes(view[start:end])
 
-		return items
+		return b''.join((view[start:], view[:end - capacity]))
 
-	def __writer_stack__(self, __object: typing.Any) -> list[T]:
+	def __linearize__(self) -> None:
 		"""
 		INTERNAL METHOD
-		Executes the writer callback stack on written data
-		:param __object: The input object to transform
-		:return: The resulting object
+		Moves stored data so that it begins at the start of the underlying bytearray
 		"""
 
-		items: list = [__object]
-
-		for callback in self.__buffer_writer__:
-			if callable(callback):
-				results: list = []
-
-				for obj in items:
-					results.extend(callback(obj))
-
-				items = results
+		if self.__head__ + self.__size__ <= len(self.__buffer__):
+			return
 
-		return items
+		self.__buffer__[:self.__size__] = self.__slice__(self.__head__, self.__size__)
+		self.__head__ = 0
 
-	def __auto_flush__(self, ignore_invalid: bool = False) -> None:
+	def append(self, data: bytes | bytearray | memoryview) -> None:
 		"""
-		INTERNAL METHOD
-		Flushes internal buffer to all connected auto-pipes
-		:param ignore_invalid: Whether to ignore closed or non-writable streams
-		:raises BrokenPipeError: If the targeted pipe is closed
+		Appends bytes to the tail of this buffer
+		:param data: The bytes-like object to append
 		"""
 
-		targets: tuple[io.BufferedIOBase, ...] = tuple(pipe for pipe, auto in self.__pipes__.items() if auto)
+		view: memoryview = memoryview(data).cast('B')
+		count: int = len(view)
 
-		if len(targets) == 0:
+		if count == 0:
 			return
 
-		for data in self.read(...):
-			for pipe in targets:
-				if pipe.closed and not ignore_invalid:
-					raise BrokenPipeError(f'Pipe \'{pipe}\' is closed')
-				elif not pipe.writable() and not ignore_invalid:
-					raise BrokenPipeError(f'Pipe \'{pipe}\' is not writable')
-				elif not pipe.closed and pipe.writable():
-					pipe.write(data)
+		self.__reserve__(count)
+		capacity: int = len(self.__buffer__)
+		tail: int = (self.__head__ + self.__size__) % capacity
+		first: int = min(count, capacity - tail)
+		self.__buffer__[tail:tail + first] = view[:first]
 
-	def close(self) -> None:
+		if first < count:
+			self.__buffer__[:count - first] = view[first:]
+
+		self.__size__ += count
+
+	def peek_front(self, count: int) -> bytes:
 		"""
-		Closes the stream
-		:raises StreamError: If the stream is already closed
+		:param count: The maximum number of bytes to copy
+		:return: Up to 'count' bytes from the head of this buffer
 		"""
 
-		if not self.__state__:
-			raise StreamError('Stream is closed')
-
-		self.__state__ = False
+		return self.__slice__(self.__head__, max(0, min(count, self.__size__)))
 
-	def readable(self) -> bool:
+	def peek_back(self, count: int) -> bytes:
 		"""
-		:return: Whether this stream can be read from
+		:param count: The maximum number of bytes to copy
+		:return: Up to 'count' bytes from the tail of this buffer, in storage order
 		"""
 
-		return self.__state__
+		count = max(0, min(count, self.__size__))
+		return self.__slice__(self.__head__ + self.__size__ - count, count)
 
-	def writable(self) -> bool:
+	def pop_front(self, count: int) -> bytes:
 		"""
-		:return: Whether this stream can be written to
+		Removes and returns bytes from the head of this buffer
+		:param count: The maximum number of bytes to remove
+		:return: The removed bytes
 		"""
 
-		return self.__state__
+		data: bytes = self.peek_front(count)
+		self.__head__ = (self.__head__ + len(data)) % len(self.__buffer__)
+		self.__size__ -= len(data)
 
-	def seekable(self) -> bool:
+		if self.__size__ == 0:
+			self.__head__ = 0
+
+		return data
+
+	def pop_back(self, count: int) -> bytes:
 		"""
-		:return: Whether this stream can seek cursor position
+		Removes and returns bytes from the tail of this buffer
+		:param count: The maximum number of bytes to remove
+		:return: The removed bytes, in storage order
 		"""
 
-		return False
+		data: bytes = self.peek_back(count)
+		self.__size__ -= len(data)
 
-	def pipe(self, *pipes: io.IOBase) -> Stream:
+		if self.__size__ == 0:
+			self.__head__ = 0
+
+		return data
+
+	def discard(self, count: int) -> int:
 		"""
-		Creates a link between this pipe (src) and the specified pipes (*dst)
-		Use 'Stream::flush' to move data from this stream to all linked pipes
-		:param pipes: The pipes to link with
-		:return: This instance
-		:raises StreamError: If this stream is closed
-		:raises TypeError: If one of the specified pipes is not an 'io.BufferedIOBase' instance
+		Removes bytes from the head of this buffer without copying them
+		:param count: The maximum number of bytes to remove
+		:return: The number of bytes removed
 		"""
 
-		if not self.__state__:
-			raise StreamError('Stream is closed')
-		elif not all(isinstance(x, io.IOBase) for x in pipes):
-			raise TypeError('Specified stream is not an \'io.BufferedIOBase\'')
+		count = max(0, min(count, self.__size__))
+		self.__head__ = (self.__head__ + count) % len(self.__buffer__)
+		self.__size__ -= count
 
-		self.__pipes__.update({pipe: False for pipe in pipes})
-		return self
+		if self.__size__ == 0:
+			self.__head__ = 0
+
+		return count
 
-	def autopipe(self, *pipes: io.BufferedIOBase, ignore_invalid: bool = False):
+	def find(self, sub: bytes, start: int = 0) -> int:
 		"""
-		Creates a link between this pipe (src) and the specified pipes (*dst)
-		Data from this stream is automatically flushed to all linked auto pipes
-		:param pipes: The pipes to link with
-		:param ignore_invalid: Whether to ignore closed or non-writable streams
-		:return: This instance
-		:raises StreamError: If this stream is closed
-		:raises TypeError: If one of the specified pipes is not an 'io.BufferedIOBase' instance
+		Searches for a byte sequence within this buffer
+		:param sub: The bytes to search for
+		:param start: The position relative to the head at which to begin searching
+		:return: The position relative to the head of the first match or -1 if not found
 		"""
 
-		if not self.__state__:
-			raise StreamError('Stream is closed')
-		elif not all(isinstance(x, io.BufferedIOBase) for x in pipes):
-			raise TypeError('Specified stream is not an \'io.BufferedIOBase\'')
-
-		self.__pipes__.update({pipe: True for pipe in pipes})
-		self.__auto_flush__(ignore_invalid)
-		return self
+		self.__linearize__()
+		index: int = self.__buffer__.find(sub, self.__head__ + max(0, start), self.__head__ + self.__size__)
+		return -1 if index < 0 else index - self.__head__
 
-	def del_pipe(self, *pipes: io.BufferedIOBase) -> Stream:
+	def readinto(self, target: bytearray | memoryview) -> int:
 		"""
-		Destroys a link between this pipe and the specified pipes
-		:param pipes: The pipes to remove
-		:return: This instance
-		:raises StreamError: If this stream is closed
-		:raises TypeError: If one of the specified pipes is not an 'io.BufferedIOBase' instance
+		Removes bytes from the head of this buffer, copying them directly into the target
+		:param target: The writable bytes-like object to fill
+		:return: The number of bytes copied
 		"""
 
-		if not self.__state__:
-			raise StreamError('Stream is closed')
-		elif not all(isinstance(x, io.BufferedIOBase) for x in pipes):
-			raise TypeError('Specified stream is not an \'io.BufferedIOBase\'')
+		target = memoryview(target).cast('B')
+		count: int = min(len(target), self.__size__)
+		capacity: int = len(self.__buffer__)
+		first: int = min(count, capacity - self.__head__)
+		target[:first] = memoryview(self.__buffer__)[self.__head__:self.__head__ + first]
 
-		for pipe in pipes:
-			if pipe in self.__pipes__:
-				del self.__pipes__[pipe]
+		if first < count:
+			target[first:count] = memoryview(self.__buffer__)[:count - first]
 
-		return self
+		self.__head__ = (self.__head__ + count) % capacity
+		self.__size__ -= count
 
-	def flush(self, ignore_invalid: bool = False) -> Stream:
+		if self.__size__ == 0:
+			self.__head__ = 0
+
+		return count
+
+	def view(self, count: int) -> memoryview:
 		"""
-		Flushes the internal buffer, clearing all contents
-		If connected to another stream via 'Stream::pipe', contents are read from this stream, duplicated, and written to each connected stream
-		:param ignore_invalid: Whether to ignore closed or non-writable streams
-		:return: This instance
-		:raises StreamError: If this stream is closed
-		:raises BrokenPipeError: If 'ignore_invalid' is false and at least one pipe is non-writable or closed
+		Returns a zero-copy view of up to 'count' bytes from the head of this buffer
+		The view is only guaranteed to reflect the stored data until the next write
+		:param count: The maximum number of bytes to view
+		:return: A read-only memoryview of the stored bytes
 		"""
 
-		if not self.__state__:
-			raise StreamError('Stream is closed')
+		count = max(0, min(count, self.__size__))
+		self.__linearize__()
+		return memoryview(self.__buffer__)[self.__head__:self.__head__ + count].toreadonly()
 
-		if self.readable() and len(self) > 0:
-			for data in self.read(...):
-				for pipe in self.__pipes__:
-					if pipe.closed and not ignore_invalid:
-						raise BrokenPipeError(f'Pipe \'{pipe}\' is closed')
-					elif not pipe.writable() and not ignore_invalid:
-						raise BrokenPipeError(f'Pipe \'{pipe}\' is not writable')
-					elif not pipe.closed and pipe.writable():
-						pipe.write(data)
+	def clear(self) -> None:
+		"""
+		Removes all bytes from this buffer
+		"""
 
-		return self
+		self.__head__ = 0
+		self.__size__ = 0
 
 	@property
-	def closed(self) -> bool:
+	def capacity(self) -> int:
 		"""
-		:return: Whether this stream is closed
+		:return: The number of bytes this buffer can hold before growing
 		"""
 
-		return not self.__state__
+		return len(self.__buffer__)
 
 
-class FileStream(Stream[str | bytes]):
+class BitBuffer(typing.Sized):
 	"""
-	Stream for file IO
+	Growable bit buffer storing bits packed MSB-first within a bytearray
 	"""
 
-	def __init__(self, path: str, mode: str, encoding: str = 'utf-8'):
+	def __init__(self):
 		"""
-		Stream for file IO
+		Growable bit buffer storing bits packed MSB-first within a bytearray
 		- Constructor -
-		:param path: The filepath
-		:param mode: The stream IO mode
-		:param encoding: For non-binary streams, the encoding to use
-		:raises InvalidArgumentException: If 'path' is not a string
-		:raises InvalidArgumentException: If 'mode' is not a string
-		:raises InvalidArgumentException: If 'encoding' is not a string
 		"""
 
-		super().__init__()
-		Misc.raise_ifn(isinstance(path, str), Exceptions.InvalidArgumentException(FileStream.__init__, 'path', type(path), (str,)))
-		Misc.raise_ifn(isinstance(mode, str), Exceptions.InvalidArgumentException(FileStream.__init__, 'mode', type(mode), (str,)))
-		Misc.raise_ifn(isinstance(encoding, str), Exceptions.InvalidArgumentException(FileStream.__init__, 'encoding', type(encoding), (str,)))
-		self.__stream__ = open(str(path), mode, encoding=None if 'b' in mode else encoding)
-		self.__filepath__: str = str(path)
+		self.__buffer__: bytearray = bytearray()
+		self.__head__: int = 0
+		self.__size__: int = 0
 
 	def __len__(self) -> int:
 		"""
-		No read operation is performed
-		:return: The number of remaining characters to read
+		:return: The number of bits stored in this buffer
 		"""
 
-		cursor = self.tell()
-		self.seek(0, 2)
-		size = self.tell()
-		self.seek(cursor, 0)
-		return size - cursor
-
-	def close(self) -> None:
-		super().close()
-		self.__stream__.close()
+		return self.__size__
 
-	def readable(self) -> bool:
-		return self.__state__ and self.__stream__.readable()
+	def __extract__(self, start: int, count: int) -> int:
+		"""
+		INTERNAL METHOD
+		Extracts 'count' bits starting at bit position 'start' relative to the first stored byte
+		:param start: The starting bit position
+		:param count: The number of bits to extract
+		:return: The extracted bits as an unsigned integer, first bit most significant
+		"""
 
-	def writable(self) -> bool:
-		return self.__state__ and self.__stream__.writable()
+		if count == 0:
+			return 0
 
-	def seekable(self) -> bool:
-		return self.__state__ and self.__stream__.seekable()
+		first: int = start // 8
+		last: int = (start + count + 7) // 8
+		value: int = int.from_bytes(memoryview(self.__buffer__)[first:last], 'big')
+		return (value >> ((last - first) * 8 - (start - first * 8) - count)) & ((1 << count) - 1)
 
-	def seek(self, __offset: int, __whence: int = ...) -> int:
+	def __compact__(self) -> None:
 		"""
-		Moves the stream cursor
-		:param __offset: The amount to move the cursor
-		:param __whence: 0 - Seek relative to beginning of file<br/>1 - Seek relative to current position<br/>2 - Seek relative to end of file
-		:return: The new cursor position relative to file beginning
-		:raises StreamError: If stream is closed or not seekable
+		INTERNAL METHOD
+		Drops fully consumed leading bytes and trailing bytes beyond the last stored bit
 		"""
 
-		if not self.__state__:
-			raise StreamError('Stream is closed')
-		elif not self.seekable():
-			raise StreamError('Stream is not seekable')
+		if self.__size__ == 0:
+			self.__buffer__.clear()
+			self.__head__ = 0
+			return
 
-		return self.__stream__.seek(__offset, __whence)
+		del self.__buffer__[(self.__head__ + self.__size__ + 7) // 8:]
 
-	def tell(self) -> int:
+		if self.__head__ >= 8:
+			del self.__buffer__[:self.__head__ // 8]
+			self.__head__ %= 8
+
+	def append(self, value: int, count: int) -> None:
 		"""
-		:return: The current stream cursor relative to beginning of file
-		:raises StreamError: If stream is closed
+		Appends bits to the tail of this buffer
+		:param value: The bits to append as an unsigned integer, first bit most significant
+		:param count: The number of bits to append
 		"""
 
-		if not self.__state__:
-			raise StreamError('Stream is closed')
+		if count <= 0:
+			return
 
-		return self.__stream__.tell()
+		value &= (1 << count) - 1
+		tail: int = self.__head__ + self.__size__
+		used: int = tail % 8
 
-	def cursor(self, offset: typing.Optional[int] = ..., whence: typing.Optional[int] = ...) -> int:
+		if used != 0:
+			value |= (self.__buffer__[-1] >> (8 - used)) << count
+			count += used
+			del self.__buffer__[-1]
+
+		padding: int = -count % 8
+		self.__buffer__.extend((value << padding).to_bytes((count + padding) // 8, 'big'))
+		self.__size__ = tail + count - used - self.__head__
+
+	def append_bytes(self, data: bytes | bytearray | memoryview) -> None:
 		"""
-		Sets or gets the current stream cursor position
-		:param offset: If supplied, seeks to the specified position
-		:param whence: If supplied, sets the offset for 'seek'; cannot be supplied without 'offset'
-		:return: The current position if neither 'offset' nor 'whence' is supplied, otherwise the new absolute cursor position
-		:raises StreamError: If this stream is closed or not seekable
-		:raises TypeError: If 'whence' is supplied without 'offset'
+		Appends all bits of a bytes-like object to the tail of this buffer
+		:param data: The bytes to append
 		"""
 
-		if not self.__state__:
-			raise StreamError('Stream is closed')
+		data = memoryview(data).cast('B')
 
-		if offset is ... and whence is ...:
-			return self.__stream__.tell()
-		elif offset is ... and whence is not ...:
-			raise TypeError('Expected \'offset\' alongside \'whence\'')
-		elif not self.seekable():
-			raise StreamError('Stream is not seekable')
+		if (self.__head__ + self.__size__) % 8 == 0:
+			self.__buffer__.extend(data)
+			self.__size__ += len(data) * 8
 		else:
-			return self.__stream__.seek(offset, whence)
+			self.append(int.from_bytes(data, 'big'), len(data) * 8)
 
-	def truncate(self, __size: typing.Optional[int] = ...) -> int:
+	def peek_front(self, count: int) -> tuple[int, int]:
 		"""
-		Truncates the file to either the current cursor position if '__size' is not specified otherwise to '__size' bytes
-		:param __size: The new size of the file in bytes
-		:return: The new file size in bytes
-		:raises StreamError: If this stream is closed
+		:param count: The maximum number of bits to copy
+		:return: A tuple containing up to 'count' bits from the head of this buffer as an unsigned integer and the number of bits
 		"""
 
-		if not self.__state__:
-			raise StreamError('Stream is closed')
-
-		return self.__stream__.truncate(None if __size is None or __size is ... else int(__size))
+		count = max(0, min(count, self.__size__))
+		return self.__extract__(self.__head__, count), count
 
-	def size(self) -> int:
+	def peek_back(self, count: int) -> tuple[int, int]:
 		"""
-		No read operation is performed
-		:return: The total size of the file contents in bytes
-		:raises StreamError: If this stream is closed
+		:param count: The maximum number of bits to copy
+		:return: A tuple containing up to 'count' bits from the tail of this buffer (in storage order) as an unsigned integer and the number of bits
 		"""
 
-		if not self.__state__:
-			raise StreamError('Stream is closed')
-
-		cursor = self.tell()
-		self.seek(0, 2)
-		size = self.tell()
-		self.seek(cursor, 0)
-		return size
+		count = max(0, min(count, self.__size__))
+		return self.__extract__(self.__head__ + self.__size__ - count, count), count
 
-	def read(self, __size: typing.Optional[int] = ...) -> bytes | str:
+	def pop_front(self, count: int) -> tuple[int, int]:
 		"""
-		Reads '__size' characters from the file
-		:param __size: The number of characters to read or all if not supplied
-		:return: The read data
-		:raises StreamError: If this stream is closed or not readable
+		Removes and returns bits from the head of this buffer
+		:param count: The maximum number of bits to remove
+		:return: A tuple containing the removed bits as an unsigned integer and the number of bits
 		"""
 
-		if not self.__state__:
-			raise StreamError('Stream is closed')
-		elif not self.readable():
-			raise StreamError('Stream is not readable')
-
-		return self.__stream__.read(None if __size is None or __size is ... else int(__size))
+		value, count = self.peek_front(count)
+		self.__head__ += count
+		self.__size__ -= count
+		self.__compact__()
+		return value, count
 
-	def peek(self, __size: typing.Optional[int] = ...) -> bytes | str:
+	def pop_back(self, count: int) -> tuple[int, int]:
 		"""
-		Reads '__size' characters from the file without moving the cursor
-		:param __size: The number of characters to read or all if not supplied
-		:return: The read data
-		:raises StreamError: If this stream is closed or not readable
+		Removes and returns bits from the tail of this buffer
+		:param count: The maximum number of bits to remove
+		:return: A tuple containing the removed bits (in storage order) as an unsigned integer and the number of bits
 		"""
 
-		if not self.__state__:
-			raise StreamError('Stream is closed')
-		elif not self.readable():
-			raise StreamError('Stream is not readable')
-
-		cursor: int = self.tell()
-		data: bytes | str = self.__stream__.read(None if __size is None or __size is ... else int(__size))
-		self.seek(cursor, 0)
-		return data
+		value, count = self.peek_back(count)
+		self.__size__ -= count
+		self.__compact__()
+		return value, count
 
-	def readline(self, __size: typing.Optional[int] = ...) -> bytes | str:
+	def clear(self) -> None:
 		"""
-		Reads one line from the file reading at most '__size' bytes if supplied
-		:param __size: The number of characters to read or all until line delimiter if not supplied
-		:return: The read data
-		:raises StreamError: If this stream is closed or not readable
+		Removes all bits from this buffer
 		"""
 
-		if not self.__state__:
-			raise StreamError('Stream is closed')
-		elif not self.readable():
-			raise StreamError('Stream is not readable')
-
-		return self.__stream__.readline(None if __size is None or __size is ... else int(__size))
-
-	def peekline(self, __size: typing.Optional[int] = ...) -> bytes | str:
-		"""
-		Reads one line from the file without moving the cursor, reading at most '__size' bytes if supplied
-		:param __size: The number of characters to read or all until line delimiter if not supplied
-		:return: The read data
-		:raises StreamError: If this stream is closed or not readable
-		"""
+		self.__buffer__.clear()
+		self.__head__ = 0
+		self.__size__ = 0
 
-		if not self.__state__:
-			raise StreamError('Stream is closed')
-		elif not self.readable():
-			raise StreamError('Stream is not readable')
 
-		cursor: int = self.tell()
-		data: bytes | str = self.__stream__.readline(None if __size is None or __size is ... else int(__size))
-		self.seek(cursor, 0)
-		return data
+class StringBuffer(typing.Sized):
+	"""
+	Rope of string chunks with a read offset into the first chunk
+	Appended strings are stored as-is and only the characters actually read are copied
+	"""
 
-	def readlines(self, __hint: int = ...) -> list[bytes | str]:
+	def __init__(self):
 		"""
-		Reads multiple line from the file stopping if '__hint' is supplied and the size of all read lines exceeds this amount
-		:param __hint: A hint indicating the number of characters to read
-		:return: The read data
-		:raises StreamError: If this stream is closed or not readable
+		Rope of string chunks with a read offset into the first chunk
+		- Constructor -
 		"""
 
-		if not self.__state__:
-			raise StreamError('Stream is closed')
-		elif not self.readable():
-			raise StreamError('Stream is not readable')
-
-		return self.__stream__.readlines(None if __hint is None or __hint is ... else int(__hint))
+		self.__chunks__: collections.deque[str] = collections.deque()
+		self.__head__: int = 0
+		self.__size__: int = 0
 
-	def write(self, __buffer: str | bytes) -> FileStream:
+	def __len__(self) -> int:
 		"""
-		Writes data to the file
-		:param __buffer: The data to write
-		:return: This instance
-		:raises StreamError: If this stream is closed or not writable
+		:return: The number of characters stored
 		"""
 
-		if not self.__state__:
-			raise StreamError('Stream is closed')
-		elif not self.writable():
-			raise StreamError('Stream is not writable')
-
-		self.__stream__.write(__buffer)
-		return self
+		return self.__size__
 
-	def writelines(self, __lines: typing.Iterable[str | bytes]) -> FileStream:
+	def __str__(self) -> str:
 		"""
-		Writes multiple lines to the file
-		:param __lines: The data to write
-		:return: This instance
-		:raises StreamError: If this stream is closed or not writable
+		:return: A copy of all stored characters
 		"""
 
-		if not self.__state__:
-			raise StreamError('Stream is closed')
-		elif not self.writable():
-			raise StreamError('Stream is not writable')
-
-		self.__stream__.writelines(__lines)
-		return self
+		return self.peek_front(self.__size__)
 
-	def reopen(self, mode: str, encoding: str = 'utf8') -> FileStream:
-		"""
-		Closes and reopens the underlying file stream
-		:param mode: The new file mode
-		:param encoding: For non-binary modes, the new encoding
-		:return: This instance
-		:raises InvalidArgumentException: If 'mode' is not a string
-		:raises InvalidArgumentException: If 'encoding' is not a string
+	def __collect__(self, count: int, front: bool, remove: bool) -> str:
 		"""
+		INTERNAL METHOD
+		Copies characters from either end of this buffer
+		:param count: The maximum number of characters to copy
+		:param front: Whether to copy from the head rather than the tail
+		:param remove: Whether to remove the copied characters
+		:return: The characters in storage order
+		"""
+
+		count = max(0, min(count, self.__size__))
+		chunks: collections.deque[str] = self.__chunks__
+		pieces: list[str] = []
+		remaining: int = count
+		index: int = 0 if front else len(chunks) - 1
+
+		while remaining > 0:
+			chunk: str = chunks[index]
+			start: int = self.__head__ if index == 0 else 0
+			available: int = len(chunk) - start
+
+			if available <= remaining:
+				pieces.append(chunk[start:] if start > 0 else chunk)
+				remaining -= available
+				index += 1 if front else -1
+			elif front:
+				pieces.append(chunk[start:start + remaining])
+				remaining = 0
+			else:
+				pieces.append(chunk[len(chunk) - remaining:])
+				remaining = 0
 
-		Misc.raise_ifn(isinstance(mode, str), Exceptions.InvalidArgumentException(FileStream.reopen, 'mode', type(mode), (str,)))
-		Misc.raise_ifn(isinstance(encoding, str), Exceptions.InvalidArgumentException(FileStream.reopen, 'encoding', type(encoding), (str,)))
+		if remove and count > 0:
+			self.__size__ -= count
+			consumed: int = index if front else len(chunks) - 1 - index
+			partial: bool = len(pieces) > consumed
 
-		if self.__state__:
-			self.close()
+			if self.__size__ == 0:
+				chunks.clear()
+				self.__head__ = 0
+			elif front:
+				head: int = (self.__head__ if consumed == 0 else 0) + len(pieces[-1]) if partial else 0
 
-		self.__stream__ = open(self.__filepath__, mode, encoding=encoding)
-		self.__state__ = True
-		return self
+				for _ in range(consumed):
+					chunks.popleft()
 
-	def flush(self, ignore_invalid: bool = False) -> FileStream:
-		"""
-		Flushes the underlying stream; Writes queued data to connected pipes
-		:return: This instance
-		:raises StreamError: If this stream is closed
-		"""
+				self.__head__ = head
+			else:
+				for _ in range(consumed):
+					chunks.pop()
 
-		if not self.__state__:
-			raise StreamError('Stream is closed')
+				if partial:
+					chunks[-1] = chunks[-1][:len(chunks[-1]) - len(pieces[-1])]
 
-		self.__stream__.flush()
-		super().flush(ignore_invalid)
-		return self
+		if not front:
+			pieces.reverse()
 
-	@property
-	def filepath(self) -> str:
+		return pieces[0] if len(pieces) == 1 else ''.join(pieces)
+
+	def append(self, text: str) -> None:
 		"""
-		:return: The filepath this stream points to
+		Appends a string to the tail of this buffer without copying it
+		:param text: The string to append
 		"""
 
-		return self.__filepath__
-
-
-class ListStream[T](Stream[T], typing.Iterable[T]):
-	"""
-	Basic FIFO stream using a list for its internal buffer
-	"""
+		if len(text) > 0:
+			self.__chunks__.append(text)
+			self.__size__ += len(text)
 
-	def __init__(self, max_length: int = -1):
+	def peek_front(self, count: int) -> str:
 		"""
-		Basic FIFO stream using a list for its internal buffer
-		- Constructor -
-		:param max_length: The maximum length (in number of items) of this stream or -1 to disable
-		:raises InvalidArgumentException: If max length is not an integer
-		:raises ValueError: If max length negative and not -1
+		:param count: The maximum number of characters to copy
+		:return: Up to 'count' characters from the head of this buffer
 		"""
 
-		super().__init__()
-		Misc.raise_ifn(isinstance(max_length, int), Exceptions.InvalidArgumentException(ListStream.__init__, 'max_length', type(max_length), (int,)))
-		Misc.raise_ifn((max_length := int(max_length)) > 0 or max_length == -1, ValueError('Max length cannot be less than 0'))
-		self.__buffer__: list[typing.Any] = []
-		self.__max_len__: int = int(max_length)
+		return self.__collect__(count, True, False)
 
-	def __len__(self) -> int:
+	def peek_back(self, count: int) -> str:
 		"""
-		:return: The length of the internal buffer
+		:param count: The maximum number of characters to copy
+		:return: Up to 'count' characters from the tail of this buffer, in storage order
 		"""
 
-		return len(self.__buffer__)
-
-	def __iter__(self) -> typing.Iterator[T]:
-		while not self.empty():
-			yield self.read(1)
+		return self.__collect__(count, False, False)
 
-	def empty(self) -> bool:
+	def pop_front(self, count: int) -> str:
 		"""
-		:return: Whether the underlying buffer is empty
+		Removes and returns characters from the head of this buffer
+		:param count: The maximum number of characters to remove
+		:return: The removed characters
 		"""
 
-		return len(self.__buffer__) == 0
+		return self.__collect__(count, True, True)
 
-	def full(self) -> bool:
+	def pop_back(self, count: int) -> str:
 		"""
-		:return: Whether the underlying buffer is full
+		Removes and returns characters from the tail of this buffer
+		:param count: The maximum number of characters to remove
+		:return: The removed characters, in storage order
 		"""
 
-		return len(self.__buffer__) == self.__max_len__
+		return self.__collect__(count, False, True)
 
-	def readinto(self, __buffer: io.IOBase | typing.IO | bytearray | list[T] | set[T]) -> int:
+	def find(self, sub: str, start: int = 0) -> int:
 		"""
-		Reads all contents from this stream into the specified buffer
-		:param __buffer: The buffer to write to
-		:return: The number of elements written
-		:raises StreamError: If this stream is closed or not readable
+		Searches for a substring within this buffer, including matches spanning chunk boundaries
+		:param sub: The substring to search for
+		:param start: The position relative to the head at which to begin searching
+		:return: The position relative to the head of the first match or -1 if not found
 		"""
 
-		if not self.__state__:
-			raise StreamError('Stream is closed')
-		elif not self.readable():
-			raise StreamError('Stream is not readable')
-
-		count: int = 0
+		if len(sub) == 0:
+			return start if 0 <= start <= self.__size__ else -1
 
-		if isinstance(__buffer, io.IOBase) or hasattr(__buffer, 'write'):
+		overlap: int = len(sub) - 1
+		position: int = 0
+		carry: str = ''
 
-			try:
-				for data in self.read():
-					__buffer.write(data)
-			except StreamFullError:
-				pass
+		for index, chunk in enumerate(self.__chunks__):
+			offset: int = self.__head__ if index == 0 else 0
 
-		elif isinstance(__buffer, bytearray):
+			if len(carry) > 0:
+				found: int = (carry + chunk[offset:offset + overlap]).find(sub, max(0, start - position + len(carry)))
 
-			for data in self.read():
-				__buffer.append(data)
+				if found >= 0:
+					return position - len(carry) + found
 
-		elif isinstance(__buffer, list):
-			__buffer.extend(self.read())
+			found: int = chunk.find(sub, offset + max(0, start - position))
 
-		elif isinstance(__buffer, set):
-			__buffer.union(self.read())
+			if found >= 0:
+				return position + found - offset
 
-		else:
-			raise TypeError(f'Cannot \'readinto\' non-writable object \'{type(__buffer).__name__}\'')
+			position += len(chunk) - offset
+			carry = (carry + chunk[max(offset, len(chunk) - overlap):])[-overlap:] if overlap > 0 else ''
 
-		return count
+		return -1
 
-	def read(self, __size: typing.Optional[int] = ...) -> tuple[T, ...] | T:
+	def clear(self) -> None:
 		"""
-		Reads data from the internal queue
-		:param __size: If specified, reads this many items, otherwise reads all data
-		:return: A tuple of read elements if more than one otherwise the single element
-		:raises StreamError: If this stream is closed or not readable
-		:raises StreamEmptyError: If the stream is empty
+		Removes all characters from this buffer
 		"""
 
-		if not self.__state__:
-			raise StreamError('Stream is closed')
-		elif not self.readable():
-			raise StreamError('Stream is not readable')
+		self.__chunks__.clear()
+		self.__head__ = 0
+		self.__size__ = 0
 
-		count: int = len(self.__buffer__) if __size is ... or __size is None or int(__size) < 0 else int(__size)
-		temp: tuple[typing.Any, ...] = tuple(self.__buffer__[:count])
-		del self.__buffer__[:count]
-		result: tuple[typing.Any, ...] = tuple((y := self.__reader_stack__(x))[0 if len(y) == 1 else slice(None)] for x in temp)
 
-		if len(result) == 0:
-			raise StreamEmptyError('Stream is empty')
+class Stream[T](io.BufferedIOBase):
+	"""
+	Base class for CustomMethodsVI Streams
+	"""
 
-		return result[0] if __size == 1 else result
+	class PipeWorker:
+		"""
+		Worker thread delivering flushed batches to a single pipe so that a slow pipe does not stall the producing stream
+		"""
+
+		def __init__(self, pipe: io.IOBase, max_pending: int = -1):
+			"""
+			Worker thread delivering flushed batches to a single pipe so that a slow pipe does not stall the producing stream
+			- Constructor -
+			:param pipe: The pipe to write to
+			:param max_pending: The maximum number of queued batches before producers block or -1 for no limit
+			:raises InvalidArgumentException: If 'max_pending' is not an integer
+			:raises ValueError: If 'max_pending' is negative and not -1
+			"""
+
+			Misc.raise_ifn(isinstance(max_pending, int), Exceptions.InvalidArgumentException(Stream.PipeWorker.__init__, 'max_pending', type(max_pending), (int,)))
+			Misc.raise_ifn((max_pending := int(max_pending)) > 0 or max_pending == -1, ValueError('Max pending cannot be less than 0'))
+			self.__pipe__: io.IOBase = pipe
+			self.__queue__: queue.Queue[typing.Optional[tuple[typing.Any, bool]]] = queue.Queue(max(0, max_pending))
+			self.__error__: typing.Optional[BaseException] = None
+			self.__thread__: threading.Thread = threading.Thread(target=self.__run__, daemon=True)
+			self.__thread__.start()
+
+		def __run__(self) -> None:
+			"""
+			INTERNAL METHOD
+			Delivers queued batches until stopped, blocking while a bounded stream pipe is full
+			Batches queued after a failed delivery are discarded until the error is raised to the producer
+			"""
+
+			while (item := self.__queue__.get()) is not None:
+				try:
+					if self.__error__ is None:
+						Stream.__deliver__(self.__pipe__, *item, True)
+				except BaseException as err:
+					self.__error__ = err
+				finally:
+					self.__queue__.task_done()
+
+			self.__queue__.task_done()
+
+		def __raise__(self) -> None:
+			"""
+			INTERNAL METHOD
+			Raises the last delivery error if one occurred
+			"""
+
+			if self.__error__ is not None:
+				error: BaseException = self.__error__
+				self.__error__ = None
+				raise error
+
+		def put(self, data: typing.Any, ignore_invalid: bool = False) -> None:
+			"""
+			Queues a batch for delivery, blocking while the queue is full
+			:param data: The batch to deliver
+			:param ignore_invalid: Whether to ignore a closed or non-writable pipe
+			:raises BrokenPipeError: If a previous delivery failed because the pipe is closed or not writable
+			:raises StreamFullError: If a previous batch could never fit within a bounded stream pipe
+			"""
+
+			self.__raise__()
+			self.__queue__.put((data, ignore_invalid))
+
+		def join(self) -> None:
+			"""
+			Blocks until all queued batches are delivered
+			:raises BrokenPipeError: If a delivery failed because the pipe is closed or not writable
+			:raises StreamFullError: If a batch could never fit within a bounded stream pipe
+			"""
+
+			self.__queue__.join()
+			self.__raise__()
+
+		def stop(self, wait: bool = True) -> None:
+			"""
+			Delivers all queued batches then stops the worker thread
+			Never blocks during interpreter shutdown or when called from the worker thread itself
+			:param wait: Whether to block until all queued batches are delivered
+			"""
+
+			if not self.__thread__.is_alive():
+				return
+
+			wait = wait and not sys.is_finalizing() and threading.current_thread() is not self.__thread__
+
+			if wait:
+				self.__queue__.put(None)
+				self.__thread__.join()
+				return
 
-	def peek(self, __size: typing.Optional[int] = ...) -> tuple[T, ...] | T:
-		"""
-		Reads data from the internal queue without removing it
-		:param __size: f specified, reads this many items, otherwise reads all data
-		:return: A tuple of read elements if more than one otherwise the single element
-		:raises StreamError: If this stream is closed or not readable
-		"""
+			try:
+				self.__queue__.put_nowait(None)
+			except queue.Full:
+				pass
 
-		if not self.__state__:
-			raise StreamError('Stream is closed')
-		elif not self.readable():
-			raise StreamError('Stream is not readable')
+		@property
+		def pending(self) -> int:
+			"""
+			:return: The number of batches waiting for delivery
+			"""
+
+			return self.__queue__.qsize()
+
+	class Metrics:
+		"""
+		Opt-in throughput and occupancy counters for a single stream
+		Installed by 'Stream::enable_metrics'; streams without metrics pay no instrumentation cost
+		"""
+
+		INSTRUMENTED: tuple[str, ...] = ('read', 'readline', 'readinto', 'write', 'writelines')
+
+		def __init__(self, name: str):
+			"""
+			Opt-in throughput and occupancy counters for a single stream
+			- Constructor -
+			:param name: The name this stream is registered under
+			"""
+
+			self.__label__: str = str(name)
+			self.__lock__: threading.Lock = threading.Lock()
+			self.__local__: threading.local = threading.local()
+			self.__installed__: dict[str, typing.Callable] = {}
+			self.reset()
+
+		@staticmethod
+		def __measure__(data: typing.Any) -> int:
+			"""
+			INTERNAL METHOD
+			:param data: The data read or written
+			:return: The number of bytes (or characters for strings) within the data
+			"""
+
+			if isinstance(data, (bytes, bytearray, str)):
+				return len(data)
+			elif isinstance(data, memoryview):
+				return data.nbytes
+			elif isinstance(data, (tuple, list)):
+				return sum(len(x) if isinstance(x, (bytes, bytearray, str)) else x.nbytes if isinstance(x, memoryview) else 0 for x in data)
+			else:
+				return 0
+
+		def __wrap__(self, stream: Stream, name: str) -> typing.Callable:
+			"""
+			INTERNAL METHOD
+			Creates an instrumented version of a stream's read or write method
+			Nested calls in the same direction (such as 'write' delegating to 'writelines') are only counted once
+			The instrumented method holds only a weak reference to the stream and looks the original method up on its type so that installed metrics never keep the stream alive
+			:param stream: The stream being instrumented
+			:param name: The name of the method to instrument
+			:return: The instrumented method
+			"""
+
+			reference: weakref.ref[Stream] = weakref.ref(stream)
+			method: typing.Callable = getattr(type(stream), name)
+			local: threading.local = self.__local__
+			reading: bool = name.startswith('read')
+			flag: str = 'reading' if reading else 'writing'
+
+			def instrumented(*args, **kwargs) -> typing.Any:
+				stream: typing.Optional[Stream] = reference()
+
+				if stream is None:
+					raise StreamError('Stream is closed')
+				elif getattr(local, flag, False):
+					return method(stream, *args, **kwargs)
+
+				if name == 'writelines' and len(args) > 0:
+					args = (tuple(args[0]), *args[1:])
+
+				setattr(local, flag, True)
 
-		count: int = len(self.__buffer__) if __size is ... or __size is None or int(__size) < 0 else int(__size)
-		temp: tuple[typing.Any, ...] = tuple(self.__buffer__[:count])
-		result: tuple[typing.Any, ...] = tuple((y := self.__reader_stack__(x))[0 if len(y) == 1 else slice(None)] for x in temp)
-		return result[0] if __size == 1 else result
+				try:
+					result: typing.Any = method(stream, *args, **kwargs)
+				finally:
+					setattr(local, flag, False)
 
-	def write(self, __object: T, *, ignore_invalid=False) -> ListStream[T]:
-		"""
-		Writes an object to the internal queue
-		:param __object: The object to write
-		:param ignore_invalid: Whether to ignore closed or non-writable streams
-		:return: This instance
-		:raises StreamError: If this stream is closed or not writable
-		:raises StreamFullError: If this stream is full
-		"""
+				if reading:
+					self.__record_read__(result, name == 'readinto')
+				else:
+					self.__record_write__(args[0] if len(args) > 0 else None, name == 'writelines')
+
+				self.__occupancy__(stream)
+				return result
+
+			instrumented.__name__ = name
+			instrumented.__doc__ = method.__doc__
+			return instrumented
+
+		def __record_read__(self, result: typing.Any, into: bool) -> None:
+			"""
+			INTERNAL METHOD
+			Counts a completed read
+			:param result: The value returned by the read method
+			:param into: Whether the result is a byte count returned by 'readinto'
+			"""
+
+			with self.__lock__:
+				self.__read_calls__ += 1
+				self.__items_read__ += len(result) if isinstance(result, (tuple, list)) else 1
+				self.__bytes_read__ += result if into else Stream.Metrics.__measure__(result)
+
+		def __record_write__(self, data: typing.Any, lines: bool) -> None:
+			"""
+			INTERNAL METHOD
+			Counts a completed write
+			:param data: The object or objects written
+			:param lines: Whether 'data' is a tuple of objects written with 'writelines'
+			"""
+
+			with self.__lock__:
+				self.__write_calls__ += 1
+				self.__items_written__ += len(data) if lines else 1
+				self.__bytes_written__ += Stream.Metrics.__measure__(data) if lines else Stream.Metrics.__measure__((data,))
+
+		def __occupancy__(self, stream: Stream) -> None:
+			"""
+			INTERNAL METHOD
+			Updates the high-water mark and the time spent empty from the stream's current length
+			:param stream: The instrumented stream
+			"""
 
-		if not self.__state__:
-			raise StreamError('Stream is closed')
-		elif not self.writable():
-			raise StreamError('Stream is not writable')
+			try:
+				length: int = len(stream)
+			except (TypeError, ValueError, OSError):
+				return
+
+			with self.__lock__:
+				self.__high_water__ = max(self.__high_water__, length)
+
+				if length == 0 and self.__empty_since__ is None:
+					self.__empty_since__ = time.perf_counter()
+				elif length > 0 and self.__empty_since__ is not None:
+					self.__empty_time__ += time.perf_counter() - self.__empty_since__
+					self.__empty_since__ = None
+
+		def record_blocked(self, seconds: float) -> None:
+			"""
+			Adds time spent blocked waiting for data or space
+			:param seconds: The number of seconds blocked
+			"""
+
+			with self.__lock__:
+				self.__blocked_time__ += seconds
+
+		def record_fan_out(self, seconds: float) -> None:
+			"""
+			Adds the latency of a single pipe fan-out
+			:param seconds: The number of seconds taken to read and deliver the batch to all pipes
+			"""
+
+			with self.__lock__:
+				self.__fan_out_count__ += 1
+				self.__fan_out_time__ += seconds
+				self.__fan_out_max__ = max(self.__fan_out_max__, seconds)
+
+		def install(self, stream: Stream) -> None:
+			"""
+			Replaces the read and write methods of a stream instance with instrumented versions
+			:param stream: The stream to instrument
+			"""
+
+			for name in Stream.Metrics.INSTRUMENTED:
+				if name not in self.__installed__ and callable(getattr(type(stream), name, None)):
+					self.__installed__[name] = self.__wrap__(stream, name)
+					setattr(stream, name, self.__installed__[name])
+
+			self.__occupancy__(stream)
+
+		def uninstall(self, stream: Stream) -> None:
+			"""
+			Restores the original read and write methods of a stream instance
+			:param stream: The instrumented stream
+			"""
+
+			for name in self.__installed__:
+				stream.__dict__.pop(name, None)
+
+			self.__installed__.clear()
+
+			with self.__lock__:
+				if self.__empty_since__ is not None:
+					self.__empty_time__ += time.perf_counter() - self.__empty_since__
+					self.__empty_since__ = None
+
+		def reset(self) -> None:
+			"""
+			Resets all counters to zero
+			"""
+
+			with self.__lock__:
+				self.__items_written__: int = 0
+				self.__bytes_written__: int = 0
+				self.__write_calls__: int = 0
+				self.__items_read__: int = 0
+				self.__bytes_read__: int = 0
+				self.__read_calls__: int = 0
+				self.__high_water__: int = 0
+				self.__blocked_time__: float = 0
+				self.__empty_time__: float = 0
+				self.__empty_since__: typing.Optional[float] = None
+				self.__fan_out_count__: int = 0
+				self.__fan_out_time__: float = 0
+				self.__fan_out_max__: float = 0
+				self.__started__: float = time.perf_counter()
+
+		def snapshot(self) -> dict[str, typing.Any]:
+			"""
+			:return: A JSON-serializable copy of all counters
+			"""
+
+			with self.__lock__:
+				now: float = time.perf_counter()
+				return {
+					'name': self.__label__,
+					'items_written': self.__items_written__,
+					'bytes_written': self.__bytes_written__,
+					'write_calls': self.__write_calls__,
+					'items_read': self.__items_read__,
+					'bytes_read': self.__bytes_read__,
+					'read_calls': self.__read_calls__,
+					'high_water': self.__high_water__,
+					'blocked_time': self.__blocked_time__,
+					'empty_time': self.__empty_time__ + (0 if self.__empty_since__ is None else now - self.__empty_since__),
+					'fan_out_count': self.__fan_out_count__,
+					'fan_out_time': self.__fan_out_time__,
+					'fan_out_max': self.__fan_out_max__,
+					'fan_out_mean': self.__fan_out_time__ / self.__fan_out_count__ if self.__fan_out_count__ > 0 else 0,
+					'elapsed': now - self.__started__,
+				}
+
+		@property
+		def name(self) -> str:
+			"""
+			:return: The name this stream is registered under
+			"""
+
+			return self.__label__
+
+	class BatchCallback:
+		"""
+		Wrapper marking a reader or writer callback as batch-capable
+		Batch callbacks receive every item of a chunk as one list and return an iterable of results, instead of being called once per item
+		"""
+
+		def __init__(self, callback: typing.Callable[[list], typing.Iterable]):
+			"""
+			Wrapper marking a reader or writer callback as batch-capable
+			- Constructor -
+			:param callback: The callback accepting a list of items and returning an iterable of results
+			:raises InvalidArgumentException: If 'callback' is not callable
+			"""
+
+			Misc.raise_ifn(callable(callback), Exceptions.InvalidArgumentException(Stream.BatchCallback.__init__, 'callback', type(callback)))
+			self.__callback__: typing.Callable[[list], typing.Iterable] = callback
+
+		def __call__(self, items: list) -> typing.Iterable:
+			return self.__callback__(items)
+
+		@property
+		def callback(self) -> typing.Callable[[list], typing.Iterable]:
+			"""
+			:return: The wrapped callback
+			"""
+
+			return self.__callback__
+
+	class CallbackStack(list):
+		"""
+		List of reader or writer callbacks which compiles into a single pipeline
+		The compiled pipeline is cached until the list is modified
+		"""
+
+		def __init__(self, callbacks: typing.Iterable[typing.Callable] = ()):
+			"""
+			List of reader or writer callbacks which compiles into a single pipeline
+			- Constructor -
+			:param callbacks: The initial callbacks
+			"""
+
+			super().__init__(callbacks)
+			self.__compiled__: typing.Optional[typing.Callable[[typing.Iterable], list]] = None
+			self.__compiled_item__: typing.Optional[typing.Callable[[typing.Any], typing.Sequence]] = None
+			self.__batched__: bool = False
+
+		def __invalidate__(self) -> None:
+			"""
+			INTERNAL METHOD
+			Discards the compiled pipelines after the stack is modified
+			"""
+
+			self.__compiled__ = None
+			self.__compiled_item__ = None
+
+		def __setitem__(self, key, value) -> None:
+			self.__invalidate__()
+			super().__setitem__(key, value)
+
+		def __delitem__(self, key) -> None:
+			self.__invalidate__()
+			super().__delitem__(key)
+
+		def __iadd__(self, other: typing.Iterable[typing.Callable]) -> Stream.CallbackStack:
+			self.__invalidate__()
+			return super().__iadd__(other)
+
+		def __imul__(self, other: int) -> Stream.CallbackStack:
+			self.__invalidate__()
+			return super().__imul__(other)
+
+		def append(self, __object: typing.Callable) -> None:
+			self.__invalidate__()
+			super().append(__object)
+
+		def extend(self, __iterable: typing.Iterable[typing.Callable]) -> None:
+			self.__invalidate__()
+			super().extend(__iterable)
+
+		def insert(self, __index: int, __object: typing.Callable) -> None:
+			self.__invalidate__()
+			super().insert(__index, __object)
+
+		def remove(self, __value: typing.Callable) -> None:
+			self.__invalidate__()
+			super().remove(__value)
 
-		if self.__max_len__ < 0 or len(self.__buffer__) < self.__max_len__:
-			self.__buffer__.extend(self.__writer_stack__(__object))
-			self.__auto_flush__(ignore_invalid)
-			return self
+		def pop(self, __index: int = -1) -> typing.Callable:
+			self.__invalidate__()
+			return super().pop(__index)
 
-		raise StreamFullError('Stream is full')
+		def clear(self) -> None:
+			self.__invalidate__()
+			super().clear()
 
-	def writefrom(self, __buffer: typing.Iterable[T] | typing.IO | io.BufferedIOBase, __size: typing.Optional[int] = ..., *, ignore_invalid=False) -> ListStream[T]:
-		"""
-		Reads all contents from the specified buffer into this stream
-		:param __buffer: The buffer to read from
-		:param __size: The number of elements to write
-		:param ignore_invalid: Whether to ignore closed or non-writable streams
-		:return: This instance
-		:raises StreamError: If this stream is closed or not writable or '__buffer' is closed or not readable
-		:raises StreamFullError: If this stream becomes full
-		:raises TypeError: If '__buffer' is not a supported stream nor an iterable
-		"""
+		def reverse(self) -> None:
+			self.__invalidate__()
+			super().reverse()
 
-		if not self.__state__:
-			raise StreamError('Stream is closed')
-		elif not self.writable():
-			raise StreamError('Stream is not writable')
+		def sort(self, *args, **kwargs) -> None:
+			self.__invalidate__()
+			super().sort(*args, **kwargs)
 
-		if isinstance(__buffer, (typing.IO, io.BufferedIOBase, io.IOBase)):
-			if __buffer.closed:
-				raise StreamError('Source buffer is closed')
-			elif not __buffer.readable():
-				raise StreamError('Source buffer is not readable')
+		def compile(self) -> typing.Callable[[typing.Iterable], list]:
+			"""
+			Composes all callable entries into one function mapping an iterable of inputs to the list of all outputs
+			Per-item stages are chained lazily so no intermediate lists are built between them
+			:return: The cached pipeline
+			"""
+
+			if self.__compiled__ is not None:
+				return self.__compiled__
 
-			try:
-				count: int = 0
+			plan: tuple[tuple[typing.Callable, bool], ...] = tuple((callback, isinstance(callback, Stream.BatchCallback)) for callback in self if callable(callback))
+			self.__batched__ = any(batch for _, batch in plan)
 
-				while self.__max_len__ < 0 or len(self.__buffer__) < self.__max_len__:
-					count += 1
-					self.write(__buffer.read(1))
-					self.__auto_flush__(ignore_invalid)
+			if len(plan) == 0:
+				pipeline: typing.Callable[[typing.Iterable], list] = list
+			elif len(plan) == 1 and not plan[0][1]:
+				callback: typing.Callable = plan[0][0]
+				pipeline: typing.Callable[[typing.Iterable], list] = lambda items: list(itertools.chain.from_iterable(map(callback, items)))
+			else:
+				def pipeline(items: typing.Iterable) -> list:
+					for stage, batch in plan:
+						items = stage(items if type(items) is list else list(items)) if batch else itertools.chain.from_iterable(map(stage, items))
 
-					if __size is not ... and __size is not None and count >= __size:
-						break
-			except StopIteration:
-				pass
+					return items if type(items) is list else list(items)
 
-			return self
+			self.__compiled__ = pipeline
+			return pipeline
 
-		elif isinstance(__buffer, typing.Iterable):
-			iterator = iter(__buffer)
+		def compile_item(self) -> typing.Callable[[typing.Any], typing.Sequence]:
+			"""
+			Composes all callable entries into one function mapping a single input to the sequence of its outputs
+			Stages producing a single output pass it straight to the next stage without building a list
+			:return: The cached pipeline
+			"""
 
-			try:
-				while True:
-					if 0 <= self.__max_len__ <= len(self.__buffer__):
-						raise StreamFullError('Stream is full')
+			if self.__compiled_item__ is not None:
+				return self.__compiled_item__
 
-					self.write(next(iterator))
-					self.__auto_flush__(ignore_invalid)
-			except StopIteration:
-				pass
+			plan: tuple[tuple[typing.Callable, bool], ...] = tuple((callback, isinstance(callback, Stream.BatchCallback)) for callback in self if callable(callback))
 
-			return self
+			def pipeline(item: typing.Any) -> typing.Sequence:
+				items: typing.Sequence = (item,)
 
-		else:
-			raise TypeError('Source is neither a stream nor an iterable')
+				for stage, batch in plan:
+					if batch:
+						items = stage(list(items))
+					elif len(items) == 1:
+						items = stage(items[0])
+					else:
+						items = tuple(itertools.chain.from_iterable(map(stage, items)))
 
-	@property
-	def max_length(self) -> int:
-		"""
-		:return: This stream's max length or -1 if not bounded
-		"""
+					if not isinstance(items, (list, tuple)):
+						items = tuple(items)
 
-		return self.__max_len__
+				return items
 
+			self.__compiled_item__ = pipeline
+			return pipeline
 
-class OrderedStream[T](ListStream[T]):
-	"""
-	A stream allowing for LIFO capabilities
-	"""
+		@property
+		def batched(self) -> bool:
+			"""
+			:return: Whether any callback in this stack is batch-capable
+			"""
 
-	def __init__(self, max_length: int = -1, fifo: bool = True):
+			self.compile()
+			return self.__batched__
+
+	__metrics_registry__: dict[str, Stream.Metrics] = {}
+	__metrics_registry_lock__: threading.Lock = threading.Lock()
+
+	def __init__(self):
 		"""
-		A stream allowing for LIFO capabilities
+		Base class for CustomMethodsVI Streams
 		- Constructor -
-		:param max_length: The maximum length (in number of items) of this stream
-		:param fifo: Whether this stream is FIFO or LIFO
 		"""
 
-		super().__init__(max_length)
-		self.__fifo__: bool = bool(fifo)
+		self.__state__: bool = True
+		self.__pipes__: dict[io.BufferedIOBase, bool] = {}
+		self.__pipe_workers__: dict[io.IOBase, Stream.PipeWorker] = {}
+		self.__buffer_writer__: Stream.CallbackStack = Stream.CallbackStack()
+		self.__buffer_reader__: Stream.CallbackStack = Stream.CallbackStack()
+		self.__metrics__: typing.Optional[Stream.Metrics] = None
 
-	def read(self, __size: typing.Optional[int] = ...) -> tuple[T, ...] | T:
-		if not self.__state__:
-			raise StreamError('Stream is closed')
-		elif not self.readable():
-			raise StreamError('Stream is not readable')
+	def __len__(self) -> int:
+		"""
+		:return: The number of items remaining in this stream
+		"""
 
-		count: int = len(self.__buffer__) if __size is ... or __size is None or int(__size) < 0 else int(__size)
-		temp: tuple[typing.Any, ...] = tuple(self.__buffer__[:count] if self.__fifo__ else reversed(self.__buffer__[-count:]))
+		return 0
 
-		if self.__fifo__:
-			del self.__buffer__[:count]
-		else:
-			del self.__buffer__[-count:]
+	def __enter__(self) -> Stream:
+		return self
 
-		result: tuple[typing.Any, ...] = tuple((y := self.__reader_stack__(x))[0 if len(y) == 1 else slice(None)] for x in temp)
+	def __exit__(self, exc_type, exc_val: typing.Any, exc_tb) -> None:
+		if self.__state__:
+			self.close()
 
-		if len(result) == 0:
-			raise StreamEmptyError('Stream is empty')
+	def __del__(self) -> None:
+		if self.__state__:
+			for worker in self.__pipe_workers__.values():
+				worker.stop(False)
 
-		return result[0] if __size == 1 else result
+			self.__pipe_workers__.clear()
+			self.close()
+
+	def __eq__(self, other) -> bool:
+		return type(other) is type(self) and id(other) == id(self)
+
+	def __hash__(self) -> int:
+		return id(self)
+
+	def __iter__(self) -> Stream[T]:
+		return self
+
+	def __next__(self) -> T:
+		"""
+		Alias for 'Stream::read(1)'
+		:return: The read item
+		:raises StopIteration: If the stream is not seekable or the stream is exhausted
+		:raises StreamError: If stream is closed or not readable
+		"""
 
-	def peek(self, __size: typing.Optional[int] = ...) -> tuple[T, ...] | T:
 		if not self.__state__:
 			raise StreamError('Stream is closed')
 		elif not self.readable():
 			raise StreamError('Stream is not readable')
 
-		count: int = len(self.__buffer__) if __size is ... or __size is None or int(__size) < 0 else int(__size)
-		temp: tuple[typing.Any, ...] = tuple(self.__buffer__[:count] if self.__fifo__ else reversed(self.__buffer__[-count:]))
-		result: tuple[typing.Any, ...] = tuple((y := self.__reader_stack__(x))[0 if len(y) == 1 else slice(None)] for x in temp)
-		return result[0] if __size == 1 else result
+		if not self.seekable():
+			raise StopIteration
 
-	@property
-	def is_fifo(self) -> bool:
-		"""
-		:return: Whether this stream is FIFO
-		"""
+		pos: int = self.tell()
+		self.seek(0, 2)
+		end: int = self.tell()
+		self.seek(pos, 0)
 
-		return self.__fifo__
+		if pos >= end:
+			raise StopIteration
 
-	@property
-	def is_lifo(self) -> bool:
+		return self.read(1)
+
+	def __reader_stack__(self, __data: tuple[T, ...]) -> T | typing.Iterable[T]:
 		"""
-		:return: Whether this stream is LIFO
+		INTERNAL METHOD
+		Executes the reader callback stack on read data
+		:param __data: The input data to transform
+		:return: The resulting data
 		"""
 
-		return not self.__fifo__
-
-
-class TypedStream[T](OrderedStream[T]):
-	"""
-	Stream limiting stored items to instances of specified types
-	"""
+		return self.__buffer_reader__.compile_item()(__data)
 
-	def __init__(self, cls: type | typing.Iterable[type], max_length: int = -1, fifo: bool = True):
+	def __writer_stack__(self, __object: typing.Any) -> list[T]:
 		"""
-		Stream limiting stored items to instances of specified types
-		- Constructor -
-		:param cls: The type(s) to allow
-		:param max_length: The maximum length (in number of items) of this stream
-		:param fifo: Whether this stream is FIFO or LIFO
-		:raises InvalidArgumentException: If any value in 'cls' is not a type
+		INTERNAL METHOD
+		Executes the writer callback stack on written data
+		:param __object: The input object to transform
+		:return: The resulting object
 		"""
 
-		super().__init__(max_length, fifo)
-		self.__cls__: tuple[type, ...] = tuple(cls) if isinstance(cls, typing.Iterable) else (cls,)
-		Misc.raise_ifn(all(type(c) is type for c in self.__cls__), Exceptions.InvalidArgumentException(TypedStream.__init__, 'cls', type(cls)))
+		return self.__buffer_writer__.compile_item()(__object)
 
-	def write(self, __object: T, *, ignore_invalid = False) -> TypedStream[T]:
+	def add_reader(self, callback: typing.Callable, *, batch: bool = False) -> Stream:
 		"""
-		Writes an object to the internal queue
-		:param __object: The object to write
-		:param ignore_invalid: Whether to ignore closed or non-writable streams
+		Appends a callback to the reader stack, transforming data as it is read
+		Per-item callbacks receive one item and return an iterable of results
+		:param callback: The callback to add
+		:param batch: Whether the callback is batch-capable, receiving a list of items and returning an iterable of results
 		:return: This instance
-		:raises StreamError: If this stream is closed or not writable
-		:raises StreamFullError: If this stream is full
-		:raises AssertionError: If the object is not an instance of a whitelisted type
+		:raises InvalidArgumentException: If 'callback' is not callable
 		"""
 
-		assert isinstance(__object, self.__cls__), f'Object of type  \'{type(__object)}\' does not match one of the specified type(s):\n  {"\n  ".join(str(c) for c in self.__cls__)}'
-		super().write(__object)
+		Misc.raise_ifn(callable(callback), Exceptions.InvalidArgumentException(Stream.add_reader, 'callback', type(callback)))
+		self.__buffer_reader__.append(Stream.BatchCallback(callback) if batch else callback)
 		return self
 
+	def add_writer(self, callback: typing.Callable, *, batch: bool = False) -> Stream:
+		"""
+		Appends a callback to the writer stack, transforming data as it is written
+		Per-item callbacks receive one item and return an iterable of results
+		:param callback: The callback to add
+		:param batch: Whether the callback is batch-capable, receiving a list of items and returning an iterable of results
+		:return: This instance
+		:raises InvalidArgumentException: If 'callback' is not callable
+		"""
 
-class ByteStream(TypedStream[bytes | bytearray], io.BytesIO):
-	"""
-	Stream designed for storing only byte-strings
-	"""
+		Misc.raise_ifn(callable(callback), Exceptions.InvalidArgumentException(Stream.add_writer, 'callback', type(callback)))
+		self.__buffer_writer__.append(Stream.BatchCallback(callback) if batch else callback)
+		return self
 
 	@staticmethod
-	def __buffer_writer_cb__(__object: bytes | bytearray | int | str) -> typing.Iterator[int] | typing.Generator[int, None, None]:
+	def __deliver__(pipe: io.IOBase, data: typing.Any, ignore_invalid: bool = False, blocking: bool = False) -> None:
 		"""
 		INTERNAL METHOD
-		Converts data to write into a bytes object
-		:param __object: The object being written
-		:return: The resulting bytes object
+		Writes a flushed batch to a pipe in a single call
+		Tuples of items are written with 'writelines', all other data with 'write'
+		Bounded streams accept the whole batch or none of it
+		:param pipe: The pipe to write to
+		:param data: The batch to write
+		:param ignore_invalid: Whether to ignore closed or non-writable streams
+		:param blocking: Whether to wait for room in bounded streams rather than failing at once
+		:raises BrokenPipeError: If 'ignore_invalid' is false and the pipe is closed or not writable
+		:raises StreamFullError: If the pipe is a bounded stream without room for the batch
 		"""
 
-		if isinstance(__object, int):
-			byte_count: int = max(1, math.ceil((__object.bit_length()) / 8)) + (__object < 0)
-			return iter(__object.to_bytes(byte_count, sys.byteorder, signed=__object < 0))
-		elif isinstance(__object, str):
-			return iter(__object.encode())
+		if pipe.closed and not ignore_invalid:
+			raise BrokenPipeError(f'Pipe \'{pipe}\' is closed')
+		elif not pipe.closed and not pipe.writable() and not ignore_invalid:
+			raise BrokenPipeError(f'Pipe \'{pipe}\' is not writable')
+		elif pipe.closed or not pipe.writable():
+			return
+		elif blocking and isinstance(pipe, (ListStream, SharedMemoryStream)) and isinstance(data, tuple):
+			pipe.writelines(data, timeout=None)
+		elif blocking and isinstance(pipe, (ListStream, SharedMemoryStream)):
+			pipe.write(data, timeout=None)
+		elif isinstance(data, tuple):
+			pipe.writelines(data)
 		else:
-			return iter(bytes(__object))
+			pipe.write(data)
 
-	def __init__(self, max_length: int = -1, fifo: bool = True):
+	def __fan_out__(self, targets: typing.Iterable[io.IOBase], ignore_invalid: bool = False) -> None:
 		"""
-		Stream designed for storing only byte-strings
-		- Constructor -
-		:param max_length: The maximum length (in number of items) of this stream
-		:param fifo: Whether this stream is FIFO or LIFO
+		INTERNAL METHOD
+		Reads the internal buffer once and delivers it as one batch to each target pipe
+		Pipes with a worker receive the batch asynchronously; errors from earlier deliveries are raised before anything is read
+		:param targets: The pipes to write to
+		:param ignore_invalid: Whether to ignore closed or non-writable streams
+		:raises BrokenPipeError: If 'ignore_invalid' is false and a pipe is closed or not writable
+		:raises StreamFullError: If a bounded pipe does not have room for the batch
 		"""
 
-		super().__init__((bytes, bytearray, int, str), max_length, fifo)
-		self.__buffer_writer__.append(ByteStream.__buffer_writer_cb__)
+		targets = tuple(targets)
 
-	def read(self, __size: typing.Optional[int] = ...) -> bytes:
-		"""
-		Reads data from the internal queue
-		:param __size: If specified, reads this many items, otherwise reads all data
-		:return: The read data as a single bytes object
-		:raises StreamError: If this stream is closed or not readable
-		"""
+		for pipe in targets:
+			worker: typing.Optional[Stream.PipeWorker] = self.__pipe_workers__.get(pipe)
 
-		data: int | tuple[int, ...] = super().read(__size)
-		return data.to_bytes(1) if isinstance(data, int) else bytes(data)
+			if worker is not None:
+				worker.__raise__()
 
-	def peek(self, __size: typing.Optional[int] = ...) -> bytes:
-		"""
-		Reads data from the internal queue without removing it
-		:param __size: If specified, reads this many items, otherwise reads all data
-		:return: The read data as a single bytes object
-		:raises StreamError: If this stream is closed or not readable
-		"""
+		if len(targets) == 0 or not self.readable() or len(self) == 0:
+			return
 
-		data: int | tuple[int, ...] = super().peek(__size)
-		return data.to_bytes(1) if isinstance(data, int) else bytes(data)
+		start: typing.Optional[float] = None if self.__metrics__ is None else time.perf_counter()
 
+		try:
+			data: typing.Any = self.read(...)
+		except StreamEmptyError:
+			return
 
-class BitStream(TypedStream[bytes | bytearray | str | int | bool], io.BytesIO):
-	"""
-	Stream designed for storing individual bits
-	"""
+		for pipe in targets:
+			worker: typing.Optional[Stream.PipeWorker] = self.__pipe_workers__.get(pipe)
 
-	@staticmethod
-	def __buffer_writer_cb__(__object: bytes | bytearray | int | str | bool) -> typing.Iterable[bool]:
+			if worker is None:
+				Stream.__deliver__(pipe, data, ignore_invalid)
+			else:
+				worker.put(data, ignore_invalid)
+
+		if start is not None and self.__metrics__ is not None:
+			self.__metrics__.record_fan_out(time.perf_counter() - start)
+
+	def __add_pipes__(self, pipes: typing.Iterable[io.IOBase], auto: bool, asynchronous: bool, max_pending: int) -> None:
 		"""
 		INTERNAL METHOD
-		Converts data to write into bits
-		:param __object: The object being written
-		:return: The resulting bits
+		Links the specified pipes, starting or stopping their delivery workers as needed
+		:param pipes: The pipes to link with
+		:param auto: Whether the pipes are auto pipes
+		:param asynchronous: Whether batches are delivered on a worker thread
+		:param max_pending: For asynchronous pipes, the maximum number of queued batches before producers block or -1 for no limit
 		"""
 
-		if isinstance(__object, bool):
-			return (bool(__object),)
-		elif isinstance(__object, int):
-			bits: list[bool] = []
+		for pipe in pipes:
+			worker: typing.Optional[Stream.PipeWorker] = self.__pipe_workers__.pop(pipe, None)
 
-			for _ in range((__object := int(__object)).bit_length()):
-				bits.append(bool(__object & 0b1))
-				__object >>= 1
+			if worker is not None:
+				worker.stop()
 
-			return reversed(bits)
-		elif isinstance(__object, str):
-			bytes_: list[bool] = []
+			if asynchronous:
+				self.__pipe_workers__[pipe] = Stream.PipeWorker(pipe, max_pending)
 
-			for byte in str(__object).encode():
-				bits: list[bool] = []
+			self.__pipes__[pipe] = auto
 
-				for _ in range(8):
-					bits.append(bool(byte & 0b1))
-					byte >>= 1
+	def __auto_flush__(self, ignore_invalid: bool = False) -> None:
+		"""
+		INTERNAL METHOD
+		Flushes internal buffer to all connected auto-pipes
+		:param ignore_invalid: Whether to ignore closed or non-writable streams
+		:raises BrokenPipeError: If the targeted pipe is closed
+		:raises StreamFullError: If a bounded pipe does not have room for the flushed data
+		"""
 
-				bytes_.extend(reversed(bits))
+		if len(self.__pipes__) > 0:
+			self.__fan_out__((pipe for pipe, auto in self.__pipes__.items() if auto), ignore_invalid)
 
-			return bytes_
-		elif isinstance(__object, (bytes, bytearray)):
-			bytes_: list[bool] = []
+	def close(self) -> None:
+		"""
+		Closes the stream
+		Asynchronous pipes deliver all queued batches before their workers stop
+		:raises StreamError: If the stream is already closed
+		"""
 
-			for byte in bytes(__object):
-				bits: list[bool] = []
+		if not self.__state__:
+			raise StreamError('Stream is closed')
 
-				for _ in range(8):
-					bits.append(bool(byte & 0b1))
-					byte >>= 1
+		self.__state__ = False
 
-				bytes_.extend(reversed(bits))
+		for worker in self.__pipe_workers__.values():
+			worker.stop()
 
-			return iter(bytes_)
-		else:
-			raise TypeError()
+		self.__pipe_workers__.clear()
 
-	def __init__(self, max_length: int = -1, fifo: bool = True, pack: bool = True):
+	def readable(self) -> bool:
 		"""
-		Stream designed for storing individual bits
-		- Constructor -
-		:param max_length: The maximum length (in number of items) of this stream
-		:param fifo: Whether this stream is FIFO or LIFO
-		:param pack: Whether to read bits packed into bytes or read individual bits
+		:return: Whether this stream can be read from
 		"""
 
-		super().__init__((bool, int, bytes, bytearray, str), max_length, fifo)
-		self.__buffer_writer__.append(BitStream.__buffer_writer_cb__)
-		self.__packed__: bool = bool(pack)
+		return self.__state__
 
-	def write_padded(self, data: bytes | bytearray | int | str | bool, size: int, pad_bit: bool = False) -> BitStream:
+	def writable(self) -> bool:
 		"""
-		Writes an object to the internal queue
-		:param data: The bit or bytes to write
-		:param size: The number of leading bits to pad
-		:param pad_bit: The bit to pad with
-		:return: This instance
-		:raises StreamError: If this stream is closed or not writable
-		:raises StreamFullError: If this stream is full
-		:raises AssertionError: If the object is not an instance of a whitelisted type
-		:raises ValueError: If the number of bits in 'data' exceeds 'size'
+		:return: Whether this stream can be written to
 		"""
 
-		bits: list[bool] = list(self.__buffer_writer_cb__(data))
-
-		if len(bits) > size:
-			raise ValueError('Object bit length exceeded size')
-
-		while len(bits) < size:
-			bits.insert(0, bool(pad_bit))
-
-		self.writefrom(bits)
-		return self
+		return self.__state__
 
-	def read(self, __size: typing.Optional[int] = ...) -> bytes | bool | tuple[bool, ...]:
+	def seekable(self) -> bool:
 		"""
-		Reads data from the internal queue
-		:param __size: If specified, reads this many items, otherwise reads all data
-		:return: The read bits as a single bytes object
-		:raises StreamError: If this stream is closed or not readable
+		:return: Whether this stream can seek cursor position
 		"""
 
-		data: bool | tuple[bool, ...] = super().read(__size)
+		return False
 
-		if not self.__packed__:
-			return data
+	def pipe(self, *pipes: io.IOBase, asynchronous: bool = False, max_pending: int = -1) -> Stream:
+		"""
+		Creates a link between this pipe (src) and the specified pipes (*dst)
+		Use 'Stream::flush' to move data from this stream to all linked pipes
+		Each flush is delivered as one batch; a bounded stream pipe receives all of it or none of it
+		Asynchronous workers wait for room in bounded stream pipes, applying backpressure through 'max_pending'
+		:param pipes: The pipes to link with
+		:param asynchronous: Whether to deliver flushed data to each pipe on its own worker thread
+		:param max_pending: For asynchronous pipes, the maximum number of queued flushes per pipe before flushing blocks or -1 for no limit
+		:return: This instance
+		:raises StreamError: If this stream is closed
+		:raises TypeError: If one of the specified pipes is not an 'io.BufferedIOBase' instance
+		:raises ValueError: If 'max_pending' is negative and not -1
+		"""
 
-		packed: list[int] = []
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+		elif not all(isinstance(x, io.IOBase) for x in pipes):
+			raise TypeError('Specified stream is not an \'io.BufferedIOBase\'')
 
-		for i in range(0, len(data), 8):
-			byte: int = 0
+		self.__add_pipes__(pipes, False, asynchronous, max_pending)
+		return self
 
-			for bit in data[i:i+8]:
-				byte <<= 1
-				byte |= int(bit) & 0b1
+	def autopipe(self, *pipes: io.BufferedIOBase, ignore_invalid: bool = False, asynchronous: bool = False, max_pending: int = -1):
+		"""
+		Creates a link between this pipe (src) and the specified pipes (*dst)
+		Data from this stream is automatically flushed to all linked auto pipes
+		:param pipes: The pipes to link with
+		:param ignore_invalid: Whether to ignore closed or non-writable streams
+		:param asynchronous: Whether to deliver flushed data to each pipe on its own worker thread
+		:param max_pending: For asynchronous pipes, the maximum number of queued flushes per pipe before writes block or -1 for no limit
+		:return: This instance
+		:raises StreamError: If this stream is closed
+		:raises TypeError: If one of the specified pipes is not an 'io.BufferedIOBase' instance
+		:raises ValueError: If 'max_pending' is negative and not -1
+		"""
 
-			packed.append(byte)
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+		elif not all(isinstance(x, io.BufferedIOBase) for x in pipes):
+			raise TypeError('Specified stream is not an \'io.BufferedIOBase\'')
 
-		return bytes(packed)
+		self.__add_pipes__(pipes, True, asynchronous, max_pending)
+		self.__auto_flush__(ignore_invalid)
+		return self
 
-	def peek(self, __size: typing.Optional[int] = ...) -> bytes | bool | tuple[bool, ...]:
+	def del_pipe(self, *pipes: io.BufferedIOBase) -> Stream:
 		"""
-		Reads data from the internal queue without removing it
-		:param __size: If specified, reads this many items, otherwise reads all data
-		:return: The read bits as a single bytes object
-		:raises StreamError: If this stream is closed or not readable
+		Destroys a link between this pipe and the specified pipes
+		:param pipes: The pipes to remove
+		:return: This instance
+		:raises StreamError: If this stream is closed
+		:raises TypeError: If one of the specified pipes is not an 'io.BufferedIOBase' instance
 		"""
 
-		data: bool | tuple[bool, ...] = super().peek(__size)
-
-		if not self.__packed__:
-			return data
-
-		packed: list[int] = []
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+		elif not all(isinstance(x, io.BufferedIOBase) for x in pipes):
+			raise TypeError('Specified stream is not an \'io.BufferedIOBase\'')
 
-		for i in range(0, len(data), 8):
-			byte: int = 0
+		for pipe in pipes:
+			if pipe in self.__pipes__:
+				del self.__pipes__[pipe]
 
-			for bit in data[i:i + 8]:
-				byte <<= 1
-				byte |= int(bit) & 0b1
+			if pipe in self.__pipe_workers__:
+				self.__pipe_workers__.pop(pipe).stop()
 
-			packed.append(byte)
+		return self
 
-		return bytes(packed)
+	def drain_pipes(self) -> Stream:
+		"""
+		Blocks until all asynchronous pipes have written their queued data
+		:return: This instance
+		:raises BrokenPipeError: If an asynchronous delivery failed because its pipe is closed or not writable
+		"""
 
+		for worker in tuple(self.__pipe_workers__.values()):
+			worker.join()
 
-class StringStream(OrderedStream[str]):
-	"""
-	Stream designed for storing only strings
-	"""
+		return self
 
-	def __init__(self, max_length: int = -1, fifo: bool = True):
+	def enable_metrics(self, name: typing.Optional[str] = ...) -> Stream:
 		"""
-		Stream designed for storing only strings
-		- Constructor -
-		:param max_length: The maximum length (in number of items) of this stream
-		:param fifo: Whether this stream is FIFO or LIFO
+		Starts collecting throughput and occupancy metrics for this stream and adds them to the global registry
+		Metrics are opt-in; streams without them run uninstrumented
+		:param name: The name to register this stream's metrics under, or the type name and id of this stream if not supplied
+		:return: This instance
+		:raises InvalidArgumentException: If 'name' is not a string
 		"""
 
-		super().__init__(max_length, fifo)
-		self.__buffer_writer__.append(str)
-		self.__buffer_reader__.append(''.join)
+		Misc.raise_ifn(name is ... or name is None or isinstance(name, str), Exceptions.InvalidArgumentException(Stream.enable_metrics, 'name', type(name), (str,)))
 
-	def read(self, __size: typing.Optional[int] = ...) -> str:
-		"""
-		Reads data from the internal queue
-		:param __size: If specified, reads this many items, otherwise reads all data
-		:return: The read data as a single string
-		:raises StreamError: If this stream is closed or not readable
-		"""
+		if self.__metrics__ is not None:
+			return self
 
-		return ''.join(super().read(__size))
+		metrics: Stream.Metrics = Stream.Metrics(f'{type(self).__name__}@{id(self):x}' if name is ... or name is None else name)
+		metrics.install(self)
+		self.__metrics__ = metrics
 
-	def peek(self, __size: typing.Optional[int] = ...) -> str:
+		with Stream.__metrics_registry_lock__:
+			Stream.__metrics_registry__[metrics.name] = metrics
+
+		return self
+
+	def disable_metrics(self) -> Stream:
 		"""
-		Reads data from the internal queue without removing it
-		:param __size: If specified, reads this many items, otherwise reads all data
-		:return: The read data as a single string
-		:raises StreamError: If this stream is closed or not readable
+		Stops collecting metrics for this stream
+		The final counters remain in the global registry until 'Stream.clear_metrics' is called
+		:return: This instance
 		"""
 
-		return super().peek(__size)
+		if self.__metrics__ is not None:
+			self.__metrics__.uninstall(self)
+			self.__metrics__ = None
 
+		return self
 
-class ZLibCompressorStream(ByteStream):
-	"""
-	Stream designed for ZLIB compressing arbitrary byte-strings
-	"""
-
-	def __init__(self, compression_ratio: int = zlib.Z_DEFAULT_COMPRESSION, max_length: int = -1, fifo: bool = True):
+	def stats(self) -> dict[str, typing.Any]:
 		"""
-		Stream designed for ZLIB compressing arbitrary byte-strings
-		:param compression_ratio: The ZLIB compression ratio
-		:param max_length:  The maximum length (in number of items) of this stream
-		:param fifo:Whether this stream is FIFO or LIFO
-		:raises InvalidArgumentException: If 'compression_ratio' is not an integer
-		:raises ValueError: If 'compression_ratio' is invalid
+		Gets the metrics collected for this stream
+		Times are in seconds; byte counts are characters for text streams
+		:return: A JSON-serializable dictionary of counters
+		:raises StreamError: If metrics are not enabled for this stream
 		"""
 
-		super().__init__(max_length, fifo)
-		Misc.raise_ifn(isinstance(compression_ratio, int), Exceptions.InvalidArgumentException(ZLibCompressorStream.__init__, 'compression_ratio', type(compression_ratio), (int,)))
-		Misc.raise_ifn(zlib.Z_NO_COMPRESSION <= (compression_ratio := int(compression_ratio)) <= zlib.Z_BEST_COMPRESSION, ValueError('Invalid compression ratio'))
-		self.__compression__: int = int(compression_ratio)
+		if self.__metrics__ is None:
+			raise StreamError('Metrics are not enabled')
 
-	def read(self, __size: typing.Optional[int] = ...) -> bytes:
-		return zlib.compress(super().read(__size), self.__compression__)
+		return self.__metrics__.snapshot()
 
-	def peek(self, __size: typing.Optional[int] = ...) -> bytes:
-		return zlib.compress(super().peek(__size), self.__compression__)
+	@staticmethod
+	def all_stats() -> dict[str, dict[str, typing.Any]]:
+		"""
+		Gets the metrics of every stream in the global registry
+		:return: A dictionary mapping registered names to counters
+		"""
 
+		with Stream.__metrics_registry_lock__:
+			registry: tuple[Stream.Metrics, ...] = tuple(Stream.__metrics_registry__.values())
 
-class ZLibDecompressorStream(ByteStream):
-	"""
-	Stream designed for ZLIB decompressing arbitrary byte-strings
-	"""
+		return {metrics.name: metrics.snapshot() for metrics in registry}
 
-	def __init__(self, max_length: int = -1, fifo: bool = True):
+	@staticmethod
+	def dump_stats(file: typing.Optional[typing.IO] = None, **kwargs) -> str:
 		"""
-		Stream designed for ZLIB decompressing arbitrary byte-strings
-		:param max_length: The maximum length (in number of items) of this stream
-		:param fifo: Whether this stream is FIFO or LIFO
+		Serializes the metrics of every stream in the global registry as JSON
+		:param file: If specified, the text file to also write the JSON to
+		:param kwargs: Extra keyword arguments passed to 'json.dumps'
+		:return: The JSON string
 		"""
 
-		super().__init__(max_length, fifo)
+		data: str = json.dumps(Stream.all_stats(), **kwargs)
 
-	def read(self, __size: typing.Optional[int] = ...) -> bytes:
-		return zlib.decompress(super().read(__size))
+		if file is not None:
+			file.write(data)
 
-	def peek(self, __size: typing.Optional[int] = ...) -> bytes:
-		return zlib.decompress(super().peek(__size))
+		return data
 
+	@staticmethod
+	def clear_metrics() -> None:
+		"""
+		Removes all entries from the global metrics registry
+		Streams with metrics enabled keep collecting, but are no longer reported by 'Stream.all_stats'
+		"""
 
-class PickleSerializerStream(ByteStream):
-	"""
-	Stream that serializes all data with pickle during write
-	"""
+		with Stream.__metrics_registry_lock__:
+			Stream.__metrics_registry__.clear()
 
-	def __init__(self, max_length: int = -1, fifo: bool = True, header_size: int = 4):
+	def flush(self, ignore_invalid: bool = False) -> Stream:
 		"""
-		Stream that serializes all data with pickle during write
-		- Constructor -
-		:param max_length: The maximum length (in number of items) of this stream
-		:param fifo: Whether this stream is FIFO or LIFO
-		:param header_size: The number of bytes to use for serialized object size
-		:raises InvalidArgumentException: If 'header_size' is not an integer
-		:raises ValueError: If 'header_size' is smaller than 1
+		Flushes the internal buffer, clearing all contents
+		If connected to another stream via 'Stream::pipe', contents are read from this stream once and written to each connected stream as a single batch
+		A synchronous bounded pipe without room for the whole batch receives none of it
+		:param ignore_invalid: Whether to ignore closed or non-writable streams
+		:return: This instance
+		:raises StreamError: If this stream is closed
+		:raises BrokenPipeError: If 'ignore_invalid' is false and at least one pipe is non-writable or closed
+		:raises StreamFullError: If a bounded pipe does not have room for the batch
 		"""
 
-		super().__init__(max_length, fifo)
-		Misc.raise_ifn(isinstance(header_size, int), Exceptions.InvalidArgumentException(PickleSerializerStream.__init__, 'header_size', type(header_size), (int,)))
-		Misc.raise_ifn((header_size := int(header_size) < 1), ValueError('Header size cannot be smaller than 1'))
-		self.__header_size__: int = int(header_size)
-		assert self.__header_size__ > 0, 'Header size must be at least 1'
+		if not self.__state__:
+			raise StreamError('Stream is closed')
 
-	def write(self, __object: typing.Any, *, ignore_invalid = False) -> PickleSerializerStream:
-		serialized: bytes = pickle.dumps(__object)
-		serialized = len(serialized).to_bytes(self.__header_size__, 'big', signed=False) + serialized
-		super().write(serialized)
+		self.__fan_out__(self.__pipes__, ignore_invalid)
 		return self
 
+	@property
+	def closed(self) -> bool:
+		"""
+		:return: Whether this stream is closed
+		"""
+
+		return not self.__state__
+
 
-class PickleDeserializerStream(ByteStream):
+class FileStream(Stream[str | bytes]):
 	"""
-	Stream that deserializes all data with pickle during read
+	Stream for file IO
+	Binary read-only streams may be memory-mapped, in which case reads, peeks and seeks are cursor moves and data is returned as memoryviews into the mapping
+	Mapping pays off for large reads and random access; short lines cost more than in buffered mode since each one is a new memoryview
 	"""
 
-	def __init__(self, max_length: int = -1, fifo: bool = True, header_size: int = 4):
+	def __init__(self, path: str, mode: str, encoding: str = 'utf-8', *, memory_map: bool = False):
 		"""
-		Stream that deserializes all data with pickle during read
+		Stream for file IO
 		- Constructor -
-		:param max_length: The maximum length (in number of items) of this stream
-		:param fifo: Whether this stream is FIFO or LIFO
-		:param header_size: The number of bytes to use for serialized object size
-		:raises InvalidArgumentException: If 'header_size' is not an integer
-		:raises ValueError: If 'header_size' is smaller than 1
+		:param path: The filepath
+		:param mode: The stream IO mode
+		:param encoding: For non-binary streams, the encoding to use
+		:param memory_map: Whether to memory-map the file; only valid for binary read-only modes
+		:raises InvalidArgumentException: If 'path' is not a string
+		:raises InvalidArgumentException: If 'mode' is not a string
+		:raises InvalidArgumentException: If 'encoding' is not a string
+		:raises ValueError: If 'memory_map' is true and 'mode' is not a binary read-only mode
 		"""
 
-		super().__init__(max_length, fifo)
-		Misc.raise_ifn(isinstance(header_size, int), Exceptions.InvalidArgumentException(PickleSerializerStream.__init__, 'header_size', type(header_size), (int,)))
-		Misc.raise_ifn((header_size := int(header_size) < 1), ValueError('Header size cannot be smaller than 1'))
-		self.__header_size__: int = int(header_size)
-		assert self.__header_size__ > 0, 'Header size must be at least 1'
-
-	def read(self, __size: typing.Optional[int] = ...) -> typing.Any | tuple[typing.Any]:
-		results: list[typing.Any] = []
-		count: int = 0
+		super().__init__()
+		self.__mapping__: typing.Optional[mmap.mmap] = None
+		self.__view__: typing.Optional[memoryview] = None
+		self.__position__: int = 0
+		Misc.raise_ifn(isinstance(path, str), Exceptions.InvalidArgumentException(FileStream.__init__, 'path', type(path), (str,)))
+		Misc.raise_ifn(isinstance(mode, str), Exceptions.InvalidArgumentException(FileStream.__init__, 'mode', type(mode), (str,)))
+		Misc.raise_ifn(isinstance(encoding, str), Exceptions.InvalidArgumentException(FileStream.__init__, 'encoding', type(encoding), (str,)))
+		Misc.raise_if(bool(memory_map) and not FileStream.__mappable__(mode), ValueError('Memory-mapped file streams require a binary read-only mode'))
+		self.__stream__ = open(str(path), mode, encoding=None if 'b' in mode else encoding)
+		self.__filepath__: str = str(path)
 
-		while True:
-			if (__size is not ... and __size is not None and count > __size) or self.empty():
-				break
+		if memory_map:
+			self.__map__()
 
-			length: int = int.from_bytes(super().read(self.__header_size__), 'big', signed=False)
-			results.append(pickle.loads(super().read(length)))
-			count += 1
+	@staticmethod
+	def __mappable__(mode: str) -> bool:
+		"""
+		INTERNAL METHOD
+		:param mode: The file mode
+		:return: Whether a file opened with the specified mode can be memory-mapped
+		"""
 
-		if len(results) == 0:
-			raise StreamEmptyError('Stream is empty')
+		return 'b' in mode and 'r' in mode and '+' not in mode
 
-		return results[0] if len(results) == 1 else tuple(results)
+	def __map__(self) -> None:
+		"""
+		INTERNAL METHOD
+		Memory-maps the underlying file
+		Empty files cannot be mapped and are represented by an empty view
+		"""
 
+		self.__position__ = self.__stream__.tell()
 
-class DillSerializerStream(ByteStream):
-	"""
-	Stream that serializes all data with dill during write
-	"""
+		try:
+			self.__mapping__ = mmap.mmap(self.__stream__.fileno(), 0, access=mmap.ACCESS_READ)
+			self.__view__ = memoryview(self.__mapping__)
+		except ValueError:
+			self.__mapping__ = None
+			self.__view__ = memoryview(b'')
 
-	def __init__(self, max_length: int = -1, fifo: bool = True, header_size: int = 4):
+	def __unmap__(self) -> None:
 		"""
-		Stream that serializes all data with dill during write
-		- Constructor -
-		:param max_length: The maximum length (in number of items) of this stream
-		:param fifo: Whether this stream is FIFO or LIFO
-		:param header_size: The number of bytes to use for serialized object size
-		:raises InvalidArgumentException: If 'header_size' is not an integer
-		:raises ValueError: If 'header_size' is smaller than 1
+		INTERNAL METHOD
+		Releases the memory map of the underlying file
+		If views returned by this stream are still alive, the mapping is closed once they are garbage collected
 		"""
 
-		super().__init__(max_length, fifo)
-		Misc.raise_ifn(isinstance(header_size, int), Exceptions.InvalidArgumentException(PickleSerializerStream.__init__, 'header_size', type(header_size), (int,)))
-		Misc.raise_ifn((header_size := int(header_size) < 1), ValueError('Header size cannot be smaller than 1'))
-		self.__header_size__: int = int(header_size)
-		assert self.__header_size__ > 0, 'Header size must be at least 1'
+		if self.__view__ is None:
+			return
 
-	def write(self, __object: typing.Any, *, ignore_invalid = False) -> DillSerializerStream:
-		serialized: bytes = dill.dumps(__object)
-		serialized = len(serialized).to_bytes(self.__header_size__, 'big', signed=False) + serialized
-		super().write(serialized)
-		return self
+		self.__view__.release()
 
+		if self.__mapping__ is not None:
+			try:
+				self.__mapping__.close()
+			except BufferError:
+				pass
 
-class DillDeserializerStream(ByteStream):
-	"""
-	Stream that deserializes all data with dill during read
-	"""
+		self.__mapping__ = None
+		self.__view__ = None
 
-	def __init__(self, max_length: int = -1, fifo: bool = True, header_size: int = 4):
+	def __len__(self) -> int:
 		"""
-		Stream that deserializes all data with dill during read
-		- Constructor -
-		:param max_length: The maximum length (in number of items) of this stream
-		:param fifo: Whether this stream is FIFO or LIFO
-		:param header_size: The number of bytes to use for serialized object size
-		:raises InvalidArgumentException: If 'header_size' is not an integer
-		:raises ValueError: If 'header_size' is smaller than 1
+		No read operation is performed
+		:return: The number of remaining characters to read
 		"""
 
-		super().__init__(max_length, fifo)
-		Misc.raise_ifn(isinstance(header_size, int), Exceptions.InvalidArgumentException(PickleSerializerStream.__init__, 'header_size', type(header_size), (int,)))
-		Misc.raise_ifn((header_size := int(header_size) < 1), ValueError('Header size cannot be smaller than 1'))
-		self.__header_size__: int = int(header_size)
-		assert self.__header_size__ > 0, 'Header size must be at least 1'
-
-	def read(self, __size: typing.Optional[int] = ...) -> typing.Any | tuple[typing.Any]:
-		results: list[typing.Any] = []
-		count: int = 0
+		cursor = self.tell()
+		self.seek(0, 2)
+		size = self.tell()
+		self.seek(cursor, 0)
+		return size - cursor
 
-		while True:
-			if (__size is not ... and __size is not None and count > __size) or self.empty():
-				break
+	def close(self) -> None:
+		super().close()
+		self.__unmap__()
+		self.__stream__.close()
 
-			length: int = int.from_bytes(super().read(self.__header_size__), 'big', signed=False)
-			results.append(dill.loads(super().read(length)))
-			count += 1
+	def readable(self) -> bool:
+		return self.__state__ and self.__stream__.readable()
 
-		if len(results) == 0:
-			raise StreamEmptyError('Stream is empty')
+	def writable(self) -> bool:
+		return self.__state__ and self.__stream__.writable()
 
-		return results[0] if len(results) == 1 else tuple(results)
+	def seekable(self) -> bool:
+		return self.__state__ and self.__stream__.seekable()
 
+	def seek(self, __offset: int, __whence: int = ...) -> int:
+		"""
+		Moves the stream cursor
+		:param __offset: The amount to move the cursor
+		:param __whence: 0 - Seek relative to beginning of file<br/>1 - Seek relative to current position<br/>2 - Seek relative to end of file
+		:return: The new cursor position relative to file beginning
+		:raises StreamError: If stream is closed or not seekable
+		"""
 
-class EventedStream[T](OrderedStream[T]):
-	"""
-	Stream which allows binding of callbacks to various stream events
-	"""
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+		elif not self.seekable():
+			raise StreamError('Stream is not seekable')
+		elif self.__view__ is not None:
+			__whence = 0 if __whence is ... else int(__whence)
+			Misc.raise_ifn(0 <= __whence <= 2, ValueError(f'Invalid whence ({__whence})'))
+			position: int = int(__offset) + (0, self.__position__, len(self.__view__))[__whence]
+			Misc.raise_if(position < 0, ValueError(f'Negative seek position {position}'))
+			self.__position__ = position
+			return position
 
-	NO_THREADING: int = 0
-	MULTITHREADING: int = 1
-	MULTIPROCESSING: int = 2
+		return self.__stream__.seek(__offset, 0 if __whence is ... else __whence)
 
-	def __init__(self, max_length: int = -1, fifo: bool = True):
+	def tell(self) -> int:
 		"""
-		Stream which allows binding of callbacks to various stream events
-		- Constructor -
-		:param max_length: The maximum length (in number of items) of this stream
-		:param fifo: Whether this stream is FIFO or LIFO
+		:return: The current stream cursor relative to beginning of file
+		:raises StreamError: If stream is closed
 		"""
 
-		super().__init__(max_length, fifo)
-		self.__callbacks__: dict[str, dict[typing.Callable, int]] = {'write': {}, 'read': {}, 'pipe': {}, 'del_pipe': {}, 'close': {}, 'peek': {}, 'flush': {}}
+		if not self.__state__:
+			raise StreamError('Stream is closed')
 
-	def __exec__(self, eid: str, *args, **kwargs) -> None:
+		return self.__position__ if self.__view__ is not None else self.__stream__.tell()
+
+	def cursor(self, offset: typing.Optional[int] = ..., whence: typing.Optional[int] = ...) -> int:
 		"""
-		INTERNAL METHOD
-		Executes the callbacks for a specified event ID
-		:param eid: The event ID
-		:param args: Arguments to call callbacks with
-		:param kwargs: Keyword arguments to call callbacks with
+		Sets or gets the current stream cursor position
+		:param offset: If supplied, seeks to the specified position
+		:param whence: If supplied, sets the offset for 'seek'; cannot be supplied without 'offset'
+		:return: The current position if neither 'offset' nor 'whence' is supplied, otherwise the new absolute cursor position
+		:raises StreamError: If this stream is closed or not seekable
+		:raises TypeError: If 'whence' is supplied without 'offset'
 		"""
 
-		assert eid in self.__callbacks__
+		if not self.__state__:
+			raise StreamError('Stream is closed')
 
-		for callback, threaded in self.__callbacks__[eid].items():
-			if threaded == EventedStream.NO_THREADING:
-				callback(*args, **kwargs)
-			elif threaded == EventedStream.MULTITHREADING:
-				threading.Thread(target=callback, args=args, kwargs=kwargs).start()
-			elif threaded == EventedStream.MULTIPROCESSING:
-				multiprocessing.Process(target=callback, args=args, kwargs=kwargs).start()
+		if offset is ... and whence is ...:
+			return self.tell()
+		elif offset is ... and whence is not ...:
+			raise TypeError('Expected \'offset\' alongside \'whence\'')
+		else:
+			return self.seek(offset, whence)
 
-	def close(self) -> None:
-		super().close()
-		self.__exec__('close')
+	def truncate(self, __size: typing.Optional[int] = ...) -> int:
+		"""
+		Truncates the file to either the current cursor position if '__size' is not specified otherwise to '__size' bytes
+		:param __size: The new size of the file in bytes
+		:return: The new file size in bytes
+		:raises StreamError: If this stream is closed
+		"""
 
-	def read(self, __size: typing.Optional[int] = ...) -> tuple[T, ...]:
-		data: tuple[typing.Any, ...] = super().read(__size)
-		self.__exec__('read', data)
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+
+		return self.__stream__.truncate(None if __size is None or __size is ... else int(__size))
+
+	def size(self) -> int:
+		"""
+		No read operation is performed
+		:return: The total size of the file contents in bytes
+		:raises StreamError: If this stream is closed
+		"""
+
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+		elif self.__view__ is not None:
+			return len(self.__view__)
+
+		cursor = self.tell()
+		self.seek(0, 2)
+		size = self.tell()
+		self.seek(cursor, 0)
+		return size
+
+	def read(self, __size: typing.Optional[int] = ...) -> bytes | str | memoryview:
+		"""
+		Reads '__size' characters from the file
+		:param __size: The number of characters to read or all if not supplied
+		:return: The read data or a memoryview into the mapping if this stream is memory-mapped
+		:raises StreamError: If this stream is closed or not readable
+		"""
+
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+		elif not self.readable():
+			raise StreamError('Stream is not readable')
+		elif self.__view__ is not None:
+			data: memoryview = self.peek(__size)
+			self.__position__ += len(data)
+			return data
+
+		return self.__stream__.read(None if __size is None or __size is ... else int(__size))
+
+	def peek(self, __size: typing.Optional[int] = ...) -> bytes | str | memoryview:
+		"""
+		Reads '__size' characters from the file without moving the cursor
+		:param __size: The number of characters to read or all if not supplied
+		:return: The read data or a memoryview into the mapping if this stream is memory-mapped
+		:raises StreamError: If this stream is closed or not readable
+		"""
+
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+		elif not self.readable():
+			raise StreamError('Stream is not readable')
+		elif self.__view__ is not None:
+			size: int = -1 if __size is None or __size is ... else int(__size)
+			return self.__view__[self.__position__:] if size < 0 else self.__view__[self.__position__:self.__position__ + size]
+
+		cursor: int = self.tell()
+		data: bytes | str = self.__stream__.read(None if __size is None or __size is ... else int(__size))
+		self.seek(cursor, 0)
 		return data
 
-	def peek(self, __size: typing.Optional[int] = ...) -> tuple[T, ...]:
-		data: tuple[typing.Any, ...] = super().peek(__size)
-		self.__exec__('peek', data)
+	def readline(self, __size: typing.Optional[int] = ...) -> bytes | str | memoryview:
+		"""
+		Reads one line from the file reading at most '__size' bytes if supplied
+		:param __size: The number of characters to read or all until line delimiter if not supplied
+		:return: The read data or a memoryview into the mapping if this stream is memory-mapped
+		:raises StreamError: If this stream is closed or not readable
+		"""
+
+		view: typing.Optional[memoryview] = self.__view__
+
+		if view is not None and self.__state__:
+			start: int = self.__position__
+			mapping: typing.Optional[mmap.mmap] = self.__mapping__
+
+			if start >= len(view):
+				return view[start:start]
+			elif __size is ... or __size is None or int(__size) < 0:
+				mapping.seek(start)
+				end: int = start + len(mapping.readline())
+			else:
+				end: int = min(len(view), start + int(__size))
+				index: int = mapping.find(b'\n', start, end)
+				end = end if index < 0 else index + 1
+
+			self.__position__ = end
+			return view[start:end]
+		elif not self.__state__:
+			raise StreamError('Stream is closed')
+		elif not self.readable():
+			raise StreamError('Stream is not readable')
+
+		return self.__stream__.readline(None if __size is None or __size is ... else int(__size))
+
+	def peekline(self, __size: typing.Optional[int] = ...) -> bytes | str | memoryview:
+		"""
+		Reads one line from the file without moving the cursor, reading at most '__size' bytes if supplied
+		:param __size: The number of characters to read or all until line delimiter if not supplied
+		:return: The read data or a memoryview into the mapping if this stream is memory-mapped
+		:raises StreamError: If this stream is closed or not readable
+		"""
+
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+		elif not self.readable():
+			raise StreamError('Stream is not readable')
+		elif self.__view__ is not None:
+			start: int = self.__position__
+			end: int = len(self.__view__) if __size is ... or __size is None or int(__size) < 0 else min(len(self.__view__), start + int(__size))
+			index: int = -1 if start >= end else self.__mapping__.find(b'\n', start, end)
+			return self.__view__[start:end if index < 0 else index + 1]
+
+		cursor: int = self.tell()
+		data: bytes | str = self.__stream__.readline(None if __size is None or __size is ... else int(__size))
+		self.seek(cursor, 0)
 		return data
 
-	def write(self, __object: T, *, ignore_invalid = False) -> EventedStream[T]:
-		super().write(__object)
-		self.__exec__('write', __object)
+	def readlines(self, __hint: int = ...) -> list[bytes | str | memoryview]:
+		"""
+		Reads multiple line from the file stopping if '__hint' is supplied and the size of all read lines exceeds this amount
+		:param __hint: A hint indicating the number of characters to read
+		:return: The read data or memoryviews into the mapping if this stream is memory-mapped
+		:raises StreamError: If this stream is closed or not readable
+		"""
+
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+		elif not self.readable():
+			raise StreamError('Stream is not readable')
+		elif self.__view__ is not None:
+			hint: int = -1 if __hint is None or __hint is ... else int(__hint)
+			start: int = self.__position__
+			lines: list[memoryview] = []
+
+			while self.__position__ < len(self.__view__) and (hint <= 0 or self.__position__ - start < hint):
+				lines.append(self.readline())
+
+			return lines
+
+		return self.__stream__.readlines(None if __hint is None or __hint is ... else int(__hint))
+
+	def iterlines(self) -> typing.Iterator[bytes | str | memoryview]:
+		"""
+		Lazily reads the remaining lines of the file, moving the cursor as each line is yielded
+		Memory-mapped streams search the mapping directly rather than going through 'FileStream::readline'
+		:return: An iterator of lines or memoryviews into the mapping if this stream is memory-mapped
+		:raises StreamError: If this stream is closed or not readable
+		"""
+
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+		elif not self.readable():
+			raise StreamError('Stream is not readable')
+
+		view: typing.Optional[memoryview] = self.__view__
+
+		if view is None:
+			while self.__state__ and len(line := self.__stream__.readline()) > 0:
+				yield line
+
+			return
+
+		if self.__position__ >= len(view):
+			return
+
+		mapping: mmap.mmap = self.__mapping__
+		mapping.seek(self.__position__)
+		readline: typing.Callable[[], bytes] = mapping.readline
+
+		while self.__view__ is view and (count := len(readline())) > 0:
+			start: int = self.__position__
+			self.__position__ += count
+			yield view[start:self.__position__]
+
+	def write(self, __buffer: str | bytes) -> FileStream:
+		"""
+		Writes data to the file
+		:param __buffer: The data to write
+		:return: This instance
+		:raises StreamError: If this stream is closed or not writable
+		"""
+
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+		elif not self.writable():
+			raise StreamError('Stream is not writable')
+
+		self.__stream__.write(__buffer)
 		return self
 
-	def pipe(self, *pipes: io.BufferedIOBase) -> EventedStream[T]:
-		super().pipe(*pipes)
-		self.__exec__('pipe', *pipes)
+	def writelines(self, __lines: typing.Iterable[str | bytes]) -> FileStream:
+		"""
+		Writes multiple lines to the file
+		:param __lines: The data to write
+		:return: This instance
+		:raises StreamError: If this stream is closed or not writable
+		"""
+
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+		elif not self.writable():
+			raise StreamError('Stream is not writable')
+
+		self.__stream__.writelines(__lines)
 		return self
 
-	def del_pipe(self, *pipes: io.BufferedIOBase) -> EventedStream[T]:
-		super().del_pipe(*pipes)
-		self.__exec__('del_pipe', *pipes)
+	def reopen(self, mode: str, encoding: str = 'utf8', *, memory_map: bool = ...) -> FileStream:
+		"""
+		Closes and reopens the underlying file stream
+		:param mode: The new file mode
+		:param encoding: For non-binary modes, the new encoding
+		:param memory_map: Whether to memory-map the file; if not supplied, the file is re-mapped if it was mapped and the new mode allows it
+		:return: This instance
+		:raises InvalidArgumentException: If 'mode' is not a string
+		:raises InvalidArgumentException: If 'encoding' is not a string
+		:raises ValueError: If 'memory_map' is true and 'mode' is not a binary read-only mode
+		"""
+
+		Misc.raise_ifn(isinstance(mode, str), Exceptions.InvalidArgumentException(FileStream.reopen, 'mode', type(mode), (str,)))
+		Misc.raise_ifn(isinstance(encoding, str), Exceptions.InvalidArgumentException(FileStream.reopen, 'encoding', type(encoding), (str,)))
+		Misc.raise_if(memory_map is not ... and bool(memory_map) and not FileStream.__mappable__(mode), ValueError('Memory-mapped file streams require a binary read-only mode'))
+		mapped: bool = self.__view__ is not None and FileStream.__mappable__(mode) if memory_map is ... else bool(memory_map)
+
+		if self.__state__:
+			self.close()
+
+		self.__stream__ = open(self.__filepath__, mode, encoding=None if 'b' in mode else encoding)
+		self.__state__ = True
+
+		if mapped:
+			self.__map__()
+
 		return self
 
-	def flush(self, ignore_invalid: bool = False) -> EventedStream[T]:
+	def flush(self, ignore_invalid: bool = False) -> FileStream:
+		"""
+		Flushes the underlying stream; Writes queued data to connected pipes
+		:return: This instance
+		:raises StreamError: If this stream is closed
+		"""
+
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+
+		self.__stream__.flush()
 		super().flush(ignore_invalid)
-		self.__exec__('flush')
 		return self
 
-	def on(self, eid: str, callback: typing.Optional[typing.Callable] = ..., *, threadability: int = NO_THREADING) -> None | typing.Callable:
+	@property
+	def filepath(self) -> str:
 		"""
-		Binds a callback to the specified event ID
-		Can be used as a decorator
-		:param eid: The event ID, one of<br/>
-		 . . . . . 'write' - Called when an item is written to this stream<br/>
-		 . . . . . 'read' - Called when an item is read from this stream<br/>
-		 . . . . . 'peek' - called when an item is peeked from this stream<br/>
-		 . . . . . 'pipe' - Called when a stream is connected to this stream (Called once for every pipe to add)<br/>
-		 . . . . . 'del_pipe' - Called when a stream is disconnected to this stream (Called once for every pipe to remove)<br/>
-		 . . . . . 'flush' - Called when this stream is flushed<br/>
-		 . . . . . 'close' - Called when this stream is closed
-		:param callback: The callback to bind or None if a decorator
-		:param threadability: The threading to use, one of<br/>
-		. . . . . 0 - No Threading<br/>
-		. . . . . 1 - 'threading.Thread' threads<br/>
-		. . . . . 2 - 'multiprocessing.Process' processes
-		:return: The binder if used as a decorator otherwise None
-		:raises NameError: If the event ID is not valid
-		:raises AssertionError: If the supplied callback is not callable
+		:return: The filepath this stream points to
+		"""
+
+		return self.__filepath__
+
+	@property
+	def mapped(self) -> bool:
+		"""
+		:return: Whether this stream is memory-mapped
+		"""
+
+		return self.__view__ is not None
+
+
+class ListStream[T](Stream[T], typing.Iterable[T]):
+	"""
+	Basic FIFO stream using a deque for its internal buffer
+	"""
+
+	def __init__(self, max_length: int = -1):
+		"""
+		Basic FIFO stream using a deque for its internal buffer
+		- Constructor -
+		:param max_length: The maximum length (in number of items) of this stream or -1 to disable
+		:raises InvalidArgumentException: If max length is not an integer
+		:raises ValueError: If max length negative and not -1
+		"""
+
+		super().__init__()
+		self.__lock__: threading.RLock = threading.RLock()
+		self.__condition__: threading.Condition = threading.Condition(self.__lock__)
+		self.__async_waiters__: list[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+		self.__waiting__: int = 0
+		Misc.raise_ifn(isinstance(max_length, int), Exceptions.InvalidArgumentException(ListStream.__init__, 'max_length', type(max_length), (int,)))
+		Misc.raise_ifn((max_length := int(max_length)) > 0 or max_length == -1, ValueError('Max length cannot be less than 0'))
+		self.__buffer__: collections.deque[typing.Any] = collections.deque()
+		self.__max_len__: int = int(max_length)
+
+	def __len__(self) -> int:
+		"""
+		:return: The length of the internal buffer
+		"""
+
+		return len(self.__buffer__)
+
+	def __iter__(self) -> typing.Iterator[T]:
+		while not self.empty():
+			yield self.read(1)
+
+	def empty(self) -> bool:
+		"""
+		:return: Whether the underlying buffer is empty
+		"""
+
+		return len(self.__buffer__) == 0
+
+	def full(self) -> bool:
+		"""
+		:return: Whether the underlying buffer is full
+		"""
+
+		return len(self.__buffer__) == self.__max_len__
+
+	def __notify__(self) -> None:
+		"""
+		INTERNAL METHOD
+		Wakes all threads and coroutines waiting on this stream
+		"""
+
+		if self.__waiting__ == 0 and len(self.__async_waiters__) == 0:
+			return
+
+		with self.__lock__:
+			self.__condition__.notify_all()
+			waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = self.__async_waiters__
+			self.__async_waiters__ = []
+
+		for loop, future in waiters:
+			if not loop.is_closed():
+				loop.call_soon_threadsafe(lambda f=future: f.done() or f.set_result(None))
+
+	def __wait_until__(self, predicate: typing.Callable[[], bool], timeout: typing.Optional[float]) -> None:
+		"""
+		INTERNAL METHOD
+		Blocks until the predicate is satisfied
+		Must be called with this stream's condition held
+		:param predicate: The condition to wait for
+		:param timeout: The maximum number of seconds to wait, None to wait indefinitely, or ... to not wait
+		:raises StreamError: If this stream is closed while waiting
+		"""
+
+		if timeout is ...:
+			return
+
+		self.__waiting__ += 1
+		start: typing.Optional[float] = None if self.__metrics__ is None else time.perf_counter()
+
+		try:
+			self.__condition__.wait_for(lambda: not self.__state__ or predicate(), None if timeout is None else float(timeout))
+		finally:
+			self.__waiting__ -= 1
+
+			if start is not None and self.__metrics__ is not None:
+				self.__metrics__.record_blocked(time.perf_counter() - start)
+
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+
+	def __await_readable__(self, __size: typing.Optional[int], timeout: typing.Optional[float]) -> None:
+		"""
+		INTERNAL METHOD
+		Blocks until enough data is available to satisfy a read of '__size' items
+		Must be called with this stream's condition held
+		:param __size: The number of items to wait for or any if not supplied
+		:param timeout: The maximum number of seconds to wait, None to wait indefinitely, or ... to not wait
+		:raises StreamError: If this stream is closed while waiting
+		"""
+
+		needed: int = 1 if __size is ... or __size is None or int(__size) < 0 else int(__size)
+		self.__wait_until__(lambda: len(self) >= needed, timeout)
+
+	def __await_writable__(self, timeout: typing.Optional[float], reserve: int = 0) -> None:
+		"""
+		INTERNAL METHOD
+		Blocks until a write fits within this stream's max length
+		A write fits if the stream is not full once 'reserve' units ahead of its last item are written, matching item-by-item writes
+		Must be called with this stream's condition held
+		:param timeout: The maximum number of seconds to wait, None to wait indefinitely, or ... to not wait
+		:param reserve: The number of units written ahead of the write's last item
+		:raises StreamError: If this stream is closed while waiting
+		:raises StreamFullError: If the write does not fit once waiting ends or can never fit
+		"""
+
+		if self.__max_len__ < 0:
+			return
+		elif reserve >= self.__max_len__:
+			raise StreamFullError(f'Write does not fit within stream capacity of {self.__max_len__}')
+
+		self.__wait_until__(lambda: len(self) + reserve < self.__max_len__, timeout)
+
+		if len(self) + reserve >= self.__max_len__:
+			raise StreamFullError('Stream is full')
+
+	def __pop__(self, count: int, lifo: bool = False) -> tuple[T, ...]:
+		"""
+		INTERNAL METHOD
+		Removes up to 'count' items from the internal buffer and applies the reader stack
+		:param count: The maximum number of items to remove
+		:param lifo: Whether to remove items from the tail rather than the head
+		:return: The removed items in read order
+		"""
+
+		buffer: collections.deque[typing.Any] = self.__buffer__
+		count = min(count, len(buffer))
+
+		if count <= 0:
+			return ()
+		elif count == 1:
+			temp: tuple[typing.Any, ...] = (buffer.pop() if lifo else buffer.popleft(),)
+		elif count == len(buffer):
+			temp: tuple[typing.Any, ...] = tuple(reversed(buffer) if lifo else buffer)
+			buffer.clear()
+		else:
+			pop: typing.Callable[[], typing.Any] = buffer.pop if lifo else buffer.popleft
+			temp: tuple[typing.Any, ...] = tuple([pop() for _ in range(count)])
+
+		return temp if len(self.__buffer_reader__) == 0 else self.__apply_reader__(temp)
+
+	def __view__(self, count: int, lifo: bool = False) -> tuple[T, ...]:
+		"""
+		INTERNAL METHOD
+		Copies up to 'count' items from the internal buffer and applies the reader stack
+		:param count: The maximum number of items to copy
+		:param lifo: Whether to copy items from the tail rather than the head
+		:return: The copied items in read order
+		"""
+
+		temp: tuple[typing.Any, ...] = tuple(itertools.islice(reversed(self.__buffer__) if lifo else self.__buffer__, max(0, count)))
+		return self.__apply_reader__(temp)
+
+	def __apply_reader__(self, temp: tuple[typing.Any, ...]) -> tuple[T, ...]:
+		"""
+		INTERNAL METHOD
+		Applies the reader stack to each buffered item
+		If the stack contains batch callbacks, the whole chunk is transformed at once and results are not grouped per item
+		:param temp: The buffered items
+		:return: The resulting items
+		"""
+
+		if len(self.__buffer_reader__) == 0:
+			return temp
+
+		if self.__buffer_reader__.batched:
+			return tuple(self.__buffer_reader__.compile()(temp))
+
+		pipeline: typing.Callable[[typing.Any], typing.Sequence] = self.__buffer_reader__.compile_item()
+		return tuple((y := pipeline(x))[0 if len(y) == 1 else slice(None)] for x in temp)
+
+	def readinto(self, __buffer: io.IOBase | typing.IO | bytearray | list[T] | set[T]) -> int:
+		"""
+		Reads all contents from this stream into the specified buffer
+		:param __buffer: The buffer to write to
+		:return: The number of elements written
+		:raises StreamError: If this stream is closed or not readable
+		"""
+
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+		elif not self.readable():
+			raise StreamError('Stream is not readable')
+
+		count: int = 0
+
+		if isinstance(__buffer, io.IOBase) or hasattr(__buffer, 'write'):
+
+			try:
+				for data in self.read():
+					__buffer.write(data)
+			except StreamFullError:
+				pass
+
+		elif isinstance(__buffer, bytearray):
+
+			for data in self.read():
+				__buffer.append(data)
+
+		elif isinstance(__buffer, list):
+			__buffer.extend(self.read())
+
+		elif isinstance(__buffer, set):
+			__buffer.union(self.read())
+
+		else:
+			raise TypeError(f'Cannot \'readinto\' non-writable object \'{type(__buffer).__name__}\'')
+
+		return count
+
+	def close(self) -> None:
+		super().close()
+		self.__notify__()
+
+	def read(self, __size: typing.Optional[int] = ..., *, timeout: typing.Optional[float] = ...) -> tuple[T, ...] | T:
+		"""
+		Reads data from the internal queue
+		:param __size: If specified, reads this many items, otherwise reads all data
+		:param timeout: If specified, the maximum number of seconds to block until '__size' items (or any if '__size' is not specified) are available; None blocks indefinitely
+		:return: A tuple of read elements if more than one otherwise the single element
+		:raises StreamError: If this stream is closed or not readable
+		:raises StreamEmptyError: If the stream is empty
+		"""
+
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+		elif not self.readable():
+			raise StreamError('Stream is not readable')
+
+		with self.__lock__:
+			self.__await_readable__(__size, timeout)
+			count: int = len(self.__buffer__) if __size is ... or __size is None or int(__size) < 0 else int(__size)
+			result: tuple[typing.Any, ...] = self.__pop__(count)
+
+		self.__notify__()
+
+		if len(result) == 0:
+			raise StreamEmptyError('Stream is empty')
+
+		return result[0] if __size == 1 else result
+
+	def peek(self, __size: typing.Optional[int] = ...) -> tuple[T, ...] | T:
+		"""
+		Reads data from the internal queue without removing it
+		:param __size: f specified, reads this many items, otherwise reads all data
+		:return: A tuple of read elements if more than one otherwise the single element
+		:raises StreamError: If this stream is closed or not readable
+		"""
+
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+		elif not self.readable():
+			raise StreamError('Stream is not readable')
+
+		count: int = len(self.__buffer__) if __size is ... or __size is None or int(__size) < 0 else int(__size)
+		result: tuple[typing.Any, ...] = self.__view__(count)
+		return result[0] if __size == 1 else result
+
+	async def aread(self, __size: typing.Optional[int] = ..., *, timeout: typing.Optional[float] = None) -> tuple[T, ...] | T:
+		"""
+		Awaits until enough data is available then reads it, see 'ListStream::read'
+		:param __size: If specified, reads this many items, otherwise reads all data
+		:param timeout: The maximum number of seconds to wait for '__size' items (or any if '__size' is not specified) or None to wait indefinitely
+		:return: The read data
+		:raises StreamError: If this stream is closed or not readable
+		:raises StreamEmptyError: If the stream is empty once the timeout expires
+		"""
+
+		loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+		deadline: typing.Optional[float] = None if timeout is None or timeout is ... else loop.time() + float(timeout)
+		needed: int = 1 if __size is ... or __size is None or int(__size) < 0 else int(__size)
+
+		while True:
+			with self.__lock__:
+				if not self.__state__ or len(self) >= needed or (deadline is not None and loop.time() >= deadline):
+					return self.read(__size)
+
+				future: asyncio.Future = loop.create_future()
+				self.__async_waiters__.append((loop, future))
+
+			try:
+				await asyncio.wait_for(future, None if deadline is None else max(0.0, deadline - loop.time()))
+			except TimeoutError:
+				pass
+			finally:
+				with self.__lock__:
+					try:
+						self.__async_waiters__.remove((loop, future))
+					except ValueError:
+						pass
+
+	def write(self, __object: T, *, ignore_invalid: bool = False, timeout: typing.Optional[float] = ...) -> ListStream[T]:
+		"""
+		Writes an object to the internal queue
+		:param __object: The object to write
+		:param ignore_invalid: Whether to ignore closed or non-writable streams
+		:param timeout: If specified, the maximum number of seconds to block while this stream is full; None blocks indefinitely
+		:return: This instance
+		:raises StreamError: If this stream is closed or not writable
+		:raises StreamFullError: If this stream is full
+		"""
+
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+		elif not self.writable():
+			raise StreamError('Stream is not writable')
+
+		with self.__lock__:
+			self.__await_writable__(timeout)
+
+			self.__buffer__.extend(self.__writer_stack__(__object))
+
+		self.__notify__()
+		self.__auto_flush__(ignore_invalid)
+		return self
+
+	def writelines(self, __lines: typing.Iterable[T], *, ignore_invalid: bool = False, timeout: typing.Optional[float] = ...) -> ListStream[T]:
+		"""
+		Writes multiple objects to the internal queue in a single atomic write
+		:param __lines: The objects to write
+		:param ignore_invalid: Whether to ignore closed or non-writable streams
+		:param timeout: If specified, the maximum number of seconds to block while this stream is full; None blocks indefinitely
+		:return: This instance
+		:raises StreamError: If this stream is closed or not writable
+		:raises StreamFullError: If this stream is full or the whole batch does not fit; nothing is written in that case
+		"""
+
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+		elif not self.writable():
+			raise StreamError('Stream is not writable')
+
+		lines: tuple[typing.Any, ...] = tuple(__lines if len(self.__buffer_writer__) == 0 else self.__buffer_writer__.compile()(__lines))
+
+		if len(lines) == 0:
+			return self
+
+		with self.__lock__:
+			self.__await_writable__(timeout, len(lines) - 1)
+			self.__buffer__.extend(lines)
+
+		self.__notify__()
+		self.__auto_flush__(ignore_invalid)
+		return self
+
+	def writefrom(self, __buffer: typing.Iterable[T] | typing.IO | io.BufferedIOBase, __size: typing.Optional[int] = ..., *, ignore_invalid=False) -> ListStream[T]:
+		"""
+		Reads all contents from the specified buffer into this stream
+		:param __buffer: The buffer to read from
+		:param __size: The number of elements to write
+		:param ignore_invalid: Whether to ignore closed or non-writable streams
+		:return: This instance
+		:raises StreamError: If this stream is closed or not writable or '__buffer' is closed or not readable
+		:raises StreamFullError: If this stream becomes full
+		:raises TypeError: If '__buffer' is not a supported stream nor an iterable
+		"""
+
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+		elif not self.writable():
+			raise StreamError('Stream is not writable')
+
+		if isinstance(__buffer, (typing.IO, io.BufferedIOBase, io.IOBase)):
+			if __buffer.closed:
+				raise StreamError('Source buffer is closed')
+			elif not __buffer.readable():
+				raise StreamError('Source buffer is not readable')
+
+			try:
+				count: int = 0
+
+				while self.__max_len__ < 0 or len(self.__buffer__) < self.__max_len__:
+					count += 1
+					self.write(__buffer.read(1))
+					self.__auto_flush__(ignore_invalid)
+
+					if __size is not ... and __size is not None and count >= __size:
+						break
+			except StopIteration:
+				pass
+
+			return self
+
+		elif isinstance(__buffer, typing.Iterable):
+			iterator = iter(__buffer)
+
+			try:
+				while True:
+					if 0 <= self.__max_len__ <= len(self.__buffer__):
+						raise StreamFullError('Stream is full')
+
+					self.write(next(iterator))
+					self.__auto_flush__(ignore_invalid)
+			except StopIteration:
+				pass
+
+			return self
+
+		else:
+			raise TypeError('Source is neither a stream nor an iterable')
+
+	@property
+	def max_length(self) -> int:
+		"""
+		:return: This stream's max length or -1 if not bounded
+		"""
+
+		return self.__max_len__
+
+
+class OrderedStream[T](ListStream[T]):
+	"""
+	A stream allowing for LIFO capabilities
+	"""
+
+	def __init__(self, max_length: int = -1, fifo: bool = True):
+		"""
+		A stream allowing for LIFO capabilities
+		- Constructor -
+		:param max_length: The maximum length (in number of items) of this stream
+		:param fifo: Whether this stream is FIFO or LIFO
+		"""
+
+		super().__init__(max_length)
+		self.__fifo__: bool = bool(fifo)
+
+	def read(self, __size: typing.Optional[int] = ..., *, timeout: typing.Optional[float] = ...) -> tuple[T, ...] | T:
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+		elif not self.readable():
+			raise StreamError('Stream is not readable')
+
+		with self.__lock__:
+			self.__await_readable__(__size, timeout)
+			count: int = len(self.__buffer__) if __size is ... or __size is None or int(__size) < 0 else int(__size)
+			result: tuple[typing.Any, ...] = self.__pop__(count, not self.__fifo__)
+
+		self.__notify__()
+
+		if len(result) == 0:
+			raise StreamEmptyError('Stream is empty')
+
+		return result[0] if __size == 1 else result
+
+	def peek(self, __size: typing.Optional[int] = ...) -> tuple[T, ...] | T:
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+		elif not self.readable():
+			raise StreamError('Stream is not readable')
+
+		count: int = len(self.__buffer__) if __size is ... or __size is None or int(__size) < 0 else int(__size)
+		result: tuple[typing.Any, ...] = self.__view__(count, not self.__fifo__)
+		return result[0] if __size == 1 else result
+
+	@property
+	def is_fifo(self) -> bool:
+		"""
+		:return: Whether this stream is FIFO
+		"""
+
+		return self.__fifo__
+
+	@property
+	def is_lifo(self) -> bool:
+		"""
+		:return: Whether this stream is LIFO
+		"""
+
+		return not self.__fifo__
+
+
+class TypedStream[T](OrderedStream[T]):
+	"""
+	Stream limiting stored items to instances of specified types
+	"""
+
+	def __init__(self, cls: type | typing.Iterable[type], max_length: int = -1, fifo: bool = True):
+		"""
+		Stream limiting stored items to instances of specified types
+		- Constructor -
+		:param cls: The type(s) to allow
+		:param max_length: The maximum length (in number of items) of this stream
+		:param fifo: Whether this stream is FIFO or LIFO
+		:raises InvalidArgumentException: If any value in 'cls' is not a type
+		"""
+
+		super().__init__(max_length, fifo)
+		self.__cls__: tuple[type, ...] = tuple(cls) if isinstance(cls, typing.Iterable) else (cls,)
+		Misc.raise_ifn(all(type(c) is type for c in self.__cls__), Exceptions.InvalidArgumentException(TypedStream.__init__, 'cls', type(cls)))
+
+	def write(self, __object: T, *, ignore_invalid: bool = False, timeout: typing.Optional[float] = ...) -> TypedStream[T]:
+		"""
+		Writes an object to the internal queue
+		:param __object: The object to write
+		:param ignore_invalid: Whether to ignore closed or non-writable streams
+		:param timeout: If specified, the maximum number of seconds to block while this stream is full; None blocks indefinitely
+		:return: This instance
+		:raises StreamError: If this stream is closed or not writable
+		:raises StreamFullError: If this stream is full
+		:raises AssertionError: If the object is not an instance of a whitelisted type
+		"""
+
+		assert isinstance(__object, self.__cls__), f'Object of type  \'{type(__object)}\' does not match one of the specified type(s):\n  {"\n  ".join(str(c) for c in self.__cls__)}'
+		super().write(__object, ignore_invalid=ignore_invalid, timeout=timeout)
+		return self
+
+	def writelines(self, __lines: typing.Iterable[T], *, ignore_invalid: bool = False, timeout: typing.Optional[float] = ...) -> TypedStream[T]:
+		"""
+		Writes multiple objects to the internal queue in a single atomic write
+		:param __lines: The objects to write
+		:param ignore_invalid: Whether to ignore closed or non-writable streams
+		:param timeout: If specified, the maximum number of seconds to block while this stream is full; None blocks indefinitely
+		:return: This instance
+		:raises StreamError: If this stream is closed or not writable
+		:raises StreamFullError: If this stream is full
+		:raises AssertionError: If an object is not an instance of a whitelisted type
+		"""
+
+		lines: tuple[T, ...] = tuple(__lines)
+
+		for line in lines:
+			assert isinstance(line, self.__cls__), f'Object of type  \'{type(line)}\' does not match one of the specified type(s):\n  {"\n  ".join(str(c) for c in self.__cls__)}'
+
+		super().writelines(lines, ignore_invalid=ignore_invalid, timeout=timeout)
+		return self
+
+
+class ByteStream(TypedStream[bytes | bytearray], io.BytesIO):
+	"""
+	Stream designed for storing only byte-strings
+	Bytes are stored contiguously within a 'ByteRingBuffer' rather than as individual items
+	"""
+
+	@staticmethod
+	def __buffer_writer_cb__(__object: bytes | bytearray | int | str) -> tuple[bytes | bytearray | memoryview]:
+		"""
+		INTERNAL METHOD
+		Converts data to write into a bytes object
+		:param __object: The object being written
+		:return: The resulting bytes chunk
+		"""
+
+		if isinstance(__object, int):
+			byte_count: int = max(1, math.ceil((__object.bit_length()) / 8)) + (__object < 0)
+			return (__object.to_bytes(byte_count, sys.byteorder, signed=__object < 0),)
+		elif isinstance(__object, str):
+			return (__object.encode(),)
+		elif isinstance(__object, (bytes, bytearray, memoryview)):
+			return (__object,)
+		else:
+			return (bytes(__object),)
+
+	def __init__(self, max_length: int = -1, fifo: bool = True):
+		"""
+		Stream designed for storing only byte-strings
+		- Constructor -
+		:param max_length: The maximum length (in number of items) of this stream
+		:param fifo: Whether this stream is FIFO or LIFO
+		"""
+
+		super().__init__((bytes, bytearray, memoryview, int, str), max_length, fifo)
+		self.__buffer__: ByteRingBuffer = ByteRingBuffer()
+		self.__buffer_writer__.append(ByteStream.__buffer_writer_cb__)
+
+	def __take__(self, __size: typing.Optional[int], remove: bool) -> bytes:
+		"""
+		INTERNAL METHOD
+		Copies bytes from the head (FIFO) or tail (LIFO) of the internal buffer and applies the reader stack
+		:param __size: The number of bytes to take or all if not supplied
+		:param remove: Whether to remove the taken bytes from the internal buffer
+		:return: The resulting bytes
+		"""
+
+		count: int = len(self.__buffer__) if __size is ... or __size is None or int(__size) < 0 else int(__size)
+
+		if self.__fifo__:
+			data: bytes = self.__buffer__.pop_front(count) if remove else self.__buffer__.peek_front(count)
+		else:
+			data: bytes = (self.__buffer__.pop_back(count) if remove else self.__buffer__.peek_back(count))[::-1]
+
+		if len(self.__buffer_reader__) == 0 or len(data) == 0:
+			return data
+
+		return b''.join(x.to_bytes(1) if isinstance(x, int) else bytes(x) for x in self.__reader_stack__(data))
+
+	def write(self, __object: bytes | bytearray | memoryview | int | str, *, ignore_invalid: bool = False, timeout: typing.Optional[float] = ...) -> ByteStream:
+		"""
+		Writes an object to the internal buffer
+		:param __object: The object to write
+		:param ignore_invalid: Whether to ignore closed or non-writable streams
+		:param timeout: If specified, the maximum number of seconds to block while this stream is full; None blocks indefinitely
+		:return: This instance
+		:raises StreamError: If this stream is closed or not writable
+		:raises StreamFullError: If this stream is full
+		:raises AssertionError: If the object is not an instance of a whitelisted type
+		"""
+
+		return self.writelines((__object,), ignore_invalid=ignore_invalid, timeout=timeout)
+
+	def writelines(self, __lines: typing.Iterable[bytes | bytearray | memoryview | int | str], *, ignore_invalid: bool = False, timeout: typing.Optional[float] = ...) -> ByteStream:
+		"""
+		Writes multiple objects to the internal buffer as a single atomic write
+		:param __lines: The objects to write
+		:param ignore_invalid: Whether to ignore closed or non-writable streams
+		:param timeout: If specified, the maximum number of seconds to block while this stream is full; None blocks indefinitely
+		:return: This instance
+		:raises StreamError: If this stream is closed or not writable
+		:raises StreamFullError: If this stream is full or the whole batch does not fit; nothing is written in that case
+		:raises AssertionError: If an object is not an instance of a whitelisted type
+		"""
+
+		self.__write_batch__(__lines, None, ignore_invalid, timeout)
+		return self
+
+	def __write_batch__(self, __lines: typing.Iterable[bytes | bytearray | memoryview | int | str], reserve: typing.Optional[int], ignore_invalid: bool, timeout: typing.Optional[float]) -> None:
+		"""
+		INTERNAL METHOD
+		Writes multiple objects to the internal buffer as a single atomic write once the whole batch fits
+		:param __lines: The objects to write
+		:param reserve: The number of bytes written ahead of the batch's last logical item or None to treat each chunk as an item
+		:param ignore_invalid: Whether to ignore closed or non-writable streams
+		:param timeout: If specified, the maximum number of seconds to block while this stream is full; None blocks indefinitely
+		:raises StreamError: If this stream is closed or not writable
+		:raises StreamFullError: If the whole batch does not fit
+		:raises AssertionError: If an object is not an instance of a whitelisted type
+		"""
+
+		__lines = tuple(__lines)
+
+		for line in __lines:
+			assert isinstance(line, self.__cls__), f'Object of type  \'{type(line)}\' does not match one of the specified type(s):\n  {"\n  ".join(str(c) for c in self.__cls__)}'
+
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+		elif not self.writable():
+			raise StreamError('Stream is not writable')
+
+		chunks: tuple[bytes | bytearray | memoryview, ...] = tuple(chunk.to_bytes(1) if isinstance(chunk, int) else chunk for chunk in self.__buffer_writer__.compile()(__lines))
+
+		if len(chunks) == 0:
+			return
+
+		if reserve is None:
+			reserve = sum(chunk.nbytes if isinstance(chunk, memoryview) else len(chunk) for chunk in chunks[:-1])
+
+		with self.__lock__:
+			self.__await_writable__(timeout, reserve)
+
+			for chunk in chunks:
+				self.__buffer__.append(chunk)
+
+		self.__notify__()
+		self.__auto_flush__(ignore_invalid)
+
+	def writefrom(self, __buffer: typing.Iterable[bytes | bytearray | int | str] | typing.IO | io.BufferedIOBase, __size: typing.Optional[int] = ..., *, ignore_invalid=False) -> ByteStream:
+		"""
+		Reads all contents from the specified buffer into this stream
+		Stream sources are read with a single bulk read rather than byte by byte
+		:param __buffer: The buffer to read from
+		:param __size: The number of bytes to write
+		:param ignore_invalid: Whether to ignore closed or non-writable streams
+		:return: This instance
+		:raises StreamError: If this stream is closed or not writable or '__buffer' is closed or not readable
+		:raises StreamFullError: If this stream is full
+		:raises TypeError: If '__buffer' is not a supported stream nor an iterable
+		"""
+
+		if not isinstance(__buffer, (typing.IO, io.BufferedIOBase, io.IOBase)):
+			super().writefrom(__buffer, __size, ignore_invalid=ignore_invalid)
+			return self
+		elif not self.__state__:
+			raise StreamError('Stream is closed')
+		elif not self.writable():
+			raise StreamError('Stream is not writable')
+		elif __buffer.closed:
+			raise StreamError('Source buffer is closed')
+		elif not __buffer.readable():
+			raise StreamError('Source buffer is not readable')
+
+		try:
+			data: bytes | str = __buffer.read(-1 if __size is ... or __size is None else int(__size))
+		except StreamEmptyError:
+			return self
+
+		if len(data) > 0:
+			self.write(data, ignore_invalid=ignore_invalid)
+
+		return self
+
+	def read(self, __size: typing.Optional[int] = ..., *, timeout: typing.Optional[float] = ...) -> bytes:
+		"""
+		Reads data from the internal buffer
+		:param __size: If specified, reads this many bytes, otherwise reads all data
+		:param timeout: If specified, the maximum number of seconds to block until '__size' bytes (or any if '__size' is not specified) are available; None blocks indefinitely
+		:return: The read data as a single bytes object
+		:raises StreamError: If this stream is closed or not readable
+		:raises StreamEmptyError: If the stream is empty
+		"""
+
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+		elif not self.readable():
+			raise StreamError('Stream is not readable')
+
+		with self.__lock__:
+			self.__await_readable__(__size, timeout)
+			data: bytes = self.__take__(__size, True)
+
+		self.__notify__()
+
+		if len(data) == 0:
+			raise StreamEmptyError('Stream is empty')
+
+		return data
+
+	def peek(self, __size: typing.Optional[int] = ...) -> bytes:
+		"""
+		Reads data from the internal buffer without removing it
+		:param __size: If specified, reads this many bytes, otherwise reads all data
+		:return: The read data as a single bytes object
+		:raises StreamError: If this stream is closed or not readable
+		"""
+
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+		elif not self.readable():
+			raise StreamError('Stream is not readable')
+
+		return self.__take__(__size, False)
+
+	def peekview(self, __size: typing.Optional[int] = ...) -> memoryview:
+		"""
+		Reads data from the internal buffer without removing or copying it
+		The returned view is only guaranteed to be valid until the next write
+		For LIFO streams or streams with reader callbacks, the view wraps a copy of the data
+		:param __size: If specified, views this many bytes, otherwise views all data
+		:return: A read-only memoryview of the data
+		:raises StreamError: If this stream is closed or not readable
+		"""
+
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+		elif not self.readable():
+			raise StreamError('Stream is not readable')
+		elif not self.__fifo__ or len(self.__buffer_reader__) > 0:
+			return memoryview(self.__take__(__size, False))
+
+		return self.__buffer__.view(len(self.__buffer__) if __size is ... or __size is None or int(__size) < 0 else int(__size))
+
+
+class BitStream(TypedStream[bytes | bytearray | str | int | bool], io.BytesIO):
+	"""
+	Stream designed for storing individual bits
+	Bits are stored packed within a 'BitBuffer' rather than as individual items
+	"""
+
+	@staticmethod
+	def __buffer_writer_cb__(__object: bytes | bytearray | int | str | bool) -> tuple[tuple[int, int] | bytes | bytearray]:
+		"""
+		INTERNAL METHOD
+		Converts data to write into bits
+		:param __object: The object being written
+		:return: The resulting bits, either as a bytes object or as a tuple of an unsigned integer value and its bit count
+		"""
+
+		if isinstance(__object, bool):
+			return ((int(__object), 1),)
+		elif isinstance(__object, int):
+			bit_count: int = (__object := int(__object)).bit_length()
+			return ((__object & ((1 << bit_count) - 1), bit_count),)
+		elif isinstance(__object, str):
+			return (str(__object).encode(),)
+		elif isinstance(__object, (bytes, bytearray)):
+			return (__object,)
+		else:
+			raise TypeError()
+
+	@staticmethod
+	def __unpack__(value: int, count: int) -> tuple[bool, ...]:
+		"""
+		INTERNAL METHOD
+		Expands bits into individual booleans
+		:param value: The bits as an unsigned integer, first bit most significant
+		:param count: The number of bits
+		:return: The bits as booleans
+		"""
+
+		padding: int = -count % 8
+		packed: numpy.ndarray = numpy.frombuffer((value << padding).to_bytes((count + padding) // 8, 'big'), dtype=numpy.uint8)
+		return tuple(numpy.unpackbits(packed, count=count).astype(bool).tolist())
+
+	@staticmethod
+	def __pack__(value: int, count: int) -> bytes:
+		"""
+		INTERNAL METHOD
+		Packs bits into bytes; trailing bits not filling a full byte are packed right-aligned into the final byte
+		:param value: The bits as an unsigned integer, first bit most significant
+		:param count: The number of bits
+		:return: The packed bytes
+		"""
+
+		remainder: int = count % 8
+		packed: bytes = (value >> remainder).to_bytes(count // 8, 'big')
+		return packed + (value & ((1 << remainder) - 1)).to_bytes(1) if remainder > 0 else packed
+
+	def __init__(self, max_length: int = -1, fifo: bool = True, pack: bool = True):
+		"""
+		Stream designed for storing individual bits
+		- Constructor -
+		:param max_length: The maximum length (in number of bits) of this stream
+		:param fifo: Whether this stream is FIFO or LIFO
+		:param pack: Whether to read bits packed into bytes or read individual bits
+		"""
+
+		super().__init__((bool, int, bytes, bytearray, str), max_length, fifo)
+		self.__buffer__: BitBuffer = BitBuffer()
+		self.__buffer_writer__.append(BitStream.__buffer_writer_cb__)
+		self.__packed__: bool = bool(pack)
+
+	def __append__(self, chunks: typing.Iterable[tuple[int, int] | bytes | bytearray | bool], ignore_invalid: bool, timeout: typing.Optional[float], atomic: bool = False) -> None:
+		"""
+		INTERNAL METHOD
+		Appends converted bit chunks to the internal buffer once they all fit
+		:param chunks: The chunks produced by the writer stack
+		:param ignore_invalid: Whether to ignore closed or non-writable streams
+		:param timeout: If specified, the maximum number of seconds to block while this stream is full; None blocks indefinitely
+		:param atomic: Whether the chunks form a single logical item rather than one item per chunk
+		:raises StreamError: If this stream is closed or not writable
+		:raises StreamFullError: If the chunks do not fit; nothing is written in that case
+		"""
+
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+		elif not self.writable():
+			raise StreamError('Stream is not writable')
+
+		chunks = tuple(chunks)
+
+		if len(chunks) == 0:
+			return
+
+		reserve: int = 0 if atomic else sum(chunk[1] if isinstance(chunk, tuple) else len(chunk) * 8 if isinstance(chunk, (bytes, bytearray, memoryview)) else 1 for chunk in chunks[:-1])
+
+		with self.__lock__:
+			self.__await_writable__(timeout, reserve)
+
+			for chunk in chunks:
+				if isinstance(chunk, tuple):
+					self.__buffer__.append(*chunk)
+				elif isinstance(chunk, (bytes, bytearray, memoryview)):
+					self.__buffer__.append_bytes(chunk)
+				else:
+					self.__buffer__.append(int(bool(chunk)), 1)
+
+		self.__notify__()
+		self.__auto_flush__(ignore_invalid)
+
+	def __take__(self, __size: typing.Optional[int], remove: bool) -> bytes | bool | tuple[bool, ...]:
+		"""
+		INTERNAL METHOD
+		Copies bits from the head (FIFO) or tail (LIFO) of the internal buffer and formats them
+		:param __size: The number of bits to take or all if not supplied
+		:param remove: Whether to remove the taken bits from the internal buffer
+		:return: The packed bytes or the individual bits
+		"""
+
+		size: int = len(self.__buffer__) if __size is ... or __size is None or int(__size) < 0 else int(__size)
+
+		if self.__fifo__:
+			value, count = self.__buffer__.pop_front(size) if remove else self.__buffer__.peek_front(size)
+		else:
+			value, count = self.__buffer__.pop_back(size) if remove else self.__buffer__.peek_back(size)
+			value = int(f'{value:0{count}b}'[::-1], 2) if count > 0 else 0
+
+		if count == 0:
+			return b'' if self.__packed__ else ()
+		elif self.__packed__:
+			result: bytes | tuple[bool, ...] = BitStream.__pack__(value, count)
+		else:
+			result: bytes | tuple[bool, ...] = BitStream.__unpack__(value, count)
+
+		if len(self.__buffer_reader__) > 0:
+			result = tuple(self.__reader_stack__(result))
+			result = result[0] if len(result) == 1 else result
+
+		return result[0] if not self.__packed__ and __size == 1 else result
+
+	def write(self, __object: bytes | bytearray | int | str | bool, *, ignore_invalid: bool = False, timeout: typing.Optional[float] = ...) -> BitStream:
+		"""
+		Writes an object to the internal buffer
+		:param __object: The bit or bytes to write
+		:param ignore_invalid: Whether to ignore closed or non-writable streams
+		:param timeout: If specified, the maximum number of seconds to block while this stream is full; None blocks indefinitely
+		:return: This instance
+		:raises StreamError: If this stream is closed or not writable
+		:raises StreamFullError: If this stream is full
+		:raises AssertionError: If the object is not an instance of a whitelisted type
+		"""
+
+		assert isinstance(__object, self.__cls__), f'Object of type  \'{type(__object)}\' does not match one of the specified type(s):\n  {"\n  ".join(str(c) for c in self.__cls__)}'
+		self.__append__(self.__writer_stack__(__object), ignore_invalid, timeout, True)
+		return self
+
+	def writelines(self, __lines: typing.Iterable[bytes | bytearray | int | str | bool], *, ignore_invalid: bool = False, timeout: typing.Optional[float] = ...) -> BitStream:
+		"""
+		Writes multiple objects to the internal buffer in a single atomic write
+		:param __lines: The bits or bytes to write
+		:param ignore_invalid: Whether to ignore closed or non-writable streams
+		:param timeout: If specified, the maximum number of seconds to block while this stream is full; None blocks indefinitely
+		:return: This instance
+		:raises StreamError: If this stream is closed or not writable
+		:raises StreamFullError: If this stream is full
+		:raises AssertionError: If an object is not an instance of a whitelisted type
+		"""
+
+		lines: tuple = tuple(__lines)
+
+		for line in lines:
+			assert isinstance(line, self.__cls__), f'Object of type  \'{type(line)}\' does not match one of the specified type(s):\n  {"\n  ".join(str(c) for c in self.__cls__)}'
+
+		self.__append__(self.__buffer_writer__.compile()(lines), ignore_invalid, timeout)
+		return self
+
+	def write_padded(self, data: bytes | bytearray | int | str | bool, size: int, pad_bit: bool = False) -> BitStream:
+		"""
+		Writes an object to the internal queue
+		:param data: The bit or bytes to write
+		:param size: The number of leading bits to pad
+		:param pad_bit: The bit to pad with
+		:return: This instance
+		:raises StreamError: If this stream is closed or not writable
+		:raises StreamFullError: If this stream is full
+		:raises AssertionError: If the object is not an instance of a whitelisted type
+		:raises ValueError: If the number of bits in 'data' exceeds 'size'
+		"""
+
+		assert isinstance(data, self.__cls__), f'Object of type  \'{type(data)}\' does not match one of the specified type(s):\n  {"\n  ".join(str(c) for c in self.__cls__)}'
+		value: int = 0
+		count: int = 0
+
+		for chunk in BitStream.__buffer_writer_cb__(data):
+			chunk_value, chunk_count = chunk if isinstance(chunk, tuple) else (int.from_bytes(chunk, 'big'), len(chunk) * 8)
+			value = (value << chunk_count) | chunk_value
+			count += chunk_count
+
+		if count > size:
+			raise ValueError('Object bit length exceeded size')
+		elif pad_bit:
+			value |= ((1 << (size - count)) - 1) << count
+
+		self.__append__(((value, size),), False, ..., True)
+		return self
+
+	def read(self, __size: typing.Optional[int] = ..., *, timeout: typing.Optional[float] = ...) -> bytes | bool | tuple[bool, ...]:
+		"""
+		Reads data from the internal buffer
+		:param __size: If specified, reads this many bits, otherwise reads all data
+		:param timeout: If specified, the maximum number of seconds to block until '__size' bits (or any if '__size' is not specified) are available; None blocks indefinitely
+		:return: The read bits as a single bytes object if packing, otherwise the individual bits
+		:raises StreamError: If this stream is closed or not readable
+		:raises StreamEmptyError: If the stream is empty
+		"""
+
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+		elif not self.readable():
+			raise StreamError('Stream is not readable')
+
+		with self.__lock__:
+			self.__await_readable__(__size, timeout)
+
+			if self.empty() or __size == 0:
+				raise StreamEmptyError('Stream is empty')
+
+			data: bytes | bool | tuple[bool, ...] = self.__take__(__size, True)
+
+		self.__notify__()
+		return data
+
+	def peek(self, __size: typing.Optional[int] = ...) -> bytes | bool | tuple[bool, ...]:
+		"""
+		Reads data from the internal buffer without removing it
+		:param __size: If specified, reads this many bits, otherwise reads all data
+		:return: The read bits as a single bytes object if packing, otherwise the individual bits
+		:raises StreamError: If this stream is closed or not readable
+		"""
+
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+		elif not self.readable():
+			raise StreamError('Stream is not readable')
+
+		return self.__take__(__size, False)
+
+
+class StringStream(OrderedStream[str]):
+	"""
+	Stream designed for storing only strings
+	Text is stored as whole chunks within a 'StringBuffer' rather than as individual characters
+	"""
+
+	@staticmethod
+	def __buffer_writer_cb__(__object: typing.Any) -> tuple[str]:
+		"""
+		INTERNAL METHOD
+		Converts data to write into a string chunk
+		:param __object: The object being written
+		:return: The resulting string chunk
+		"""
+
+		return (__object if isinstance(__object, str) else str(__object),)
+
+	def __init__(self, max_length: int = -1, fifo: bool = True):
+		"""
+		Stream designed for storing only strings
+		- Constructor -
+		:param max_length: The maximum length (in number of characters) of this stream
+		:param fifo: Whether this stream is FIFO or LIFO
+		"""
+
+		super().__init__(max_length, fifo)
+		self.__buffer__: StringBuffer = StringBuffer()
+		self.__buffer_writer__.append(StringStream.__buffer_writer_cb__)
+
+	def __take__(self, __size: typing.Optional[int], remove: bool) -> str:
+		"""
+		INTERNAL METHOD
+		Copies characters from the head (FIFO) or tail (LIFO) of the internal buffer and applies the reader stack
+		:param __size: The number of characters to take or all if not supplied
+		:param remove: Whether to remove the taken characters from the internal buffer
+		:return: The resulting string
+		"""
+
+		count: int = len(self.__buffer__) if __size is ... or __size is None or int(__size) < 0 else int(__size)
+
+		if self.__fifo__:
+			data: str = self.__buffer__.pop_front(count) if remove else self.__buffer__.peek_front(count)
+		else:
+			data: str = (self.__buffer__.pop_back(count) if remove else self.__buffer__.peek_back(count))[::-1]
+
+		if len(self.__buffer_reader__) == 0 or len(data) == 0:
+			return data
+
+		return ''.join(str(x) for x in self.__reader_stack__(data))
+
+	def __line_length__(self, __size: typing.Optional[int]) -> int:
+		"""
+		INTERNAL METHOD
+		Finds the length of the next line including its line terminator
+		Must be called with this stream's lock held
+		:param __size: The maximum line length or all if not supplied
+		:return: The number of characters in the next line, or all remaining characters if no line terminator is buffered
+		"""
+
+		limit: int = len(self.__buffer__) if __size is ... or __size is None or int(__size) < 0 else min(len(self.__buffer__), int(__size))
+
+		if self.__fifo__:
+			index: int = self.__buffer__.find('\n')
+		else:
+			index: int = self.__buffer__.peek_back(len(self.__buffer__))[::-1].find('\n')
+
+		return limit if index < 0 else min(limit, index + 1)
+
+	def write(self, __object: typing.Any, *, ignore_invalid: bool = False, timeout: typing.Optional[float] = ...) -> StringStream:
+		"""
+		Writes an object to the internal buffer as a single string chunk
+		:param __object: The object to write; non-string objects are converted with 'str'
+		:param ignore_invalid: Whether to ignore closed or non-writable streams
+		:param timeout: If specified, the maximum number of seconds to block while this stream is full; None blocks indefinitely
+		:return: This instance
+		:raises StreamError: If this stream is closed or not writable
+		:raises StreamFullError: If this stream is full
+		"""
+
+		return self.writelines((__object,), ignore_invalid=ignore_invalid, timeout=timeout)
+
+	def writelines(self, __lines: typing.Iterable[typing.Any], *, ignore_invalid: bool = False, timeout: typing.Optional[float] = ...) -> StringStream:
+		"""
+		Writes multiple objects to the internal buffer as a single atomic write
+		:param __lines: The objects to write; non-string objects are converted with 'str'
+		:param ignore_invalid: Whether to ignore closed or non-writable streams
+		:param timeout: If specified, the maximum number of seconds to block while this stream is full; None blocks indefinitely
+		:return: This instance
+		:raises StreamError: If this stream is closed or not writable
+		:raises StreamFullError: If this stream is full or the whole batch does not fit; nothing is written in that case
+		"""
+
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+		elif not self.writable():
+			raise StreamError('Stream is not writable')
+
+		chunks: tuple[str, ...] = tuple(chunk if isinstance(chunk, str) else str(chunk) for chunk in self.__buffer_writer__.compile()(__lines))
+
+		if len(chunks) == 0:
+			return self
+
+		with self.__lock__:
+			self.__await_writable__(timeout, sum(len(chunk) for chunk in chunks[:-1]))
+
+			for chunk in chunks:
+				self.__buffer__.append(chunk)
+
+		self.__notify__()
+		self.__auto_flush__(ignore_invalid)
+		return self
+
+	def writefrom(self, __buffer: typing.Iterable[typing.Any] | typing.IO | io.IOBase, __size: typing.Optional[int] = ..., *, ignore_invalid=False) -> StringStream:
+		"""
+		Reads all contents from the specified buffer into this stream
+		Stream sources are read with a single bulk read rather than character by character
+		:param __buffer: The buffer to read from
+		:param __size: The number of characters to write
+		:param ignore_invalid: Whether to ignore closed or non-writable streams
+		:return: This instance
+		:raises StreamError: If this stream is closed or not writable or '__buffer' is closed or not readable
+		:raises StreamFullError: If this stream is full
+		:raises TypeError: If '__buffer' is not a supported stream nor an iterable
+		"""
+
+		if not isinstance(__buffer, (typing.IO, io.BufferedIOBase, io.IOBase)):
+			super().writefrom(__buffer, __size, ignore_invalid=ignore_invalid)
+			return self
+		elif not self.__state__:
+			raise StreamError('Stream is closed')
+		elif not self.writable():
+			raise StreamError('Stream is not writable')
+		elif __buffer.closed:
+			raise StreamError('Source buffer is closed')
+		elif not __buffer.readable():
+			raise StreamError('Source buffer is not readable')
+
+		try:
+			data: str | bytes = __buffer.read(-1 if __size is ... or __size is None else int(__size))
+		except StreamEmptyError:
+			return self
+
+		if len(data) > 0:
+			self.write(data.decode() if isinstance(data, (bytes, bytearray)) else data, ignore_invalid=ignore_invalid)
+
+		return self
+
+	def read(self, __size: typing.Optional[int] = ..., *, timeout: typing.Optional[float] = ...) -> str:
+		"""
+		Reads data from the internal buffer
+		:param __size: If specified, reads this many characters, otherwise reads all data
+		:param timeout: If specified, the maximum number of seconds to block until '__size' characters (or any if '__size' is not specified) are available; None blocks indefinitely
+		:return: The read data as a single string
+		:raises StreamError: If this stream is closed or not readable
+		:raises StreamEmptyError: If the stream is empty
+		"""
+
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+		elif not self.readable():
+			raise StreamError('Stream is not readable')
+
+		with self.__lock__:
+			self.__await_readable__(__size, timeout)
+			data: str = self.__take__(__size, True)
+
+		self.__notify__()
+
+		if len(data) == 0:
+			raise StreamEmptyError('Stream is empty')
+
+		return data
+
+	def peek(self, __size: typing.Optional[int] = ...) -> str:
+		"""
+		Reads data from the internal buffer without removing it
+		:param __size: If specified, reads this many characters, otherwise reads all data
+		:return: The read data as a single string
+		:raises StreamError: If this stream is closed or not readable
+		"""
+
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+		elif not self.readable():
+			raise StreamError('Stream is not readable')
+
+		with self.__lock__:
+			return self.__take__(__size, False)
+
+	def readline(self, __size: typing.Optional[int] = ..., *, timeout: typing.Optional[float] = ...) -> str:
+		"""
+		Reads one line from the internal buffer, including its line terminator, reading at most '__size' characters if supplied
+		For LIFO streams, lines are read in reverse order and finding the line terminator is linear in the buffer length
+		:param __size: The maximum number of characters to read or all until the line terminator if not supplied
+		:param timeout: If specified, the maximum number of seconds to block until a complete line (or '__size' characters) is available; None blocks indefinitely
+		:return: The read line, or all remaining data if no line terminator is buffered
+		:raises StreamError: If this stream is closed or not readable
+		:raises StreamEmptyError: If the stream is empty
+		"""
+
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+		elif not self.readable():
+			raise StreamError('Stream is not readable')
+
+		limit: int = -1 if __size is ... or __size is None else int(__size)
+
+		with self.__lock__:
+			self.__wait_until__(lambda: (0 <= limit <= len(self.__buffer__)) or (self.__buffer__.find('\n') >= 0 if self.__fifo__ else '\n' in str(self.__buffer__)), timeout)
+			data: str = self.__take__(self.__line_length__(__size), True)
+
+		self.__notify__()
+
+		if len(data) == 0:
+			raise StreamEmptyError('Stream is empty')
+
+		return data
+
+	def peekline(self, __size: typing.Optional[int] = ...) -> str:
+		"""
+		Reads one line from the internal buffer without removing it, reading at most '__size' characters if supplied
+		:param __size: The maximum number of characters to read or all until the line terminator if not supplied
+		:return: The line, or all remaining data if no line terminator is buffered
+		:raises StreamError: If this stream is closed or not readable
+		"""
+
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+		elif not self.readable():
+			raise StreamError('Stream is not readable')
+
+		with self.__lock__:
+			return self.__take__(self.__line_length__(__size), False)
+
+
+class FrameStream(ByteStream):
+	"""
+	Stream splitting byte data into length-delimited frames
+	Each frame is laid out as: sync marker, unsigned LEB128 varint payload length, payload, then an optional big-endian CRC32 of the payload
+	Corrupted frames are detected by a missing sync marker, an oversized length, or a checksum mismatch, after which the stream resynchronizes on the next sync marker
+	"""
+
+	def __init__(self, max_length: int = -1, *, checksum: bool = True, sync: bytes = b'\xA5\x5A', max_frame_size: int = 1 << 22, encoder: typing.Optional[typing.Callable[[typing.Any], bytes]] = None, decoder: typing.Optional[typing.Callable[[bytes], typing.Any]] = None, on_error: typing.Literal['skip', 'throw'] = 'skip'):
+		"""
+		Stream splitting byte data into length-delimited frames
+		- Constructor -
+		:param max_length: The maximum length (in number of bytes) of this stream
+		:param checksum: Whether to append and verify a CRC32 for every frame
+		:param sync: The marker written before every frame; used to resynchronize after corruption
+		:param max_frame_size: The largest accepted payload size in bytes (4 MiB by default) or -1 to disable; larger lengths are treated as corruption so resync can skip a damaged length
+		:param encoder: An optional serializer converting written objects into payload bytes
+		:param decoder: An optional deserializer converting payload bytes into read objects
+		:param on_error: How to handle corrupted frames<br/>
+		 . . . . . 'skip' - The frame is dropped and counted in 'FrameStream::dropped_frames'<br/>
+		 . . . . . 'throw' - Corrupted data is dropped and a StreamError is raised; frames read before the corruption are returned first
+		:raises InvalidArgumentException: If 'sync' is not a bytes object or 'max_frame_size' is not an integer
+		:raises ValueError: If 'sync' is empty or 'on_error' is invalid
+		:raises InvalidArgumentException: If 'encoder' or 'decoder' is not callable
+		"""
+
+		super().__init__(max_length, True)
+		Misc.raise_ifn(isinstance(sync, (bytes, bytearray)), Exceptions.InvalidArgumentException(FrameStream.__init__, 'sync', type(sync), (bytes, bytearray)))
+		Misc.raise_ifn(len(sync) > 0, ValueError('Sync marker cannot be empty'))
+		Misc.raise_ifn(isinstance(max_frame_size, int), Exceptions.InvalidArgumentException(FrameStream.__init__, 'max_frame_size', type(max_frame_size), (int,)))
+		Misc.raise_ifn(encoder is None or callable(encoder), Exceptions.InvalidArgumentException(FrameStream.__init__, 'encoder', type(encoder)))
+		Misc.raise_ifn(decoder is None or callable(decoder), Exceptions.InvalidArgumentException(FrameStream.__init__, 'decoder', type(decoder)))
+		Misc.raise_ifn(on_error == 'skip' or on_error == 'throw', ValueError('On Error must be either \'skip\' or \'throw\''))
+		self.__checksum__: bool = bool(checksum)
+		self.__sync__: bytes = bytes(sync)
+		self.__max_frame_size__: int = int(max_frame_size)
+		self.__encoder__: typing.Optional[typing.Callable[[typing.Any], bytes]] = encoder
+		self.__decoder__: typing.Optional[typing.Callable[[bytes], typing.Any]] = decoder
+		self.__on_error__: str = str(on_error)
+		self.__dropped_frames__: int = 0
+		self.__dropped_bytes__: int = 0
+
+	@staticmethod
+	def encode_varint(value: int) -> bytes:
+		"""
+		Encodes an unsigned integer as a LEB128 varint
+		:param value: The value to encode
+		:return: The encoded bytes
+		:raises ValueError: If 'value' is negative
+		"""
+
+		Misc.raise_ifn(value >= 0, ValueError('Varint value cannot be negative'))
+		encoded: bytearray = bytearray()
+
+		while value > 0x7F:
+			encoded.append((value & 0x7F) | 0x80)
+			value >>= 7
+
+		encoded.append(value)
+		return bytes(encoded)
+
+	@staticmethod
+	def decode_varint(data: bytes | bytearray | memoryview, offset: int = 0) -> tuple[int, int]:
+		"""
+		Decodes a LEB128 varint
+		:param data: The bytes to decode from
+		:param offset: The position of the varint within 'data'
+		:return: A tuple containing the decoded value and the position following the varint, or (-1, -1) if 'data' ends before the varint does
+		:raises ValueError: If the varint exceeds 10 bytes
+		"""
+
+		value: int = 0
+		shift: int = 0
+
+		for position in range(offset, min(len(data), offset + 10)):
+			byte: int = data[position]
+			value |= (byte & 0x7F) << shift
+
+			if byte < 0x80:
+				return value, position + 1
+
+			shift += 7
+
+		if len(data) >= offset + 10:
+			raise ValueError('Varint exceeds 10 bytes')
+
+		return -1, -1
+
+	def __scan__(self, limit: int, consume: bool) -> tuple[list[bytes], bool]:
+		"""
+		INTERNAL METHOD
+		Parses complete frames from the head of the internal buffer
+		Must be called with this stream's lock held
+		:param limit: The maximum number of frames to parse or -1 for all
+		:param consume: Whether to remove parsed and corrupted data from the internal buffer
+		:return: A tuple containing the parsed payloads and whether corruption was encountered
+		"""
+
+		sync: bytes = self.__sync__
+		sync_length: int = len(sync)
+		view: memoryview = self.__buffer__.view(len(self.__buffer__))
+		available: int = len(view)
+		payloads: list[bytes] = []
+		position: int = 0
+		corrupted: bool = False
+
+		try:
+			while (limit < 0 or len(payloads) < limit) and available - position >= sync_length:
+				valid: bool = view[position:position + sync_length] == sync
+
+				if valid and position + sync_length < available and view[position + sync_length] < 0x80:
+					length, start = view[position + sync_length], position + sync_length + 1
+				elif valid:
+					try:
+						length, start = FrameStream.decode_varint(view, position + sync_length)
+					except ValueError:
+						length, start, valid = 0, 0, False
+
+				if valid and start < 0:
+					break
+
+				valid = valid and (self.__max_frame_size__ < 0 or length <= self.__max_frame_size__)
+				end: int = start + length + (4 * self.__checksum__) if valid else 0
+
+				if valid and end > available:
+					break
+				elif valid and self.__checksum__:
+					valid = zlib.crc32(view[start:start + length]) == int.from_bytes(view[start + length:end], 'big')
+
+				if valid:
+					payloads.append(bytes(view[start:start + length]))
+					position = end
+					continue
+
+				corrupted = True
+
+				if not consume or (self.__on_error__ == 'throw' and len(payloads) > 0):
+					break
+
+				resync: int = self.__buffer__.find(sync, position + 1)
+				resync = max(position + 1, available - sync_length + 1) if resync < 0 else resync
+				self.__dropped_frames__ += 1
+				self.__dropped_bytes__ += resync - position
+				position = resync
+
+				if self.__on_error__ == 'throw':
+					break
+		finally:
+			view.release()
+
+			if consume:
+				self.__buffer__.discard(position)
+
+		return payloads, corrupted
+
+	def __ready__(self) -> bool:
+		"""
+		INTERNAL METHOD
+		Checks whether a read can complete, first dropping corrupted data at the head of the internal buffer if 'on_error' is 'skip'
+		Must be called with this stream's lock held
+		:return: Whether a complete frame is available, or whether the head is corrupted if 'on_error' is 'throw'
+		"""
+
+		while True:
+			payloads, corrupted = self.__scan__(1, False)
+
+			if len(payloads) > 0 or not corrupted:
+				return len(payloads) > 0
+			elif self.__on_error__ == 'throw':
+				return True
+
+			available: int = len(self.__buffer__)
+			resync: int = self.__buffer__.find(self.__sync__, 1)
+			resync = max(1, available - len(self.__sync__) + 1) if resync < 0 else resync
+			self.__dropped_frames__ += 1
+			self.__dropped_bytes__ += resync
+			self.__buffer__.discard(resync)
+
+	def writelines(self, __lines: typing.Iterable[typing.Any], *, ignore_invalid: bool = False, timeout: typing.Optional[float] = ...) -> FrameStream:
+		"""
+		Writes each object as its own frame in a single atomic write
+		:param __lines: The payloads to write, or objects to encode if this stream has an encoder
+		:param ignore_invalid: Whether to ignore closed or non-writable streams
+		:param timeout: If specified, the maximum number of seconds to block while this stream is full; None blocks indefinitely
+		:return: This instance
+		:raises StreamError: If this stream is closed or not writable
+		:raises StreamFullError: If this stream is full
+		:raises ValueError: If a payload exceeds this stream's max frame size
+		"""
+
+		frames: bytearray = bytearray()
+		sync: bytes = self.__sync__
+
+		for line in __lines:
+			payload: bytes | bytearray | memoryview = self.__encoder__(line) if self.__encoder__ is not None else ByteStream.__buffer_writer_cb__(line)[0]
+			length: int = payload.nbytes if isinstance(payload, memoryview) else len(payload)
+			Misc.raise_if(0 <= self.__max_frame_size__ < length, ValueError(f'Payload of {length} bytes exceeds max frame size'))
+			frames += sync
+			frames += FrameStream.encode_varint(length) if length > 0x7F else length.to_bytes(1)
+			frames += payload
+
+			if self.__checksum__:
+				frames += zlib.crc32(payload).to_bytes(4, 'big')
+
+		super().writelines((frames,), ignore_invalid=ignore_invalid, timeout=timeout)
+		return self
+
+	def read(self, __size: typing.Optional[int] = ..., *, timeout: typing.Optional[float] = ...) -> typing.Any | tuple[typing.Any, ...]:
+		"""
+		Reads complete frames from the internal buffer in a single pass
+		:param __size: If specified, reads at most this many frames, otherwise reads all complete frames
+		:param timeout: If specified, the maximum number of seconds to block until a complete frame is available; None blocks indefinitely
+		:return: The frame payload (or decoded object) if '__size' is 1, otherwise a tuple of payloads
+		:raises StreamError: If this stream is closed or not readable or a corrupted frame is found and 'on_error' is 'throw'
+		:raises StreamEmptyError: If the stream contains no complete frames
+		"""
+
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+		elif not self.readable():
+			raise StreamError('Stream is not readable')
+
+		limit: int = -1 if __size is ... or __size is None or int(__size) < 0 else int(__size)
+
+		with self.__lock__:
+			self.__wait_until__(self.__ready__, timeout)
+			payloads, corrupted = self.__scan__(limit, True)
+
+		self.__notify__()
+
+		if corrupted and len(payloads) == 0 and self.__on_error__ == 'throw':
+			raise StreamError('Corrupted frame')
+		elif len(payloads) == 0:
+			raise StreamEmptyError('Stream is empty')
+
+		results: tuple[typing.Any, ...] = tuple(payloads) if self.__decoder__ is None else tuple(self.__decoder__(payload) for payload in payloads)
+		return results[0] if __size == 1 else results
+
+	def peek(self, __size: typing.Optional[int] = ...) -> typing.Any | tuple[typing.Any, ...]:
+		"""
+		Reads complete frames from the internal buffer without removing them; parsing stops at the first corrupted frame
+		If 'on_error' is 'skip', corrupted data at the head of the internal buffer is dropped first, as 'FrameStream::read' would
+		:param __size: If specified, reads at most this many frames, otherwise reads all complete frames
+		:return: The frame payload (or decoded object) if '__size' is 1, otherwise a tuple of payloads
+		:raises StreamError: If this stream is closed or not readable
+		"""
+
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+		elif not self.readable():
+			raise StreamError('Stream is not readable')
+
+		with self.__lock__:
+			dropped: int = self.__dropped_bytes__
+
+			if self.__on_error__ == 'skip':
+				self.__ready__()
+
+			payloads: list[bytes] = self.__scan__(-1 if __size is ... or __size is None or int(__size) < 0 else int(__size), False)[0]
+
+		if self.__dropped_bytes__ != dropped:
+			self.__notify__()
+
+		results: tuple[typing.Any, ...] = tuple(payloads) if self.__decoder__ is None else tuple(self.__decoder__(payload) for payload in payloads)
+		return (results[0] if len(results) > 0 else None) if __size == 1 else results
+
+	@property
+	def dropped_frames(self) -> int:
+		"""
+		:return: The number of corrupted frames dropped while resynchronizing
+		"""
+
+		return self.__dropped_frames__
+
+	@property
+	def dropped_bytes(self) -> int:
+		"""
+		:return: The number of bytes dropped while resynchronizing
+		"""
+
+		return self.__dropped_bytes__
+
+
+class CompressorStream(ByteStream):
+	"""
+	Base class for streams incrementally compressing arbitrary byte-strings
+	Written data is compressed by a single compressor so that successive reads form one continuous compressed stream
+	"""
+
+	FLUSH_MODES: tuple[str, ...] = ('none', 'finish')
+
+	def __init__(self, max_length: int = -1, fifo: bool = True, flush: str = 'finish'):
+		"""
+		Base class for streams incrementally compressing arbitrary byte-strings
+		- Constructor -
+		:param max_length: The maximum length (in number of items) of this stream
+		:param fifo: Whether this stream is FIFO or LIFO
+		:param flush: The default flush mode applied after each read, one of this class's 'FLUSH_MODES'<br/>
+		 . . . . . 'none' - Output is only produced once the compressor's internal buffer fills<br/>
+		 . . . . . 'sync' - All pending output is produced and aligned to a byte boundary<br/>
+		 . . . . . 'full' - As 'sync', but the compression state is reset so decompression can restart from this point<br/>
+		 . . . . . 'finish' - The compressed stream is terminated; the next read begins a new compressed stream
+		:raises TypeError: If this class does not implement a codec
+		:raises ValueError: If 'flush' is not supported by this codec
+		"""
+
+		super().__init__(max_length, fifo)
+		Misc.raise_if(type(self).__new_compressor__ is CompressorStream.__new_compressor__, TypeError(f'\'{type(self).__name__}\' does not implement a codec; use a concrete subclass such as ZLibCompressorStream'))
+		Misc.raise_ifn(flush in type(self).FLUSH_MODES, ValueError(f'Flush mode must be one of: {", ".join(type(self).FLUSH_MODES)}'))
+		self.__flush_mode__: str = str(flush)
+		self.__compressor__: typing.Any = None
+		self.__pending__: bool = False
+
+	def __new_compressor__(self) -> typing.Any:
+		"""
+		INTERNAL METHOD
+		Creates a new compressor object for this codec
+		:return: An object supporting 'compress' and 'flush'
+		"""
+
+		raise NotImplementedError()
+
+	def __flush_compressor__(self, compressor: typing.Any, mode: str) -> bytes:
+		"""
+		INTERNAL METHOD
+		Flushes the specified compressor
+		:param compressor: The compressor object
+		:param mode: The flush mode, one of this class's 'FLUSH_MODES' except 'none'
+		:return: The flushed output
+		"""
+
+		return compressor.flush()
+
+	def __compress__(self, data: bytes, flush: typing.Optional[str], commit: bool) -> bytes:
+		"""
+		INTERNAL METHOD
+		Feeds data through this stream's compressor and flushes it
+		:param data: The raw data
+		:param flush: The flush mode or None to use this stream's default
+		:param commit: Whether to advance this stream's compressor or work on a copy
+		:return: The compressed data
+		:raises ValueError: If 'flush' is invalid
+		:raises StreamError: If 'commit' is False and this codec cannot copy a compressor holding pending data
+		"""
+
+		mode: str = self.__flush_mode__ if flush is None or flush is ... else flush
+		Misc.raise_ifn(mode in type(self).FLUSH_MODES, ValueError(f'Flush mode must be one of: {", ".join(type(self).FLUSH_MODES)}'))
+
+		if self.__compressor__ is None:
+			self.__compressor__ = self.__new_compressor__()
+
+		if commit:
+			compressor: typing.Any = self.__compressor__
+		elif hasattr(self.__compressor__, 'copy'):
+			compressor: typing.Any = self.__compressor__.copy()
+		elif not self.__pending__:
+			compressor: typing.Any = self.__new_compressor__()
+		else:
+			raise StreamError('Codec cannot peek while compressed data is pending; read with flush mode \'finish\' first')
+
+		compressed: bytes = compressor.compress(data)
+
+		if mode != 'none':
+			compressed += self.__flush_compressor__(compressor, mode)
+
+		if commit and mode == 'finish':
+			self.__compressor__ = None
+			self.__pending__ = False
+		elif commit:
+			self.__pending__ = True
+
+		return compressed
+
+	def read(self, __size: typing.Optional[int] = ..., *, timeout: typing.Optional[float] = ..., flush: typing.Optional[str] = None) -> bytes:
+		"""
+		Reads and compresses data from the internal buffer
+		:param __size: If specified, compresses this many raw bytes, otherwise compresses all data
+		:param timeout: If specified, the maximum number of seconds to block until '__size' bytes (or any if '__size' is not specified) are available; None blocks indefinitely
+		:param flush: The flush mode to use for this read or None to use this stream's default
+		:return: The compressed data; may be empty if flush mode is 'none'
+		:raises StreamError: If this stream is closed or not readable
+		:raises StreamEmptyError: If the stream is empty
+		:raises ValueError: If 'flush' is invalid
+		"""
+
+		with self.__lock__:
+			return self.__compress__(super().read(__size, timeout=timeout), flush, True)
+
+	def peek(self, __size: typing.Optional[int] = ..., *, flush: typing.Optional[str] = None) -> bytes:
+		"""
+		Compresses data from the internal buffer without removing it or advancing the compressor
+		:param __size: If specified, compresses this many raw bytes, otherwise compresses all data
+		:param flush: The flush mode to use or None to use this stream's default
+		:return: The compressed data
+		:raises StreamError: If this stream is closed or not readable or the codec cannot copy a compressor holding pending data
+		:raises ValueError: If 'flush' is invalid
+		"""
+
+		with self.__lock__:
+			return self.__compress__(super().peek(__size), flush, False)
+
+	def finish(self) -> bytes:
+		"""
+		Terminates the current compressed stream without consuming buffered data
+		The next read begins a new compressed stream
+		:return: The remaining compressed output including the stream trailer
+		:raises StreamError: If this stream is closed
+		"""
+
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+
+		with self.__lock__:
+			if self.__compressor__ is None:
+				self.__compressor__ = self.__new_compressor__()
+
+			compressed: bytes = self.__flush_compressor__(self.__compressor__, 'finish')
+			self.__compressor__ = None
+			self.__pending__ = False
+			return compressed
+
+	@property
+	def flush_mode(self) -> str:
+		"""
+		:return: The default flush mode applied after each read
+		"""
+
+		return self.__flush_mode__
+
+
+class DecompressorStream(ByteStream):
+	"""
+	Base class for streams incrementally decompressing arbitrary byte-strings
+	Written data is decompressed as it arrives so partial compressed streams may be read; concatenated streams are supported
+	"""
+
+	def __init__(self, max_length: int = -1, fifo: bool = True):
+		"""
+		Base class for streams incrementally decompressing arbitrary byte-strings
+		- Constructor -
+		:param max_length: The maximum length (in number of items) of this stream
+		:param fifo: Whether this stream is FIFO or LIFO
+		:raises TypeError: If this class does not implement a codec
+		"""
+
+		super().__init__(max_length, fifo)
+		Misc.raise_if(type(self).__new_decompressor__ is DecompressorStream.__new_decompressor__, TypeError(f'\'{type(self).__name__}\' does not implement a codec; use a concrete subclass such as ZLibDecompressorStream'))
+		self.__decompressor__: typing.Any = None
+		self.__pending__: bool = False
+
+	def __new_decompressor__(self) -> typing.Any:
+		"""
+		INTERNAL METHOD
+		Creates a new decompressor object for this codec
+		:return: An object supporting 'decompress', 'eof' and 'unused_data'
+		"""
+
+		raise NotImplementedError()
+
+	def __decompress__(self, data: bytes, commit: bool) -> bytes:
+		"""
+		INTERNAL METHOD
+		Feeds data through this stream's decompressor, starting new decompressors for concatenated streams
+		:param data: The compressed data
+		:param commit: Whether to advance this stream's decompressor or work on a copy
+		:return: The decompressed data
+		:raises StreamError: If 'commit' is False and this codec cannot copy a decompressor holding a partial stream
+		"""
+
+		if self.__decompressor__ is None:
+			self.__decompressor__ = self.__new_decompressor__()
+
+		if commit:
+			decompressor: typing.Any = self.__decompressor__
+		elif hasattr(self.__decompressor__, 'copy'):
+			decompressor: typing.Any = self.__decompressor__.copy()
+		elif not self.__pending__:
+			decompressor: typing.Any = self.__new_decompressor__()
+		else:
+			raise StreamError('Codec cannot peek into a partially decompressed stream')
+
+		chunks: list[bytes] = []
+		pending: bool = self.__pending__
+
+		while len(data) > 0:
+			chunks.append(decompressor.decompress(data))
+			pending = not decompressor.eof
+
+			if pending:
+				break
+
+			data = decompressor.unused_data
+			decompressor = self.__new_decompressor__()
+
+		if commit:
+			self.__decompressor__ = decompressor
+			self.__pending__ = pending
+
+		return b''.join(chunks)
+
+	def read(self, __size: typing.Optional[int] = ..., *, timeout: typing.Optional[float] = ...) -> bytes:
+		"""
+		Reads and decompresses data from the internal buffer
+		:param __size: If specified, decompresses this many compressed bytes, otherwise decompresses all data
+		:param timeout: If specified, the maximum number of seconds to block until '__size' bytes (or any if '__size' is not specified) are available; None blocks indefinitely
+		:return: The decompressed data; may be empty if the compressed data does not yet contain a complete block
+		:raises StreamError: If this stream is closed or not readable
+		:raises StreamEmptyError: If the stream is empty
+		"""
+
+		with self.__lock__:
+			return self.__decompress__(super().read(__size, timeout=timeout), True)
+
+	def peek(self, __size: typing.Optional[int] = ...) -> bytes:
+		"""
+		Decompresses data from the internal buffer without removing it or advancing the decompressor
+		:param __size: If specified, decompresses this many compressed bytes, otherwise decompresses all data
+		:return: The decompressed data
+		:raises StreamError: If this stream is closed or not readable or the codec cannot copy a decompressor holding a partial stream
+		"""
+
+		with self.__lock__:
+			return self.__decompress__(super().peek(__size), False)
+
+
+class ZLibCompressorStream(CompressorStream):
+	"""
+	Stream designed for ZLIB compressing arbitrary byte-strings
+	"""
+
+	FLUSH_MODES: dict[str, int] = {'none': zlib.Z_NO_FLUSH, 'sync': zlib.Z_SYNC_FLUSH, 'full': zlib.Z_FULL_FLUSH, 'finish': zlib.Z_FINISH}
+	WBITS: int = zlib.MAX_WBITS
+
+	def __init__(self, compression_ratio: int = zlib.Z_DEFAULT_COMPRESSION, max_length: int = -1, fifo: bool = True, flush: typing.Literal['none', 'sync', 'full', 'finish'] = 'sync'):
+		"""
+		Stream designed for ZLIB compressing arbitrary byte-strings
+		- Constructor -
+		:param compression_ratio: The ZLIB compression ratio
+		:param max_length:  The maximum length (in number of items) of this stream
+		:param fifo: Whether this stream is FIFO or LIFO
+		:param flush: The default flush mode applied after each read, see 'CompressorStream::__init__'
+		:raises InvalidArgumentException: If 'compression_ratio' is not an integer
+		:raises ValueError: If 'compression_ratio' or 'flush' is invalid
+		"""
+
+		super().__init__(max_length, fifo, flush)
+		Misc.raise_ifn(isinstance(compression_ratio, int), Exceptions.InvalidArgumentException(ZLibCompressorStream.__init__, 'compression_ratio', type(compression_ratio), (int,)))
+		Misc.raise_ifn(zlib.Z_DEFAULT_COMPRESSION <= (compression_ratio := int(compression_ratio)) <= zlib.Z_BEST_COMPRESSION, ValueError('Invalid compression ratio'))
+		self.__compression__: int = int(compression_ratio)
+
+	def __new_compressor__(self) -> typing.Any:
+		return zlib.compressobj(self.__compression__, zlib.DEFLATED, type(self).WBITS)
+
+	def __flush_compressor__(self, compressor: typing.Any, mode: str) -> bytes:
+		return compressor.flush(ZLibCompressorStream.FLUSH_MODES[mode])
+
+
+class ZLibDecompressorStream(DecompressorStream):
+	"""
+	Stream designed for ZLIB decompressing arbitrary byte-strings
+	"""
+
+	WBITS: int = zlib.MAX_WBITS
+
+	def __new_decompressor__(self) -> typing.Any:
+		return zlib.decompressobj(type(self).WBITS)
+
+
+class GZipCompressorStream(ZLibCompressorStream):
+	"""
+	Stream designed for GZIP compressing arbitrary byte-strings
+	Output is GZIP formatted DEFLATE data produced by 'zlib' so that sync and full flushes are supported
+	"""
+
+	WBITS: int = 16 + zlib.MAX_WBITS
+
+
+class GZipDecompressorStream(ZLibDecompressorStream):
+	"""
+	Stream designed for GZIP decompressing arbitrary byte-strings
+	"""
+
+	WBITS: int = 16 + zlib.MAX_WBITS
+
+
+class LZMACompressorStream(CompressorStream):
+	"""
+	Stream designed for LZMA (XZ) compressing arbitrary byte-strings
+	LZMA compressors cannot be flushed without terminating the stream; supported flush modes are 'none' and 'finish'
+	"""
+
+	def __init__(self, preset: int = lzma.PRESET_DEFAULT, max_length: int = -1, fifo: bool = True, flush: typing.Literal['none', 'finish'] = 'finish'):
+		"""
+		Stream designed for LZMA (XZ) compressing arbitrary byte-strings
+		- Constructor -
+		:param preset: The LZMA compression preset, optionally OR'd with 'lzma.PRESET_EXTREME'
+		:param max_length: The maximum length (in number of items) of this stream
+		:param fifo: Whether this stream is FIFO or LIFO
+		:param flush: The default flush mode applied after each read, see 'CompressorStream::__init__'
+		:raises InvalidArgumentException: If 'preset' is not an integer
+		:raises ValueError: If 'preset' or 'flush' is invalid
+		"""
+
+		super().__init__(max_length, fifo, flush)
+		Misc.raise_ifn(isinstance(preset, int), Exceptions.InvalidArgumentException(LZMACompressorStream.__init__, 'preset', type(preset), (int,)))
+		Misc.raise_ifn(0 <= ((preset := int(preset)) & ~lzma.PRESET_EXTREME) <= 9, ValueError('Invalid LZMA preset'))
+		self.__preset__: int = int(preset)
+
+	def __new_compressor__(self) -> typing.Any:
+		return lzma.LZMACompressor(lzma.FORMAT_XZ, preset=self.__preset__)
+
+
+class LZMADecompressorStream(DecompressorStream):
+	"""
+	Stream designed for LZMA (XZ or legacy LZMA) decompressing arbitrary byte-strings
+	"""
+
+	def __new_decompressor__(self) -> typing.Any:
+		return lzma.LZMADecompressor(lzma.FORMAT_AUTO)
+
+
+class BZ2CompressorStream(CompressorStream):
+	"""
+	Stream designed for BZ2 compressing arbitrary byte-strings
+	BZ2 compressors cannot be flushed without terminating the stream; supported flush modes are 'none' and 'finish'
+	"""
+
+	def __init__(self, compression_level: int = 9, max_length: int = -1, fifo: bool = True, flush: typing.Literal['none', 'finish'] = 'finish'):
+		"""
+		Stream designed for BZ2 compressing arbitrary byte-strings
+		- Constructor -
+		:param compression_level: The BZ2 compression level between 1 and 9
+		:param max_length: The maximum length (in number of items) of this stream
+		:param fifo: Whether this stream is FIFO or LIFO
+		:param flush: The default flush mode applied after each read, see 'CompressorStream::__init__'
+		:raises InvalidArgumentException: If 'compression_level' is not an integer
+		:raises ValueError: If 'compression_level' or 'flush' is invalid
+		"""
+
+		super().__init__(max_length, fifo, flush)
+		Misc.raise_ifn(isinstance(compression_level, int), Exceptions.InvalidArgumentException(BZ2CompressorStream.__init__, 'compression_level', type(compression_level), (int,)))
+		Misc.raise_ifn(1 <= (compression_level := int(compression_level)) <= 9, ValueError('Invalid BZ2 compression level'))
+		self.__compression__: int = int(compression_level)
+
+	def __new_compressor__(self) -> typing.Any:
+		return bz2.BZ2Compressor(self.__compression__)
+
+
+class BZ2DecompressorStream(DecompressorStream):
+	"""
+	Stream designed for BZ2 decompressing arbitrary byte-strings
+	"""
+
+	def __new_decompressor__(self) -> typing.Any:
+		return bz2.BZ2Decompressor()
+
+
+class PickleSerializerStream(ByteStream):
+	"""
+	Stream that serializes all data with pickle during write
+	Large contiguous buffers (bytearray, numpy arrays, etc.) are transferred out-of-band using pickle protocol 5
+	Each frame is laid out as: pickle length, buffer count, one length per buffer, the pickle data, then each raw buffer
+	"""
+
+	SERIALIZER: typing.Any = pickle
+
+	def __init__(self, max_length: int = -1, fifo: bool = True, header_size: int = 4, *, protocol: int = 5, out_of_band: bool = True):
+		"""
+		Stream that serializes all data with pickle during write
+		- Constructor -
+		:param max_length: The maximum length (in number of items) of this stream
+		:param fifo: Whether this stream is FIFO or LIFO
+		:param header_size: The number of bytes to use for each frame header field
+		:param protocol: The pickle protocol to use
+		:param out_of_band: Whether to transfer 'pickle.PickleBuffer' compatible buffers out-of-band; requires protocol 5 or higher
+		:raises InvalidArgumentException: If 'header_size' or 'protocol' is not an integer
+		:raises ValueError: If 'header_size' is smaller than 1 or 'out_of_band' is set with a protocol lower than 5
+		"""
+
+		super().__init__(max_length, fifo)
+		Misc.raise_ifn(isinstance(header_size, int), Exceptions.InvalidArgumentException(PickleSerializerStream.__init__, 'header_size', type(header_size), (int,)))
+		Misc.raise_ifn((header_size := int(header_size)) >= 1, ValueError('Header size cannot be smaller than 1'))
+		Misc.raise_ifn(isinstance(protocol, int), Exceptions.InvalidArgumentException(PickleSerializerStream.__init__, 'protocol', type(protocol), (int,)))
+		Misc.raise_if(bool(out_of_band) and int(protocol) < 5, ValueError('Out-of-band buffers require pickle protocol 5 or higher'))
+		self.__header_size__: int = int(header_size)
+		self.__protocol__: int = int(protocol)
+		self.__out_of_band__: bool = bool(out_of_band)
+
+	def write(self, __object: typing.Any, *, ignore_invalid: bool = False, timeout: typing.Optional[float] = ...) -> PickleSerializerStream:
+		"""
+		Serializes an object and writes the resulting frame to the internal buffer
+		Out-of-band buffers are copied once, directly into the internal buffer
+		:param __object: The object to serialize
+		:param ignore_invalid: Whether to ignore closed or non-writable streams
+		:param timeout: If specified, the maximum number of seconds to block while this stream is full; None blocks indefinitely
+		:return: This instance
+		:raises StreamError: If this stream is closed or not writable
+		:raises StreamFullError: If this stream is full
+		"""
+
+		return self.writelines((__object,), ignore_invalid=ignore_invalid, timeout=timeout)
+
+	def writelines(self, __lines: typing.Iterable[typing.Any], *, ignore_invalid: bool = False, timeout: typing.Optional[float] = ...) -> PickleSerializerStream:
+		"""
+		Serializes multiple objects and writes the resulting frames to the internal buffer in a single atomic write
+		:param __lines: The objects to serialize
+		:param ignore_invalid: Whether to ignore closed or non-writable streams
+		:param timeout: If specified, the maximum number of seconds to block while this stream is full; None blocks indefinitely
+		:return: This instance
+		:raises StreamError: If this stream is closed or not writable
+		:raises StreamFullError: If this stream is full
+		"""
+
+		parts: list[bytes | memoryview] = []
+		reserve: int = 0
+		last: int = 0
+
+		for line in __lines:
+			reserve += last
+			buffers: list[memoryview] = []
+
+			def buffer_callback(buffer: pickle.PickleBuffer) -> bool:
+				try:
+					buffers.append(buffer.raw())
+					return False
+				except BufferError:
+					return True
+
+			serialized: bytes = type(self).SERIALIZER.dumps(line, protocol=self.__protocol__, buffer_callback=buffer_callback if self.__out_of_band__ else None)
+			header: bytes = b''.join(length.to_bytes(self.__header_size__, 'big', signed=False) for length in (len(serialized), len(buffers), *(buffer.nbytes for buffer in buffers)))
+			parts.append(header)
+			parts.append(serialized)
+			parts.extend(buffers)
+			last = len(header) + len(serialized) + sum(buffer.nbytes for buffer in buffers)
+
+		self.__write_batch__(parts, reserve, ignore_invalid, timeout)
+		return self
+
+
+class PickleDeserializerStream(ByteStream):
+	"""
+	Stream that deserializes all data with pickle during read
+	Expects frames as written by 'PickleSerializerStream'; incomplete frames remain buffered until the rest arrives
+	"""
+
+	SERIALIZER: typing.Any = pickle
+
+	def __init__(self, max_length: int = -1, fifo: bool = True, header_size: int = 4):
+		"""
+		Stream that deserializes all data with pickle during read
+		- Constructor -
+		:param max_length: The maximum length (in number of items) of this stream
+		:param fifo: Whether this stream is FIFO or LIFO
+		:param header_size: The number of bytes to use for each frame header field
+		:raises InvalidArgumentException: If 'header_size' is not an integer
+		:raises ValueError: If 'header_size' is smaller than 1
+		"""
+
+		super().__init__(max_length, fifo)
+		Misc.raise_ifn(isinstance(header_size, int), Exceptions.InvalidArgumentException(PickleDeserializerStream.__init__, 'header_size', type(header_size), (int,)))
+		Misc.raise_ifn((header_size := int(header_size)) >= 1, ValueError('Header size cannot be smaller than 1'))
+		self.__header_size__: int = int(header_size)
+
+	def __next_frame__(self) -> typing.Optional[tuple[int, tuple[int, ...]]]:
+		"""
+		INTERNAL METHOD
+		Parses the header of the next buffered frame without consuming it
+		:return: A tuple containing the header length and the lengths of the pickle data and each buffer, or None if the frame is incomplete
+		"""
+
+		size: int = self.__header_size__
+
+		if len(self.__buffer__) < size * 2:
+			return None
+
+		header: bytes = self.__buffer__.peek_front(size * 2)
+		pickle_length: int = int.from_bytes(header[:size], 'big', signed=False)
+		buffer_count: int = int.from_bytes(header[size:], 'big', signed=False)
+		header_length: int = size * (2 + buffer_count)
+
+		if len(self.__buffer__) < header_length:
+			return None
+
+		header = self.__buffer__.peek_front(header_length)
+		lengths: tuple[int, ...] = (pickle_length, *(int.from_bytes(header[i:i + size], 'big', signed=False) for i in range(size * 2, header_length, size)))
+		return (header_length, lengths) if len(self.__buffer__) >= header_length + sum(lengths) else None
+
+	def read(self, __size: typing.Optional[int] = ..., *, timeout: typing.Optional[float] = ...) -> typing.Any | tuple[typing.Any]:
+		"""
+		Reads and deserializes complete frames directly from the internal buffer
+		Out-of-band buffers are copied once, directly into writable bytearrays
+		:param __size: If specified, reads at most this many objects, otherwise reads all complete frames
+		:param timeout: If specified, the maximum number of seconds to block until a complete frame is available; None blocks indefinitely
+		:return: The deserialized object if only one was read, otherwise a tuple of objects
+		:raises StreamError: If this stream is closed or not readable
+		:raises StreamEmptyError: If the stream contains no complete frames
+		"""
+
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+		elif not self.readable():
+			raise StreamError('Stream is not readable')
+
+		results: list[typing.Any] = []
+		limit: int = -1 if __size is ... or __size is None else int(__size)
+
+		with self.__lock__:
+			self.__wait_until__(lambda: self.__next_frame__() is not None, timeout)
+
+			while (limit < 0 or len(results) < limit) and (frame := self.__next_frame__()) is not None:
+				header_length, (pickle_length, *buffer_lengths) = frame
+				self.__buffer__.discard(header_length)
+				serialized: bytes = self.__buffer__.pop_front(pickle_length)
+				buffers: list[bytearray] = []
+
+				for length in buffer_lengths:
+					buffer: bytearray = bytearray(length)
+					self.__buffer__.readinto(buffer)
+					buffers.append(buffer)
+
+				results.append(type(self).SERIALIZER.loads(serialized, buffers=buffers))
+
+		self.__notify__()
+
+		if len(results) == 0:
+			raise StreamEmptyError('Stream is empty')
+
+		return results[0] if len(results) == 1 else tuple(results)
+
+
+class DillSerializerStream(PickleSerializerStream):
+	"""
+	Stream that serializes all data with dill during write
+	Uses the same framing and out-of-band buffer transfer as 'PickleSerializerStream'
+	"""
+
+	SERIALIZER: typing.Any = dill
+
+
+class DillDeserializerStream(PickleDeserializerStream):
+	"""
+	Stream that deserializes all data with dill during read
+	Expects frames as written by 'DillSerializerStream'
+	"""
+
+	SERIALIZER: typing.Any = dill
+
+
+class SharedMemoryStream(Stream[bytes]):
+	"""
+	Single-producer single-consumer byte stream backed by a ring buffer in shared memory
+	Read and write indices live in the shared block and blocked ends are woken through semaphores, so data crosses processes without pickling
+	Pass the stream to a child process as a 'multiprocessing.Process' argument to use it from both ends; exactly one process may write and one may read
+	"""
+
+	HEAD_OFFSET: int = 0
+	TAIL_OFFSET: int = 64
+	FLAGS_OFFSET: int = 128
+	DATA_OFFSET: int = 192
+
+	def __init__(self, capacity: int = 1 << 20, *, context: typing.Optional[str | multiprocessing.context.BaseContext] = None):
+		"""
+		Single-producer single-consumer byte stream backed by a ring buffer in shared memory
+		- Constructor -
+		:param capacity: The size in bytes of the shared ring buffer
+		:param context: The multiprocessing context or start method used by the processes sharing this stream, or None for the default
+		:raises InvalidArgumentException: If 'capacity' is not an integer
+		:raises ValueError: If 'capacity' is not positive
+		"""
+
+		super().__init__()
+		self.__memory__: typing.Optional[multiprocessing.shared_memory.SharedMemory] = None
+		Misc.raise_ifn(isinstance(capacity, int), Exceptions.InvalidArgumentException(SharedMemoryStream.__init__, 'capacity', type(capacity), (int,)))
+		Misc.raise_ifn((capacity := int(capacity)) > 0, ValueError('Capacity must be greater than 0'))
+		self.__capacity__: int = capacity
+		self.__owner__: int = os.getpid()
+		context = context if isinstance(context, multiprocessing.context.BaseContext) else multiprocessing.get_context(context)
+		self.__readable_signal__: multiprocessing.synchronize.BoundedSemaphore = context.BoundedSemaphore(1)
+		self.__writable_signal__: multiprocessing.synchronize.BoundedSemaphore = context.BoundedSemaphore(1)
+		self.__readable_signal__.acquire(False)
+		self.__writable_signal__.acquire(False)
+		self.__attach__(multiprocessing.shared_memory.SharedMemory(create=True, size=SharedMemoryStream.DATA_OFFSET + capacity))
+		self.__index__[SharedMemoryStream.HEAD_OFFSET // 8] = 0
+		self.__index__[SharedMemoryStream.TAIL_OFFSET // 8] = 0
+		self.__index__[SharedMemoryStream.FLAGS_OFFSET // 8] = 0
+
+	def __getstate__(self) -> dict[str, typing.Any]:
+		return {'name': self.__memory__.name, 'capacity': self.__capacity__, 'readable': self.__readable_signal__, 'writable': self.__writable_signal__}
+
+	def __setstate__(self, state: dict[str, typing.Any]) -> None:
+		Stream.__init__(self)
+		self.__capacity__ = state['capacity']
+		self.__owner__ = -1
+		self.__readable_signal__ = state['readable']
+		self.__writable_signal__ = state['writable']
+
+		self.__attach__(multiprocessing.shared_memory.SharedMemory(state['name'], track=False) if sys.version_info >= (3, 13) else multiprocessing.shared_memory.SharedMemory(state['name']))
+
+	def __len__(self) -> int:
+		"""
+		:return: The number of bytes waiting to be read
+		"""
+
+		return self.__index__[SharedMemoryStream.TAIL_OFFSET // 8] - self.__index__[SharedMemoryStream.HEAD_OFFSET // 8] if self.__memory__ is not None else 0
+
+	def __attach__(self, memory: multiprocessing.shared_memory.SharedMemory) -> None:
+		"""
+		INTERNAL METHOD
+		Binds the index and data views of a shared memory block
+		:param memory: The shared memory block
+		"""
+
+		self.__memory__ = memory
+		self.__index__: memoryview = memory.buf[:SharedMemoryStream.DATA_OFFSET].cast('Q')
+		self.__data__: memoryview = memory.buf[SharedMemoryStream.DATA_OFFSET:SharedMemoryStream.DATA_OFFSET + self.__capacity__]
+
+	@staticmethod
+	def __signal__(semaphore: multiprocessing.synchronize.BoundedSemaphore) -> None:
+		"""
+		INTERNAL METHOD
+		Wakes the opposite end if it is waiting; signals never accumulate past one
+		:param semaphore: The semaphore to release
+		"""
+
+		try:
+			semaphore.release()
+		except ValueError:
+			pass
+
+	def __wait__(self, semaphore: multiprocessing.synchronize.BoundedSemaphore, predicate: typing.Callable[[], bool], deadline: typing.Optional[float]) -> bool:
+		"""
+		INTERNAL METHOD
+		Blocks until the predicate is satisfied, the other end closes, or the deadline passes
+		:param semaphore: The semaphore the other end releases when the predicate may have changed
+		:param predicate: The condition to wait for
+		:param deadline: The 'time.monotonic' deadline, None to wait indefinitely, or ... to not wait
+		:return: Whether the predicate is satisfied
+		"""
+
+		while not predicate():
+			if deadline is ... or self.__remote_closed__():
+				return predicate()
+
+			remaining: typing.Optional[float] = None if deadline is None else deadline - time.monotonic()
+
+			if remaining is not None and remaining <= 0:
+				return False
+
+			start: typing.Optional[float] = None if self.__metrics__ is None else time.perf_counter()
+			semaphore.acquire(timeout=remaining)
+
+			if start is not None and self.__metrics__ is not None:
+				self.__metrics__.record_blocked(time.perf_counter() - start)
+
+		return True
+
+	def __remote_closed__(self) -> bool:
+		"""
+		INTERNAL METHOD
+		:return: Whether either end has closed the shared buffer
+		"""
+
+		return self.__index__[SharedMemoryStream.FLAGS_OFFSET // 8] != 0
+
+	def __copy_out__(self, target: memoryview, start: int) -> None:
+		"""
+		INTERNAL METHOD
+		Copies bytes out of the ring without moving the read index
+		:param target: The destination view; its length is the number of bytes copied
+		:param start: The absolute read position to copy from
+		"""
+
+		offset: int = start % self.__capacity__
+		first: int = min(len(target), self.__capacity__ - offset)
+		target[:first] = self.__data__[offset:offset + first]
+
+		if first < len(target):
+			target[first:] = self.__data__[:len(target) - first]
+
+	def __receive__(self, target: memoryview, remove: bool) -> int:
+		"""
+		INTERNAL METHOD
+		Copies available bytes into the target, optionally advancing the read index
+		:param target: The destination view
+		:param remove: Whether to consume the copied bytes
+		:return: The number of bytes copied
+		"""
+
+		head: int = self.__index__[SharedMemoryStream.HEAD_OFFSET // 8]
+		count: int = min(len(target), self.__index__[SharedMemoryStream.TAIL_OFFSET // 8] - head)
+
+		if count > 0:
+			self.__copy_out__(target[:count], head)
+
+			if remove:
+				self.__index__[SharedMemoryStream.HEAD_OFFSET // 8] = head + count
+				SharedMemoryStream.__signal__(self.__writable_signal__)
+
+		return count
+
+	def close(self) -> None:
+		"""
+		Closes this end of the stream and marks the shared buffer closed so the other end stops waiting
+		The shared memory block is unlinked once the creating process closes its end
+		:raises StreamError: If the stream is already closed
+		"""
+
+		super().close()
+
+		if self.__memory__ is None:
+			return
+
+		self.__index__[SharedMemoryStream.FLAGS_OFFSET // 8] = 1
+		SharedMemoryStream.__signal__(self.__readable_signal__)
+		SharedMemoryStream.__signal__(self.__writable_signal__)
+		self.__index__.release()
+		self.__data__.release()
+		self.__memory__.close()
+
+		if self.__owner__ == os.getpid():
+			self.__memory__.unlink()
+
+		self.__memory__ = None
+
+	def empty(self) -> bool:
+		"""
+		:return: Whether the shared buffer is empty
+		"""
+
+		return len(self) == 0
+
+	def full(self) -> bool:
+		"""
+		:return: Whether the shared buffer is full
+		"""
+
+		return len(self) >= self.__capacity__
+
+	def readable(self) -> bool:
+		return self.__state__ and self.__memory__ is not None
+
+	def writable(self) -> bool:
+		return self.__state__ and self.__memory__ is not None and not self.__remote_closed__()
+
+	def readinto(self, __buffer: bytearray | memoryview, *, timeout: typing.Optional[float] = ...) -> int:
+		"""
+		Reads available data directly into a writable buffer
+		:param __buffer: The buffer to fill
+		:param timeout: If specified, the maximum number of seconds to block until any data is available; None blocks indefinitely
+		:return: The number of bytes read
+		:raises StreamError: If this stream is closed or not readable
+		"""
+
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+		elif not self.readable():
+			raise StreamError('Stream is not readable')
+
+		target: memoryview = memoryview(__buffer).cast('B')
+		self.__wait__(self.__readable_signal__, lambda: len(self) > 0, ... if timeout is ... else None if timeout is None else time.monotonic() + float(timeout))
+		return self.__receive__(target, True)
+
+	def read(self, __size: typing.Optional[int] = ..., *, timeout: typing.Optional[float] = ...) -> bytes:
+		"""
+		Reads data from the shared buffer
+		Reads larger than the buffer capacity are assembled as the producer refills it
+		:param __size: If specified, reads this many bytes, otherwise reads all available data
+		:param timeout: If specified, the maximum number of seconds to block until '__size' bytes (or any if '__size' is not specified) are available; None blocks indefinitely
+		:return: The read data as a single bytes object
+		:raises StreamError: If this stream is closed or not readable, or the other end closed and no data remains
+		:raises StreamEmptyError: If the stream is empty
+		"""
+
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+		elif not self.readable():
+			raise StreamError('Stream is not readable')
+
+		deadline: typing.Optional[float] = ... if timeout is ... else None if timeout is None else time.monotonic() + float(timeout)
+
+		if __size is ... or __size is None or int(__size) < 0:
+			self.__wait__(self.__readable_signal__, lambda: len(self) > 0, deadline)
+			result: bytearray = bytearray(len(self))
+			filled: int = self.__receive__(memoryview(result), True)
+		else:
+			result: bytearray = bytearray(int(__size))
+			target: memoryview = memoryview(result)
+			filled: int = 0
+
+			while filled < len(result):
+				needed: int = min(len(result) - filled, self.__capacity__)
+
+				if not self.__wait__(self.__readable_signal__, lambda: len(self) >= needed, deadline) and len(self) == 0:
+					break
+
+				filled += self.__receive__(target[filled:], True)
+
+				if deadline is ...:
+					break
+
+			target.release()
+
+		if filled == 0 and self.__remote_closed__():
+			raise StreamError('Stream is closed')
+		elif filled == 0:
+			raise StreamEmptyError('Stream is empty')
+
+		del result[filled:]
+		return bytes(result)
+
+	def peek(self, __size: typing.Optional[int] = ...) -> bytes:
+		"""
+		Reads available data from the shared buffer without removing it
+		:param __size: If specified, reads at most this many bytes, otherwise reads all available data
+		:return: The read data as a single bytes object
+		:raises StreamError: If this stream is closed or not readable
+		"""
+
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+		elif not self.readable():
+			raise StreamError('Stream is not readable')
+
+		result: bytearray = bytearray(len(self) if __size is ... or __size is None or int(__size) < 0 else min(len(self), int(__size)))
+		del result[self.__receive__(memoryview(result), False):]
+		return bytes(result)
+
+	def write(self, __buffer: bytes | bytearray | memoryview, *, ignore_invalid: bool = False, timeout: typing.Optional[float] = ...) -> SharedMemoryStream:
+		"""
+		Writes data to the shared buffer
+		Data is published all at once; nothing is written if it does not fit within the timeout
+		:param __buffer: The bytes-like object to write
+		:param ignore_invalid: Whether to ignore closed or non-writable streams
+		:param timeout: If specified, the maximum number of seconds to block while the buffer is full; None blocks indefinitely
+		:return: This instance
+		:raises StreamError: If this stream is closed or not writable, or the other end closes while writing
+		:raises StreamFullError: If the data is larger than the buffer capacity or the buffer does not have room for it within the timeout
+		:raises InvalidArgumentException: If '__buffer' is not a bytes-like object
+		"""
+
+		if not self.__state__:
+			raise StreamError('Stream is closed')
+		elif not self.writable():
+			raise StreamError('Stream is not writable')
+
+		Misc.raise_ifn(isinstance(__buffer, (bytes, bytearray, memoryview)), Exceptions.InvalidArgumentException(SharedMemoryStream.write, '__buffer', type(__buffer), (bytes, bytearray, memoryview)))
+		view: memoryview = memoryview(__buffer).cast('B')
+		count: int = len(view)
+
+		if count > self.__capacity__:
+			raise StreamFullError(f'Write of {count} bytes exceeds stream capacity of {self.__capacity__}')
+		elif self.__remote_closed__():
+			raise StreamError('Stream is closed')
+
+		deadline: typing.Optional[float] = ... if timeout is ... else None if timeout is None else time.monotonic() + float(timeout)
+
+		if not self.__wait__(self.__writable_signal__, lambda: self.__capacity__ - len(self) >= count, deadline):
+			if self.__remote_closed__():
+				raise StreamError('Stream is closed')
+
+			raise StreamFullError('Stream is full')
+
+		if count > 0:
+			tail: int = self.__index__[SharedMemoryStream.TAIL_OFFSET // 8]
+			offset: int = tail % self.__capacity__
+			first: int = min(count, self.__capacity__ - offset)
+			self.__data__[offset:offset + first] = view[:first]
+
+			if first < count:
+				self.__data__[:count - first] = view[first:]
+
+			self.__index__[SharedMemoryStream.TAIL_OFFSET // 8] = tail + count
+			SharedMemoryStream.__signal__(self.__readable_signal__)
+
+		self.__auto_flush__(ignore_invalid)
+		return self
+
+	@property
+	def capacity(self) -> int:
+		"""
+		:return: The size in bytes of the shared ring buffer
+		"""
+
+		return self.__capacity__
+
+	@property
+	def name(self) -> str:
+		"""
+		:return: The name of the underlying shared memory block
+		"""
+
+		return self.__memory__.name
+
+
+class EventedStream[T](OrderedStream[T]):
+	"""
+	Stream which allows binding of callbacks to various stream events
+	"""
+
+	NO_THREADING: int = 0
+	MULTITHREADING: int = 1
+	MULTIPROCESSING: int = 2
+
+	def __init__(self, max_length: int = -1, fifo: bool = True, *, max_workers: typing.Optional[int] = None, ordered: bool = False, coalesce: bool = False, thread_executor: typing.Optional[concurrent.futures.Executor] = None, process_executor: typing.Optional[concurrent.futures.Executor] = None):
+		"""
+		Stream which allows binding of callbacks to various stream events
+		Threaded and multiprocessed callbacks are dispatched to persistent worker pools, created on first use unless supplied
+		- Constructor -
+		:param max_length: The maximum length (in number of items) of this stream
+		:param fifo: Whether this stream is FIFO or LIFO
+		:param max_workers: The maximum number of workers in each pool this stream creates, or None for the executor default
+		:param ordered: Whether pooled callbacks for the same event ID run one at a time in the order their events occurred
+		:param coalesce: Whether a pooled callback still waiting to run is replaced, rather than queued again, when its event repeats; the latest arguments are used
+		:param thread_executor: An existing executor for threaded callbacks; it is not shut down when this stream closes
+		:param process_executor: An existing executor for multiprocessed callbacks; it is not shut down when this stream closes
+		:raises InvalidArgumentException: If 'max_workers' is not an integer or 'thread_executor' or 'process_executor' is not an executor
+		:raises ValueError: If 'max_workers' is not positive
+		"""
+
+		super().__init__(max_length, fifo)
+		Misc.raise_ifn(max_workers is None or isinstance(max_workers, int), Exceptions.InvalidArgumentException(EventedStream.__init__, 'max_workers', type(max_workers), (int,)))
+		Misc.raise_ifn(max_workers is None or max_workers > 0, ValueError('Max workers must be greater than 0'))
+		Misc.raise_ifn(thread_executor is None or isinstance(thread_executor, concurrent.futures.Executor), Exceptions.InvalidArgumentException(EventedStream.__init__, 'thread_executor', type(thread_executor), (concurrent.futures.Executor,)))
+		Misc.raise_ifn(process_executor is None or isinstance(process_executor, concurrent.futures.Executor), Exceptions.InvalidArgumentException(EventedStream.__init__, 'process_executor', type(process_executor), (concurrent.futures.Executor,)))
+		self.__callbacks__: dict[str, dict[typing.Callable, int]] = {'write': {}, 'read': {}, 'pipe': {}, 'del_pipe': {}, 'close': {}, 'peek': {}, 'flush': {}}
+		self.__max_workers__: typing.Optional[int] = max_workers
+		self.__ordered__: bool = bool(ordered)
+		self.__coalesce__: bool = bool(coalesce)
+		self.__executors__: dict[int, concurrent.futures.Executor] = {}
+		self.__owned_executors__: list[concurrent.futures.Executor] = []
+		self.__dispatch_lock__: threading.Condition = threading.Condition(threading.RLock())
+		self.__outstanding__: int = 0
+		self.__pending__: dict[tuple[str, typing.Callable], concurrent.futures.Future] = {}
+		self.__queues__: dict[str, collections.deque[list]] = {}
+		self.__running__: set[str] = set()
+
+		if thread_executor is not None:
+			self.__executors__[EventedStream.MULTITHREADING] = thread_executor
+
+		if process_executor is not None:
+			self.__executors__[EventedStream.MULTIPROCESSING] = process_executor
+
+	def __executor__(self, threadability: int) -> concurrent.futures.Executor:
+		"""
+		INTERNAL METHOD
+		Gets the worker pool for a threadability, creating it on first use
+		Must be called with the dispatch lock held
+		:param threadability: Either 'EventedStream.MULTITHREADING' or 'EventedStream.MULTIPROCESSING'
+		:return: The executor
+		"""
+
+		executor: typing.Optional[concurrent.futures.Executor] = self.__executors__.get(threadability)
+
+		if executor is None:
+			executor = concurrent.futures.ThreadPoolExecutor(self.__max_workers__) if threadability == EventedStream.MULTITHREADING else concurrent.futures.ProcessPoolExecutor(self.__max_workers__)
+			self.__executors__[threadability] = executor
+			self.__owned_executors__.append(executor)
+
+		return executor
+
+	@staticmethod
+	def __invoke__(payload: bytes) -> None:
+		"""
+		INTERNAL METHOD
+		Runs a multiprocessed callback within a worker
+		:param payload: The callback, arguments and keyword arguments serialized with dill
+		"""
+
+		callback, args, kwargs = dill.loads(payload)
+		callback(*args, **kwargs)
+
+	def __submit__(self, threadability: int, callback: typing.Callable, args: tuple, kwargs: dict) -> concurrent.futures.Future:
+		"""
+		INTERNAL METHOD
+		Submits a callback to its worker pool
+		Must be called with the dispatch lock held
+		If the pool has already been shut down, the callback runs on the calling thread
+		:param threadability: The threadability of the callback
+		:param callback: The callback to run
+		:param args: Arguments to call the callback with, or the serialized call from 'EventedStream::__dispatch__' for multiprocessed callbacks
+		:param kwargs: Keyword arguments to call the callback with
+		:return: The callback's future
+		"""
+
+		if threadability == EventedStream.MULTIPROCESSING:
+			callback = EventedStream.__invoke__
+
+		try:
+			return self.__executor__(threadability).submit(callback, *args, **kwargs)
+		except RuntimeError:
+			future: concurrent.futures.Future = concurrent.futures.Future()
+
+			try:
+				future.set_result(callback(*args, **kwargs))
+			except BaseException as err:
+				future.set_exception(err)
+
+			return future
+
+	def __finish__(self, future: concurrent.futures.Future, eid: typing.Optional[str] = None, key: typing.Optional[tuple[str, typing.Callable]] = None) -> None:
+		"""
+		INTERNAL METHOD
+		Completes a dispatched callback, reporting its error and starting the next ordered callback for its event
+		:param future: The finished future
+		:param eid: For ordered dispatch, the event ID of the callback
+		:param key: For coalesced unordered dispatch, the pending key of the callback
+		"""
+
+		if not future.cancelled() and future.exception() is not None:
+			traceback.print_exception(future.exception(), file=sys.stderr)
+
+		with self.__dispatch_lock__:
+			if key is not None and self.__pending__.get(key) is future:
+				del self.__pending__[key]
+
+			if eid is not None:
+				self.__running__.discard(eid)
+				self.__start_next__(eid)
+
+			if not future.cancelled():
+				self.__outstanding__ -= 1
+
+			self.__dispatch_lock__.notify_all()
+
+	def __start_next__(self, eid: str) -> None:
+		"""
+		INTERNAL METHOD
+		Starts the next queued ordered callback for an event if none is running
+		Must be called with the dispatch lock held
+		:param eid: The event ID
+		"""
+
+		waiting: typing.Optional[collections.deque[list]] = self.__queues__.get(eid)
+
+		if eid in self.__running__ or waiting is None or len(waiting) == 0:
+			return
+
+		callback, threadability, args, kwargs = waiting.popleft()
+		self.__running__.add(eid)
+		self.__submit__(threadability, callback, args, kwargs).add_done_callback(lambda future: self.__finish__(future, eid=eid))
+
+	def __dispatch__(self, eid: str, callback: typing.Callable, threadability: int, args: tuple, kwargs: dict) -> None:
+		"""
+		INTERNAL METHOD
+		Queues a pooled callback, applying ordering and coalescing
+		:param eid: The event ID
+		:param callback: The callback to run
+		:param threadability: The threadability of the callback
+		:param args: Arguments to call the callback with
+		:param kwargs: Keyword arguments to call the callback with
+		:raises StreamError: If a multiprocessed callback or its arguments cannot be serialized
+		"""
+
+		if threadability == EventedStream.MULTIPROCESSING:
+			try:
+				args, kwargs = (dill.dumps((callback, args, kwargs)),), {}
+			except Exception as err:
+				raise StreamError(f'Failed to serialize multiprocessed \'{eid}\' callback: {err}') from err
+
+		with self.__dispatch_lock__:
+			if self.__ordered__:
+				waiting: collections.deque[list] = self.__queues__.setdefault(eid, collections.deque())
+				queued: typing.Optional[list] = next((entry for entry in waiting if entry[0] is callback), None) if self.__coalesce__ else None
+
+				if queued is not None:
+					queued[2], queued[3] = args, kwargs
+				else:
+					waiting.append([callback, threadability, args, kwargs])
+					self.__outstanding__ += 1
+					self.__start_next__(eid)
+
+				return
+
+			key: tuple[str, typing.Callable] = (eid, callback)
+
+			if self.__coalesce__ and key in self.__pending__ and self.__pending__[key].cancel():
+				self.__pending__.pop(key, None)
+				self.__outstanding__ -= 1
+
+			future: concurrent.futures.Future = self.__submit__(threadability, callback, args, kwargs)
+			self.__outstanding__ += 1
+
+			if self.__coalesce__ and not future.done():
+				self.__pending__[key] = future
+
+		future.add_done_callback(lambda done: self.__finish__(done, key=key if self.__coalesce__ else None))
+
+	def __exec__(self, eid: str, *args, **kwargs) -> None:
+		"""
+		INTERNAL METHOD
+		Executes the callbacks for a specified event ID
+		:param eid: The event ID
+		:param args: Arguments to call callbacks with
+		:param kwargs: Keyword arguments to call callbacks with
+		"""
+
+		assert eid in self.__callbacks__
+
+		for callback, threaded in tuple(self.__callbacks__[eid].items()):
+			if threaded == EventedStream.NO_THREADING:
+				callback(*args, **kwargs)
+			elif threaded == EventedStream.MULTITHREADING or threaded == EventedStream.MULTIPROCESSING:
+				self.__dispatch__(eid, callback, threaded, args, kwargs)
+
+	def close(self) -> None:
+		"""
+		Closes the stream
+		Already dispatched callbacks still run; worker pools created by this stream are shut down once they finish
+		:raises StreamError: If the stream is already closed
+		"""
+
+		super().close()
+		self.__exec__('close')
+
+		for executor in self.__owned_executors__:
+			executor.shutdown(wait=False)
+
+	def join(self, timeout: typing.Optional[float] = None) -> bool:
+		"""
+		Blocks until all dispatched threaded and multiprocessed callbacks have finished
+		:param timeout: The maximum number of seconds to wait or None to wait indefinitely
+		:return: Whether all callbacks finished
+		"""
+
+		with self.__dispatch_lock__:
+			return self.__dispatch_lock__.wait_for(lambda: self.__outstanding__ == 0, timeout)
+
+	def read(self, __size: typing.Optional[int] = ..., *, timeout: typing.Optional[float] = ...) -> tuple[T, ...]:
+		data: tuple[typing.Any, ...] = super().read(__size, timeout=timeout)
+		self.__exec__('read', data)
+		return data
+
+	def peek(self, __size: typing.Optional[int] = ...) -> tuple[T, ...]:
+		data: tuple[typing.Any, ...] = super().peek(__size)
+		self.__exec__('peek', data)
+		return data
+
+	def write(self, __object: T, *, ignore_invalid: bool = False, timeout: typing.Optional[float] = ...) -> EventedStream[T]:
+		super().write(__object, ignore_invalid=ignore_invalid, timeout=timeout)
+		self.__exec__('write', __object)
+		return self
+
+	def writelines(self, __lines: typing.Iterable[T], *, ignore_invalid: bool = False, timeout: typing.Optional[float] = ...) -> EventedStream[T]:
+		lines: tuple[T, ...] = tuple(__lines)
+		super().writelines(lines, ignore_invalid=ignore_invalid, timeout=timeout)
+
+		for line in lines:
+			self.__exec__('write', line)
+
+		return self
+
+	def pipe(self, *pipes: io.BufferedIOBase, asynchronous: bool = False, max_pending: int = -1) -> EventedStream[T]:
+		super().pipe(*pipes, asynchronous=asynchronous, max_pending=max_pending)
+		self.__exec__('pipe', *pipes)
+		return self
+
+	def del_pipe(self, *pipes: io.BufferedIOBase) -> EventedStream[T]:
+		super().del_pipe(*pipes)
+		self.__exec__('del_pipe', *pipes)
+		return self
+
+	def flush(self, ignore_invalid: bool = False) -> EventedStream[T]:
+		super().flush(ignore_invalid)
+		self.__exec__('flush')
+		return self
+
+	def on(self, eid: str, callback: typing.Optional[typing.Callable] = ..., *, threadability: int = NO_THREADING) -> None | typing.Callable:
+		"""
+		Binds a callback to the specified event ID
+		Can be used as a decorator
+		:param eid: The event ID, one of<br/>
+		 . . . . . 'write' - Called when an item is written to this stream<br/>
+		 . . . . . 'read' - Called when an item is read from this stream<br/>
+		 . . . . . 'peek' - called when an item is peeked from this stream<br/>
+		 . . . . . 'pipe' - Called when a stream is connected to this stream (Called once for every pipe to add)<br/>
+		 . . . . . 'del_pipe' - Called when a stream is disconnected to this stream (Called once for every pipe to remove)<br/>
+		 . . . . . 'flush' - Called when this stream is flushed<br/>
+		 . . . . . 'close' - Called when this stream is closed
+		:param callback: The callback to bind or None if a decorator
+		:param threadability: The threading to use, one of<br/>
+		. . . . . 0 - No Threading<br/>
+		. . . . . 1 - This stream's thread pool<br/>
+		. . . . . 2 - This stream's process pool; the callback and its arguments are serialized with dill, so lambdas and closures are supported
+		:return: The binder if used as a decorator otherwise None
+		:raises NameError: If the event ID is not valid
+		:raises AssertionError: If the supplied callback is not callable
+		"""
+
+		if eid not in self.__callbacks__:
+			raise NameError(f'Unexpected event ID, expected one of:\n  {"\n  ".join(self.__callbacks__.keys())}')
+
+		elif callback is None or callback is ...:
+			def binder(func: typing.Callable):
+				assert callable(func), 'Callback is not callable'
+				self.__callbacks__[eid][func] = threadability
+
+			return binder
+
+		else:
+			assert callable(callback), 'Callback is not callable'
+			self.__callbacks__[eid][callback] = threadability
+
+	def off(self, eid: str, callback: typing.Optional[typing.Callable] = ...) -> None:
+		"""
+		Unbinds a callback from the specified event ID
+		:param eid: The event ID, see 'EventedStream::on' for a list of valid IDs
+		:param callback: The callable to unbind, or all if no callback supplied
+		:raises NameError: If the event ID is not valid
+		:raises AssertionError: If the supplied callback is not bound
+		"""
+
+		if eid not in self.__callbacks__:
+			raise NameError(f'Unexpected event ID, expected one of:\n  {"\n  ".join(self.__callbacks__.keys())}')
+
+		elif callback is None or callback is ...:
+			self.__callbacks__[eid].clear()
+
+		else:
+			assert callback in self.__callbacks__[eid], 'Specified callback not bound'
+			del self.__callbacks__[eid][callback]
+
+
+class LinqStream[T](typing.Reversible):
+	"""
+	Lazy generator mimicking C# LINQ or Java Streams
+	Transform, filter, skip and take calls are recorded as a logical plan which is optimized when the query is evaluated
+	Deferred sources wrapping another query redo their work on every enumeration, so queries built on them can be replayed
+	"""
+
+	class Accumulator:
+		"""
+		Incremental per-group aggregation used by 'LinqStream::group_aggregate'
+		Only the running state is kept; elements are never stored
+		"""
+
+		BUILTINS: tuple[str, ...] = ('count', 'sum', 'min', 'max', 'mean', 'first', 'last')
+
+		def __init__(self, combiner: typing.Callable[[typing.Any, typing.Any], typing.Any], initial: typing.Any = ..., *, selector: typing.Optional[typing.Callable[[typing.Any], typing.Any]] = None, finalizer: typing.Optional[typing.Callable[[typing.Any], typing.Any]] = None):
+			"""
+			Incremental per-group aggregation used by 'LinqStream::group_aggregate'
+			- Constructor -
+			:param combiner: The function combining the running state with the next selected value
+			:param initial: The initial state, or the first selected value of each group if not supplied
+			:param selector: The function selecting the value to aggregate from each element or None to use the element
+			:param finalizer: The function converting the final state into the result or None to use the state
+			:raises InvalidArgumentException: If 'combiner', 'selector' or 'finalizer' is not callable
+			"""
+
+			Misc.raise_ifn(callable(combiner), Exceptions.InvalidArgumentException(LinqStream.Accumulator.__init__, 'combiner', type(combiner)))
+			Misc.raise_ifn(selector is None or callable(selector), Exceptions.InvalidArgumentException(LinqStream.Accumulator.__init__, 'selector', type(selector)))
+			Misc.raise_ifn(finalizer is None or callable(finalizer), Exceptions.InvalidArgumentException(LinqStream.Accumulator.__init__, 'finalizer', type(finalizer)))
+			self.__combiner__: typing.Callable[[typing.Any, typing.Any], typing.Any] = combiner
+			self.__initial__: typing.Any = initial
+			self.__selector__: typing.Optional[typing.Callable[[typing.Any], typing.Any]] = selector
+			self.__finalizer__: typing.Optional[typing.Callable[[typing.Any], typing.Any]] = finalizer
+
+		@staticmethod
+		def builtin(name: str, selector: typing.Optional[typing.Callable[[typing.Any], typing.Any]] = None) -> LinqStream.Accumulator:
+			"""
+			Creates one of the built-in accumulators
+			:param name: One of 'count', 'sum', 'min', 'max', 'mean', 'first' or 'last'
+			:param selector: The function selecting the value to aggregate from each element or None to use the element
+			:return: The accumulator
+			:raises ValueError: If 'name' is not a built-in accumulator
+			"""
+
+			if name == 'count':
+				return LinqStream.Accumulator(lambda state, _: state + 1, 0)
+			elif name == 'sum':
+				return LinqStream.Accumulator(operator.add, selector=selector)
+			elif name == 'min':
+				return LinqStream.Accumulator(min, selector=selector)
+			elif name == 'max':
+				return LinqStream.Accumulator(max, selector=selector)
+			elif name == 'mean':
+				return LinqStream.Accumulator(lambda state, value: (state[0] + value, state[1] + 1), (0, 0), selector=selector, finalizer=lambda state: state[0] / state[1])
+			elif name == 'first':
+				return LinqStream.Accumulator(lambda state, _: state, selector=selector)
+			elif name == 'last':
+				return LinqStream.Accumulator(lambda _, value: value, selector=selector)
+			else:
+				raise ValueError(f'Accumulator must be one of {", ".join(repr(x) for x in LinqStream.Accumulator.BUILTINS)}; got \'{name}\'')
+
+		@staticmethod
+		def create(specification: str | tuple[str, typing.Callable[[typing.Any], typing.Any]] | typing.Callable[[typing.Any, typing.Any], typing.Any] | LinqStream.Accumulator) -> LinqStream.Accumulator:
+			"""
+			Converts an accumulator specification into an accumulator
+			:param specification: A built-in name, a pair of built-in name and selector, a combiner folding each group from its first element, or an accumulator
+			:return: The accumulator
+			:raises InvalidArgumentException: If 'specification' is not a valid specification
+			:raises ValueError: If a built-in name is not a built-in accumulator
+			"""
+
+			if isinstance(specification, LinqStream.Accumulator):
+				return specification
+			elif isinstance(specification, str):
+				return LinqStream.Accumulator.builtin(specification)
+			elif isinstance(specification, tuple) and len(specification) == 2 and isinstance(specification[0], str) and callable(specification[1]):
+				return LinqStream.Accumulator.builtin(*specification)
+			elif callable(specification):
+				return LinqStream.Accumulator(specification)
+			else:
+				raise Exceptions.InvalidArgumentException(LinqStream.Accumulator.create, 'specification', type(specification), (str, tuple, LinqStream.Accumulator))
+
+		def start(self, element: typing.Any) -> typing.Any:
+			"""
+			:param element: The first element of a group
+			:return: The initial state of the group
+			"""
+
+			value: typing.Any = element if self.__selector__ is None else self.__selector__(element)
+			return value if self.__initial__ is ... else self.__combiner__(self.__initial__, value)
+
+		def step(self, state: typing.Any, element: typing.Any) -> typing.Any:
+			"""
+			:param state: The running state of a group
+			:param element: The next element of the group
+			:return: The new state of the group
+			"""
+
+			return self.__combiner__(state, element if self.__selector__ is None else self.__selector__(element))
+
+		def __compile__(self) -> typing.Callable[[typing.Any, typing.Any], typing.Any]:
+			"""
+			INTERNAL METHOD
+			:return: A step function equivalent to 'LinqStream.Accumulator::step' without the per-call selector check
+			"""
+
+			combiner: typing.Callable[[typing.Any, typing.Any], typing.Any] = self.__combiner__
+			selector: typing.Optional[typing.Callable[[typing.Any], typing.Any]] = self.__selector__
+			return combiner if selector is None else lambda state, element: combiner(state, selector(element))
+
+		def finish(self, state: typing.Any) -> typing.Any:
+			"""
+			:param state: The final state of a group
+			:return: The aggregated result
+			"""
+
+			return state if self.__finalizer__ is None else self.__finalizer__(state)
+
+	class Cache[T](typing.Iterable[T]):
+		"""
+		Replayable source used by 'LinqStream::cache'
+		The wrapped iterable is enumerated at most once; its elements are recorded and replayed to every iterator, including concurrent ones
+		"""
+
+		def __init__(self, iterable: typing.Iterable[T], max_memory: typing.Optional[int] = None, spill_dir: typing.Optional[str] = None, codec: typing.Any = pickle):
+			"""
+			Replayable source used by 'LinqStream::cache'
+			- Constructor -
+			:param iterable: The source iterable
+			:param max_memory: The estimated number of bytes of elements held in memory before spilling or None to never spill
+			:param spill_dir: The directory for the spill file or None for the system temporary directory
+			:param codec: An object providing 'dumps' and 'loads' for lists of elements
+			"""
+
+			self.__iterable__: typing.Optional[typing.Iterable[T]] = iterable
+			self.__iterator__: typing.Optional[typing.Iterator[T]] = None
+			self.__lock__: threading.Lock = threading.Lock()
+			self.__memory__: list[T] = []
+			self.__memory_size__: int = 0
+			self.__max_memory__: typing.Optional[int] = max_memory
+			self.__spill_dir__: typing.Optional[str] = spill_dir
+			self.__spill_file__: typing.Optional[typing.IO[bytes]] = None
+			self.__spill_size__: int = 0
+			self.__spilled__: int = 0
+			self.__codec__: typing.Any = codec
+			self.__exhausted__: bool = False
+
+		def __iter__(self) -> typing.Iterator[T]:
+			lock: threading.Lock = self.__lock__
+			index: int = 0
+			block_index: int = 0
+			offset: int = 0
+
+			while True:
+				data: typing.Optional[bytes] = None
+				elements: list[T] = []
+
+				with lock:
+					if index < self.__spilled__:
+						self.__spill_file__.seek(offset)
+						length: int = int.from_bytes(self.__spill_file__.read(8), 'little')
+						data = self.__spill_file__.read(length)
+						offset += 8 + length
+					elif (start := index - self.__spilled__) < len(self.__memory__):
+						elements = self.__memory__[start:]
+						block_index = self.__spilled__
+						offset = self.__spill_size__
+					elif self.__exhausted__:
+						return
+
+				if data is not None:
+					block: list[T] = self.__codec__.loads(data)
+					elements = block[index - block_index:] if index > block_index else block
+					block_index += len(block)
+					index += len(elements)
+					yield from elements
+				elif len(elements) > 0:
+					index += len(elements)
+					yield from elements
+				else:
+					# At the end of the recording; pull from the source until another iterator gets ahead
+					while True:
+						with lock:
+							if (pulled := self.__pull__(index)) is not None:
+								block_index = self.__spilled__
+								offset = self.__spill_size__
+
+						if pulled is None:
+							break
+						elif len(pulled) == 0:
+							return
+
+						index += 1
+						yield pulled[0]
+
+		def __pull__(self, index: int) -> typing.Optional[tuple[T, ...]]:
+			"""
+			INTERNAL METHOD
+			Records the next element of the source; must be called with the lock held
+			:param index: The index of the element the calling iterator needs
+			:return: A tuple containing the next element, an empty tuple if the source is exhausted or None if the element was already recorded
+			"""
+
+			if index != self.__spilled__ + len(self.__memory__):
+				return None
+			elif self.__exhausted__:
+				return ()
+			elif self.__iterator__ is None:
+				self.__iterator__ = iter(self.__iterable__)
+
+			try:
+				element: T = next(self.__iterator__)
+			except StopIteration:
+				self.__exhausted__ = True
+				self.__iterable__ = None
+				self.__iterator__ = None
+				return ()
+
+			self.__memory__.append(element)
+
+			if self.__max_memory__ is not None:
+				self.__memory_size__ += LinqStream.__estimate__(element)
+
+				if self.__memory_size__ >= self.__max_memory__:
+					self.__flush__()
+
+			return element,
+
+		def __flush__(self) -> None:
+			"""
+			INTERNAL METHOD
+			Appends the in-memory elements to the spill file as length-prefixed blocks; must be called with the lock held
+			"""
+
+			if self.__spill_file__ is None:
+				self.__spill_file__ = tempfile.TemporaryFile(prefix='linq-cache-', dir=self.__spill_dir__)
+
+			self.__spill_file__.seek(0, os.SEEK_END)
+
+			for i in range(0, len(self.__memory__), LinqStream.SPILL_BLOCK_SIZE):
+				data: bytes = self.__codec__.dumps(self.__memory__[i:i + LinqStream.SPILL_BLOCK_SIZE])
+				self.__spill_file__.write(len(data).to_bytes(8, 'little'))
+				self.__spill_file__.write(data)
+				self.__spill_size__ += 8 + len(data)
+
+			self.__spill_file__.flush()
+			self.__spilled__ += len(self.__memory__)
+			self.__memory__ = []
+			self.__memory_size__ = 0
+
+		def close(self) -> None:
+			"""
+			Releases all recorded elements and the spill file
+			Later iterators will be empty
+			"""
+
+			with self.__lock__:
+				if self.__spill_file__ is not None:
+					self.__spill_file__.close()
+
+				self.__exhausted__ = True
+				self.__iterable__ = None
+				self.__iterator__ = None
+				self.__memory__ = []
+				self.__memory_size__ = 0
+				self.__spill_file__ = None
+				self.__spill_size__ = 0
+				self.__spilled__ = 0
+
+		@property
+		def exhausted(self) -> bool:
+			"""
+			:return: Whether the source has been fully recorded
+			"""
+
+			return self.__exhausted__
+
+		@property
+		def spilled(self) -> int:
+			"""
+			:return: The number of elements written to the spill file
+			"""
+
+			return self.__spilled__
+
+	class WindowAccumulator:
+		"""
+		Invertible aggregation used by 'LinqStream::rolling'
+		Elements are added as they enter a window and removed in the same order as they leave it, so each window costs O(1) amortized
+		"""
+
+		BUILTINS: tuple[str, ...] = ('count', 'sum', 'mean', 'min', 'max')
+
+		def __init__(self, factory: typing.Callable[[], typing.Any], add: typing.Callable[[typing.Any, typing.Any], typing.Any], remove: typing.Callable[[typing.Any, typing.Any], typing.Any], *, selector: typing.Optional[typing.Callable[[typing.Any], typing.Any]] = None, finalizer: typing.Optional[typing.Callable[[typing.Any], typing.Any]] = None):
+			"""
+			Invertible aggregation used by 'LinqStream::rolling'
+			- Constructor -
+			:param factory: The function creating the state of an empty window
+			:param add: The function combining the state with a value entering the window
+			:param remove: The function removing the oldest value in the window from the state
+			:param selector: The function selecting the value to aggregate from each element or None to use the element
+			:param finalizer: The function converting the state into the result or None to use the state
+			:raises InvalidArgumentException: If 'factory', 'add', 'remove', 'selector' or 'finalizer' is not callable
+			"""
+
+			Misc.raise_ifn(callable(factory), Exceptions.InvalidArgumentException(LinqStream.WindowAccumulator.__init__, 'factory', type(factory)))
+			Misc.raise_ifn(callable(add), Exceptions.InvalidArgumentException(LinqStream.WindowAccumulator.__init__, 'add', type(add)))
+			Misc.raise_ifn(callable(remove), Exceptions.InvalidArgumentException(LinqStream.WindowAccumulator.__init__, 'remove', type(remove)))
+			Misc.raise_ifn(selector is None or callable(selector), Exceptions.InvalidArgumentException(LinqStream.WindowAccumulator.__init__, 'selector', type(selector)))
+			Misc.raise_ifn(finalizer is None or callable(finalizer), Exceptions.InvalidArgumentException(LinqStream.WindowAccumulator.__init__, 'finalizer', type(finalizer)))
+			self.__factory__: typing.Callable[[], typing.Any] = factory
+			self.__adder__: typing.Callable[[typing.Any, typing.Any], typing.Any] = add
+			self.__remover__: typing.Callable[[typing.Any, typing.Any], typing.Any] = remove
+			self.__selector__: typing.Optional[typing.Callable[[typing.Any], typing.Any]] = selector
+			self.__finalizer__: typing.Optional[typing.Callable[[typing.Any], typing.Any]] = finalizer
+
+		@staticmethod
+		def __extreme_add__(state: collections.deque, value: typing.Any, better: typing.Callable[[typing.Any, typing.Any], bool]) -> collections.deque:
+			"""
+			INTERNAL METHOD
+			Adds a value to a monotonic deque whose first value is the extreme of the window
+			:param state: The monotonic deque
+			:param value: The value entering the window
+			:param better: The comparison returning whether the first value should replace the second
+			:return: The monotonic deque
+			"""
+
+			while len(state) > 0 and better(value, state[-1]):
+				state.pop()
+
+			state.append(value)
+			return state
+
+		@staticmethod
+		def __extreme_remove__(state: collections.deque, value: typing.Any) -> collections.deque:
+			"""
+			INTERNAL METHOD
+			Removes the oldest value in the window from a monotonic deque
+			:param state: The monotonic deque
+			:param value: The value leaving the window
+			:return: The monotonic deque
+			"""
+
+			if state[0] == value:
+				state.popleft()
+
+			return state
+
+		@staticmethod
+		def builtin(name: str, selector: typing.Optional[typing.Callable[[typing.Any], typing.Any]] = None) -> LinqStream.WindowAccumulator:
+			"""
+			Creates one of the built-in window accumulators
+			'min' and 'max' keep a monotonic deque so that removals stay O(1) amortized
+			:param name: One of 'count', 'sum', 'mean', 'min' or 'max'
+			:param selector: The function selecting the value to aggregate from each element or None to use the element
+			:return: The window accumulator
+			:raises ValueError: If 'name' is not a built-in window accumulator
+			"""
+
+			if name == 'count':
+				return LinqStream.WindowAccumulator(int, lambda state, _: state + 1, lambda state, _: state - 1)
+			elif name == 'sum':
+				return LinqStream.WindowAccumulator(int, operator.add, operator.sub, selector=selector)
+			elif name == 'mean':
+				return LinqStream.WindowAccumulator(lambda: (0, 0), lambda state, value: (state[0] + value, state[1] + 1), lambda state, value: (state[0] - value, state[1] - 1), selector=selector, finalizer=lambda state: state[0] / state[1])
+			elif name == 'min':
+				return LinqStream.WindowAccumulator(collections.deque, lambda state, value: LinqStream.WindowAccumulator.__extreme_add__(state, value, operator.lt), LinqStream.WindowAccumulator.__extreme_remove__, selector=selector, finalizer=operator.itemgetter(0))
+			elif name == 'max':
+				return LinqStream.WindowAccumulator(collections.deque, lambda state, value: LinqStream.WindowAccumulator.__extreme_add__(state, value, operator.gt), LinqStream.WindowAccumulator.__extreme_remove__, selector=selector, finalizer=operator.itemgetter(0))
+			else:
+				raise ValueError(f'Window accumulator must be one of {", ".join(repr(x) for x in LinqStream.WindowAccumulator.BUILTINS)}; got \'{name}\'')
+
+		@staticmethod
+		def create(specification: str | tuple[str, typing.Callable[[typing.Any], typing.Any]] | LinqStream.WindowAccumulator) -> LinqStream.WindowAccumulator:
+			"""
+			Converts a window accumulator specification into a window accumulator
+			:param specification: A built-in name, a pair of built-in name and selector, or a window accumulator
+			:return: The window accumulator
+			:raises InvalidArgumentException: If 'specification' is not a valid specification
+			:raises ValueError: If a built-in name is not a built-in window accumulator
+			"""
+
+			if isinstance(specification, LinqStream.WindowAccumulator):
+				return specification
+			elif isinstance(specification, str):
+				return LinqStream.WindowAccumulator.builtin(specification)
+			elif isinstance(specification, tuple) and len(specification) == 2 and isinstance(specification[0], str) and callable(specification[1]):
+				return LinqStream.WindowAccumulator.builtin(*specification)
+			else:
+				raise Exceptions.InvalidArgumentException(LinqStream.WindowAccumulator.create, 'specification', type(specification), (str, tuple, LinqStream.WindowAccumulator))
+
+		def __compile__(self) -> tuple[typing.Callable[[typing.Any, typing.Any], typing.Any], typing.Callable[[typing.Any, typing.Any], typing.Any]]:
+			"""
+			INTERNAL METHOD
+			:return: The add and remove functions taking elements rather than selected values
+			"""
+
+			add: typing.Callable[[typing.Any, typing.Any], typing.Any] = self.__adder__
+			remove: typing.Callable[[typing.Any, typing.Any], typing.Any] = self.__remover__
+			selector: typing.Optional[typing.Callable[[typing.Any], typing.Any]] = self.__selector__
+
+			if selector is None:
+				return add, remove
+
+			return (lambda state, element: add(state, selector(element))), (lambda state, element: remove(state, selector(element)))
+
+		def empty(self) -> typing.Any:
+			"""
+			:return: The state of an empty window
+			"""
+
+			return self.__factory__()
+
+		def finish(self, state: typing.Any) -> typing.Any:
+			"""
+			:param state: The state of a window
+			:return: The aggregated result
+			"""
+
+			return state if self.__finalizer__ is None else self.__finalizer__(state)
+
+	class Sorted[T](typing.Iterable[T]):
+		"""
+		Deferred sort used by 'LinqStream::sort'
+		The elements are collected up front; a full enumeration sorts them once in place, while queries needing only a prefix select it with a heap instead
+		"""
+
+		def __init__(self, elements: list[T], key: typing.Optional[typing.Callable[[T], typing.Any]], reverse: bool):
+			"""
+			Deferred sort used by 'LinqStream::sort'
+			- Constructor -
+			:param elements: The collected elements to sort; the list is owned and reordered by this instance
+			:param key: The sort key or None
+			:param reverse: Whether to sort in reverse order
+			"""
+
+			self.__elements__: list[T] = elements
+			self.__key__: typing.Optional[typing.Callable[[T], typing.Any]] = key
+			self.__reverse__: bool = reverse
+			self.__sorted__: bool = False
+
+		def __iter__(self) -> typing.Iterator[T]:
+			if not self.__sorted__:
+				self.__elements__.sort(key=self.__key__, reverse=self.__reverse__)
+				self.__sorted__ = True
+
+			return iter(self.__elements__)
+
+		def head(self, count: int) -> typing.Iterable[T]:
+			"""
+			:param count: The number of leading elements to select
+			:return: The first 'count' elements in sorted order
+			"""
+
+			return self.__elements__[:count] if self.__sorted__ else LinqStream.__select__(self.__elements__, count, self.__key__, self.__reverse__)
+
+	class ExternalSorted[T](typing.Iterable[T]):
+		"""
+		Deferred external sort used by 'LinqStream::sort' with a memory budget
+		The source query is cut into budget-sized sorted runs that are spilled to disk and merged lazily
+		"""
+
+		def __init__(self, query: LinqStream[T], key: typing.Optional[typing.Callable[[T], typing.Any]], reverse: bool, max_memory: int, spill_dir: typing.Optional[str], codec: typing.Any):
+			"""
+			Deferred external sort used by 'LinqStream::sort' with a memory budget
+			- Constructor -
+			:param query: The query to sort
+			:param key: The sort key or None
+			:param reverse: Whether to sort in reverse order
+			:param max_memory: The estimated number of bytes of elements held in memory per run
+			:param spill_dir: The directory for run files or None for the system temporary directory
+			:param codec: An object providing 'dumps' and 'loads'
+			"""
+
+			self.__query__: LinqStream[T] = query
+			self.__arguments__: tuple = (key, reverse, max_memory, spill_dir, codec)
+
+		def __iter__(self) -> typing.Iterator[T]:
+			return self.__query__.__external_sort__(*self.__arguments__)
+
+	class TopSelected[T](typing.Iterable[T]):
+		"""
+		Deferred top-k selection used by 'LinqStream::top' and 'LinqStream::bottom'
+		The source query is streamed through a heap holding at most 'count' elements
+		"""
+
+		def __init__(self, query: LinqStream[T], count: int, key: typing.Optional[typing.Callable[[T], typing.Any]], reverse: bool):
+			"""
+			Deferred top-k selection used by 'LinqStream::top' and 'LinqStream::bottom'
+			- Constructor -
+			:param query: The query to select from
+			:param count: The number of elements to select
+			:param key: The sort key or None
+			:param reverse: Whether to select the largest rather than the smallest elements
+			"""
+
+			self.__query__: LinqStream[T] = query
+			self.__arguments__: tuple = (count, key, reverse)
+
+		def __iter__(self) -> typing.Iterator[T]:
+			return iter(LinqStream.__select__(self.__query__, *self.__arguments__))
+
+	__optimizable__: bool = True
+	__fused_templates__: dict[tuple[str, ...], typing.Callable[..., typing.Iterator]] = {}
+	SPILL_BLOCK_SIZE: int = 4096
+	MERGE_FAN_IN: int = 64
+
+	def __init__(self, iterable: typing.Iterable[T]):
+		"""
+		Lazy generator mimicking C# LINQ or Java Streams
+		- Constructor -
+		:param iterable: The source iterable
+		:raises InvalidArgumentException: If 'iterable' is not iterable
+		"""
+
+		Misc.raise_ifn(isinstance(iterable, typing.Iterable), Exceptions.InvalidArgumentException(LinqStream.__init__, 'iterable', type(iterable)))
+		adopt: bool = type(self) is LinqStream and type(iterable) is LinqStream
+		self.__source__: typing.Iterable[T] = iterable.__source__ if adopt else iterable
+		self.__plan__: tuple[tuple, ...] = iterable.__plan__ if adopt else ()
+		self.__nodes__: typing.Optional[tuple[tuple, ...]] = None
+
+	def __contains__(self, item: T) -> bool:
+		"""
+		*Evaluates the query*
+		:param item: The item to check
+		:return: Whether the specified item is within this query
+		"""
+
+		for elem in self:
+			if elem == item:
+				return True
+
+		return False
+
+	def __iter__(self) -> typing.Iterator[T]:
+		if isinstance(self.__source__, numpy.ndarray) and (vector := self.__vectorize__()) is not None:
+			return LinqStream.__run__(vector[0], vector[2])
+
+		nodes: tuple[tuple, ...] = self.__optimize__()
+
+		if isinstance(self.__source__, LinqStream.Sorted) and len(nodes) > 0 and nodes[0][0] == 'slice' and nodes[0][2] is not None:
+			return LinqStream.__run__(self.__source__.head(nodes[0][2]), nodes)
+
+		return LinqStream.__run__(self.__source__, nodes)
+
+	def __reversed__(self) -> typing.Iterator[T]:
+		if (window := self.__window__(True, False)) is None:
+			return reversed(tuple(self))
+
+		iterator: typing.Iterable[T] = map(self.__source__.__getitem__, reversed(range(*window)))
+
+		for node in self.__optimize__():
+			if node[0] == 'fused':
+				iterator = LinqStream.__fuse__(node[1])(iterator)
+
+		return iterator
+
+	@staticmethod
+	def __run__(iterable: typing.Iterable[T], nodes: typing.Iterable[tuple]) -> typing.Iterator[T]:
+		"""
+		INTERNAL METHOD
+		Chains optimized plan nodes over an iterable
+		:param iterable: The source iterable
+		:param nodes: The optimized plan nodes to apply
+		:return: The resulting iterator
+		"""
+
+		for node in nodes:
+			iterable = itertools.islice(iterable, node[1], node[2]) if node[0] == 'slice' else LinqStream.__fuse__(node[1])(iterable)
+
+		return iter(iterable)
+
+	@staticmethod
+	def __numeric_source__(source: typing.Iterable) -> typing.Optional[tuple[numpy.ndarray, bool]]:
+		"""
+		INTERNAL METHOD
+		Views a numeric source as an ndarray block without copying where possible
+		Lists and tuples are not converted since conversion costs more than the Python kernels it would replace
+		:param source: The source iterable
+		:return: The block and whether the source yields numpy scalars, or None if the source is not a 1-dimensional numeric ndarray or numeric 'array.array'
+		"""
+
+		if isinstance(source, numpy.ndarray):
+			return (source, True) if source.ndim == 1 and source.dtype.kind in 'biuf' else None
+		elif isinstance(source, array.array):
+			return (numpy.frombuffer(source, dtype=source.typecode), False) if source.typecode in 'bBhHiIlLqQfd' else None
+		else:
+			return None
+
+	@staticmethod
+	def vectorized[C: typing.Callable](callback: C) -> C:
+		"""
+		Marks a transform or filter callback as also accepting whole ndarray blocks of a numeric query
+		A marked transform must return an array of the same shape; a marked filter must return a boolean mask of the same shape
+		The callback must still accept single elements, since it runs element-wise whenever the query cannot be vectorized
+		Unary ufuncs such as 'numpy.sqrt' need not be marked
+		:param callback: The callback to mark
+		:return: The marked callback, or a marked wrapper if the callback does not accept attributes
+		:raises InvalidArgumentException: If 'callback' is not callable
+		"""
+
+		Misc.raise_ifn(callable(callback), Exceptions.InvalidArgumentException(LinqStream.vectorized, 'callback', type(callback)))
+
+		try:
+			callback.__linq_vectorized__ = True
+			return callback
+		except (AttributeError, TypeError):
+			@functools.wraps(callback)
+			def wrapper(*args, **kwargs) -> typing.Any:
+				return callback(*args, **kwargs)
+
+			wrapper.__linq_vectorized__ = True
+			return wrapper
+
+	@staticmethod
+	def __vector_capable__(kind: str, callback: typing.Callable) -> bool:
+		"""
+		INTERNAL METHOD
+		:param kind: The stage kind
+		:param callback: The stage callback
+		:return: Whether the stage may be called with a whole block: a unary ufunc or a callback marked with 'LinqStream::vectorized'
+		"""
+
+		if kind != 'transform' and kind != 'filter':
+			return False
+		elif isinstance(callback, numpy.ufunc):
+			return callback.nin == 1 and callback.nout == 1
+		else:
+			return getattr(callback, '__linq_vectorized__', False) is True
+
+	@staticmethod
+	def __vector_stage__(block: numpy.ndarray, kind: str, callback: typing.Callable) -> typing.Optional[numpy.ndarray]:
+		"""
+		INTERNAL METHOD
+		Applies a single block-capable stage to a whole block
+		:param block: The input block
+		:param kind: The stage kind
+		:param callback: The stage callback, accepted by 'LinqStream::__vector_capable__'
+		:return: The resulting block or None if the callback returned an unexpected result
+		"""
+
+		result: typing.Any = callback(block)
+
+		if not isinstance(result, numpy.ndarray) or result.shape != block.shape:
+			return None
+		elif kind == 'transform':
+			return result if result.dtype.kind in 'biufc' else None
+		else:
+			return block[result] if result.dtype == numpy.bool_ else None
+
+	def __vectorize__(self, complete: bool = False) -> typing.Optional[tuple[numpy.ndarray, bool, tuple[tuple, ...]]]:
+		"""
+		INTERNAL METHOD
+		Evaluates the longest vectorizable prefix of this query's plan on an ndarray block
+		Only stages accepted by 'LinqStream::__vector_capable__' are called with blocks; vectorizability is decided from the plan before any stage runs
+		:param complete: Whether to return None unless the entire plan can be vectorized
+		:return: The resulting block, whether the source yields numpy scalars and the plan nodes still to be applied in Python, or None if the source is not numeric
+		:raises ValueError: If a marked stage returns something other than an array of the block's shape
+		"""
+
+		if not self.__optimizable__:
+			return None
+
+		nodes: tuple[tuple, ...] = self.__optimize__()
+		position: int = len(nodes)
+		index: int = 0
+
+		for i, node in enumerate(nodes):
+			blocked: list[int] = [j for j, stage in enumerate(node[1]) if not LinqStream.__vector_capable__(*stage)] if node[0] == 'fused' else []
+
+			if len(blocked) > 0:
+				position, index = i, blocked[0]
+				break
+
+		if complete and position < len(nodes):
+			return None
+		elif (numeric := LinqStream.__numeric_source__(self.__source__)) is None:
+			return None
+
+		block, native = numeric
+
+		for i, node in enumerate(nodes[:position + 1]):
+			if node[0] == 'slice':
+				block = block[node[1]:node[2]]
+				continue
+
+			for kind, callback in (node[1][:index] if i == position else node[1]):
+				if (result := LinqStream.__vector_stage__(block, kind, callback)) is None:
+					raise ValueError(f'Vectorized {kind} \'{LinqStream.__describe__(callback)}\' did not return an array of the block\'s shape')
+
+				block = result
+
+		return block, native, () if position == len(nodes) else (('fused', nodes[position][1][index:]), *nodes[position + 1:])
+
+	def __vector_result__(self) -> typing.Optional[tuple[numpy.ndarray, bool]]:
+		"""
+		INTERNAL METHOD
+		:return: The fully vectorized real-valued block of this query and whether the source yields numpy scalars, or None if any stage requires Python
+		"""
+
+		vector: typing.Optional[tuple[numpy.ndarray, bool, tuple[tuple, ...]]] = self.__vectorize__(True)
+		return None if vector is None or vector[0].dtype.kind not in 'biuf' else vector[:2]
+
+	@staticmethod
+	def __fuse__(stages: tuple[tuple[str, typing.Callable], ...]) -> typing.Callable[[typing.Iterable], typing.Iterator]:
+		"""
+		INTERNAL METHOD
+		Builds a single generator loop running all adjacent transform and filter stages
+		The loop body is compiled once per sequence of stage kinds and cached
+		:param stages: The stages as pairs of stage kind and callback
+		:return: A function accepting the upstream iterable and returning the fused iterator
+		"""
+
+		kinds: tuple[str, ...] = tuple(kind for kind, _ in stages)
+		template: typing.Optional[typing.Callable[..., typing.Iterator]] = LinqStream.__fused_templates__.get(kinds)
+
+		if template is None:
+			names: list[str] = [f'stage_{i}' for i in range(len(kinds))]
+			lines: list[str] = [f'def fused(iterable, {", ".join(names)}):', '\tfor x in iterable:']
+
+			for index, (name, kind) in enumerate(zip(names, kinds)):
+				if kind == 'filter':
+					lines.append(f'\t\tif not {name}(x):\n\t\t\tcontinue')
+				elif index == len(kinds) - 1:
+					lines.append(f'\t\tyield {name}(x)')
+				else:
+					lines.append(f'\t\tx = {name}(x)')
+
+			if kinds[-1] == 'filter':
+				lines.append('\t\tyield x')
+
+			namespace: dict[str, typing.Any] = {}
+			exec('\n'.join(lines), namespace)
+			template = LinqStream.__fused_templates__[kinds] = namespace['fused']
+
+		callbacks: tuple[typing.Callable, ...] = tuple(callback for _, callback in stages)
+		return lambda iterable: template(iterable, *callbacks)
+
+	def __chain__(self, operation: tuple) -> LinqStream:
+		"""
+		INTERNAL METHOD
+		:param operation: The logical operation to append
+		:return: A new query with the operation appended to this query's plan
+		"""
+
+		stream: LinqStream = LinqStream(self)
+		stream.__plan__ = (*stream.__plan__, operation)
+		return stream
+
+	def __optimize__(self) -> tuple[tuple, ...]:
+		"""
+		INTERNAL METHOD
+		Optimizes this query's logical plan, caching the result
+		Skip and take are merged into slices and moved toward the source past transforms, then adjacent transforms and filters are fused into one loop
+		:return: The optimized plan as 'slice' nodes (start, stop) and 'fused' nodes (stages)
+		"""
+
+		if self.__nodes__ is not None:
+			return self.__nodes__
+
+		nodes: list[tuple] = []
+
+		for operation in self.__plan__:
+			if operation[0] != 'slice':
+				nodes.append(operation)
+				continue
+
+			_, start, stop = operation
+			index: int = len(nodes)
+
+			while index > 0 and nodes[index - 1][0] == 'transform':
+				index -= 1
+
+			if index > 0 and nodes[index - 1][0] == 'slice':
+				_, previous_start, previous_stop = nodes[index - 1]
+				stop = None if stop is None and previous_stop is None else previous_stop if stop is None else previous_start + stop if previous_stop is None else min(previous_stop, previous_start + stop)
+				start = previous_start + start if stop is None else min(previous_start + start, stop)
+				nodes[index - 1] = ('slice', start, stop)
+			else:
+				nodes.insert(index, ('slice', start, stop))
+
+		fused: list[tuple] = []
+
+		for node in nodes:
+			if node[0] == 'slice':
+				fused.append(node)
+			elif len(fused) > 0 and fused[-1][0] == 'fused':
+				fused[-1] = ('fused', (*fused[-1][1], node))
+			else:
+				fused.append(('fused', (node,)))
+
+		self.__nodes__ = tuple(fused)
+		return self.__nodes__
+
+	def __window__(self, sequence: bool, ignore_filters: bool) -> typing.Optional[tuple[int, int]]:
+		"""
+		INTERNAL METHOD
+		Computes the range of source indices selected by this query's slices without iterating
+		:param sequence: Whether the source must support indexing rather than only 'len'
+		:param ignore_filters: Whether filters may appear after all slices; otherwise any filter prevents a direct answer
+		:return: The start and stop source indices or None if this query cannot be answered directly from its source
+		"""
+
+		source: typing.Iterable[T] = self.__source__
+
+		if not self.__optimizable__ or isinstance(source, (collections.abc.Iterator, Stream)) or not isinstance(source, collections.abc.Sequence if sequence else collections.abc.Sized):
+			return None
+
+		start: int = 0
+		stop: int = len(source)
+		filtered: bool = False
+
+		for node in self.__optimize__():
+			if node[0] == 'fused':
+				filtered = filtered or any(kind == 'filter' for kind, _ in node[1])
+			elif filtered:
+				return None
+			else:
+				previous: int = start
+				start = min(stop, start + node[1])
+				stop = stop if node[2] is None else min(stop, previous + node[2])
+
+		return None if filtered and not ignore_filters else (start, max(start, stop))
+
+	def __next__(self) -> T:
+		"""
+		*Evaluates one item from the query*
+		:return: The first item in the query
+		:raises StopIteration: If the query is empty
+		"""
+
+		return next(iter(self))
+
+	def cast[Q](self, cls: type[Q], *, on_error: typing.Literal['ignore', 'replace', 'pass', 'throw'] = 'replace') -> LinqStream[Q]:
+		"""
+		Casts all elements in this query to the specified type
+		:param cls: The type to cast to
+		:param on_error: How to handle serialization errors
+		:return: The modified query
+		:raises TypeError: If 'on_error' is throw and a cast error occurs
+
+		*Casting Errors*\n
+		- ignore: Erroneous element is removed from the resulting query\n
+		- replace: Erroneous element is replaced with 'None'\n
+		- pass: Erroneous element is passed as is without serialization\n
+		- throw: Error is raised
+		"""
+
+		def __cast(stream: LinqStream[T]) -> typing.Generator[Q]:
+			for elem in stream:
+				try:
+					yield cls(elem)
+				except Exception as err:
+					if on_error == 'ignore':
+						continue
+					elif on_error == 'replace':
+						yield None
+					elif on_error == 'pass':
+						yield elem
+					elif on_error == 'throw':
+						raise TypeError(f'Failed to cast element: \'{elem}\'') from err
+
+		return LinqStream(__cast(self))
+
+	def cast_if[Q](self, cls: type[Q], filter_: typing.Callable[[T], bool], *, on_error: typing.Literal['ignore', 'replace', 'pass', 'throw'] = 'replace') -> LinqStream[T | Q]:
+		"""
+		Casts matching elements in this query to the specified type
+		:param cls: The type to cast to
+		:param filter_: The filter to apply; matching elements will be cast
+		:param on_error: How to handle serialization errors
+		:return: The modified query
+		:raises TypeError: If 'on_error' is throw and a cast error occurs
+		:raises InvalidArgumentException: If 'filter_' is not callable
+
+		*Casting Errors*\n
+		- ignore: Erroneous element is removed from the resulting query\n
+		- replace: Erroneous element is replaced with 'None'\n
+		- pass: Erroneous element is passed as is without serialization\n
+		- throw: Error is raised
+		"""
+
+		Misc.raise_ifn(callable(filter_), Exceptions.InvalidArgumentException(LinqStream.filter, 'filter_', type(filter_)))
+
+		def __cast(stream: LinqStream[T]) -> typing.Generator[Q]:
+			for elem in stream:
+				if not filter_(elem):
+					yield elem
+					continue
+
+				try:
+					yield cls(elem)
+				except Exception as err:
+					if on_error == 'ignore':
+						continue
+					elif on_error == 'replace':
+						yield None
+					elif on_error == 'pass':
+						yield elem
+					elif on_error == 'throw':
+						raise TypeError(f'Failed to cast element: \'{elem}\'') from err
+
+		return LinqStream(__cast(self))
+
+	def for_each(self, callback: typing.Callable[[T], typing.Any]) -> None:
+		"""
+		*Evaluates the query*\n
+		Executes a callback for every element in this query
+		:param callback: The callback
+		:raises InvalidArgumentException: If the callback is not callable
+		"""
+
+		Misc.raise_ifn(callable(callback), Exceptions.InvalidArgumentException(LinqStream.for_each, 'callback', type(callback)))
+
+		for elem in self:
+			callback(elem)
+
+	def apply(self, collection: typing.Iterable[T], collector: typing.Optional[typing.Callable[[typing.Iterable[T], T], ...]] = None, *, clear: bool = True, clearer: typing.Optional[typing.Callable[[typing.Iterable[T]], ...]] = None) -> None:
+		"""
+		*Evaluates the query*\n
+		Collects all elements in this query into an existing collection or Stream; modifies the specified iterable in-place
+		:param collection: The iterable to modify
+		:param collector: Writer function describing how elements should be appended to the collection
+		:param clear: Whether the collection should be cleared before writing
+		:param clearer: Function describing how the collection should be cleared
+		:raises InvalidArgumentException: If the iterable is not mutable
+		"""
+
+		query: tuple[T, ...] = tuple(self)
+		Misc.raise_if(collector is not None and collector is not ... and not callable(collector), Exceptions.InvalidArgumentException(LinqStream.apply, 'collector', type(collector), (typing.Callable,)))
+		Misc.raise_if(clearer is not None and clearer is not ... and not callable(clearer), Exceptions.InvalidArgumentException(LinqStream.apply, 'clearer', type(clearer), (typing.Callable,)))
+
+		if clear and callable(clearer):
+			clearer(collection)
+		elif clear and isinstance(collection, typing.MutableSequence):
+			collection.clear()
+		elif clear and isinstance(collection, Stream):
+			collection.flush()
+		elif clear:
+			raise TypeError(f'Collection of type \'{type(collection).__name__}\' has no default clearer')
+
+		if callable(collector):
+			for element in query:
+				collector(collection, element)
+		elif isinstance(collection, typing.MutableSequence):
+			collection.extend(query)
+		elif isinstance(collection, Stream):
+			for element in query:
+				collection.write(element)
+		else:
+			raise TypeError(f'Collection of type \'{type(collection).__name__}\' has no default collector')
+
+	def any(self) -> bool:
+		"""
+		*Evaluates the query*
+		Answered from the source's length when the query contains no filters
+		:return: Whether this query contains any items
+		"""
+
+		if (window := self.__window__(False, False)) is not None:
+			return window[1] > window[0]
+
+		try:
+			next(self)
+			return True
+		except StopIteration:
+			return False
+
+	def at_least(self, count: int) -> bool:
+		"""
+		*Evaluates the query*
+		:param count: The minimum number of items
+		:return: Whether this query contains at least 'count' items
+		"""
+
+		try:
+			for _ in range(count):
+				next(self)
+			return True
+		except StopIteration:
+			return False
+
+	def at_most(self, count: int) -> bool:
+		"""
+		*Evaluates the query*
+		:param count: The maximum number of items
+		:return: Whether this query contains at most 'count' items
+		"""
+
+		try:
+			for _ in range(count + 1):
+				next(self)
+			return False
+		except StopIteration:
+			return True
+
+	def contains(self, elem: T) -> bool:
+		"""
+		*Evaluates the query*
+		:param elem: The item to check
+		:return: Whether the item is within this query
+		"""
+
+		return elem in self
+
+	def count(self) -> int:
+		"""
+		*Evaluates the query*
+		Answered from the source's length when the query contains no filters
+		:return: The number of elements in this query
+		"""
+
+		if (window := self.__window__(False, False)) is not None:
+			return window[1] - window[0]
+		elif (vector := self.__vectorize__(True)) is not None:
+			return int(vector[0].size)
+
+		return sum(1 for _ in self)
+
+	def __direct_first__(self) -> typing.Optional[tuple[bool, T]]:
+		"""
+		INTERNAL METHOD
+		Indexes the first element directly when the source is a sequence and the query contains no filters
+		:return: Whether an element exists and the transformed element, or None if the query cannot be answered directly
+		"""
+
+		if (window := self.__window__(True, False)) is None:
+			return None
+		elif window[1] <= window[0]:
+			return False, None
+
+		element: T = self.__source__[window[0]]
+
+		for node in self.__optimize__():
+			if node[0] == 'fused':
+				for _, callback in node[1]:
+					element = callback(element)
+
+		return True, element
+
+	def first(self) -> T:
+		"""
+		*Evaluates the query*
+		:return: The first element in this query
+		:raises IterableEmptyException: If this query contains no elements
+		"""
+
+		if (direct := self.__direct_first__()) is not None:
+			Misc.raise_ifn(direct[0], Exceptions.IterableEmptyException('Collection is empty'))
+			return direct[1]
+
+		try:
+			return next(self)
+		except StopIteration:
+			raise Exceptions.IterableEmptyException('Collection is empty') from None
+
+	def first_or_default(self, default: typing.Any = None) -> typing.Optional[T]:
+		"""
+		*Evaluates the query*
+		:param default: The default
+		:return: The first element in this query or "default" if this query has no elements
+		"""
+
+		if (direct := self.__direct_first__()) is not None:
+			return direct[1] if direct[0] else default
+
+		try:
+			return next(self)
+		except StopIteration:
+			return default
+
+	def last(self) -> T:
+		"""
+		*Evaluates the query*
+		:return: The last element in this query
+		:raises IterableEmptyException: If this query contains no elements
+		"""
+
+		element: typing.Any = None
+		has_one: bool = False
+
+		for element in self:
+			has_one = True
+
+		if not has_one:
+			raise Exceptions.IterableEmptyException('Collection is empty') from None
+
+		return element
+
+	def last_or_default(self, default: typing.Any = None) -> typing.Optional[T]:
+		"""
+		*Evaluates the query*
+		:param default: The default
+		:return: The last element in this query or "default" if this query has no elements
+		"""
+
+		element: typing.Any = default
+
+		for element in self:
+			pass
+
+		return element
+
+	def min(self, comparer: typing.Callable[[T], typing.Any] = None) -> T:
+		"""
+		*Evaluates the query*
+		Numeric sources without a comparer are reduced with numpy
+		:param comparer: The comparer to use for comparisons
+		:return: The smallest value in this query
+		:raises InvalidArgumentException: If 'comparer' is not callable
+		"""
+
+		Misc.raise_ifn(comparer is None or callable(comparer), Exceptions.InvalidArgumentException(LinqStream.min, 'comparer', type(comparer)))
+
+		if comparer is None and (vector := self.__vector_result__()) is not None:
+			Misc.raise_if(vector[0].size == 0, ValueError('min() iterable argument is empty'))
+			return vector[0].min() if vector[1] else vector[0].min().item()
+
+		return min(self, key=comparer)
+
+	def max(self, comparer: typing.Callable[[T], typing.Any] = None) -> T:
+		"""
+		*Evaluates the query*
+		Numeric sources without a comparer are reduced with numpy
+		:param comparer: The comparer to use for comparisons
+		:return: The largest value in this query
+		:raises InvalidArgumentException: If 'comparer' is not callable
+		"""
+
+		Misc.raise_ifn(comparer is None or callable(comparer), Exceptions.InvalidArgumentException(LinqStream.max, 'comparer', type(comparer)))
+
+		if comparer is None and (vector := self.__vector_result__()) is not None:
+			Misc.raise_if(vector[0].size == 0, ValueError('max() iterable argument is empty'))
+			return vector[0].max() if vector[1] else vector[0].max().item()
+
+		return max(self, key=comparer)
+
+	def aggregate(self, initial: T, aggregator: typing.Callable[[T, T], T]) -> T:
+		"""
+		Applies an aggregator function over all elements in this query
+		:param initial: The initial value
+		:param aggregator: The aggregate functon
+		:return: The aggregate result
+		:raises InvalidArgumentException: If 'aggregator' is not callable
+		"""
+
+		Misc.raise_ifn(callable(aggregator), Exceptions.InvalidArgumentException(LinqStream.aggregate, 'aggregator', type(aggregator)))
+
+		for elem in self:
+			initial = aggregator(initial, elem)
+
+		return initial
+
+	def element_at(self, index: int) -> T:
+		"""
+		*Evaluates the query*
+		:param index: The element index
+		:return: The element at the specified index
+		:raises IndexError: If the specified index is out of bounds or negative
+		"""
+
+		current: int = 0
+
+		for elem in self:
+			if index == current:
+				return elem
+
+			current += 1
+
+		raise IndexError(f'Index \'{index}\' out of bounds for LinqStream of len \'{current}\'')
+
+	def element_at_or_default(self, index: int, default: typing.Optional[T] = None) -> T:
+		"""
+		*Evaluates the query*
+		:param index: The element index
+		:param default: The default
+		:return: The element at the specified index or "default" if index is out of bounds
+		"""
+
+		current: int = 0
+
+		for elem in self:
+			if index == current:
+				return elem
+
+			current += 1
+
+		return default
+
+	def single(self) -> T:
+		"""
+		*Evaluates the query*
+		:return: The sole element of this query
+		:raises ValueError: If this query's length is not 1
+		"""
+
+		singled: bool = False
+		result: T = None
+
+		for elem in self:
+			if singled:
+				raise ValueError('LinqStream does not have exactly one element')
+
+			result = elem
+			singled	= True
+
+		if singled:
+			return result
+		else:
+			raise ValueError('LinqStream does not have exactly one element')
+
+	def single_or_default(self, default: typing.Optional[T] = None) -> T:
+		"""
+		*Evaluates the query*
+		:param default: The default
+		:return: The sole element of this query or "default" is this query's length is not 1
+		"""
+
+		singled: bool = False
+		result: T = None
+
+		for elem in self:
+			if singled:
+				return default
+
+			result = elem
+			singled = True
+
+		return result if singled else default
+
+	def sum(self) -> typing.Any:
+		"""
+		*Evaluates the query*
+		Numeric sources are reduced with numpy; for non-ndarray sources, float blocks and integer blocks that could overflow int64 are summed in Python so results match 'sum'
+		:return: The sum of all elements in this query
+		"""
+
+		if (vector := self.__vector_result__()) is not None and vector[0].size > 0:
+			block, native = vector
+
+			if native:
+				return block.sum()
+			elif block.dtype.kind in 'biu' and max(abs(int(block.min())), abs(int(block.max()))) * block.size < (1 << 63):
+				return block.sum().item()
+
+			return sum(block.tolist())
+		elif vector is not None:
+			return 0
+
+		return sum(self)
+
+	def average(self) -> complex:
+		"""
+		*Evaluates the query*
+		Numeric sources are reduced with numpy; for non-ndarray sources, float blocks are accumulated in order in float64 so results match a Python running total
+		:return: The average of all numbers in this query
+		:raises TypeError: If any element in this query is not a number
+		:raises ZeroDivisionError: If this query contains no elements
+		"""
+
+		if (vector := self.__vector_result__()) is not None:
+			block, native = vector
+			Misc.raise_if(block.size == 0, ZeroDivisionError('division by zero'))
+
+			if native:
+				return block.mean()
+			elif block.dtype.kind == 'f':
+				return numpy.cumsum(block, dtype=numpy.float64)[-1].item() / block.size
+
+			return sum(block.tolist()) / block.size
+
+		count: int = 0
+		total: complex = 0
+
+		for elem in self:
+			Misc.raise_ifn(isinstance(elem, (int, float, complex)), TypeError('Resulting element is not a number'))
+			count += 1
+			total += elem
+
+		return total / count
+
+	def collect[C: typing.Iterable](self, collection: Stream[T] | type[C] = tuple, *args, **kwargs) -> Stream[T] | C:
+		"""
+		*Evaluates the query*
+		Collects all elements in this query into a new collection or Stream
+		:param collection: The type of collection to collect into or a Stream instance
+		:param args: Extra positional arguments to apply to the collector's constructor
+		:param kwargs: Extra keyword arguments to apply to the collector's constructor
+		:return: The populated collection or Stream
+		:raises InvalidArgumentException: If 'collector' is not an iterable type, Stream, or Stream type
+		"""
+
+		if isinstance(collection, type) and issubclass(collection, Stream):
+			stream: Stream = collection(*args, **kwargs)
+
+			for elem in self:
+				stream.write(elem)
+
+			return stream
+		elif isinstance(collection, type) and issubclass(collection, (typing.Iterable, collections.abc.Sequence, collections.abc.Iterable)):
+			return collection(self, *args, **kwargs)
+		elif isinstance(collection, Stream):
+			for elem in self:
+				collection.write(elem)
+			return collection
+		else:
+			raise Exceptions.InvalidArgumentException(LinqStream.collect, 'collector', type(collection), (type, Stream))
+
+	def transform[K](self, mapper: typing.Callable[[T], K]) -> LinqStream[K]:
+		"""
+		Applies a transformer to all elements in this query
+		:param mapper: Transformer function
+		:return: The modified query
+		:raises InvalidArgumentException: If 'mapper' is not callable
+		"""
+
+		Misc.raise_ifn(callable(mapper), Exceptions.InvalidArgumentException(LinqStream.transform, 'mapper', type(mapper)))
+		return self.__chain__(('transform', mapper))
+
+	def transform_many[K](self, mapper: typing.Callable[[T], typing.Iterable[K]]) -> LinqStream[K]:
+		"""
+		Applies a transformer to all elements in this query and flattens the result
+		:param mapper: Transformer function
+		:return: The modified query
+		:raises InvalidArgumentException: If 'mapper' is not callable
+		"""
+
+		Misc.raise_ifn(callable(mapper), Exceptions.InvalidArgumentException(LinqStream.transform_many, 'mapper', type(mapper)))
+
+		def _many() -> typing.Generator[K]:
+			for elem in self:
+				collection: typing.Iterable[K] = mapper(elem)
+
+				for subelem in collection:
+					yield subelem
+
+		return LinqStream(_many())
+
+	def filter(self, filter_: typing.Callable[[T], bool]) -> LinqStream[T]:
+		"""
+		Filters elements in this query
+		:param filter_: The filter function (return True to keep and False to discard)
+		:return: The modified query
+		:raises InvalidArgumentException: If 'filter_' is not callable
+		"""
+
+		Misc.raise_ifn(callable(filter_), Exceptions.InvalidArgumentException(LinqStream.filter, 'filter_', type(filter_)))
+		return self.__chain__(('filter', filter_))
+
+	def split(self, filter_: typing.Callable[[T], collections.abc.Hashable], *groups: typing.Hashable) -> LinqStream[tuple[T, ...]]:
+		"""
+		Splits elements in this query based on the hashed result of the filter function
+		:param filter_: The filter function
+		:param groups: An optional set of groups to add to the internal mapping
+		:return: The modified query
+		:raises InvalidArgumentException: If 'filter_' is not callable
+		"""
+
+		Misc.raise_ifn(callable(filter_), Exceptions.InvalidArgumentException(LinqStream.filter, 'filter_', type(filter_)))
+
+		def __splitter__(linq: LinqStream[T]) -> typing.Iterator[tuple[T, ...]]:
+			splitter: collections.OrderedDict[int, list[T]] = collections.OrderedDict({hash(group): [] for group in groups})
+
+			for elem in linq:
+				bucket: int = hash(filter_(elem))
+				splitter.setdefault(bucket, []).append(elem)
+
+			for group in splitter.values():
+				yield tuple(group)
+
+		return LinqStream(__splitter__(self))
+
+	def assert_if(self, filter_: typing.Callable[[T], bool], exception: Exception = AssertionError('Assertion failed')):
+		"""
+		Raises an exception if any element passes the check
+		:param filter_: The filter function (return True to throw error and True to allow)
+		:param exception: The exception to raise
+		:return: The modified query
+		:raises InvalidArgumentException: If 'filter_' is not callable or 'exception' is not an exception
+		"""
+
+		Misc.raise_ifn(callable(filter_), Exceptions.InvalidArgumentException(LinqStream.filter, 'filter_', type(filter_)))
+		Misc.raise_ifn(isinstance(exception, BaseException), Exceptions.InvalidArgumentException(LinqStream.filter, 'exception', type(exception)))
+
+		def __assert__(stream: LinqStream[T]) -> typing.Iterator[T]:
+			for elem in stream:
+				if filter_(elem):
+					raise exception
+				yield elem
+
+		return LinqStream(__assert__(self))
+
+	def instance_of[I](self, cls: type[I]) -> LinqStream[I]:
+		"""
+		Filters elements in this query
+		All elements that derive the specified type are allowed
+		:param cls: The class type to check for
+		:return: The modified query
+		:raises InvalidArgumentException: If 'cls' is not a type
+		"""
+
+		Misc.raise_ifn(isinstance(cls, type), Exceptions.InvalidArgumentException(LinqStream.instance_of, 'cls', type(cls), (type,)))
+		return self.__chain__(('filter', lambda x: isinstance(x, cls)))
+
+	def not_instance_of[I](self, cls: type[I]) -> LinqStream[I]:
+		"""
+		Filters elements in this query
+		All elements that do not derive the specified type are allowed
+		:param cls: The class type to check for
+		:return: The modified query
+		:raises InvalidArgumentException: If 'cls' is not a type
+		"""
+
+		Misc.raise_ifn(isinstance(cls, type), Exceptions.InvalidArgumentException(LinqStream.not_instance_of, 'cls', type(cls), (type,)))
+		return self.__chain__(('filter', lambda x: not isinstance(x, cls)))
+
+	def skip(self, count: int) -> LinqStream[T]:
+		"""
+		Skips the first 'count' elements in this query
+		Skips are moved toward the source past transforms when the query is evaluated
+		:param count: The number of elements to skip
+		:return: The modified query
+		:raises InvalidArgumentException: If 'count' is not an integer
+		:raises ValueError: If 'count' is negative
+		"""
+
+		Misc.raise_ifn(isinstance(count, int), Exceptions.InvalidArgumentException(LinqStream.skip, 'count', type(count), (int,)))
+		Misc.raise_ifn((count := int(count)) >= 0, ValueError('Count cannot be negative'))
+		return self.__chain__(('slice', count, None))
+
+	def skip_while(self, condition: typing.Callable[[T], bool]) -> LinqStream[T]:
+		"""
+		Skips the elements in this query while the condition callback returns True
+		:param condition: The condition
+		:return: The modified query
+		:raises InvalidArgumentException: If 'condition' is not callable
+		"""
+
+		def _skip(stream: LinqStream[T]) -> typing.Generator[T]:
+			for elem in stream:
+				if not condition(elem):
+					yield elem
+					break
+
+			for elem in stream:
+				yield elem
+
+		Misc.raise_ifn(callable(condition), Exceptions.InvalidArgumentException(LinqStream.skip_while, 'condition', type(condition)))
+		return LinqStream(_skip(self))
+
+	def take(self, count: int) -> LinqStream[T]:
+		"""
+		Takes the first 'count' elements in this query, discarding all remaining elements
+		Takes are moved toward the source past transforms when the query is evaluated
+		:param count: The number of elements to take
+		:return: The modified query
+		:raises InvalidArgumentException: If 'count' is not an integer
+		:raises ValueError: If 'count' is negative
+		"""
+
+		Misc.raise_ifn(isinstance(count, int), Exceptions.InvalidArgumentException(LinqStream.take, 'count', type(count), (int,)))
+		Misc.raise_ifn((count := int(count)) >= 0, ValueError('Count cannot be negative'))
+		return self.__chain__(('slice', 0, count))
+
+	def take_while(self, condition: typing.Callable[[T], bool]) -> LinqStream[T]:
+		"""
+		Takes the first "count" elements in this query, discarding all remaining elements, while the condition callback returns True
+		:param condition: (CALLABLE) The condition
+		:return: (LinqStream) The modified query
+		:raises InvalidArgumentException: If 'condition' is not callable
+		"""
+
+		def _take(stream: LinqStream[T]) -> typing.Generator[T]:
+			for elem in stream:
+				if condition(elem):
+					yield elem
+				else:
+					break
+
+		Misc.raise_ifn(callable(condition), Exceptions.InvalidArgumentException(LinqStream.take_while, 'condition', type(condition)))
+		return LinqStream(_take(self))
+
+	def chunk(self, batch_size: int) -> LinqStream[tuple[T, ...]]:
+		"""
+		Groups elements in this query into batches of a set size
+		:param batch_size: The batch size
+		:return: The modified query
+		:raises InvalidArgumentException: If 'batch_size' is not an integer
+		:raises ValueError: If 'batch_size' is smaller than 1
+		"""
+
+		def _chunk(stream: LinqStream[T]) -> typing.Generator[tuple[T, ...]]:
+			for elem in stream:
+				chunk.append(elem)
+
+				if len(chunk) == batch_size:
+					yield tuple(chunk)
+					chunk.clear()
+
+			if len(chunk) > 0:
+				yield tuple(chunk)
+
+		Misc.raise_ifn(isinstance(batch_size, int), Exceptions.InvalidArgumentException(LinqStream.chunk, 'batch_size', type(batch_size), (int,)))
+		Misc.raise_ifn((batch_size := int(batch_size)) >= 1, ValueError('Batch size must be greater than or equal to 1'))
+		chunk: list[T] = []
+		return LinqStream(_chunk(self))
+
+	def window(self, size: int, step: int = 1) -> LinqStream[tuple[T, ...]]:
+		"""
+		Groups elements in this query into sliding windows of a set size
+		A window is yielded every 'step' elements once 'size' elements have been seen; trailing partial windows are not yielded
+		:param size: The number of elements per window
+		:param step: The number of elements between the starts of consecutive windows
+		:return: The modified query
+		:raises InvalidArgumentException: If 'size' or 'step' is not an integer
+		:raises ValueError: If 'size' or 'step' is smaller than 1
+		"""
+
+		def _window(stream: LinqStream[T]) -> typing.Generator[tuple[T, ...]]:
+			buffer: collections.deque[T] = collections.deque(maxlen=size)
+			remaining: int = size
+
+			for elem in stream:
+				buffer.append(elem)
+				remaining -= 1
+
+				if remaining == 0:
+					yield tuple(buffer)
+					remaining = step
+
+		Misc.raise_ifn(isinstance(size, int), Exceptions.InvalidArgumentException(LinqStream.window, 'size', type(size), (int,)))
+		Misc.raise_ifn(isinstance(step, int), Exceptions.InvalidArgumentException(LinqStream.window, 'step', type(step), (int,)))
+		Misc.raise_ifn((size := int(size)) >= 1, ValueError('Window size must be greater than or equal to 1'))
+		Misc.raise_ifn((step := int(step)) >= 1, ValueError('Window step must be greater than or equal to 1'))
+		return LinqStream(_window(self))
+
+	def tumbling_window(self, duration: int | float, timestamp: typing.Callable[[T], int | float], *, origin: int | float = 0) -> LinqStream[tuple[int | float, tuple[T, ...]]]:
+		"""
+		Groups elements in this query into consecutive, non-overlapping time windows of a set duration
+		Timestamps must be non-decreasing; windows without elements are not yielded
+		:param duration: The length of each window in timestamp units
+		:param timestamp: The function returning the timestamp of each element
+		:param origin: The timestamp at which the first window boundary lies
+		:return: The modified query yielding the start timestamp of each window with its elements
+		:raises InvalidArgumentException: If 'duration' or 'origin' is not a number or 'timestamp' is not callable
+		:raises ValueError: If 'duration' is not positive or a timestamp is smaller than the previous one
+		"""
+
+		def _tumbling(stream: LinqStream[T]) -> typing.Generator[tuple[int | float, tuple[T, ...]]]:
+			bucket: typing.Optional[int | float] = None
+			window: list[T] = []
+
+			for elem in stream:
+				current: int | float = (timestamp(elem) - origin) // duration
+
+				if current != bucket:
+					if bucket is not None and current < bucket:
+						raise ValueError('Timestamps must be non-decreasing')
+					elif len(window) > 0:
+						yield origin + bucket * duration, tuple(window)
+
+					bucket = current
+					window = []
+
+				window.append(elem)
+
+			if len(window) > 0:
+				yield origin + bucket * duration, tuple(window)
+
+		Misc.raise_ifn(isinstance(duration, (int, float)), Exceptions.InvalidArgumentException(LinqStream.tumbling_window, 'duration', type(duration), (int, float)))
+		Misc.raise_ifn(isinstance(origin, (int, float)), Exceptions.InvalidArgumentException(LinqStream.tumbling_window, 'origin', type(origin), (int, float)))
+		Misc.raise_ifn(callable(timestamp), Exceptions.InvalidArgumentException(LinqStream.tumbling_window, 'timestamp', type(timestamp)))
+		Misc.raise_ifn(duration > 0, ValueError('Window duration must be greater than 0'))
+		return LinqStream(_tumbling(self))
+
+	def session_window(self, gap: int | float, timestamp: typing.Callable[[T], int | float]) -> LinqStream[tuple[T, ...]]:
+		"""
+		Groups elements in this query into sessions, starting a new session whenever consecutive timestamps are more than 'gap' apart
+		Timestamps must be non-decreasing
+		:param gap: The largest difference between consecutive timestamps within one session
+		:param timestamp: The function returning the timestamp of each element
+		:return: The modified query
+		:raises InvalidArgumentException: If 'gap' is not a number or 'timestamp' is not callable
+		:raises ValueError: If 'gap' is negative or a timestamp is smaller than the previous one
+		"""
+
+		def _session(stream: LinqStream[T]) -> typing.Generator[tuple[T, ...]]:
+			session: list[T] = []
+			previous: typing.Optional[int | float] = None
+
+			for elem in stream:
+				current: int | float = timestamp(elem)
+
+				if previous is not None and current < previous:
+					raise ValueError('Timestamps must be non-decreasing')
+				elif previous is not None and current - previous > gap:
+					yield tuple(session)
+					session = []
+
+				session.append(elem)
+				previous = current
+
+			if len(session) > 0:
+				yield tuple(session)
+
+		Misc.raise_ifn(isinstance(gap, (int, float)), Exceptions.InvalidArgumentException(LinqStream.session_window, 'gap', type(gap), (int, float)))
+		Misc.raise_ifn(callable(timestamp), Exceptions.InvalidArgumentException(LinqStream.session_window, 'timestamp', type(timestamp)))
+		Misc.raise_ifn(gap >= 0, ValueError('Session gap must be greater than or equal to 0'))
+		return LinqStream(_session(self))
+
+	def rolling(self, size: int | float, step: int = 1, *, timestamp: typing.Optional[typing.Callable[[T], int | float]] = None, **aggregators: str | tuple[str, typing.Callable[[T], typing.Any]] | LinqStream.WindowAccumulator) -> LinqStream[tuple[T, dict[str, typing.Any]]]:
+		"""
+		Aggregates sliding windows over this query incrementally
+		Each element is added to the aggregation state once when it enters the window and removed once when it leaves, so the cost does not depend on the window size
+		Without 'timestamp', windows hold the last 'size' elements and a result is yielded every 'step' elements once the first window is full
+		With 'timestamp', windows hold the elements whose timestamp lies within 'size' units of the newest element, and a result is yielded for every element; timestamps must be non-decreasing
+		Each aggregator is one of:\n
+		- A built-in name: 'count', 'sum', 'mean', 'min' or 'max'\n
+		- A pair of built-in name and selector, such as ('mean', lambda sample: sample.temperature)\n
+		- A 'LinqStream.WindowAccumulator'
+		:param size: The number of elements per window, or the window duration if 'timestamp' is supplied
+		:param step: The number of elements between consecutive results of count-based windows
+		:param timestamp: The function returning the timestamp of each element or None for count-based windows
+		:param aggregators: The aggregators keyed by result name
+		:return: The modified query yielding the newest element of each window with a dictionary of aggregated results
+		:raises InvalidArgumentException: If 'size' or 'step' is not a valid number, 'timestamp' is not callable or an aggregator is not a valid specification
+		:raises ValueError: If 'size' or 'step' is not positive, an aggregator names an unknown built-in, no aggregators are supplied or a timestamp is smaller than the previous one
+		"""
+
+		def _rolling(stream: LinqStream[T]) -> typing.Generator[tuple[T, dict[str, typing.Any]]]:
+			states: list[typing.Any] = [accumulator.empty() for accumulator in accumulators]
+			buffer: collections.deque = collections.deque()
+			indices: range = range(len(accumulators))
+			remaining: int = size if timestamp is None else 0
+
+			for elem in stream:
+				for i in indices:
+					states[i] = adds[i](states[i], elem)
+
+				if timestamp is None:
+					buffer.append(elem)
+
+					if len(buffer) > size:
+						oldest: T = buffer.popleft()
+
+						for i in indices:
+							states[i] = removes[i](states[i], oldest)
+
+					if (remaining := remaining - 1) > 0:
+						continue
+
+					remaining = step
+				else:
+					current: int | float = timestamp(elem)
+
+					if len(buffer) > 0 and current < buffer[-1][0]:
+						raise ValueError('Timestamps must be non-decreasing')
+
+					buffer.append((current, elem))
+
+					while buffer[0][0] <= current - size:
+						oldest: T = buffer.popleft()[1]
+
+						for i in indices:
+							states[i] = removes[i](states[i], oldest)
+
+				yield elem, {name: accumulators[i].finish(states[i]) for i, name in enumerate(names)}
+
+		if timestamp is None:
+			Misc.raise_ifn(isinstance(size, int), Exceptions.InvalidArgumentException(LinqStream.rolling, 'size', type(size), (int,)))
+			Misc.raise_ifn((size := int(size)) >= 1, ValueError('Window size must be greater than or equal to 1'))
+		else:
+			Misc.raise_ifn(callable(timestamp), Exceptions.InvalidArgumentException(LinqStream.rolling, 'timestamp', type(timestamp)))
+			Misc.raise_ifn(isinstance(size, (int, float)), Exceptions.InvalidArgumentException(LinqStream.rolling, 'size', type(size), (int, float)))
+			Misc.raise_ifn(size > 0, ValueError('Window duration must be greater than 0'))
+
+		Misc.raise_ifn(isinstance(step, int), Exceptions.InvalidArgumentException(LinqStream.rolling, 'step', type(step), (int,)))
+		Misc.raise_ifn((step := int(step)) >= 1, ValueError('Window step must be greater than or equal to 1'))
+		Misc.raise_ifn(len(aggregators) > 0, ValueError('At least one aggregator must be supplied'))
+		names: tuple[str, ...] = tuple(aggregators.keys())
+		accumulators: tuple[LinqStream.WindowAccumulator, ...] = tuple(LinqStream.WindowAccumulator.create(x) for x in aggregators.values())
+		compiled: tuple[tuple[typing.Callable, typing.Callable], ...] = tuple(accumulator.__compile__() for accumulator in accumulators)
+		adds: tuple[typing.Callable[[typing.Any, T], typing.Any], ...] = tuple(add for add, _ in compiled)
+		removes: tuple[typing.Callable[[typing.Any, T], typing.Any], ...] = tuple(remove for _, remove in compiled)
+		return LinqStream(_rolling(self))
+
+	def enumerate(self) -> LinqStream[tuple[int, T]]:
+		"""
+		For each element in this query, returns a tuple containing the element's index and value
+		*Identical to "LinqStream(enumerate(self))"*
+		:return: The modified query
+		"""
+
+		return LinqStream(enumerate(self))
+
+	def group[K](self, grouper: typing.Callable[[T], K]) -> LinqStream[tuple[T, tuple[K, ...]]]:
+		"""
+		Groups all elements in this query by a key
+		:param grouper: Grouping function retuning the key used for comparisons
+		:return: The modified query
+		:raises InvalidArgumentException: If 'grouper' is not callable
+		"""
+
+		def _group(stream: LinqStream[T]) -> typing.Generator[tuple[T, tuple[K, ...]]]:
+			for elem in stream:
+				key: K = grouper(elem)
+
+				if key in grouping:
+					grouping[key].append(elem)
+				else:
+					grouping[key] = [elem]
+
+			for key, group in grouping.items():
+				yield key, tuple(group)
+
+		Misc.raise_ifn(callable(grouper), Exceptions.InvalidArgumentException(LinqStream.group, 'grouper', type(grouper)))
+		grouping: dict[K, list[T]] = {}
+		return LinqStream(_group(self))
+
+	def group_aggregate[K](self, key: typing.Callable[[T], K], **aggregators: str | tuple[str, typing.Callable[[T], typing.Any]] | typing.Callable[[typing.Any, typing.Any], typing.Any] | LinqStream.Accumulator) -> LinqStream[tuple[K, dict[str, typing.Any]]]:
+		"""
+		Groups all elements in this query by a key and aggregates each group incrementally
+		The query is enumerated once and only one running state per key and aggregator is kept
+		Each aggregator is one of:\n
+		- A built-in name: 'count', 'sum', 'min', 'max', 'mean', 'first' or 'last'\n
+		- A pair of built-in name and selector, such as ('sum', lambda order: order.total)\n
+		- A combiner function (state, element) -> state, folding each group starting from its first element\n
+		- A 'LinqStream.Accumulator'
+		:param key: Grouping function returning the key of each element
+		:param aggregators: The aggregators keyed by result name
+		:return: The modified query yielding each key with a dictionary of aggregated results, in order of first appearance
+		:raises InvalidArgumentException: If 'key' is not callable or an aggregator is not a valid specification
+		:raises ValueError: If an aggregator names an unknown built-in or no aggregators are supplied
 		"""
 
-		if eid not in self.__callbacks__:
-			raise NameError(f'Unexpected event ID, expected one of:\n  {"\n  ".join(self.__callbacks__.keys())}')
+		def _aggregate(stream: LinqStream[T]) -> typing.Generator[tuple[K, dict[str, typing.Any]]]:
+			states: dict[K, list[typing.Any]] = {}
+			starts: tuple[typing.Callable[[T], typing.Any], ...] = tuple(accumulator.start for accumulator in accumulators)
+			steps: tuple[typing.Callable[[typing.Any, T], typing.Any], ...] = tuple(accumulator.__compile__() for accumulator in accumulators)
+			indices: range = range(len(steps))
 
-		elif callback is None or callback is ...:
-			def binder(func: typing.Callable):
-				assert callable(func), 'Callback is not callable'
-				self.__callbacks__[eid][func] = threadability
+			for elem in stream:
+				group_key: K = key(elem)
+				state: typing.Optional[list[typing.Any]] = states.get(group_key)
 
-			return binder
+				if state is None:
+					states[group_key] = [start(elem) for start in starts]
+				else:
+					for i in indices:
+						state[i] = steps[i](state[i], elem)
 
-		else:
-			assert callable(callback), 'Callback is not callable'
-			self.__callbacks__[eid][callback] = threadability
+			for group_key, state in states.items():
+				yield group_key, {name: accumulator.finish(state[i]) for i, (name, accumulator) in enumerate(zip(names, accumulators))}
 
-	def off(self, eid: str, callback: typing.Optional[typing.Callable] = ...) -> None:
+		Misc.raise_ifn(callable(key), Exceptions.InvalidArgumentException(LinqStream.group_aggregate, 'key', type(key)))
+		Misc.raise_ifn(len(aggregators) > 0, ValueError('At least one aggregator must be supplied'))
+		names: tuple[str, ...] = tuple(aggregators.keys())
+		accumulators: tuple[LinqStream.Accumulator, ...] = tuple(LinqStream.Accumulator.create(x) for x in aggregators.values())
+		return LinqStream(_aggregate(self))
+
+	def distinct(self, key: typing.Optional[typing.Callable[[T], typing.Hashable]] = ...) -> LinqStream[T]:
 		"""
-		Unbinds a callback from the specified event ID
-		:param eid: The event ID, see 'EventedStream::on' for a list of valid IDs
-		:param callback: The callable to unbind, or all if no callback supplied
-		:raises NameError: If the event ID is not valid
-		:raises AssertionError: If the supplied callback is not bound
+		Returns a distinct (non-duplicate) list of elements in this query
+		:param key: If provided, a function returning the keys used for comparison
+		:return: The modified query
+		:raises InvalidArgumentException: If 'key' is not callable
 		"""
 
-		if eid not in self.__callbacks__:
-			raise NameError(f'Unexpected event ID, expected one of:\n  {"\n  ".join(self.__callbacks__.keys())}')
+		def _distinct(stream: LinqStream[T]) -> typing.Generator[T]:
+			matched: set[typing.Hashable] = set()
 
-		elif callback is None or callback is ...:
-			self.__callbacks__[eid].clear()
+			for elem in stream:
+				_key: typing.Hashable = key(elem) if callable(key) else elem
 
-		else:
-			assert callback in self.__callbacks__[eid], 'Specified callback not bound'
-			del self.__callbacks__[eid][callback]
+				if _key in matched:
+					continue
 
+				matched.add(_key)
+				yield elem
 
-class LinqStream[T](typing.Reversible):
-	"""
-	Lazy generator mimicking C# LINQ or Java Streams
-	"""
+		Misc.raise_ifn(key is None or key is ... or callable(key), Exceptions.InvalidArgumentException(LinqStream.distinct, 'key', type(key)))
+		return LinqStream(_distinct(self))
 
-	def __init__(self, iterable: typing.Iterable[T]):
+	def set_difference(self, iterable: typing.Iterable[T], key: typing.Optional[typing.Callable[[T], typing.Hashable]] = ...) -> LinqStream[T]:
 		"""
-		Lazy generator mimicking C# LINQ or Java Streams
-		- Constructor -
-		:param iterable: The source iterable
+		Applies the set difference between the elements in this query and the supplied iterable
+		:param iterable: The second iterable to apply difference with
+		:param key: If provided, a function returning the keys used for comparison
+		:return: The modified query
 		:raises InvalidArgumentException: If 'iterable' is not iterable
+		:raises InvalidArgumentException: If 'key' is not callable
 		"""
 
-		Misc.raise_ifn(isinstance(iterable, typing.Iterable), Exceptions.InvalidArgumentException(LinqStream.__init__, 'iterable', type(iterable)))
-		self.__source__: typing.Iterable[T] = iterable
+		def _difference(stream: LinqStream[T]) -> typing.Generator[T]:
+			for elem in stream:
+				_key: typing.Hashable = hash(elem) if key is None or key is ... else key(elem)
 
-	def __contains__(self, item: T) -> bool:
-		"""
-		*Evaluates the query*
-		:param item: The item to check
-		:return: Whether the specified item is within this query
-		"""
+				if _key in primary or _key in secondary:
+					continue
 
-		for elem in self:
-			if elem == item:
-				return True
+				primary.add(_key)
+				yield elem
 
-		return False
+		Misc.raise_ifn(key is ... or key is None or callable(key), Exceptions.InvalidArgumentException(LinqStream.set_difference, 'key', type(key)))
+		Misc.raise_ifn(hasattr(iterable, '__iter__'), Exceptions.InvalidArgumentException(LinqStream.set_difference, 'iterable', type(iterable)))
+		secondary: set[typing.Hashable] = set(iterable)
+		primary: set[typing.Hashable] = set()
+		return LinqStream(_difference(self))
 
-	def __iter__(self) -> typing.Iterator[T]:
-		iterator: typing.Iterator[T] = iter(self.__source__)
+	def set_intersect(self, iterable: typing.Iterable[T], key: typing.Optional[typing.Callable[[T], typing.Hashable]] = ...) -> LinqStream[T]:
+		"""
+		Applies the set intersection between the elements in this query and the supplied iterable
+		:param iterable: The second iterable to apply intersection with
+		:param key: If provided, a function returning the keys used for comparison
+		:return: The modified query
+		:raises InvalidArgumentException: If 'iterable' is not iterable
+		:raises InvalidArgumentException: If 'key' is not callable
+		"""
 
-		while True:
-			try:
-				yield next(iterator)
-			except StopIteration:
-				break
+		def _intersect(stream: LinqStream[T]) -> typing.Generator[T]:
+			for elem in stream:
+				_key: typing.Hashable = hash(elem) if key is None or key is ... else key(elem)
 
-	def __reversed__(self) -> typing.Iterator[T]:
-		return reversed(tuple(self))
+				if _key in primary or _key not in secondary:
+					continue
 
-	def __next__(self) -> T:
-		"""
-		*Evaluates one item from the query*
-		:return: The first item in the query
-		:raises StopIteration: If the query is empty
-		"""
+				primary.add(_key)
+				yield elem
 
-		return next(iter(self))
+		Misc.raise_ifn(key is ... or key is None or callable(key), Exceptions.InvalidArgumentException(LinqStream.set_intersect, 'key', type(key)))
+		Misc.raise_ifn(hasattr(iterable, '__iter__'), Exceptions.InvalidArgumentException(LinqStream.set_intersect, 'iterable', type(iterable)))
+		secondary: set[typing.Hashable] = set(iterable)
+		primary: set[typing.Hashable] = set()
+		return LinqStream(_intersect(self))
 
-	def cast[Q](self, cls: type[Q], *, on_error: typing.Literal['ignore', 'replace', 'pass', 'throw'] = 'replace') -> LinqStream[Q]:
+	def set_union(self, iterable: typing.Iterable[T], key: typing.Optional[typing.Callable[[T], typing.Hashable]] = ...) -> LinqStream[T]:
 		"""
-		Casts all elements in this query to the specified type
-		:param cls: The type to cast to
-		:param on_error: How to handle serialization errors
+		Applies the set union between the elements in this query and the supplied iterable
+		:param iterable: The second iterable to apply union with
+		:param key: If provided, a function returning the keys used for comparison
 		:return: The modified query
-		:raises TypeError: If 'on_error' is throw and a cast error occurs
-
-		*Casting Errors*\n
-		- ignore: Erroneous element is removed from the resulting query\n
-		- replace: Erroneous element is replaced with 'None'\n
-		- pass: Erroneous element is passed as is without serialization\n
-		- throw: Error is raised
+		:raises InvalidArgumentException: If 'iterable' is not iterable
+		:raises InvalidArgumentException: If 'key' is not callable
 		"""
 
-		def __cast(stream: LinqStream[T]) -> typing.Generator[Q]:
+		def _union(stream: LinqStream[T]) -> typing.Generator[T]:
 			for elem in stream:
-				try:
-					yield cls(elem)
-				except Exception as err:
-					if on_error == 'ignore':
-						continue
-					elif on_error == 'replace':
-						yield None
-					elif on_error == 'pass':
-						yield elem
-					elif on_error == 'throw':
-						raise TypeError(f'Failed to cast element: \'{elem}\'') from err
+				_key: typing.Hashable = hash(elem) if key is None or key is ... else key(elem)
 
-		return LinqStream(__cast(self))
+				if _key not in primary:
+					primary.add(_key)
+					yield elem
 
-	def cast_if[Q](self, cls: type[Q], filter_: typing.Callable[[T], bool], *, on_error: typing.Literal['ignore', 'replace', 'pass', 'throw'] = 'replace') -> LinqStream[T | Q]:
-		"""
-		Casts matching elements in this query to the specified type
-		:param cls: The type to cast to
-		:param filter_: The filter to apply; matching elements will be cast
-		:param on_error: How to handle serialization errors
-		:return: The modified query
-		:raises TypeError: If 'on_error' is throw and a cast error occurs
-		:raises InvalidArgumentException: If 'filter_' is not callable
+			for elem in iterable:
+				_key: typing.Hashable = hash(elem) if key is None or key is ... else key(elem)
 
-		*Casting Errors*\n
-		- ignore: Erroneous element is removed from the resulting query\n
-		- replace: Erroneous element is replaced with 'None'\n
-		- pass: Erroneous element is passed as is without serialization\n
-		- throw: Error is raised
+				if _key not in primary:
+					primary.add(_key)
+					yield elem
+
+		Misc.raise_ifn(key is ... or key is None or callable(key), Exceptions.InvalidArgumentException(LinqStream.set_union, 'key', type(key)))
+		Misc.raise_ifn(hasattr(iterable, '__iter__'), Exceptions.InvalidArgumentException(LinqStream.set_union, 'iterable', type(iterable)))
+		primary: set[typing.Hashable] = set()
+		return LinqStream(_union(self))
+
+	def to_lookup[K, V](self, converter: typing.Optional[typing.Callable[[T], tuple[K, V]]] = ...) -> dict[K, tuple[V, ...]]:
+		"""
+		*Evaluates this query*
+		:param converter: The function to convert elements to key-value pairs
+		:return: A dict mapping a key with multiple values
+		:raises InvalidArgumentException: If 'key_converter' is not callable
+		:raises InvalidArgumentException: If 'value_converter' is not callable
 		"""
 
-		Misc.raise_ifn(callable(filter_), Exceptions.InvalidArgumentException(LinqStream.filter, 'filter_', type(filter_)))
+		Misc.raise_ifn(converter is ... or converter is None or callable(converter), Exceptions.InvalidArgumentException(LinqStream.to_lookup, 'converter', type(converter)))
+		mapping: dict[K, list[V]] = {}
 
-		def __cast(stream: LinqStream[T]) -> typing.Generator[Q]:
-			for elem in stream:
-				if not filter_(elem):
-					yield elem
-					continue
+		for elem in self:
+			elem: tuple[K, V] = converter(converter) if callable(elem) else elem
+			Misc.raise_ifn(isinstance(elem, typing.Iterable) and len(elem := tuple(elem)) < 2, ValueError(f'Cannot convert value to lookup pair - must be an iterable with at least 2 elements; got \'{type(elem)}\''))
+			key, *values = elem
 
-				try:
-					yield cls(elem)
-				except Exception as err:
-					if on_error == 'ignore':
-						continue
-					elif on_error == 'replace':
-						yield None
-					elif on_error == 'pass':
-						yield elem
-					elif on_error == 'throw':
-						raise TypeError(f'Failed to cast element: \'{elem}\'') from err
+			if key in mapping:
+				mapping[key].extend(values)
+			else:
+				mapping[key] = list(values)
 
-		return LinqStream(__cast(self))
+		return {k: tuple(v) for k, v in mapping.items()}
 
-	def for_each(self, callback: typing.Callable[[T], typing.Any]) -> None:
+	def to_dictionary[K, V](self, converter: typing.Optional[typing.Callable[[T], tuple[K, V]]] = ...) -> dict[K, V]:
 		"""
-		*Evaluates the query*\n
-		Executes a callback for every element in this query
-		:param callback: The callback
-		:raises InvalidArgumentException: If the callback is not callable
+		*Evaluates this query*
+		:param converter: The function to convert elements to key-value pairs
+		:return: A dict mapping each key with a single value
+		:raises InvalidArgumentException: If 'key_converter' is not callable
+		:raises InvalidArgumentException: If 'value_converter' is not callable
+		:raises KeyError: If a duplicate key is found
 		"""
 
-		Misc.raise_ifn(callable(callback), Exceptions.InvalidArgumentException(LinqStream.for_each, 'callback', type(callback)))
+		Misc.raise_ifn(converter is ... or converter is None or callable(converter), Exceptions.InvalidArgumentException(LinqStream.to_dictionary, 'converter', type(converter)))
+		mapping: dict[K, V] = {}
 
 		for elem in self:
-			callback(elem)
+			elem: tuple[K, V] = converter(elem) if callable(converter) else elem
+			Misc.raise_ifn(isinstance(elem, typing.Iterable) and len(elem := tuple(elem)) == 2, ValueError(f'Cannot convert value to dictionary pair - must be an iterable with at least 2 elements; got \'{type(elem)}\''))
+			key, value = elem
 
-	def apply(self, collection: typing.Iterable[T], collector: typing.Optional[typing.Callable[[typing.Iterable[T], T], ...]] = None, *, clear: bool = True, clearer: typing.Optional[typing.Callable[[typing.Iterable[T]], ...]] = None) -> None:
+			if key in mapping:
+				raise KeyError(f'Duplicate key \'{key}\' in dictionary conversion')
+			else:
+				mapping[key] = value
+
+		return mapping
+
+	@staticmethod
+	def __estimate__(element: typing.Any) -> int:
 		"""
-		*Evaluates the query*\n
-		Collects all elements in this query into an existing collection or Stream; modifies the specified iterable in-place
-		:param collection: The iterable to modify
-		:param collector: Writer function describing how elements should be appended to the collection
-		:param clear: Whether the collection should be cleared before writing
-		:param clearer: Function describing how the collection should be cleared
-		:raises InvalidArgumentException: If the iterable is not mutable
+		INTERNAL METHOD
+		Estimates the memory used by an element from its own size and the size of its direct members
+		:param element: The element to measure
+		:return: The estimated size in bytes
 		"""
 
-		query: tuple[T, ...] = tuple(self)
-		Misc.raise_if(collector is not None and collector is not ... and not callable(collector), Exceptions.InvalidArgumentException(LinqStream.apply, 'collector', type(collector), (typing.Callable,)))
-		Misc.raise_if(clearer is not None and clearer is not ... and not callable(clearer), Exceptions.InvalidArgumentException(LinqStream.apply, 'clearer', type(clearer), (typing.Callable,)))
-
-		if clear and callable(clearer):
-			clearer(collection)
-		elif clear and isinstance(collection, typing.MutableSequence):
-			collection.clear()
-		elif clear and isinstance(collection, Stream):
-			collection.flush()
-		elif clear:
-			raise TypeError(f'Collection of type \'{type(collection).__name__}\' has no default clearer')
+		size: int = sys.getsizeof(element)
 
-		if callable(collector):
-			for element in query:
-				collector(collection, element)
-		elif isinstance(collection, typing.MutableSequence):
-			collection.extend(query)
-		elif isinstance(collection, Stream):
-			for element in query:
-				collection.write(element)
-		else:
-			raise TypeError(f'Collection of type \'{type(collection).__name__}\' has no default collector')
+		if isinstance(element, (tuple, list, set, frozenset)):
+			size += sum(sys.getsizeof(x) for x in element)
+		elif isinstance(element, dict):
+			size += sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in element.items())
 
-	def any(self) -> bool:
+		return size
+
+	@staticmethod
+	def __spill__(elements: typing.Iterable[T], directory: str, codec: typing.Any, block_size: int) -> str:
 		"""
-		*Evaluates the query*
-		:return: Whether this query contains any items
+		INTERNAL METHOD
+		Writes elements to a new run file as length-prefixed blocks encoded with the codec
+		:param elements: The elements to write, in sorted order
+		:param directory: The directory to create the run file in
+		:param codec: An object providing 'dumps' and 'loads'
+		:param block_size: The number of elements per block
+		:return: The run file path
 		"""
 
-		try:
-			next(self)
-			return True
-		except StopIteration:
-			return False
+		handle, path = tempfile.mkstemp(suffix='.run', dir=directory)
+		iterator: typing.Iterator[T] = iter(elements)
 
-	def at_least(self, count: int) -> bool:
+		with os.fdopen(handle, 'wb') as file:
+			while len(block := list(itertools.islice(iterator, block_size))) > 0:
+				data: bytes = codec.dumps(block)
+				file.write(len(data).to_bytes(8, 'little'))
+				file.write(data)
+
+		return path
+
+	@staticmethod
+	def __replay__(path: str, codec: typing.Any) -> typing.Generator[T]:
 		"""
-		*Evaluates the query*
-		:param count: The minimum number of items
-		:return: Whether this query contains at least 'count' items
+		INTERNAL METHOD
+		Lazily reads the elements of a run file one block at a time
+		:param path: The run file path
+		:param codec: An object providing 'dumps' and 'loads'
+		:return: A generator of the run's elements
 		"""
 
-		try:
-			for _ in range(count):
-				next(self)
-			return True
-		except StopIteration:
-			return False
+		with open(path, 'rb') as file:
+			while len(header := file.read(8)) == 8:
+				yield from codec.loads(file.read(int.from_bytes(header, 'little')))
 
-	def at_most(self, count: int) -> bool:
+	@staticmethod
+	def __merge_runs__(paths: list[str], codec: typing.Any, key: typing.Optional[typing.Callable[[T], typing.Any]], reverse: bool) -> typing.Generator[T]:
 		"""
-		*Evaluates the query*
-		:param count: The maximum number of items
-		:return: Whether this query contains at most 'count' items
+		INTERNAL METHOD
+		Lazily k-way merges sorted run files, closing all of them once exhausted or abandoned
+		:param paths: The run file paths in source order
+		:param codec: An object providing 'dumps' and 'loads'
+		:param key: The sort key or None
+		:param reverse: Whether the runs are sorted in reverse order
+		:return: A generator of the merged elements
 		"""
 
+		readers: list[typing.Generator[T]] = [LinqStream.__replay__(path, codec) for path in paths]
+
 		try:
-			for _ in range(count + 1):
-				next(self)
-			return False
-		except StopIteration:
-			return True
+			yield from heapq.merge(*readers, key=key, reverse=reverse)
+		finally:
+			for reader in readers:
+				reader.close()
 
-	def contains(self, elem: T) -> bool:
+	def __external_sort__(self, key: typing.Optional[typing.Callable[[T], typing.Any]], reverse: bool, max_memory: int, spill_dir: typing.Optional[str], codec: typing.Any) -> typing.Generator[T]:
 		"""
-		*Evaluates the query*
-		:param elem: The item to check
-		:return: Whether the item is within this query
+		INTERNAL METHOD
+		Sorts this query in runs bounded by 'max_memory', spilling each run to disk and lazily merging them
+		Runs keep source order and ties are merged from earlier runs first, so the sort is stable
+		Blocks are sized so that all merge readers together hold about one run in memory
+		:param key: The sort key or None
+		:param reverse: Whether to sort in reverse order
+		:param max_memory: The estimated number of bytes of elements held in memory per run
+		:param spill_dir: The directory for run files or None for the system temporary directory
+		:param codec: An object providing 'dumps' and 'loads'
+		:return: A generator of the sorted elements
 		"""
 
-		return elem in self
+		run: list[T] = []
+		size: int = 0
+		block_size: int = LinqStream.SPILL_BLOCK_SIZE
 
-	def count(self) -> int:
+		with tempfile.TemporaryDirectory(prefix='linq-sort-', dir=spill_dir) as directory:
+			runs: list[str] = []
+
+			for element in self:
+				run.append(element)
+
+				if (size := size + LinqStream.__estimate__(element)) >= max_memory:
+					block_size = max(1, min(block_size, len(run) // LinqStream.MERGE_FAN_IN))
+					run.sort(key=key, reverse=reverse)
+					runs.append(LinqStream.__spill__(run, directory, codec, block_size))
+					run = []
+					size = 0
+
+			run.sort(key=key, reverse=reverse)
+
+			if len(runs) == 0:
+				yield from run
+				return
+			elif len(run) > 0:
+				runs.append(LinqStream.__spill__(run, directory, codec, block_size))
+
+			run = []
+
+			while len(runs) > LinqStream.MERGE_FAN_IN:
+				merged: list[str] = []
+
+				for i in range(0, len(runs), LinqStream.MERGE_FAN_IN):
+					group: list[str] = runs[i:i + LinqStream.MERGE_FAN_IN]
+					merged.append(LinqStream.__spill__(LinqStream.__merge_runs__(group, codec, key, reverse), directory, codec, block_size))
+
+					for path in group:
+						os.remove(path)
+
+				runs = merged
+
+			yield from LinqStream.__merge_runs__(runs, codec, key, reverse)
+
+	@staticmethod
+	def __resolve_codec__(method: typing.Callable, codec: typing.Literal['pickle', 'dill'] | typing.Any) -> typing.Any:
 		"""
-		*Evaluates the query*
-		:return: The number of elements in this query
+		INTERNAL METHOD
+		:param method: The method reporting an invalid codec
+		:param codec: 'pickle', 'dill' or an object providing 'dumps' and 'loads'
+		:return: The codec object
+		:raises InvalidArgumentException: If 'codec' is not a valid codec
 		"""
 
-		return sum(1 for _ in self)
+		codec = pickle if codec == 'pickle' else dill if codec == 'dill' else codec
+		Misc.raise_ifn(callable(getattr(codec, 'dumps', None)) and callable(getattr(codec, 'loads', None)), Exceptions.InvalidArgumentException(method, 'codec', type(codec)))
+		return codec
 
-	def first(self) -> T:
+	def sort(self, sorter: typing.Optional[typing.Callable[[T], typing.Any]] = None, *, reverse: bool = False, max_memory: typing.Optional[int] = None, spill_dir: typing.Optional[str] = None, codec: typing.Literal['pickle', 'dill'] | typing.Any = 'pickle') -> LinqStream[T]:
 		"""
-		*Evaluates the query*
-		:return: The first element in this query
-		:raises IterableEmptyException: If this query contains no elements
+		Sorts all elements in this query and yields the sorted query
+		Numeric sources without a sorter are sorted with numpy
+		Otherwise the elements are collected immediately and sorted once when the query is first evaluated; if only a prefix is needed, as in sort(...).take(n), the prefix is selected from the collected elements with a heap in O(len * log n) time
+		If 'max_memory' is supplied, the query is sorted externally each time it is evaluated: sorted runs of at most 'max_memory' estimated bytes are spilled to temporary files and lazily merged
+		:param sorter: The optional sorter used to supply sort keys
+		:param reverse: Whether to sort in reverse order
+		:param max_memory: If supplied, the memory budget in bytes for an external merge sort
+		:param spill_dir: The directory to spill runs to or None for the system temporary directory
+		:param codec: The run serializer: 'pickle', 'dill' or an object providing 'dumps' and 'loads' for lists of elements
+		:return: The modified query
+		:raises InvalidArgumentException: If 'sorter' is not callable, 'max_memory' is not an integer or 'codec' is not a valid codec
+		:raises ValueError: If 'max_memory' is not positive
 		"""
 
-		try:
-			return next(self)
-		except StopIteration:
-			raise Exceptions.IterableEmptyException('Collection is empty') from None
+		Misc.raise_ifn(sorter is ... or sorter is None or callable(sorter), Exceptions.InvalidArgumentException(LinqStream.sort, 'sorter', type(sorter)))
+		key: typing.Optional[typing.Callable[[T], typing.Any]] = None if sorter is ... or sorter is None else sorter
 
-	def first_or_default(self, default: typing.Any = None) -> typing.Optional[T]:
+		if max_memory is not None and max_memory is not ...:
+			Misc.raise_ifn(isinstance(max_memory, int), Exceptions.InvalidArgumentException(LinqStream.sort, 'max_memory', type(max_memory), (int,)))
+			Misc.raise_ifn((max_memory := int(max_memory)) > 0, ValueError('Max memory must be greater than 0'))
+			return LinqStream(LinqStream.ExternalSorted(self, key, bool(reverse), max_memory, spill_dir, LinqStream.__resolve_codec__(LinqStream.sort, codec)))
+		elif key is None and (vector := self.__vector_result__()) is not None:
+			block: numpy.ndarray = numpy.sort(vector[0], kind='stable')
+			block = block[::-1] if reverse else block
+			return LinqStream(block if vector[1] else block.tolist())
+
+		return LinqStream(LinqStream.Sorted(list(self), key, bool(reverse)))
+
+	@staticmethod
+	def __select__(query: typing.Iterable[T], count: int, key: typing.Optional[typing.Callable[[T], typing.Any]], reverse: bool) -> list[T] | numpy.ndarray:
 		"""
-		*Evaluates the query*
-		:param default: The default
-		:return: The first element in this query or "default" if this query has no elements
+		INTERNAL METHOD
+		Selects the first elements of a sorted query without sorting all of it
+		Equivalent to sorted(query, key=key, reverse=reverse)[:count], including the order of equal elements
+		Numeric queries without a key are partitioned with numpy; all others use a heap of 'count' elements
+		:param query: The query or iterable to select from
+		:param count: The number of elements to select
+		:param key: The sort key or None
+		:param reverse: Whether to select the largest rather than the smallest elements
+		:return: The selected elements in sorted order
 		"""
 
-		try:
-			return next(self)
-		except StopIteration:
-			return default
+		if count <= 0:
+			return []
+		elif key is None and isinstance(query, LinqStream) and (vector := query.__vector_result__()) is not None:
+			block: numpy.ndarray = vector[0]
 
-	def last(self) -> T:
+			if count < len(block):
+				block = numpy.partition(block, len(block) - count)[len(block) - count:] if reverse else numpy.partition(block, count - 1)[:count]
+
+			block = numpy.sort(block, kind='stable')
+			block = block[::-1] if reverse else block
+			return block if vector[1] else block.tolist()
+
+		return heapq.nlargest(count, query, key=key) if reverse else heapq.nsmallest(count, query, key=key)
+
+	def top(self, count: int, key: typing.Optional[typing.Callable[[T], typing.Any]] = None) -> LinqStream[T]:
 		"""
-		*Evaluates the query*
-		:return: The last element in this query
-		:raises IterableEmptyException: If this query contains no elements
+		Selects the largest elements in this query in descending order
+		Equivalent to sort(key, reverse=True).take(count) but runs in O(len * log count) time and O(count) memory
+		:param count: The number of elements to select
+		:param key: The optional function supplying sort keys
+		:return: The modified query
+		:raises InvalidArgumentException: If 'count' is not an integer or 'key' is not callable
+		:raises ValueError: If 'count' is negative
 		"""
 
-		element: typing.Any = None
-		has_one: bool = False
-
-		for element in self:
-			has_one = True
+		Misc.raise_ifn(isinstance(count, int), Exceptions.InvalidArgumentException(LinqStream.top, 'count', type(count), (int,)))
+		Misc.raise_ifn(key is None or callable(key), Exceptions.InvalidArgumentException(LinqStream.top, 'key', type(key)))
+		Misc.raise_ifn((count := int(count)) >= 0, ValueError('Count must be greater than or equal to 0'))
+		return LinqStream(LinqStream.TopSelected(self, count, key, True))
 
-		if not has_one:
-			raise Exceptions.IterableEmptyException('Collection is empty') from None
+	def bottom(self, count: int, key: typing.Optional[typing.Callable[[T], typing.Any]] = None) -> LinqStream[T]:
+		"""
+		Selects the smallest elements in this query in ascending order
+		Equivalent to sort(key).take(count) but runs in O(len * log count) time and O(count) memory
+		:param count: The number of elements to select
+		:param key: The optional function supplying sort keys
+		:return: The modified query
+		:raises InvalidArgumentException: If 'count' is not an integer or 'key' is not callable
+		:raises ValueError: If 'count' is negative
+		"""
 
-		return element
+		Misc.raise_ifn(isinstance(count, int), Exceptions.InvalidArgumentException(LinqStream.bottom, 'count', type(count), (int,)))
+		Misc.raise_ifn(key is None or callable(key), Exceptions.InvalidArgumentException(LinqStream.bottom, 'key', type(key)))
+		Misc.raise_ifn((count := int(count)) >= 0, ValueError('Count must be greater than or equal to 0'))
+		return LinqStream(LinqStream.TopSelected(self, count, key, False))
 
-	def last_or_default(self, default: typing.Any = None) -> typing.Optional[T]:
+	def nth_element(self, index: int, key: typing.Optional[typing.Callable[[T], typing.Any]] = None, *, reverse: bool = False) -> T:
 		"""
 		*Evaluates the query*
-		:param default: The default
-		:return: The last element in this query or "default" if this query has no elements
+		Gets the element at the specified position of this query's sorted order without sorting all of it
+		Equivalent to sort(key, reverse=reverse).element_at(index) but runs in O(len * log index) time and O(index) memory
+		:param index: The position in sorted order
+		:param key: The optional function supplying sort keys
+		:param reverse: Whether to count from the largest rather than the smallest element
+		:return: The element
+		:raises InvalidArgumentException: If 'index' is not an integer or 'key' is not callable
+		:raises IndexError: If 'index' is negative or not smaller than the number of elements
 		"""
 
-		element: typing.Any = default
+		Misc.raise_ifn(isinstance(index, int), Exceptions.InvalidArgumentException(LinqStream.nth_element, 'index', type(index), (int,)))
+		Misc.raise_ifn(key is None or callable(key), Exceptions.InvalidArgumentException(LinqStream.nth_element, 'key', type(key)))
+		Misc.raise_ifn((index := int(index)) >= 0, IndexError('Index must be greater than or equal to 0'))
+		selected: list[T] | numpy.ndarray = LinqStream.__select__(self, index + 1, key, bool(reverse))
 
-		for element in self:
-			pass
+		if len(selected) <= index:
+			raise IndexError(f'Index \'{index}\' out of bounds for LinqStream of len \'{len(selected)}\'')
 
-		return element
+		return selected[index]
 
-	def min(self, comparer: typing.Callable[[T], typing.Any] = None) -> T:
+	def cache(self, *, max_memory: typing.Optional[int] = None, spill_dir: typing.Optional[str] = None, codec: typing.Literal['pickle', 'dill'] | typing.Any = 'pickle') -> LinqStream[T]:
 		"""
-		*Evaluates the query*
-		:param comparer: The comparer to use for comparisons
-		:return: The smallest value in this query
-		:raises InvalidArgumentException: If 'comparer' is not callable
+		Records the elements of this query on first enumeration and replays them to all later and concurrent enumerations
+		The query is evaluated at most once, so several terminal operations cost a single pass over the source
+		If 'max_memory' is supplied, recorded elements beyond 'max_memory' estimated bytes are spilled to a temporary file
+		:param max_memory: If supplied, the memory budget in bytes for recorded elements
+		:param spill_dir: The directory for the spill file or None for the system temporary directory
+		:param codec: The spill serializer: 'pickle', 'dill' or an object providing 'dumps' and 'loads' for lists of elements
+		:return: The replayable query
+		:raises InvalidArgumentException: If 'max_memory' is not an integer or 'codec' is not a valid codec
+		:raises ValueError: If 'max_memory' is not positive
 		"""
 
-		Misc.raise_ifn(callable(comparer), Exceptions.InvalidArgumentException(LinqStream.min, 'comparer', type(comparer)))
-		return min(self, key=comparer)
+		if max_memory is ...:
+			max_memory = None
+		elif max_memory is not None:
+			Misc.raise_ifn(isinstance(max_memory, int), Exceptions.InvalidArgumentException(LinqStream.cache, 'max_memory', type(max_memory), (int,)))
+			Misc.raise_ifn((max_memory := int(max_memory)) > 0, ValueError('Max memory must be greater than 0'))
 
-	def max(self, comparer: typing.Callable[[T], typing.Any] = None) -> T:
+		return LinqStream(LinqStream.Cache(self, max_memory, spill_dir, LinqStream.__resolve_codec__(LinqStream.cache, codec)))
+
+	def reverse(self) -> LinqStream[T]:
 		"""
-		*Evaluates the query*
-		:param comparer: The comparer to use for comparisons
-		:return: The largest value in this query
-		:raises InvalidArgumentException: If 'comparer' is not callable
+		Reverses the order of elements in this query
+		:return: THe modified query
 		"""
 
-		Misc.raise_ifn(callable(comparer), Exceptions.InvalidArgumentException(LinqStream.max, 'comparer', type(comparer)))
-		return max(self, key=comparer)
+		return LinqStream(reversed(self))
 
-	def aggregate(self, initial: T, aggregator: typing.Callable[[T, T], T]) -> T:
+	def merge(self, *others: typing.Iterable[T]) -> LinqStream[T]:
 		"""
-		Applies an aggregator function over all elements in this query
-		:param initial: The initial value
-		:param aggregator: The aggregate functon
-		:return: The aggregate result
-		:raises InvalidArgumentException: If 'aggregator' is not callable
+		Appends multiple iterables to the end of this query
+		:param others: The iterable whose elements to append
+		:return: The modified query
+		:raises InvalidArgumentException: If one or more iterables is not iterable
 		"""
 
-		Misc.raise_ifn(callable(aggregator), Exceptions.InvalidArgumentException(LinqStream.aggregate, 'aggregator', type(aggregator)))
+		Misc.raise_ifn(all(hasattr(x, '__iter__') for x in others), Exceptions.InvalidArgumentException(LinqStream.merge, 'others', type(others)))
+		streams: tuple[LinqStream, ...] = (self, *others)
 
-		for elem in self:
-			initial = aggregator(initial, elem)
+		def iterator() -> typing.Generator[T]:
+			for stream in streams:
+				for item in stream:
+					yield item
 
-		return initial
+		return LinqStream(iterator())
 
-	def element_at(self, index: int) -> T:
+	def zip(self, *others: typing.Iterable[T]) -> LinqStream[tuple[T, ...]]:
 		"""
-		*Evaluates the query*
-		:param index: The element index
-		:return: The element at the specified index
-		:raises IndexError: If the specified index is out of bounds or negative
+		Zips multiple iterables with this one
+		The resulting query contains a tuple of index aligned elements from each iterable
+		:param others: The iterable whose elements to zip
+		:return: The modified query
+		:raises InvalidArgumentException: If one or more iterables is not iterable
 		"""
 
-		current: int = 0
+		Misc.raise_ifn(all(hasattr(x, '__iter__') for x in others), Exceptions.InvalidArgumentException(LinqStream.zip, 'others', type(others)))
+		streams: tuple[typing.Iterator[T], ...] = tuple(iter(x) for x in (self, *others))
 
-		for elem in self:
-			if index == current:
-				return elem
+		def iterator() -> typing.Generator[T]:
+			package: list[T] = []
 
-			current += 1
+			while True:
+				try:
+					for i in streams:
+						package.append(next(i))
+					yield tuple(package)
+					package.clear()
+				except StopIteration:
+					break
 
-		raise IndexError(f'Index \'{index}\' out of bounds for LinqStream of len \'{current}\'')
+		return LinqStream(iterator())
 
-	def element_at_or_default(self, index: int, default: typing.Optional[T] = None) -> T:
+	@staticmethod
+	def __known_length__(iterable: typing.Iterable) -> typing.Optional[int]:
 		"""
-		*Evaluates the query*
-		:param index: The element index
-		:param default: The default
-		:return: The element at the specified index or "default" if index is out of bounds
+		INTERNAL METHOD
+		:param iterable: The iterable to measure
+		:return: The number of elements the iterable yields if known without iterating it or None
 		"""
 
-		current: int = 0
+		if isinstance(iterable, LinqStream):
+			window: typing.Optional[tuple[int, int]] = iterable.__window__(False, False)
+			return None if window is None else window[1] - window[0]
+		elif isinstance(iterable, collections.abc.Sized) and not isinstance(iterable, (collections.abc.Iterator, Stream)):
+			return len(iterable)
+		else:
+			return None
 
-		for elem in self:
-			if index == current:
-				return elem
+	@staticmethod
+	def __hash_join__(outer: typing.Iterable, inner: typing.Iterable, outer_key: typing.Callable, inner_key: typing.Callable, result: typing.Callable, mode: str, default: typing.Any, build: str = 'inner') -> typing.Generator:
+		"""
+		INTERNAL METHOD
+		Joins two iterables by building a hash table of one side and probing it with the other
+		Inner joins with 'build' set to 'smaller' build on the outer side if it is known to be smaller; all other joins build on the inner side
+		:param outer: The outer iterable
+		:param inner: The inner iterable
+		:param outer_key: The outer key selector
+		:param inner_key: The inner key selector
+		:param result: The result selector
+		:param mode: One of 'inner', 'left', 'group', 'semi' or 'anti'
+		:param default: The inner element paired with unmatched outer elements of a left join
+		:param build: Either 'inner' or 'smaller'
+		:return: A generator of the joined elements
+		"""
 
-			current += 1
+		if mode == 'inner' and build == 'smaller' and (outer_length := LinqStream.__known_length__(outer)) is not None and (inner_length := LinqStream.__known_length__(inner)) is not None and outer_length < inner_length:
+			table: dict[typing.Any, list] = {}
 
-		return default
+			for element in outer:
+				table.setdefault(outer_key(element), []).append(element)
 
-	def single(self) -> T:
-		"""
-		*Evaluates the query*
-		:return: The sole element of this query
-		:raises ValueError: If this query's length is not 1
-		"""
+			for element in inner:
+				for match in table.get(inner_key(element), ()):
+					yield result(match, element)
 
-		singled: bool = False
-		result: T = None
+			return
+		elif mode == 'semi' or mode == 'anti':
+			keys: set = set(map(inner_key, inner))
+			expected: bool = mode == 'semi'
 
-		for elem in self:
-			if singled:
-				raise ValueError('LinqStream does not have exactly one element')
+			for element in outer:
+				if (outer_key(element) in keys) is expected:
+					yield element
 
-			result = elem
-			singled	= True
+			return
 
-		if singled:
-			return result
-		else:
-			raise ValueError('LinqStream does not have exactly one element')
+		table: dict[typing.Any, list] = {}
 
-	def single_or_default(self, default: typing.Optional[T] = None) -> T:
-		"""
-		*Evaluates the query*
-		:param default: The default
-		:return: The sole element of this query or "default" is this query's length is not 1
-		"""
+		for element in inner:
+			table.setdefault(inner_key(element), []).append(element)
 
-		singled: bool = False
-		result: T = None
+		for element in outer:
+			matches: typing.Optional[list] = table.get(outer_key(element))
 
-		for elem in self:
-			if singled:
-				return default
+			if mode == 'group':
+				yield result(element, () if matches is None else tuple(matches))
+			elif matches is not None:
+				for match in matches:
+					yield result(element, match)
+			elif mode == 'left':
+				yield result(element, default)
 
-			result = elem
-			singled = True
+	@staticmethod
+	def __merge_join__(outer: typing.Iterable, inner: typing.Iterable, outer_key: typing.Callable, inner_key: typing.Callable, result: typing.Callable, mode: str, default: typing.Any) -> typing.Generator:
+		"""
+		INTERNAL METHOD
+		Joins two iterables sorted in ascending key order by advancing through both at once
+		Only the inner elements sharing the current key are held in memory
+		:param outer: The outer iterable
+		:param inner: The inner iterable
+		:param outer_key: The outer key selector
+		:param inner_key: The inner key selector
+		:param result: The result selector
+		:param mode: One of 'inner', 'left', 'group', 'semi' or 'anti'
+		:param default: The inner element paired with unmatched outer elements of a left join
+		:return: A generator of the joined elements
+		:raises ValueError: If either iterable is not sorted by key
+		"""
+
+		iterator: typing.Iterator = iter(inner)
+		pending: typing.Any = next(iterator, ...)
+		pending_key: typing.Any = ... if pending is ... else inner_key(pending)
+		group_key: typing.Any = ...
+		group: list = []
+		store: bool = mode != 'semi' and mode != 'anti'
+
+		for element in outer:
+			key: typing.Any = outer_key(element)
+
+			if group_key is ... or key != group_key:
+				if group_key is not ... and key < group_key:
+					raise ValueError('Outer iterable is not sorted by key')
+
+				while pending is not ... and pending_key < key:
+					previous: typing.Any = pending_key
+					pending = next(iterator, ...)
+
+					if pending is not ... and (pending_key := inner_key(pending)) < previous:
+						raise ValueError('Inner iterable is not sorted by key')
+
+				group_key = key
+				group = []
+
+				while pending is not ... and pending_key == key:
+					group.append(pending if store else True)
+					pending = next(iterator, ...)
+
+					if pending is not ... and (pending_key := inner_key(pending)) < key:
+						raise ValueError('Inner iterable is not sorted by key')
+
+			if mode == 'group':
+				yield result(element, tuple(group))
+			elif mode == 'semi' or mode == 'anti':
+				if (len(group) > 0) is (mode == 'semi'):
+					yield element
+			elif len(group) > 0:
+				for match in group:
+					yield result(element, match)
+			elif mode == 'left':
+				yield result(element, default)
 
-		return result if singled else default
+	def __join__(self, method: typing.Callable, inner: typing.Iterable, outer_key: typing.Callable, inner_key: typing.Optional[typing.Callable], result: typing.Optional[typing.Callable], mode: str, strategy: str, default: typing.Any = None, build: str = 'inner') -> LinqStream:
+		"""
+		INTERNAL METHOD
+		Validates the arguments of a join and creates the joined query
+		:param method: The public join method reporting invalid arguments
+		:param inner: The inner iterable
+		:param outer_key: The outer key selector
+		:param inner_key: The inner key selector or ... to use the outer key selector
+		:param result: The result selector or ... to yield tuples
+		:param mode: One of 'inner', 'left', 'group', 'semi' or 'anti'
+		:param strategy: Either 'hash' or 'merge'
+		:param default: The inner element paired with unmatched outer elements of a left join
+		:param build: Either 'inner' or 'smaller'
+		:return: The joined query
+		:raises InvalidArgumentException: If 'inner' is not iterable or 'outer_key', 'inner_key' or 'result' is not callable
+		:raises ValueError: If 'strategy' is not 'hash' or 'merge' or 'build' is not 'inner' or 'smaller'
+		"""
+
+		inner_key = outer_key if inner_key is ... or inner_key is None else inner_key
+		result = (lambda a, b: (a, b)) if result is ... or result is None else result
+		Misc.raise_ifn(isinstance(inner, typing.Iterable), Exceptions.InvalidArgumentException(method, 'inner', type(inner)))
+		Misc.raise_ifn(callable(outer_key), Exceptions.InvalidArgumentException(method, 'outer_key', type(outer_key)))
+		Misc.raise_ifn(callable(inner_key), Exceptions.InvalidArgumentException(method, 'inner_key', type(inner_key)))
+		Misc.raise_ifn(callable(result), Exceptions.InvalidArgumentException(method, 'result', type(result)))
+		Misc.raise_ifn(build == 'inner' or build == 'smaller', ValueError(f'Join build side must be either \'inner\' or \'smaller\'; got \'{build}\''))
+
+		if strategy == 'hash':
+			return LinqStream(LinqStream.__hash_join__(self, inner, outer_key, inner_key, result, mode, default, build))
+		elif strategy == 'merge':
+			return LinqStream(LinqStream.__merge_join__(self, inner, outer_key, inner_key, result, mode, default))
+		else:
+			raise ValueError(f'Join strategy must be either \'hash\' or \'merge\'; got \'{strategy}\'')
 
-	def sum(self) -> typing.Any:
+	def join[I, K, R](self, inner: typing.Iterable[I], outer_key: typing.Callable[[T], K], inner_key: typing.Callable[[I], K] = ..., result: typing.Callable[[T, I], R] = ..., *, strategy: typing.Literal['hash', 'merge'] = 'hash', build: typing.Literal['inner', 'smaller'] = 'inner') -> LinqStream[R]:
 		"""
-		*Evaluates the query*
-		:return: The sum of all elements in this query
+		Correlates the elements of this query and another iterable with equal keys
+		Results follow the order of this query, then the order of matching inner elements
+		The 'hash' strategy builds a hash table of 'inner'; with 'build' set to 'smaller' it instead builds on this query if both lengths are known without iterating and this query is shorter, in which case the result order is unspecified
+		The 'merge' strategy requires both sides sorted in ascending key order and only holds the inner elements sharing the current key
+		:param inner: The iterable to join with
+		:param outer_key: The key selector for elements of this query
+		:param inner_key: The key selector for elements of 'inner' or ... to use 'outer_key'
+		:param result: The selector combining a matching outer and inner element or ... to yield (outer, inner) tuples
+		:param strategy: Either 'hash' or 'merge'
+		:param build: The side the 'hash' strategy builds its table on: 'inner' or 'smaller'
+		:return: The joined query
+		:raises InvalidArgumentException: If 'inner' is not iterable or 'outer_key', 'inner_key' or 'result' is not callable
+		:raises ValueError: If 'strategy' is not 'hash' or 'merge' or 'build' is not 'inner' or 'smaller'
 		"""
 
-		return sum(self)
+		return self.__join__(LinqStream.join, inner, outer_key, inner_key, result, 'inner', strategy, build=build)
 
-	def average(self) -> complex:
+	def left_join[I, K, R](self, inner: typing.Iterable[I], outer_key: typing.Callable[[T], K], inner_key: typing.Callable[[I], K] = ..., result: typing.Callable[[T, I], R] = ..., *, default: typing.Any = None, strategy: typing.Literal['hash', 'merge'] = 'hash') -> LinqStream[R]:
 		"""
-		*Evaluates the query*
-		:return: The average of all numbers in this query
-		:raises TypeError: If any element in this query is not a number
+		Correlates the elements of this query and another iterable with equal keys, keeping elements of this query without a match
+		Results follow the order of this query
+		The 'merge' strategy requires both sides sorted in ascending key order and only holds the inner elements sharing the current key
+		:param inner: The iterable to join with
+		:param outer_key: The key selector for elements of this query
+		:param inner_key: The key selector for elements of 'inner' or ... to use 'outer_key'
+		:param result: The selector combining an outer and inner element or ... to yield (outer, inner) tuples
+		:param default: The inner element paired with outer elements without a match
+		:param strategy: Either 'hash' or 'merge'
+		:return: The joined query
+		:raises InvalidArgumentException: If 'inner' is not iterable or 'outer_key', 'inner_key' or 'result' is not callable
+		:raises ValueError: If 'strategy' is not 'hash' or 'merge'
 		"""
 
-		count: int = 0
-		total: complex = 0
+		return self.__join__(LinqStream.left_join, inner, outer_key, inner_key, result, 'left', strategy, default)
 
-		for elem in self:
-			Misc.raise_ifn(isinstance(elem, (int, float, complex)), TypeError('Resulting element is not a number'))
-			count += 1
-			total += elem
+	def group_join[I, K, R](self, inner: typing.Iterable[I], outer_key: typing.Callable[[T], K], inner_key: typing.Callable[[I], K] = ..., result: typing.Callable[[T, tuple[I, ...]], R] = ..., *, strategy: typing.Literal['hash', 'merge'] = 'hash') -> LinqStream[R]:
+		"""
+		Correlates each element of this query with the tuple of all elements of another iterable with an equal key
+		Results follow the order of this query
+		The 'merge' strategy requires both sides sorted in ascending key order and only holds the inner elements sharing the current key
+		:param inner: The iterable to join with
+		:param outer_key: The key selector for elements of this query
+		:param inner_key: The key selector for elements of 'inner' or ... to use 'outer_key'
+		:param result: The selector combining an outer element and its tuple of matches or ... to yield (outer, matches) tuples
+		:param strategy: Either 'hash' or 'merge'
+		:return: The joined query
+		:raises InvalidArgumentException: If 'inner' is not iterable or 'outer_key', 'inner_key' or 'result' is not callable
+		:raises ValueError: If 'strategy' is not 'hash' or 'merge'
+		"""
 
-		return total / count
+		return self.__join__(LinqStream.group_join, inner, outer_key, inner_key, result, 'group', strategy)
 
-	def collect[C: typing.Iterable](self, collection: Stream[T] | type[C] = tuple, *args, **kwargs) -> Stream[T] | C:
+	def semi_join[I, K](self, inner: typing.Iterable[I], outer_key: typing.Callable[[T], K], inner_key: typing.Callable[[I], K] = ..., *, strategy: typing.Literal['hash', 'merge'] = 'hash') -> LinqStream[T]:
 		"""
-		*Evaluates the query*
-		Collects all elements in this query into a new collection or Stream
-		:param collection: The type of collection to collect into or a Stream instance
-		:param args: Extra positional arguments to apply to the collector's constructor
-		:param kwargs: Extra keyword arguments to apply to the collector's constructor
-		:return: The populated collection or Stream
-		:raises InvalidArgumentException: If 'collector' is not an iterable type, Stream, or Stream type
+		Keeps the elements of this query whose key matches at least one element of another iterable
+		The 'hash' strategy only stores the keys of 'inner'; the 'merge' strategy requires both sides sorted in ascending key order
+		:param inner: The iterable to match against
+		:param outer_key: The key selector for elements of this query
+		:param inner_key: The key selector for elements of 'inner' or ... to use 'outer_key'
+		:param strategy: Either 'hash' or 'merge'
+		:return: The filtered query
+		:raises InvalidArgumentException: If 'inner' is not iterable or 'outer_key' or 'inner_key' is not callable
+		:raises ValueError: If 'strategy' is not 'hash' or 'merge'
 		"""
 
-		if isinstance(collection, type) and issubclass(collection, Stream):
-			stream: Stream = collection(*args, **kwargs)
+		return self.__join__(LinqStream.semi_join, inner, outer_key, inner_key, ..., 'semi', strategy)
 
-			for elem in self:
-				stream.write(elem)
+	def anti_join[I, K](self, inner: typing.Iterable[I], outer_key: typing.Callable[[T], K], inner_key: typing.Callable[[I], K] = ..., *, strategy: typing.Literal['hash', 'merge'] = 'hash') -> LinqStream[T]:
+		"""
+		Keeps the elements of this query whose key matches no element of another iterable
+		The 'hash' strategy only stores the keys of 'inner'; the 'merge' strategy requires both sides sorted in ascending key order
+		:param inner: The iterable to match against
+		:param outer_key: The key selector for elements of this query
+		:param inner_key: The key selector for elements of 'inner' or ... to use 'outer_key'
+		:param strategy: Either 'hash' or 'merge'
+		:return: The filtered query
+		:raises InvalidArgumentException: If 'inner' is not iterable or 'outer_key' or 'inner_key' is not callable
+		:raises ValueError: If 'strategy' is not 'hash' or 'merge'
+		"""
 
-			return stream
-		elif isinstance(collection, type) and issubclass(collection, (typing.Iterable, collections.abc.Sequence, collections.abc.Iterable)):
-			return collection(self, *args, **kwargs)
-		elif isinstance(collection, Stream):
-			for elem in self:
-				collection.write(elem)
-			return collection
-		else:
-			raise Exceptions.InvalidArgumentException(LinqStream.collect, 'collector', type(collection), (type, Stream))
+		return self.__join__(LinqStream.anti_join, inner, outer_key, inner_key, ..., 'anti', strategy)
 
-	def transform[K](self, mapper: typing.Callable[[T], K]) -> LinqStream[K]:
+	def append(self, element: T) -> LinqStream[T]:
 		"""
-		Applies a transformer to all elements in this query
-		:param mapper: Transformer function
+		Appends an element to the end of this query
+		:param element: The element to append
 		:return: The modified query
-		:raises InvalidArgumentException: If 'mapper' is not callable
 		"""
 
-		Misc.raise_ifn(callable(mapper), Exceptions.InvalidArgumentException(LinqStream.transform, 'mapper', type(mapper)))
-		return LinqStream(mapper(x) for x in self)
+		def _append(stream: LinqStream[T]) -> typing.Generator[T]:
+			for elem in stream:
+				yield elem
 
-	def transform_many[K](self, mapper: typing.Callable[[T], typing.Iterable[K]]) -> LinqStream[K]:
+			yield element
+
+		return LinqStream(_append(self))
+
+	def prepend(self, element: T) -> LinqStream[T]:
 		"""
-		Applies a transformer to all elements in this query and flattens the result
-		:param mapper: Transformer function
+		Prepends an element to the end of this query
+		:param element: The element to prepend
 		:return: The modified query
-		:raises InvalidArgumentException: If 'mapper' is not callable
 		"""
 
-		Misc.raise_ifn(callable(mapper), Exceptions.InvalidArgumentException(LinqStream.transform_many, 'mapper', type(mapper)))
-
-		def _many() -> typing.Generator[K]:
-			for elem in self:
-				collection: typing.Iterable[K] = mapper(elem)
+		def _prepend(stream: LinqStream[T]) -> typing.Generator[T]:
+			yield element
 
-				for subelem in collection:
-					yield subelem
+			for elem in stream:
+				yield elem
 
-		return LinqStream(_many())
+		return LinqStream(_prepend(self))
 
-	def filter(self, filter_: typing.Callable[[T], bool]) -> LinqStream[T]:
+	def insert(self, index: int, element: T) -> LinqStream[T]:
 		"""
-		Filters elements in this query
-		:param filter_: The filter function (return True to keep and False to discard)
+		Inserts an element into this query
+		:param index: The index to insert at
+		:param element: The element to insert
 		:return: The modified query
-		:raises InvalidArgumentException: If 'filter_' is not callable
+		:raises InvalidArgumentException: If 'index' is not an integer
+		:raises ValueError: If 'index' is negative
 		"""
 
-		Misc.raise_ifn(callable(filter_), Exceptions.InvalidArgumentException(LinqStream.filter, 'filter_', type(filter_)))
-		return LinqStream(x for x in self if filter_(x))
+		def _insert(stream: LinqStream[T]) -> typing.Generator[T]:
+			for i, elem in enumerate(stream):
+				yield elem
 
-	def split(self, filter_: typing.Callable[[T], collections.abc.Hashable], *groups: typing.Hashable) -> LinqStream[tuple[T, ...]]:
+				if i == index:
+					yield element
+
+		Misc.raise_ifn(isinstance(index, int), Exceptions.InvalidArgumentException(LinqStream.insert, 'index', type(index), (int,)))
+		Misc.raise_ifn((index := int(index)) >= 0, ValueError('Index cannot be negative'))
+		return LinqStream(_insert(self))
+
+	def serialize(self, serializer: typing.Literal['dill', 'pickle'] = 'pickle', *, on_error: typing.Literal['ignore', 'replace', 'pass', 'throw'] = 'replace', **kwargs) -> LinqStream[bytes | T | None]:
 		"""
-		Splits elements in this query based on the hashed result of the filter function
-		:param filter_: The filter function
-		:param groups: An optional set of groups to add to the internal mapping
+		Serializes all elements in this query into bytes
+		:param serializer: The serializer to use: either 'dill' or 'pickle'
+		:param on_error: How to handle serialization errors
+		:param kwargs: Extra arguments to pass to serializers
 		:return: The modified query
-		:raises InvalidArgumentException: If 'filter_' is not callable
-		"""
-
-		Misc.raise_ifn(callable(filter_), Exceptions.InvalidArgumentException(LinqStream.filter, 'filter_', type(filter_)))
+		:raises InvalidArgumentException: If 'serializer' or 'on_error' is not a valid literal
+		:raises TypeError: If 'on_error' is throw and a serialization error occurs
 
-		def __splitter__(linq: LinqStream[T]) -> typing.Iterator[tuple[T, ...]]:
-			splitter: collections.OrderedDict[int, list[T]] = collections.OrderedDict({hash(group): [] for group in groups})
+		*Serialization Errors*\n
+		- ignore: Erroneous element is removed from the resulting query\n
+		- replace: Erroneous element is replaced with 'None'\n
+		- pass: Erroneous element is passed as is without serialization\n
+		- throw: Error is raised
+		"""
 
-			for elem in linq:
-				bucket: int = hash(filter_(elem))
-				splitter.setdefault(bucket, []).append(elem)
+		Misc.raise_ifn(serializer == 'dill' or serializer == 'pickle', ValueError('Serializer must be either \'dill\' or \'pickle\''))
+		Misc.raise_ifn(on_error == 'ignore' or on_error == 'replace' or on_error == 'pass' or on_error == 'throw', ValueError('On Error must be either \'ignore\', \'replace\', \'pass\' or \'throw\''))
 
-			for group in splitter.values():
-				yield tuple(group)
+		def __serialize(stream: LinqStream[T]) -> typing.Generator[bytes | T | None]:
+			for elem in stream:
+				try:
+					if serializer == 'dill':
+						yield dill.dumps(elem, **kwargs)
+					elif serializer == 'pickle':
+						yield pickle.dumps(elem, **kwargs)
+				except Exception as err:
+					if on_error == 'ignore':
+						continue
+					elif on_error == 'replace':
+						yield None
+					elif on_error == 'pass':
+						yield elem
+					elif on_error == 'throw':
+						raise TypeError(f'Failed to serialize element: \'{elem}\'') from err
 
-		return LinqStream(__splitter__(self))
+		return LinqStream(__serialize(self))
 
-	def assert_if(self, filter_: typing.Callable[[T], bool], exception: Exception = AssertionError('Assertion failed')):
+	def deserialize[T](self, serializer: typing.Literal['dill', 'pickle'] = 'pickle', *, on_error: typing.Literal['ignore', 'replace', 'pass', 'throw'] = 'replace', **kwargs) -> LinqStream[T | bytes | None]:
 		"""
-		Raises an exception if any element passes the check
-		:param filter_: The filter function (return True to throw error and True to allow)
-		:param exception: The exception to raise
+		Deserializes all elements in this query into bytes
+		:param serializer: The serializer to use: either 'dill' or 'pickle'
+		:param on_error: How to handle serialization errors
+		:param kwargs: Extra arguments to pass to serializers
 		:return: The modified query
-		:raises InvalidArgumentException: If 'filter_' is not callable or 'exception' is not an exception
+		:raises InvalidArgumentException: If 'serializer' or 'on_error' is not a valid literal
+		:raises TypeError: If the specified element is not a bytes or bytearray object or 'on_error' is throw and a serialization error occurs
+
+		*Deserialization Errors*\n
+		- ignore: Erroneous element is removed from the resulting query\n
+		- replace: Erroneous element is replaced with 'None'\n
+		- pass: Erroneous element is passed as is without deserialization\n
+		- throw: Error is raised
 		"""
 
-		Misc.raise_ifn(callable(filter_), Exceptions.InvalidArgumentException(LinqStream.filter, 'filter_', type(filter_)))
-		Misc.raise_ifn(isinstance(exception, BaseException), Exceptions.InvalidArgumentException(LinqStream.filter, 'exception', type(exception)))
+		Misc.raise_ifn(serializer == 'dill' or serializer == 'pickle', ValueError('Serializer must be either \'dill\' or \'pickle\''))
+		Misc.raise_ifn(on_error == 'ignore' or on_error == 'replace' or on_error == 'pass' or on_error == 'throw', ValueError('On Error must be either \'ignore\', \'replace\', \'pass\' or \'throw\''))
 
-		def __assert__(stream: LinqStream[T]) -> typing.Iterator[T]:
+		def __deserialize(stream: LinqStream[T]) -> typing.Generator[bytes]:
 			for elem in stream:
-				if filter_(elem):
-					raise exception
-				yield elem
+				try:
+					if serializer == 'dill':
+						yield dill.loads(elem, **kwargs)
+					elif serializer == 'pickle':
+						yield pickle.loads(elem, **kwargs)
+				except Exception as err:
+					if on_error == 'ignore':
+						continue
+					elif on_error == 'replace':
+						yield None
+					elif on_error == 'pass':
+						yield elem
+					elif on_error == 'throw':
+						raise TypeError(f'Failed to deserialize element: \'{elem}\'') from err
 
-		return LinqStream(__assert__(self))
+		return LinqStream(__deserialize(self))
 
-	def instance_of[I](self, cls: type[I]) -> LinqStream[I]:
+	@staticmethod
+	def __describe__(callback: typing.Callable) -> str:
 		"""
-		Filters elements in this query
-		All elements that derive the specified type are allowed
-		:param cls: The class type to check for
-		:return: The modified query
-		:raises InvalidArgumentException: If 'cls' is not a type
+		INTERNAL METHOD
+		:param callback: A stage callback
+		:return: A short name for the callback
 		"""
 
-		Misc.raise_ifn(isinstance(cls, type), Exceptions.InvalidArgumentException(LinqStream.instance_of, 'cls', type(cls), (type,)))
-		return LinqStream(x for x in self if isinstance(x, cls))
+		return getattr(callback, '__qualname__', None) or type(callback).__name__
 
-	def not_instance_of[I](self, cls: type[I]) -> LinqStream[I]:
+	def explain(self, file: typing.Optional[typing.IO] = ...) -> str:
 		"""
-		Filters elements in this query
-		All elements that do not derive the specified type are allowed
-		:param cls: The class type to check for
-		:return: The modified query
-		:raises InvalidArgumentException: If 'cls' is not a type
+		Describes the optimized plan of this query without evaluating it
+		:param file: The text file to print the plan to, sys.stdout if not supplied, or None to not print
+		:return: The plan description
 		"""
 
-		Misc.raise_ifn(isinstance(cls, type), Exceptions.InvalidArgumentException(LinqStream.not_instance_of, 'cls', type(cls), (type,)))
-		return LinqStream(x for x in self if not isinstance(x, cls))
+		source: typing.Iterable[T] = self.__source__
+		sized: bool = isinstance(source, collections.abc.Sized) and not isinstance(source, (collections.abc.Iterator, Stream))
+		lines: list[str] = [f'Source: {type(source).__name__}' + (f' (len={len(source)})' if sized else '')]
 
-	def skip(self, count: int) -> LinqStream[T]:
+		for node in self.__optimize__():
+			if node[0] == 'slice':
+				lines.append(f'  Slice [{node[1]}:{"" if node[2] is None else node[2]}]')
+			else:
+				lines.append(f'  Fused loop: {" -> ".join(f"{kind}({LinqStream.__describe__(callback)})" for kind, callback in node[1])}')
+
+		if isinstance(source, LinqStream.Sorted) and (nodes := self.__optimize__()) and nodes[0][0] == 'slice' and nodes[0][2] is not None:
+			lines.append(f'Top-k: the first {nodes[0][2]} sorted elements are selected with a heap')
+
+		direct: tuple[str, ...] = tuple(name for name, window in (('count', self.__window__(False, False)), ('any', self.__window__(False, False)), ('first', self.__window__(True, False)), ('reversed', self.__window__(True, False))) if window is not None)
+		lines.append(f'Direct: {", ".join(direct) if len(direct) > 0 else "none"}')
+
+		if isinstance(source, (numpy.ndarray, array.array)):
+			lines.append('Vectorized: numeric source; unary ufunc stages and stages marked with LinqStream.vectorized run on ndarray blocks')
+
+		text: str = '\n'.join(lines)
+
+		if file is ...:
+			print(text)
+		elif file is not None:
+			print(text, file=file)
+
+		return text
+
+	def parallel(self, workers: typing.Optional[int] = None, backend: typing.Literal['thread', 'process'] = 'thread', *, ordered: bool = True, chunk_size: int = 1024) -> ParallelLinqStream[T]:
 		"""
-		Skips the first 'count' elements in this query
-		:param count: The number of elements to skip
-		:return: The modified query
-		:raises InvalidArgumentException: If 'count' is not an integer
-		:raises ValueError: If 'count' is negative
+		Runs the transform, transform_many and filter stages following this call on a pool of workers
+		Source elements are sent to workers in chunks; all other operators consume the parallel results sequentially
+		:param workers: The number of workers or None to use the number of CPUs
+		:param backend: Either 'thread' or 'process'; process workers receive stages serialized with dill
+		:param ordered: Whether results keep the source order; unordered results are yielded as chunks complete
+		:param chunk_size: The number of source elements sent to a worker at once
+		:return: The parallel query
+		:raises InvalidArgumentException: If 'workers' or 'chunk_size' is not an integer
+		:raises ValueError: If 'workers' or 'chunk_size' is less than 1 or 'backend' is not 'thread' or 'process'
 		"""
 
-		def _skip(stream: LinqStream[T]) -> typing.Generator[T]:
-			nonlocal index
+		return ParallelLinqStream(self, workers, backend, ordered=ordered, chunk_size=chunk_size)
 
-			for elem in stream:
-				if (index := (index + 1)) > count:
-					yield elem
 
-		Misc.raise_ifn(isinstance(count, int), Exceptions.InvalidArgumentException(LinqStream.skip, 'count', type(count), (int,)))
-		Misc.raise_ifn((count := int(count)) >= 0, ValueError('Count cannot be negative'))
-		index: int = 0
-		return LinqStream(_skip(self))
+class ParallelLinqStream[T](LinqStream[T]):
+	"""
+	LinqStream whose element-wise stages run on a thread or process pool
+	Adjacent transform, transform_many and filter calls are recorded and executed together on each source chunk
+	"""
 
-	def skip_while(self, condition: typing.Callable[[T], bool]) -> LinqStream[T]:
+	__optimizable__: bool = False
+
+	def __init__(self, iterable: typing.Iterable[T], workers: typing.Optional[int] = None, backend: typing.Literal['thread', 'process'] = 'thread', *, ordered: bool = True, chunk_size: int = 1024, stages: tuple[tuple[str, typing.Callable], ...] = ()):
 		"""
-		Skips the elements in this query while the condition callback returns True
-		:param condition: The condition
-		:return: The modified query
-		:raises InvalidArgumentException: If 'condition' is not callable
+		LinqStream whose element-wise stages run on a thread or process pool
+		- Constructor -
+		:param iterable: The source iterable
+		:param workers: The number of workers or None to use the number of CPUs
+		:param backend: Either 'thread' or 'process'; process workers receive stages serialized with dill
+		:param ordered: Whether results keep the source order; unordered results are yielded as chunks complete
+		:param chunk_size: The number of source elements sent to a worker at once
+		:param stages: The recorded stages as pairs of stage kind and callback
+		:raises InvalidArgumentException: If 'iterable' is not iterable or 'workers' or 'chunk_size' is not an integer
+		:raises ValueError: If 'workers' or 'chunk_size' is less than 1 or 'backend' is not 'thread' or 'process'
+		"""
+
+		super().__init__(iterable)
+		Misc.raise_ifn(workers is None or isinstance(workers, int), Exceptions.InvalidArgumentException(ParallelLinqStream.__init__, 'workers', type(workers), (int,)))
+		Misc.raise_ifn(isinstance(chunk_size, int), Exceptions.InvalidArgumentException(ParallelLinqStream.__init__, 'chunk_size', type(chunk_size), (int,)))
+		Misc.raise_ifn(workers is None or int(workers) >= 1, ValueError('Workers must be greater than or equal to 1'))
+		Misc.raise_ifn(int(chunk_size) >= 1, ValueError('Chunk size must be greater than or equal to 1'))
+		Misc.raise_ifn(backend == 'thread' or backend == 'process', ValueError('Backend must be either \'thread\' or \'process\''))
+		self.__workers__: int = (os.cpu_count() or 1) if workers is None else int(workers)
+		self.__backend__: str = str(backend)
+		self.__ordered__: bool = bool(ordered)
+		self.__chunk_size__: int = int(chunk_size)
+		self.__stages__: tuple[tuple[str, typing.Callable], ...] = tuple(stages)
+
+	@staticmethod
+	def __execute__(payload: bytes | tuple[tuple[tuple[str, typing.Callable], ...], typing.Callable], chunk: tuple[T, ...]) -> typing.Any:
+		"""
+		INTERNAL METHOD
+		Runs all stages over one chunk within a worker and reduces the results to a partial result
+		:param payload: The stages and reducer, serialized with dill for process workers
+		:param chunk: The source elements to process
+		:return: The partial result
+		"""
+
+		stages, reducer = dill.loads(payload) if isinstance(payload, bytes) else payload
+		items: typing.Iterable = chunk
+
+		for kind, callback in stages:
+			if kind == 'transform':
+				items = map(callback, items)
+			elif kind == 'filter':
+				items = filter(callback, items)
+			else:
+				items = itertools.chain.from_iterable(map(callback, items))
+
+		return reducer(items)
+
+	def __extend__(self, kind: str, callback: typing.Callable) -> ParallelLinqStream:
+		"""
+		INTERNAL METHOD
+		:param kind: The stage kind
+		:param callback: The stage callback
+		:return: A copy of this query with the stage appended
+		"""
+
+		return ParallelLinqStream(self.__source__, self.__workers__, self.__backend__, ordered=self.__ordered__, chunk_size=self.__chunk_size__, stages=(*self.__stages__, (kind, callback)))
+
+	def __evaluate__(self, reducer: typing.Callable[[typing.Iterable], typing.Any]) -> typing.Iterator[typing.Any]:
+		"""
+		INTERNAL METHOD
+		Distributes source chunks over a worker pool, keeping at most two chunks per worker in flight
+		:param reducer: The function reducing each chunk's results to a partial result within the worker
+		:return: An iterator of partial results, in source order if this query is ordered
 		"""
 
-		def _skip(stream: LinqStream[T]) -> typing.Generator[T]:
-			for elem in stream:
-				if not condition(elem):
-					yield elem
+		process: bool = self.__backend__ == 'process'
+		payload: bytes | tuple = dill.dumps((self.__stages__, reducer)) if process else (self.__stages__, reducer)
+		executor: concurrent.futures.Executor = concurrent.futures.ProcessPoolExecutor(self.__workers__) if process else concurrent.futures.ThreadPoolExecutor(self.__workers__)
+		source: typing.Iterator[T] = iter(self.__source__)
+		pending: collections.deque[concurrent.futures.Future] = collections.deque()
+		exhausted: bool = False
+
+		try:
+			while True:
+				while not exhausted and len(pending) < self.__workers__ * 2:
+					chunk: tuple[T, ...] = tuple(itertools.islice(source, self.__chunk_size__))
+
+					if len(chunk) == 0:
+						exhausted = True
+					else:
+						pending.append(executor.submit(ParallelLinqStream.__execute__, payload, chunk))
+
+				if len(pending) == 0:
 					break
+				elif self.__ordered__:
+					yield pending.popleft().result()
+				else:
+					done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
 
-			for elem in stream:
-				yield elem
+					for future in done:
+						pending.remove(future)
+						yield future.result()
+		finally:
+			executor.shutdown(wait=True, cancel_futures=True)
 
-		Misc.raise_ifn(callable(condition), Exceptions.InvalidArgumentException(LinqStream.skip_while, 'condition', type(condition)))
-		return LinqStream(_skip(self))
+	@staticmethod
+	def __count_reducer__(items: typing.Iterable) -> int:
+		"""
+		INTERNAL METHOD
+		:param items: The chunk results
+		:return: The number of results
+		"""
 
-	def take(self, count: int) -> LinqStream[T]:
+		return sum(1 for _ in items)
+
+	@staticmethod
+	def __average_reducer__(items: typing.Iterable) -> tuple[complex, int]:
 		"""
-		Takes the first 'count' elements in this query, discarding all remaining elements
-		:param count: The number of elements to take
-		:return: The modified query
-		:raises InvalidArgumentException: If 'count' is not an integer
-		:raises ValueError: If 'count' is negative
+		INTERNAL METHOD
+		:param items: The chunk results
+		:return: The total and number of results
+		:raises TypeError: If any result is not a number
 		"""
 
-		def _take(stream: LinqStream[T]) -> typing.Generator[T]:
-			index: int = 0
+		count: int = 0
+		total: complex = 0
 
-			for elem in stream:
-				nindex: int = index + 1
+		for elem in items:
+			Misc.raise_ifn(isinstance(elem, (int, float, complex)), TypeError('Resulting element is not a number'))
+			count += 1
+			total += elem
 
-				if nindex == count:
-					yield elem
-					break
-				elif index < count:
-					index = nindex
-					yield elem
-				else:
-					break
+		return total, count
 
-		Misc.raise_ifn(isinstance(count, int), Exceptions.InvalidArgumentException(LinqStream.take, 'count', type(count), (int,)))
-		Misc.raise_ifn((count := int(count)) >= 0, ValueError('Count cannot be negative'))
-		return LinqStream(_take(self))
+	def __iter__(self) -> typing.Iterator[T]:
+		if len(self.__stages__) == 0:
+			yield from self.__source__
+			return
 
-	def take_while(self, condition: typing.Callable[[T], bool]) -> LinqStream[T]:
+		for partial in self.__evaluate__(list):
+			yield from partial
+
+	def parallel(self, workers: typing.Optional[int] = None, backend: typing.Literal['thread', 'process'] = 'thread', *, ordered: bool = True, chunk_size: int = 1024) -> ParallelLinqStream[T]:
 		"""
-		Takes the first "count" elements in this query, discarding all remaining elements, while the condition callback returns True
-		:param condition: (CALLABLE) The condition
-		:return: (LinqStream) The modified query
-		:raises InvalidArgumentException: If 'condition' is not callable
+		Changes the worker pool settings of this query; recorded stages are kept
+		:param workers: The number of workers or None to use the number of CPUs
+		:param backend: Either 'thread' or 'process'; process workers receive stages serialized with dill
+		:param ordered: Whether results keep the source order; unordered results are yielded as chunks complete
+		:param chunk_size: The number of source elements sent to a worker at once
+		:return: The parallel query
+		:raises InvalidArgumentException: If 'workers' or 'chunk_size' is not an integer
+		:raises ValueError: If 'workers' or 'chunk_size' is less than 1 or 'backend' is not 'thread' or 'process'
 		"""
 
-		def _take(stream: LinqStream[T]) -> typing.Generator[T]:
-			for elem in stream:
-				if condition(elem):
-					yield elem
-				else:
-					break
-
-		Misc.raise_ifn(callable(condition), Exceptions.InvalidArgumentException(LinqStream.take_while, 'condition', type(condition)))
-		return LinqStream(_take(self))
+		return ParallelLinqStream(self.__source__, workers, backend, ordered=ordered, chunk_size=chunk_size, stages=self.__stages__)
 
-	def chunk(self, batch_size: int) -> LinqStream[tuple[T, ...]]:
+	def explain(self, file: typing.Optional[typing.IO] = ...) -> str:
 		"""
-		Groups elements in this query into batches of a set size
-		:param batch_size: The batch size
-		:return: The modified query
-		:raises InvalidArgumentException: If 'batch_size' is not an integer
-		:raises ValueError: If 'batch_size' is smaller than 1
+		Describes the parallel stages of this query without evaluating it
+		:param file: The text file to print the plan to, sys.stdout if not supplied, or None to not print
+		:return: The plan description
 		"""
 
-		def _chunk(stream: LinqStream[T]) -> typing.Generator[tuple[T, ...]]:
-			for elem in stream:
-				chunk.append(elem)
+		upstream: str = '\n'.join(self.__source__.explain(None).splitlines()[:-1]) if type(self.__source__) is LinqStream else f'Source: {type(self.__source__).__name__}'
+		stages: str = ' -> '.join(f'{kind}({LinqStream.__describe__(callback)})' for kind, callback in self.__stages__) or 'passthrough'
+		text: str = f'{upstream}\n  Parallel [{self.__backend__} x{self.__workers__}, {"ordered" if self.__ordered__ else "unordered"}, chunk={self.__chunk_size__}]: {stages}'
 
-				if len(chunk) == batch_size:
-					yield tuple(chunk)
-					chunk.clear()
+		if file is ...:
+			print(text)
+		elif file is not None:
+			print(text, file=file)
 
-			if len(chunk) > 0:
-				yield tuple(chunk)
+		return text
 
-		Misc.raise_ifn(isinstance(batch_size, int), Exceptions.InvalidArgumentException(LinqStream.chunk, 'batch_size', type(batch_size), (int,)))
-		Misc.raise_ifn((batch_size := int(batch_size)) >= 1, ValueError('Batch size must be greater than or equal to 1'))
-		chunk: list[T] = []
-		return LinqStream(_chunk(self))
+	def sequential(self) -> LinqStream[T]:
+		"""
+		Ends the parallel section; operators applied to the result run on the calling thread
+		:return: The sequential query
+		"""
 
-	def enumerate(self) -> LinqStream[tuple[int, T]]:
+		return LinqStream(self)
+
+	def transform[K](self, mapper: typing.Callable[[T], K]) -> ParallelLinqStream[K]:
 		"""
-		For each element in this query, returns a tuple containing the element's index and value
-		*Identical to "LinqStream(enumerate(self))"*
+		Applies a transformer to all elements in this query on the worker pool
+		:param mapper: Transformer function
 		:return: The modified query
+		:raises InvalidArgumentException: If 'mapper' is not callable
 		"""
 
-		return LinqStream(enumerate(self))
+		Misc.raise_ifn(callable(mapper), Exceptions.InvalidArgumentException(ParallelLinqStream.transform, 'mapper', type(mapper)))
+		return self.__extend__('transform', mapper)
 
-	def group[K](self, grouper: typing.Callable[[T], K]) -> LinqStream[tuple[T, tuple[K, ...]]]:
+	def transform_many[K](self, mapper: typing.Callable[[T], typing.Iterable[K]]) -> ParallelLinqStream[K]:
 		"""
-		Groups all elements in this query by a key
-		:param grouper: Grouping function retuning the key used for comparisons
+		Applies a transformer to all elements in this query on the worker pool and flattens the result
+		:param mapper: Transformer function
 		:return: The modified query
-		:raises InvalidArgumentException: If 'grouper' is not callable
+		:raises InvalidArgumentException: If 'mapper' is not callable
 		"""
 
-		def _group(stream: LinqStream[T]) -> typing.Generator[tuple[T, tuple[K, ...]]]:
-			for elem in stream:
-				key: K = grouper(elem)
+		Misc.raise_ifn(callable(mapper), Exceptions.InvalidArgumentException(ParallelLinqStream.transform_many, 'mapper', type(mapper)))
+		return self.__extend__('transform_many', mapper)
 
-				if key in grouping:
-					grouping[key].append(elem)
-				else:
-					grouping[key] = [elem]
+	def filter(self, filter_: typing.Callable[[T], bool]) -> ParallelLinqStream[T]:
+		"""
+		Filters elements in this query on the worker pool
+		:param filter_: The filter function (return True to keep and False to discard)
+		:return: The modified query
+		:raises InvalidArgumentException: If 'filter_' is not callable
+		"""
 
-			for key, group in grouping.items():
-				yield key, tuple(group)
+		Misc.raise_ifn(callable(filter_), Exceptions.InvalidArgumentException(ParallelLinqStream.filter, 'filter_', type(filter_)))
+		return self.__extend__('filter', filter_)
 
-		Misc.raise_ifn(callable(grouper), Exceptions.InvalidArgumentException(LinqStream.group, 'grouper', type(grouper)))
-		grouping: dict[K, list[T]] = {}
-		return LinqStream(_group(self))
+	def count(self) -> int:
+		"""
+		*Evaluates the query*
+		Each worker counts its own chunks
+		:return: The number of elements in this query
+		"""
 
-	def distinct(self, key: typing.Optional[typing.Callable[[T], typing.Hashable]] = ...) -> LinqStream[T]:
+		return sum(self.__evaluate__(ParallelLinqStream.__count_reducer__))
+
+	def sum(self) -> typing.Any:
 		"""
-		Returns a distinct (non-duplicate) list of elements in this query
-		:param key: If provided, a function returning the keys used for comparison
-		:return: The modified query
-		:raises InvalidArgumentException: If 'key' is not callable
+		*Evaluates the query*
+		Each worker sums its own chunks and the partial sums are added together
+		:return: The sum of all elements in this query
 		"""
 
-		def _distinct(stream: LinqStream[T]) -> typing.Generator[T]:
-			matched: set[typing.Hashable] = set()
+		return sum(self.__evaluate__(sum))
 
-			for elem in stream:
-				_key: typing.Hashable = key(elem) if callable(key) else elem
+	def average(self) -> complex:
+		"""
+		*Evaluates the query*
+		Each worker totals its own chunks and the partial totals are combined
+		:return: The average of all numbers in this query
+		:raises TypeError: If any element in this query is not a number
+		"""
 
-				if _key in matched:
-					continue
+		count: int = 0
+		total: complex = 0
 
-				matched.add(_key)
-				yield elem
+		for partial_total, partial_count in self.__evaluate__(ParallelLinqStream.__average_reducer__):
+			count += partial_count
+			total += partial_total
 
-		Misc.raise_ifn(key is None or key is ... or callable(key), Exceptions.InvalidArgumentException(LinqStream.distinct, 'key', type(key)))
-		return LinqStream(_distinct(self))
+		return total / count
 
-	def set_difference(self, iterable: typing.Iterable[T], key: typing.Optional[typing.Callable[[T], typing.Hashable]] = ...) -> LinqStream[T]:
+	def aggregate(self, initial: T, aggregator: typing.Callable[[T, T], T], combiner: typing.Optional[typing.Callable[[T, T], T]] = ...) -> T:
 		"""
-		Applies the set difference between the elements in this query and the supplied iterable
-		:param iterable: The second iterable to apply difference with
-		:param key: If provided, a function returning the keys used for comparison
-		:return: The modified query
-		:raises InvalidArgumentException: If 'iterable' is not iterable
-		:raises InvalidArgumentException: If 'key' is not callable
+		*Evaluates the query*
+		Each worker folds its own chunks starting from 'initial', then the partial results are folded with 'combiner'
+		'initial' must therefore be an identity value of the aggregation, such as 0 for addition
+		:param initial: The initial value
+		:param aggregator: The aggregate function
+		:param combiner: The function combining two partial results or 'aggregator' if not supplied
+		:return: The aggregate result
+		:raises InvalidArgumentException: If 'aggregator' or 'combiner' is not callable
 		"""
 
-		def _difference(stream: LinqStream[T]) -> typing.Generator[T]:
-			for elem in stream:
-				_key: typing.Hashable = hash(elem) if key is None or key is ... else key(elem)
-
-				if _key in primary or _key in secondary:
-					continue
+		Misc.raise_ifn(callable(aggregator), Exceptions.InvalidArgumentException(ParallelLinqStream.aggregate, 'aggregator', type(aggregator)))
+		Misc.raise_ifn(combiner is ... or combiner is None or callable(combiner), Exceptions.InvalidArgumentException(ParallelLinqStream.aggregate, 'combiner', type(combiner)))
+		combiner = aggregator if combiner is ... or combiner is None else combiner
+		result: T = initial
 
-				primary.add(_key)
-				yield elem
+		for partial in self.__evaluate__(lambda items: functools.reduce(aggregator, items, initial)):
+			result = combiner(result, partial)
 
-		Misc.raise_ifn(key is ... or key is None or callable(key), Exceptions.InvalidArgumentException(LinqStream.set_difference, 'key', type(key)))
-		Misc.raise_ifn(hasattr(iterable, '__iter__'), Exceptions.InvalidArgumentException(LinqStream.set_difference, 'iterable', type(iterable)))
-		secondary: set[typing.Hashable] = set(iterable)
-		primary: set[typing.Hashable] = set()
-		return LinqStream(_difference(self))
+		return result
 
-	def set_intersect(self, iterable: typing.Iterable[T], key: typing.Optional[typing.Callable[[T], typing.Hashable]] = ...) -> LinqStream[T]:
+	def to_dictionary[K, V](self, converter: typing.Optional[typing.Callable[[T], tuple[K, V]]] = ...) -> dict[K, V]:
 		"""
-		Applies the set intersection between the elements in this query and the supplied iterable
-		:param iterable: The second iterable to apply intersection with
-		:param key: If provided, a function returning the keys used for comparison
-		:return: The modified query
-		:raises InvalidArgumentException: If 'iterable' is not iterable
-		:raises InvalidArgumentException: If 'key' is not callable
+		*Evaluates this query*
+		Each worker builds a dictionary from its own chunks and the partial dictionaries are merged
+		:param converter: The function to convert elements to key-value pairs
+		:return: A dict mapping each key with a single value
+		:raises InvalidArgumentException: If 'converter' is not callable
+		:raises KeyError: If a duplicate key is found
 		"""
 
-		def _intersect(stream: LinqStream[T]) -> typing.Generator[T]:
-			for elem in stream:
-				_key: typing.Hashable = hash(elem) if key is None or key is ... else key(elem)
+		Misc.raise_ifn(converter is ... or converter is None or callable(converter), Exceptions.InvalidArgumentException(ParallelLinqStream.to_dictionary, 'converter', type(converter)))
+		mapping: dict[K, V] = {}
 
-				if _key in primary or _key not in secondary:
-					continue
+		for partial in self.__evaluate__(lambda items: LinqStream(items).to_dictionary(converter)):
+			for key, value in partial.items():
+				if key in mapping:
+					raise KeyError(f'Duplicate key \'{key}\' in dictionary conversion')
 
-				primary.add(_key)
-				yield elem
+				mapping[key] = value
 
-		Misc.raise_ifn(key is ... or key is None or callable(key), Exceptions.InvalidArgumentException(LinqStream.set_intersect, 'key', type(key)))
-		Misc.raise_ifn(hasattr(iterable, '__iter__'), Exceptions.InvalidArgumentException(LinqStream.set_intersect, 'iterable', type(iterable)))
-		secondary: set[typing.Hashable] = set(iterable)
-		primary: set[typing.Hashable] = set()
-		return LinqStream(_intersect(self))
+		return mapping
 
-	def set_union(self, iterable: typing.Iterable[T], key: typing.Optional[typing.Callable[[T], typing.Hashable]] = ...) -> LinqStream[T]:
+
+class AsyncLinqStream[T](typing.AsyncIterable[T]):
+	"""
+	Lazy asynchronous generator mimicking C# LINQ or Java Streams over 'async for' sources
+	Callbacks may be plain functions or return awaitables; terminal operators are coroutines
+	"""
+
+	def __init__(self, iterable: typing.AsyncIterable[T] | typing.Iterable[T]):
 		"""
-		Applies the set union between the elements in this query and the supplied iterable
-		:param iterable: The second iterable to apply union with
-		:param key: If provided, a function returning the keys used for comparison
-		:return: The modified query
+		Lazy asynchronous generator mimicking C# LINQ or Java Streams over 'async for' sources
+		- Constructor -
+		:param iterable: The source asynchronous or synchronous iterable
 		:raises InvalidArgumentException: If 'iterable' is not iterable
-		:raises InvalidArgumentException: If 'key' is not callable
 		"""
 
-		def _union(stream: LinqStream[T]) -> typing.Generator[T]:
-			for elem in stream:
-				_key: typing.Hashable = hash(elem) if key is None or key is ... else key(elem)
+		Misc.raise_ifn(isinstance(iterable, (typing.AsyncIterable, typing.Iterable)), Exceptions.InvalidArgumentException(AsyncLinqStream.__init__, 'iterable', type(iterable), (typing.AsyncIterable, typing.Iterable)))
+		self.__source__: typing.AsyncIterable[T] | typing.Iterable[T] = iterable
 
-				if _key not in primary:
-					primary.add(_key)
+	async def __aiter__(self) -> typing.AsyncIterator[T]:
+		if isinstance(self.__source__, typing.AsyncIterable):
+			async with AsyncLinqStream.__closing__(self.__source__) as iterator:
+				async for elem in iterator:
 					yield elem
+		else:
+			for elem in self.__source__:
+				yield elem
 
-			for elem in iterable:
-				_key: typing.Hashable = hash(elem) if key is None or key is ... else key(elem)
+	@staticmethod
+	@contextlib.asynccontextmanager
+	async def __closing__(iterable: typing.AsyncIterable[T]) -> typing.AsyncIterator[typing.AsyncIterator[T]]:
+		"""
+		INTERNAL METHOD
+		Iterates an asynchronous iterable, closing its iterator on exit so that upstream generators are finalized immediately when iteration stops early
+		:param iterable: The asynchronous iterable
+		:return: An asynchronous context manager yielding the iterator
+		"""
 
-				if _key not in primary:
-					primary.add(_key)
-					yield elem
+		iterator: typing.AsyncIterator[T] = aiter(iterable)
 
-		Misc.raise_ifn(key is ... or key is None or callable(key), Exceptions.InvalidArgumentException(LinqStream.set_union, 'key', type(key)))
-		Misc.raise_ifn(hasattr(iterable, '__iter__'), Exceptions.InvalidArgumentException(LinqStream.set_union, 'iterable', type(iterable)))
-		primary: set[typing.Hashable] = set()
-		return LinqStream(_union(self))
+		try:
+			yield iterator
+		finally:
+			if callable(getattr(iterator, 'aclose', None)):
+				await iterator.aclose()
 
-	def to_lookup[K, V](self, converter: typing.Optional[typing.Callable[[T], tuple[K, V]]] = ...) -> dict[K, tuple[V, ...]]:
+	@staticmethod
+	async def __invoke__(callback: typing.Callable[..., typing.Any], *args) -> typing.Any:
 		"""
-		*Evaluates this query*
-		:param converter: The function to convert elements to key-value pairs
-		:return: A dict mapping a key with multiple values
-		:raises InvalidArgumentException: If 'key_converter' is not callable
-		:raises InvalidArgumentException: If 'value_converter' is not callable
+		INTERNAL METHOD
+		Calls a callback, awaiting its result if it is awaitable
+		:param callback: The callback to call
+		:param args: The arguments to pass
+		:return: The callback's result
 		"""
 
-		Misc.raise_ifn(converter is ... or converter is None or callable(converter), Exceptions.InvalidArgumentException(LinqStream.to_lookup, 'converter', type(converter)))
-		mapping: dict[K, list[V]] = {}
+		result: typing.Any = callback(*args)
+		return (await result) if isinstance(result, collections.abc.Awaitable) else result
 
-		for elem in self:
-			elem: tuple[K, V] = converter(converter) if callable(elem) else elem
-			Misc.raise_ifn(isinstance(elem, typing.Iterable) and len(elem := tuple(elem)) < 2, ValueError(f'Cannot convert value to lookup pair - must be an iterable with at least 2 elements; got \'{type(elem)}\''))
-			key, *values = elem
+	async def __map__(self, callback: typing.Callable[[T], typing.Any], concurrency: int, ordered: bool) -> typing.AsyncIterator[typing.Any]:
+		"""
+		INTERNAL METHOD
+		Applies a callback to all elements, running up to 'concurrency' calls at once
+		:param callback: The callback to apply
+		:param concurrency: The maximum number of calls in flight
+		:param ordered: Whether results keep the source order; unordered results are yielded as calls complete
+		:return: An asynchronous iterator of results
+		"""
 
-			if key in mapping:
-				mapping[key].extend(values)
-			else:
-				mapping[key] = list(values)
+		if concurrency == 1:
+			async with AsyncLinqStream.__closing__(self) as iterator:
+				async for elem in iterator:
+					yield await AsyncLinqStream.__invoke__(callback, elem)
+
+			return
+
+		pending: collections.deque[asyncio.Task] = collections.deque()
+
+		async def drain(count: int) -> typing.AsyncIterator[typing.Any]:
+			while len(pending) > count:
+				if ordered:
+					yield await pending.popleft()
+				else:
+					done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+					for task in done:
+						pending.remove(task)
+						yield task.result()
+
+		try:
+			async with AsyncLinqStream.__closing__(self) as iterator:
+				async for elem in iterator:
+					pending.append(asyncio.ensure_future(AsyncLinqStream.__invoke__(callback, elem)))
+
+					async with AsyncLinqStream.__closing__(drain(concurrency - 1)) as results:
+						async for result in results:
+							yield result
+
+			async with AsyncLinqStream.__closing__(drain(0)) as results:
+				async for result in results:
+					yield result
+		finally:
+			for task in pending:
+				task.cancel()
 
-		return {k: tuple(v) for k, v in mapping.items()}
+			await asyncio.gather(*pending, return_exceptions=True)
 
-	def to_dictionary[K, V](self, converter: typing.Optional[typing.Callable[[T], tuple[K, V]]] = ...) -> dict[K, V]:
+	@staticmethod
+	def __validate_concurrency__(method: typing.Callable, concurrency: int) -> int:
 		"""
-		*Evaluates this query*
-		:param converter: The function to convert elements to key-value pairs
-		:return: A dict mapping each key with a single value
-		:raises InvalidArgumentException: If 'key_converter' is not callable
-		:raises InvalidArgumentException: If 'value_converter' is not callable
-		:raises KeyError: If a duplicate key is found
+		INTERNAL METHOD
+		:param method: The method to report in errors
+		:param concurrency: The requested concurrency
+		:return: The concurrency as an integer
+		:raises InvalidArgumentException: If 'concurrency' is not an integer
+		:raises ValueError: If 'concurrency' is less than 1
 		"""
 
-		Misc.raise_ifn(converter is ... or converter is None or callable(converter), Exceptions.InvalidArgumentException(LinqStream.to_dictionary, 'converter', type(converter)))
-		mapping: dict[K, V] = {}
-
-		for elem in self:
-			elem: tuple[K, V] = converter(elem) if callable(converter) else elem
-			Misc.raise_ifn(isinstance(elem, typing.Iterable) and len(elem := tuple(elem)) == 2, ValueError(f'Cannot convert value to dictionary pair - must be an iterable with at least 2 elements; got \'{type(elem)}\''))
-			key, value = elem
+		Misc.raise_ifn(isinstance(concurrency, int), Exceptions.InvalidArgumentException(method, 'concurrency', type(concurrency), (int,)))
+		Misc.raise_ifn((concurrency := int(concurrency)) >= 1, ValueError('Concurrency must be greater than or equal to 1'))
+		return concurrency
 
-			if key in mapping:
-				raise KeyError(f'Duplicate key \'{key}\' in dictionary conversion')
-			else:
-				mapping[key] = value
+	def transform[K](self, mapper: typing.Callable[[T], K | typing.Awaitable[K]], *, concurrency: int = 1, ordered: bool = True) -> AsyncLinqStream[K]:
+		"""
+		Applies a transformer to all elements in this query
+		:param mapper: Transformer function, which may return an awaitable
+		:param concurrency: The maximum number of transformer calls awaited at once
+		:param ordered: Whether results keep the source order when 'concurrency' is greater than 1
+		:return: The modified query
+		:raises InvalidArgumentException: If 'mapper' is not callable or 'concurrency' is not an integer
+		:raises ValueError: If 'concurrency' is less than 1
+		"""
 
-		return mapping
+		Misc.raise_ifn(callable(mapper), Exceptions.InvalidArgumentException(AsyncLinqStream.transform, 'mapper', type(mapper)))
+		concurrency = AsyncLinqStream.__validate_concurrency__(AsyncLinqStream.transform, concurrency)
+		return AsyncLinqStream(self.__map__(mapper, concurrency, bool(ordered)))
 
-	def sort(self, sorter: typing.Optional[typing.Callable[[T], typing.Any]] = None, *, reverse: bool = False) -> LinqStream[T]:
+	def filter(self, filter_: typing.Callable[[T], bool | typing.Awaitable[bool]], *, concurrency: int = 1, ordered: bool = True) -> AsyncLinqStream[T]:
 		"""
-		Sorts all elements in this query and yields the sorted query
-		:param sorter: The optional sorter used to supply sort keys
-		:param reverse: Whether to sort in reverse order
+		Filters elements in this query
+		:param filter_: The filter function (return True to keep and False to discard), which may return an awaitable
+		:param concurrency: The maximum number of filter calls awaited at once
+		:param ordered: Whether results keep the source order when 'concurrency' is greater than 1
 		:return: The modified query
-		:raises InvalidArgumentException: If 'sorter' is not callable
+		:raises InvalidArgumentException: If 'filter_' is not callable or 'concurrency' is not an integer
+		:raises ValueError: If 'concurrency' is less than 1
 		"""
 
-		Misc.raise_ifn(sorter is ... or sorter is None or callable(sorter), Exceptions.InvalidArgumentException(LinqStream.sort, 'sorter', type(sorter)))
-		return LinqStream(sorted(self, key=None if sorter is ... or sorter is None else sorter, reverse=reverse))
+		async def _check(elem: T) -> tuple[T, bool]:
+			return elem, await AsyncLinqStream.__invoke__(filter_, elem)
 
-	def reverse(self) -> LinqStream[T]:
+		async def _filter(results: typing.AsyncIterator[tuple[T, bool]]) -> typing.AsyncIterator[T]:
+			async with AsyncLinqStream.__closing__(results) as iterator:
+				async for elem, keep in iterator:
+					if keep:
+						yield elem
+
+		Misc.raise_ifn(callable(filter_), Exceptions.InvalidArgumentException(AsyncLinqStream.filter, 'filter_', type(filter_)))
+		concurrency = AsyncLinqStream.__validate_concurrency__(AsyncLinqStream.filter, concurrency)
+		return AsyncLinqStream(_filter(self.__map__(_check, concurrency, bool(ordered))))
+
+	def chunk(self, batch_size: int) -> AsyncLinqStream[tuple[T, ...]]:
 		"""
-		Reverses the order of elements in this query
-		:return: THe modified query
+		Groups elements in this query into batches of a set size
+		:param batch_size: The batch size
+		:return: The modified query
+		:raises InvalidArgumentException: If 'batch_size' is not an integer
+		:raises ValueError: If 'batch_size' is smaller than 1
 		"""
 
-		return LinqStream(reversed(self))
+		async def _chunk(stream: AsyncLinqStream[T]) -> typing.AsyncIterator[tuple[T, ...]]:
+			chunk: list[T] = []
 
-	def merge(self, *others: typing.Iterable[T]) -> LinqStream[T]:
+			async with AsyncLinqStream.__closing__(stream) as iterator:
+				async for elem in iterator:
+					chunk.append(elem)
+
+					if len(chunk) == batch_size:
+						yield tuple(chunk)
+						chunk.clear()
+
+			if len(chunk) > 0:
+				yield tuple(chunk)
+
+		Misc.raise_ifn(isinstance(batch_size, int), Exceptions.InvalidArgumentException(AsyncLinqStream.chunk, 'batch_size', type(batch_size), (int,)))
+		Misc.raise_ifn((batch_size := int(batch_size)) >= 1, ValueError('Batch size must be greater than or equal to 1'))
+		return AsyncLinqStream(_chunk(self))
+
+	def skip(self, count: int) -> AsyncLinqStream[T]:
 		"""
-		Appends multiple iterables to the end of this query
-		:param others: The iterable whose elements to append
+		Skips the first 'count' elements in this query
+		:param count: The number of elements to skip
 		:return: The modified query
-		:raises InvalidArgumentException: If one or more iterables is not iterable
+		:raises InvalidArgumentException: If 'count' is not an integer
+		:raises ValueError: If 'count' is negative
 		"""
 
-		Misc.raise_ifn(all(hasattr(x, '__iter__') for x in others), Exceptions.InvalidArgumentException(LinqStream.merge, 'others', type(others)))
-		streams: tuple[LinqStream, ...] = (self, *others)
+		async def _skip(stream: AsyncLinqStream[T]) -> typing.AsyncIterator[T]:
+			index: int = 0
 
-		def iterator() -> typing.Generator[T]:
-			for stream in streams:
-				for item in stream:
-					yield item
+			async with AsyncLinqStream.__closing__(stream) as iterator:
+				async for elem in iterator:
+					if (index := (index + 1)) > count:
+						yield elem
 
-		return LinqStream(iterator())
+		Misc.raise_ifn(isinstance(count, int), Exceptions.InvalidArgumentException(AsyncLinqStream.skip, 'count', type(count), (int,)))
+		Misc.raise_ifn((count := int(count)) >= 0, ValueError('Count cannot be negative'))
+		return AsyncLinqStream(_skip(self))
 
-	def zip(self, *others: typing.Iterable[T]) -> LinqStream[tuple[T, ...]]:
+	def take(self, count: int) -> AsyncLinqStream[T]:
 		"""
-		Zips multiple iterables with this one
-		The resulting query contains a tuple of index aligned elements from each iterable
-		:param others: The iterable whose elements to zip
+		Takes the first 'count' elements in this query, discarding all remaining elements
+		The source is not advanced past the last taken element
+		:param count: The number of elements to take
 		:return: The modified query
-		:raises InvalidArgumentException: If one or more iterables is not iterable
+		:raises InvalidArgumentException: If 'count' is not an integer
+		:raises ValueError: If 'count' is negative
 		"""
 
-		Misc.raise_ifn(all(hasattr(x, '__iter__') for x in others), Exceptions.InvalidArgumentException(LinqStream.zip, 'others', type(others)))
-		streams: tuple[typing.Iterator[T], ...] = tuple(iter(x) for x in (self, *others))
+		async def _take(stream: AsyncLinqStream[T]) -> typing.AsyncIterator[T]:
+			if count == 0:
+				return
 
-		def iterator() -> typing.Generator[T]:
-			package: list[T] = []
+			index: int = 0
 
-			while True:
-				try:
-					for i in streams:
-						package.append(next(i))
-					yield tuple(package)
-					package.clear()
-				except StopIteration:
-					break
+			async with AsyncLinqStream.__closing__(stream) as iterator:
+				async for elem in iterator:
+					yield elem
 
-		return LinqStream(iterator())
+					if (index := (index + 1)) >= count:
+						break
 
-	def append(self, element: T) -> LinqStream[T]:
+		Misc.raise_ifn(isinstance(count, int), Exceptions.InvalidArgumentException(AsyncLinqStream.take, 'count', type(count), (int,)))
+		Misc.raise_ifn((count := int(count)) >= 0, ValueError('Count cannot be negative'))
+		return AsyncLinqStream(_take(self))
+
+	def distinct(self, key: typing.Optional[typing.Callable[[T], typing.Hashable]] = ...) -> AsyncLinqStream[T]:
 		"""
-		Appends an element to the end of this query
-		:param element: The element to append
+		Returns a distinct (non-duplicate) list of elements in this query
+		:param key: If provided, a function returning the keys used for comparison
 		:return: The modified query
+		:raises InvalidArgumentException: If 'key' is not callable
 		"""
 
-		def _append(stream: LinqStream[T]) -> typing.Generator[T]:
-			for elem in stream:
-				yield elem
+		async def _distinct(stream: AsyncLinqStream[T]) -> typing.AsyncIterator[T]:
+			matched: set[typing.Hashable] = set()
 
-			yield element
+			async with AsyncLinqStream.__closing__(stream) as iterator:
+				async for elem in iterator:
+					_key: typing.Hashable = key(elem) if callable(key) else elem
 
-		return LinqStream(_append(self))
+					if _key in matched:
+						continue
 
-	def prepend(self, element: T) -> LinqStream[T]:
+					matched.add(_key)
+					yield elem
+
+		Misc.raise_ifn(key is None or key is ... or callable(key), Exceptions.InvalidArgumentException(AsyncLinqStream.distinct, 'key', type(key)))
+		return AsyncLinqStream(_distinct(self))
+
+	async def for_each(self, callback: typing.Callable[[T], typing.Any]) -> None:
 		"""
-		Prepends an element to the end of this query
-		:param element: The element to prepend
-		:return: The modified query
+		*Evaluates the query*\n
+		Executes a callback for every element in this query, awaiting its result if awaitable
+		:param callback: The callback
+		:raises InvalidArgumentException: If the callback is not callable
 		"""
 
-		def _prepend(stream: LinqStream[T]) -> typing.Generator[T]:
-			yield element
+		Misc.raise_ifn(callable(callback), Exceptions.InvalidArgumentException(AsyncLinqStream.for_each, 'callback', type(callback)))
 
-			for elem in stream:
-				yield elem
+		async with AsyncLinqStream.__closing__(self) as iterator:
+			async for elem in iterator:
+				await AsyncLinqStream.__invoke__(callback, elem)
 
-		return LinqStream(_prepend(self))
+	async def any(self) -> bool:
+		"""
+		*Evaluates the query*
+		:return: Whether this query contains any items
+		"""
 
-	def insert(self, index: int, element: T) -> LinqStream[T]:
+		async with AsyncLinqStream.__closing__(self.take(1)) as iterator:
+			async for _ in iterator:
+				return True
+
+		return False
+
+	async def count(self) -> int:
 		"""
-		Inserts an element into this query
-		:param index: The index to insert at
-		:param element: The element to insert
-		:return: The modified query
-		:raises InvalidArgumentException: If 'index' is not an integer
-		:raises ValueError: If 'index' is negative
+		*Evaluates the query*
+		:return: The number of elements in this query
 		"""
 
-		def _insert(stream: LinqStream[T]) -> typing.Generator[T]:
-			for i, elem in enumerate(stream):
-				yield elem
+		count: int = 0
 
-				if i == index:
-					yield element
+		async with AsyncLinqStream.__closing__(self) as iterator:
+			async for _ in iterator:
+				count += 1
 
-		Misc.raise_ifn(isinstance(index, int), Exceptions.InvalidArgumentException(LinqStream.insert, 'index', type(index), (int,)))
-		Misc.raise_ifn((index := int(index)) >= 0, ValueError('Index cannot be negative'))
-		return LinqStream(_insert(self))
+		return count
 
-	def serialize(self, serializer: typing.Literal['dill', 'pickle'] = 'pickle', *, on_error: typing.Literal['ignore', 'replace', 'pass', 'throw'] = 'replace', **kwargs) -> LinqStream[bytes | T | None]:
+	async def first(self) -> T:
+		"""
+		*Evaluates the query*
+		:return: The first element in this query
+		:raises IterableEmptyException: If this query contains no elements
 		"""
-		Serializes all elements in this query into bytes
-		:param serializer: The serializer to use: either 'dill' or 'pickle'
-		:param on_error: How to handle serialization errors
-		:param kwargs: Extra arguments to pass to serializers
-		:return: The modified query
-		:raises InvalidArgumentException: If 'serializer' or 'on_error' is not a valid literal
-		:raises TypeError: If 'on_error' is throw and a serialization error occurs
 
-		*Serialization Errors*\n
-		- ignore: Erroneous element is removed from the resulting query\n
-		- replace: Erroneous element is replaced with 'None'\n
-		- pass: Erroneous element is passed as is without serialization\n
-		- throw: Error is raised
+		async with AsyncLinqStream.__closing__(self.take(1)) as iterator:
+			async for elem in iterator:
+				return elem
+
+		raise Exceptions.IterableEmptyException('Collection is empty')
+
+	async def first_or_default(self, default: typing.Any = None) -> typing.Optional[T]:
+		"""
+		*Evaluates the query*
+		:param default: The default
+		:return: The first element in this query or "default" if this query has no elements
 		"""
 
-		Misc.raise_ifn(serializer == 'dill' or serializer == 'pickle', ValueError('Serializer must be either \'dill\' or \'pickle\''))
-		Misc.raise_ifn(on_error == 'ignore' or on_error == 'replace' or on_error == 'pass' or on_error == 'throw', ValueError('On Error must be either \'ignore\', \'replace\', \'pass\' or \'throw\''))
+		async with AsyncLinqStream.__closing__(self.take(1)) as iterator:
+			async for elem in iterator:
+				return elem
 
-		def __serialize(stream: LinqStream[T]) -> typing.Generator[bytes | T | None]:
-			for elem in stream:
-				try:
-					if serializer == 'dill':
-						yield dill.dumps(elem, **kwargs)
-					elif serializer == 'pickle':
-						yield pickle.dumps(elem, **kwargs)
-				except Exception as err:
-					if on_error == 'ignore':
-						continue
-					elif on_error == 'replace':
-						yield None
-					elif on_error == 'pass':
-						yield elem
-					elif on_error == 'throw':
-						raise TypeError(f'Failed to serialize element: \'{elem}\'') from err
+		return default
 
-		return LinqStream(__serialize(self))
+	async def sum(self) -> typing.Any:
+		"""
+		*Evaluates the query*
+		:return: The sum of all elements in this query
+		"""
 
-	def deserialize[T](self, serializer: typing.Literal['dill', 'pickle'] = 'pickle', *, on_error: typing.Literal['ignore', 'replace', 'pass', 'throw'] = 'replace', **kwargs) -> LinqStream[T | bytes | None]:
+		total: typing.Any = 0
+
+		async with AsyncLinqStream.__closing__(self) as iterator:
+			async for elem in iterator:
+				total += elem
+
+		return total
+
+	async def aggregate(self, initial: T, aggregator: typing.Callable[[T, T], T | typing.Awaitable[T]]) -> T:
+		"""
+		*Evaluates the query*
+		Applies an aggregator function over all elements in this query
+		:param initial: The initial value
+		:param aggregator: The aggregate function, which may return an awaitable
+		:return: The aggregate result
+		:raises InvalidArgumentException: If 'aggregator' is not callable
 		"""
-		Deserializes all elements in this query into bytes
-		:param serializer: The serializer to use: either 'dill' or 'pickle'
-		:param on_error: How to handle serialization errors
-		:param kwargs: Extra arguments to pass to serializers
-		:return: The modified query
-		:raises InvalidArgumentException: If 'serializer' or 'on_error' is not a valid literal
-		:raises TypeError: If the specified element is not a bytes or bytearray object or 'on_error' is throw and a serialization error occurs
 
-		*Deserialization Errors*\n
-		- ignore: Erroneous element is removed from the resulting query\n
-		- replace: Erroneous element is replaced with 'None'\n
-		- pass: Erroneous element is passed as is without deserialization\n
-		- throw: Error is raised
+		Misc.raise_ifn(callable(aggregator), Exceptions.InvalidArgumentException(AsyncLinqStream.aggregate, 'aggregator', type(aggregator)))
+
+		async with AsyncLinqStream.__closing__(self) as iterator:
+			async for elem in iterator:
+				initial = await AsyncLinqStream.__invoke__(aggregator, initial, elem)
+
+		return initial
+
+	async def collect[C: typing.Iterable](self, collection: Stream[T] | type[C] = tuple, *args, **kwargs) -> Stream[T] | C:
+		"""
+		*Evaluates the query*
+		Collects all elements in this query into a new collection or Stream
+		:param collection: The type of collection to collect into or a Stream instance
+		:param args: Extra positional arguments to apply to the collector's constructor
+		:param kwargs: Extra keyword arguments to apply to the collector's constructor
+		:return: The populated collection or Stream
+		:raises InvalidArgumentException: If 'collector' is not an iterable type, Stream, or Stream type
 		"""
 
-		Misc.raise_ifn(serializer == 'dill' or serializer == 'pickle', ValueError('Serializer must be either \'dill\' or \'pickle\''))
-		Misc.raise_ifn(on_error == 'ignore' or on_error == 'replace' or on_error == 'pass' or on_error == 'throw', ValueError('On Error must be either \'ignore\', \'replace\', \'pass\' or \'throw\''))
+		if isinstance(collection, type) and issubclass(collection, Stream):
+			collection = collection(*args, **kwargs)
+		elif not isinstance(collection, Stream) and not (isinstance(collection, type) and issubclass(collection, (typing.Iterable, collections.abc.Sequence, collections.abc.Iterable))):
+			raise Exceptions.InvalidArgumentException(AsyncLinqStream.collect, 'collector', type(collection), (type, Stream))
 
-		def __deserialize(stream: LinqStream[T]) -> typing.Generator[bytes]:
-			for elem in stream:
-				try:
-					if serializer == 'dill':
-						yield dill.loads(elem, **kwargs)
-					elif serializer == 'pickle':
-						yield pickle.loads(elem, **kwargs)
-				except Exception as err:
-					if on_error == 'ignore':
-						continue
-					elif on_error == 'replace':
-						yield None
-					elif on_error == 'pass':
-						yield elem
-					elif on_error == 'throw':
-						raise TypeError(f'Failed to deserialize element: \'{elem}\'') from err
+		async with AsyncLinqStream.__closing__(self) as iterator:
+			elements: list[T] = [elem async for elem in iterator]
 
-		return LinqStream(__deserialize(self))
+		if isinstance(collection, Stream):
+			for elem in elements:
+				collection.write(elem)
 
+			return collection
+		else:
+			return collection(elements, *args, **kwargs)
 
 __all__: list[str] = [
 	'StreamError', 'StreamFullError', 'StreamEmptyError',
-	'Stream', 'FileStream', 'ListStream', 'OrderedStream', 'TypedStream', 'ByteStream', 'BitStream', 'StringStream', 'EventedStream', 'LinqStream',
-	'ZLibCompressorStream', 'ZLibDecompressorStream', 'PickleSerializerStream', 'PickleDeserializerStream', 'DillSerializerStream', 'DillDeserializerStream'
+	'ByteRingBuffer', 'BitBuffer', 'StringBuffer', 'Stream', 'FileStream', 'ListStream', 'OrderedStream', 'TypedStream', 'ByteStream', 'BitStream', 'FrameStream', 'StringStream', 'SharedMemoryStream', 'EventedStream', 'LinqStream', 'ParallelLinqStream', 'AsyncLinqStream',
+	'CompressorStream', 'DecompressorStream', 'ZLibCompressorStream', 'ZLibDecompressorStream', 'GZipCompressorStream', 'GZipDecompressorStream',
+	'LZMACompressorStream', 'LZMADecompressorStream', 'BZ2CompressorStream', 'BZ2DecompressorStream',
+	'PickleSerializerStream', 'PickleDeserializerStream', 'DillSerializerStream', 'DillDeserializerStream'
 ]
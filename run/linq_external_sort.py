@@ -0,0 +1,42 @@
+import random
+import time
+import tracemalloc
+import typing
+
+from CustomMethodsVI.Stream import LinqStream
+
+
+RECORD_COUNT: int = 500000
+MEMORY_BUDGETS: tuple[int, ...] = (64 * 1024 * 1024, 16 * 1024 * 1024, 4 * 1024 * 1024)
+
+
+def records() -> typing.Iterator[tuple[int, str, float]]:
+	generator: random.Random = random.Random(0)
+
+	for i in range(RECORD_COUNT):
+		yield generator.getrandbits(32), f'user-{i:08}', generator.random()
+
+
+def measure(max_memory: typing.Optional[int]) -> tuple[float, float]:
+	tracemalloc.start()
+	start: float = time.perf_counter()
+	previous: int = -1
+
+	for record in LinqStream(records()).sort(lambda record: record[0], max_memory=max_memory):
+		assert record[0] >= previous, 'Records out of order'
+		previous = record[0]
+
+	elapsed: float = time.perf_counter() - start
+	peak: int = tracemalloc.get_traced_memory()[1]
+	tracemalloc.stop()
+	return elapsed, peak / 1024 / 1024
+
+
+if __name__ == '__main__':
+	print(f'Sorting {RECORD_COUNT} records\n')
+	elapsed, peak = measure(None)
+	print(f'{"in-memory":<20} {elapsed:8.3f}s {peak:10.1f} MB peak')
+
+	for budget in MEMORY_BUDGETS:
+		elapsed, peak = measure(budget)
+		print(f'{f"external {budget // 1024 // 1024} MB":<20} {elapsed:8.3f}s {peak:10.1f} MB peak')
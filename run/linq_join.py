@@ -0,0 +1,66 @@
+import random
+import time
+import typing
+
+from CustomMethodsVI.Stream import LinqStream
+
+
+ORDER_COUNT: int = 20000
+CUSTOMER_COUNT: int = 2000
+
+
+def order_key(order: tuple[int, int, float]) -> int:
+	return order[1]
+
+
+def customer_key(customer: tuple[int, str]) -> int:
+	return customer[0]
+
+
+def nested_join(orders: list, customers: list) -> list:
+	return [(order, customer) for order in orders for customer in customers if order_key(order) == customer_key(customer)]
+
+
+def nested_left_join(orders: list, customers: list) -> list:
+	joined: list = []
+
+	for order in orders:
+		matches: list = [customer for customer in customers if order_key(order) == customer_key(customer)]
+		joined.extend((order, customer) for customer in matches) if len(matches) > 0 else joined.append((order, None))
+
+	return joined
+
+
+def nested_group_join(orders: list, customers: list) -> list:
+	return [(order, tuple(customer for customer in customers if order_key(order) == customer_key(customer))) for order in orders]
+
+
+def nested_semi_join(orders: list, customers: list) -> list:
+	return [order for order in orders if any(order_key(order) == customer_key(customer) for customer in customers)]
+
+
+def nested_anti_join(orders: list, customers: list) -> list:
+	return [order for order in orders if not any(order_key(order) == customer_key(customer) for customer in customers)]
+
+
+def measure(callback: typing.Callable[[], list]) -> tuple[float, list]:
+	start: float = time.perf_counter()
+	result: list = callback()
+	return time.perf_counter() - start, result
+
+
+if __name__ == '__main__':
+	generator: random.Random = random.Random(0)
+	orders: list[tuple[int, int, float]] = [(i, generator.randrange(CUSTOMER_COUNT * 2), generator.random() * 100) for i in range(ORDER_COUNT)]
+	customers: list[tuple[int, str]] = [(i, f'customer-{i}') for i in range(0, CUSTOMER_COUNT * 2, 2)]
+	sorted_orders: list[tuple[int, int, float]] = sorted(orders, key=order_key)
+	joins: dict[str, typing.Callable[[list, list], list]] = {'join': nested_join, 'left_join': nested_left_join, 'group_join': nested_group_join, 'semi_join': nested_semi_join, 'anti_join': nested_anti_join}
+	print(f'Joining {ORDER_COUNT} orders with {CUSTOMER_COUNT} customers\n')
+	print(f'{"operator":<12} {"nested":>10} {"hash":>10} {"merge":>10}')
+
+	for name, nested in joins.items():
+		nested_time, expected = measure(lambda: nested(sorted_orders, customers))
+		hash_time, hashed = measure(lambda: getattr(LinqStream(sorted_orders), name)(customers, order_key, customer_key).collect(list))
+		merge_time, merged = measure(lambda: getattr(LinqStream(sorted_orders), name)(customers, order_key, customer_key, strategy='merge').collect(list))
+		assert hashed == expected and merged == expected, f'{name} results differ'
+		print(f'{name:<12} {nested_time:9.3f}s {hash_time:9.3f}s {merge_time:9.3f}s   ({nested_time / hash_time:.0f}x / {nested_time / merge_time:.0f}x)')
@@ -0,0 +1,43 @@
+import array
+import functools
+import operator
+import time
+import typing
+
+import numpy
+
+from CustomMethodsVI.Stream import LinqStream
+
+
+ITEM_COUNT: int = 10 ** 7
+
+
+def measure(callback: typing.Callable[[], typing.Any]) -> float:
+	start: float = time.perf_counter()
+	callback()
+	return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+	singles: array.array = array.array('f', [0.1] * 10 ** 6)
+	assert LinqStream(singles).sum() == sum(singles), 'float32 array sum differs from Python'
+	assert LinqStream(singles).average() == functools.reduce(operator.add, singles, 0.0) / len(singles), 'float32 array average differs from Python'
+	assert LinqStream(array.array('d', [1e16, 1.0, -1e16])).sum() == 1.0, 'float64 array sum lost precision'
+
+	values: numpy.ndarray = numpy.random.default_rng(0).random(ITEM_COUNT)
+	cases: dict[str, tuple[typing.Callable[[], typing.Any], typing.Callable[[], typing.Any]]] = {
+		'sum': (lambda: sum(iter(values)), lambda: LinqStream(values).sum()),
+		'average': (lambda: sum(iter(values)) / len(values), lambda: LinqStream(values).average()),
+		'min': (lambda: min(iter(values)), lambda: LinqStream(values).min()),
+		'max': (lambda: max(iter(values)), lambda: LinqStream(values).max()),
+		'sort': (lambda: sorted(iter(values)), lambda: LinqStream(values).sort()),
+		'sqrt + filter + sum': (lambda: sum(x for x in map(numpy.sqrt, values) if x > 0.5), lambda: LinqStream(values).transform(numpy.sqrt).filter(LinqStream.vectorized(lambda x: x > 0.5)).sum()),
+	}
+
+	print(f'{ITEM_COUNT} float64 values, element-wise iteration against ndarray kernels\n')
+	print(f'{"operation":<22} {"elements":>10} {"ndarray":>10} {"speedup":>9}')
+
+	for name, (python, vectorized) in cases.items():
+		python_time: float = measure(python)
+		vector_time: float = measure(vectorized)
+		print(f'{name:<22} {python_time:9.3f}s {vector_time:9.3f}s {python_time / vector_time:8.1f}x')
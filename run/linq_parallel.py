@@ -0,0 +1,36 @@
+import os
+import time
+
+from CustomMethodsVI.Stream import LinqStream
+
+
+ITEM_COUNT: int = 1000
+WORK: int = 20000
+
+
+def checksum(x: int) -> int:
+	total: int = 0
+
+	for i in range(WORK):
+		total = (total * 31 + i * x) & 0xFFFFFFFF
+
+	return total
+
+
+def measure(query: LinqStream[int]) -> tuple[int, float]:
+	start: float = time.perf_counter()
+	result: int = query.transform(checksum).filter(lambda x: x % 2 == 0).sum()
+	return result, time.perf_counter() - start
+
+
+if __name__ == '__main__':
+	workers: int = os.cpu_count() or 1
+	print(f'CPU-bound transform over {ITEM_COUNT} items with {workers} workers\n')
+	expected, baseline = measure(LinqStream(range(ITEM_COUNT)))
+	print(f'{"sequential":<24} {baseline:8.3f}s')
+
+	for backend in ('thread', 'process'):
+		for ordered in (True, False):
+			result, elapsed = measure(LinqStream(range(ITEM_COUNT)).parallel(workers, backend, ordered=ordered, chunk_size=32))
+			assert result == expected, 'Parallel result mismatch'
+			print(f'{backend + (" ordered" if ordered else " unordered"):<24} {elapsed:8.3f}s  ({baseline / elapsed:.1f}x)')
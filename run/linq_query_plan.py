@@ -0,0 +1,37 @@
+import time
+import typing
+
+from CustomMethodsVI.Stream import LinqStream
+
+
+ITEM_COUNT: int = 10 ** 6
+
+
+def square(x: int) -> int:
+	return x * x
+
+
+def measure(callback: typing.Callable[[], typing.Any]) -> tuple[float, typing.Any]:
+	start: float = time.perf_counter()
+	result: typing.Any = callback()
+	return time.perf_counter() - start, result
+
+
+if __name__ == '__main__':
+	unfiltered: LinqStream[int] = LinqStream(range(20)).transform(square).skip(2).take(5)
+	assert 'reversed' in unfiltered.explain(None), 'Unfiltered slice should reverse directly'
+	assert list(reversed(unfiltered)) == [square(x) for x in reversed(range(2, 7))], 'Direct reversal differs'
+
+	filtered: LinqStream[int] = unfiltered.filter(lambda x: x % 2 == 0)
+	assert 'reversed' not in filtered.explain(None), 'Filtered query cannot reverse directly'
+	assert list(reversed(filtered)) == [square(x) for x in reversed(range(2, 7)) if square(x) % 2 == 0], 'Filtered reversal differs'
+
+	values: list[int] = list(range(ITEM_COUNT))
+	query: LinqStream[int] = LinqStream(values).transform(square).skip(10).take(10)
+	print(f'Taking 10 of {ITEM_COUNT} transformed items\n')
+	query.explain()
+	python_time, expected = measure(lambda: [square(x) for x in values][10:20])
+	planned_time, result = measure(lambda: query.collect(list))
+	assert result == expected, 'Planned results differ'
+	print(f'\n{"list comprehension":<20} {python_time:8.3f}s')
+	print(f'{"planned query":<20} {planned_time:8.3f}s  ({python_time / planned_time:.1f}x)')
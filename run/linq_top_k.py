@@ -0,0 +1,31 @@
+import random
+import time
+import typing
+
+from CustomMethodsVI.Stream import LinqStream
+
+
+ITEM_COUNT: int = 10 ** 7
+TOP_COUNT: int = 100
+
+
+def readings() -> typing.Iterator[float]:
+	generator: random.Random = random.Random(0)
+	return (generator.random() for _ in range(ITEM_COUNT))
+
+
+def measure(callback: typing.Callable[[], list[float]]) -> tuple[float, list[float]]:
+	start: float = time.perf_counter()
+	result: list[float] = callback()
+	return time.perf_counter() - start, result
+
+
+if __name__ == '__main__':
+	print(f'Selecting the {TOP_COUNT} largest of {ITEM_COUNT} items\n')
+	baseline, expected = measure(lambda: sorted(readings(), reverse=True)[:TOP_COUNT])
+	print(f'{"full sort":<28} {baseline:8.3f}s')
+
+	for name, query in (('top', lambda: LinqStream(readings()).top(TOP_COUNT).collect(list)), ('sort().take() rewritten', lambda: LinqStream(readings()).sort(reverse=True).take(TOP_COUNT).collect(list))):
+		elapsed, result = measure(query)
+		assert result == expected, f'{name} results differ'
+		print(f'{name:<28} {elapsed:8.3f}s  ({baseline / elapsed:.1f}x)')
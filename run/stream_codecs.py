@@ -0,0 +1,84 @@
+import os
+import random
+import struct
+import time
+
+from CustomMethodsVI.Stream import CompressorStream, DecompressorStream, ZLibCompressorStream, ZLibDecompressorStream, GZipCompressorStream, GZipDecompressorStream, LZMACompressorStream, LZMADecompressorStream, BZ2CompressorStream, BZ2DecompressorStream
+
+
+PAYLOAD_SIZE: int = 8 * 1024 * 1024
+CHUNK_SIZE: int = 64 * 1024
+
+
+def log_payload() -> bytes:
+	levels: tuple[str, ...] = ('DEBUG', 'INFO', 'WARNING', 'ERROR')
+	lines: list[str] = []
+	size: int = 0
+
+	while size < PAYLOAD_SIZE:
+		line: str = f'2025-01-01T00:00:{random.randint(0, 59):02}.{random.randint(0, 999999):06} [{random.choice(levels)}] worker-{random.randint(0, 15)}: processed request {random.getrandbits(32):08x} in {random.random() * 100:.3f}ms\n'
+		lines.append(line)
+		size += len(line)
+
+	return ''.join(lines).encode()[:PAYLOAD_SIZE]
+
+
+def telemetry_payload() -> bytes:
+	record: struct.Struct = struct.Struct('<Qfffi')
+	values: bytearray = bytearray()
+	timestamp: int = 0
+	temperature: float = 20
+
+	while len(values) < PAYLOAD_SIZE:
+		timestamp += 1000
+		temperature += random.uniform(-0.05, 0.05)
+		values.extend(record.pack(timestamp, temperature, 101.3 + random.uniform(-0.01, 0.01), 0.5, random.randint(0, 3)))
+
+	return bytes(values[:PAYLOAD_SIZE])
+
+
+def measure(payload: bytes, compressor: CompressorStream, decompressor: DecompressorStream) -> tuple[float, float, float]:
+	compressed: list[bytes] = []
+	start: float = time.perf_counter()
+
+	for i in range(0, len(payload), CHUNK_SIZE):
+		compressor.write(payload[i:i + CHUNK_SIZE])
+		compressed.append(compressor.read())
+
+	compressed.append(compressor.finish())
+	compress_time: float = time.perf_counter() - start
+	total: int = sum(len(x) for x in compressed)
+	output: list[bytes] = []
+	start = time.perf_counter()
+
+	for chunk in compressed:
+		if len(chunk) > 0:
+			decompressor.write(chunk)
+			output.append(decompressor.read())
+
+	decompress_time: float = time.perf_counter() - start
+	assert b''.join(output) == payload, 'Round trip failed'
+	megabytes: float = len(payload) / 1024 / 1024
+	return len(payload) / total, megabytes / compress_time, megabytes / decompress_time
+
+
+if __name__ == '__main__':
+	payloads: dict[str, bytes] = {'logs': log_payload(), 'telemetry': telemetry_payload(), 'random': os.urandom(PAYLOAD_SIZE)}
+	codecs: dict[str, tuple[type[CompressorStream], type[DecompressorStream], dict]] = {
+		'zlib-1 sync': (ZLibCompressorStream, ZLibDecompressorStream, {'compression_ratio': 1}),
+		'zlib-6 sync': (ZLibCompressorStream, ZLibDecompressorStream, {'compression_ratio': 6}),
+		'zlib-6 none': (ZLibCompressorStream, ZLibDecompressorStream, {'compression_ratio': 6, 'flush': 'none'}),
+		'gzip-6 sync': (GZipCompressorStream, GZipDecompressorStream, {'compression_ratio': 6}),
+		'bz2-9 none': (BZ2CompressorStream, BZ2DecompressorStream, {'flush': 'none'}),
+		'lzma-0 none': (LZMACompressorStream, LZMADecompressorStream, {'preset': 0, 'flush': 'none'}),
+		'lzma-6 none': (LZMACompressorStream, LZMADecompressorStream, {'preset': 6, 'flush': 'none'}),
+	}
+
+	print(f'{"payload":<10} {"codec":<12} {"ratio":>8} {"comp MB/s":>10} {"decomp MB/s":>12}')
+
+	for payload_name, payload in payloads.items():
+		for codec_name, (compressor_type, decompressor_type, kwargs) in codecs.items():
+			ratio, compress_speed, decompress_speed = measure(payload, compressor_type(**kwargs), decompressor_type())
+			print(f'{payload_name:<10} {codec_name:<12} {ratio:8.2f} {compress_speed:10.1f} {decompress_speed:12.1f}')
+
+		print()
@@ -0,0 +1,33 @@
+import time
+import typing
+
+from CustomMethodsVI.Stream import ListStream, OrderedStream
+
+
+ITEM_COUNT: int = 10 ** 6
+
+
+def drain(stream: ListStream[int], batch_size: int) -> float:
+	for i in range(ITEM_COUNT):
+		stream.write(i)
+
+	start: float = time.perf_counter()
+
+	while not stream.empty():
+		stream.read(batch_size)
+
+	return time.perf_counter() - start
+
+
+def report(name: str, factory: typing.Callable[[], ListStream[int]], batch_size: int) -> None:
+	elapsed: float = drain(factory(), batch_size)
+	print(f'{name:<32} batch={batch_size:<6} {elapsed:8.3f}s  {ITEM_COUNT / elapsed / 1e6:8.3f} M items/s')
+
+
+if __name__ == '__main__':
+	print(f'Draining {ITEM_COUNT} items\n')
+
+	for batch in (1, 64, 4096):
+		report('ListStream (FIFO)', ListStream, batch)
+		report('OrderedStream (FIFO)', lambda: OrderedStream(fifo=True), batch)
+		report('OrderedStream (LIFO)', lambda: OrderedStream(fifo=False), batch)
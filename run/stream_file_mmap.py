@@ -0,0 +1,62 @@
+import os
+import random
+import tempfile
+import time
+
+from CustomMethodsVI.Stream import FileStream
+
+
+FILE_SIZE: int = 256 * 1024 * 1024
+PASSES: int = 3
+
+
+def write_capture(path: str) -> None:
+	with open(path, 'wb') as file:
+		written: int = 0
+
+		while written < FILE_SIZE:
+			record: bytes = b'%016x %s\n' % (random.getrandbits(64), os.urandom(random.randint(16, 96)).hex().encode())
+			file.write(record)
+			written += len(record)
+
+
+def scan(path: str, mapped: bool) -> tuple[float, float, float]:
+	with FileStream(path, 'rb', memory_map=mapped) as stream:
+		start: float = time.perf_counter()
+
+		for _ in range(PASSES):
+			stream.seek(0)
+
+			while len(stream.readline()) > 0:
+				pass
+
+		line_time: float = time.perf_counter() - start
+		start = time.perf_counter()
+
+		for _ in range(PASSES):
+			stream.seek(0)
+
+			for _ in stream.iterlines():
+				pass
+
+		iter_time: float = time.perf_counter() - start
+		start = time.perf_counter()
+
+		for _ in range(PASSES):
+			stream.seek(0)
+
+			while len(stream.peek(64 * 1024)) > 0:
+				stream.seek(64 * 1024, 1)
+
+		return line_time, iter_time, time.perf_counter() - start
+
+
+if __name__ == '__main__':
+	with tempfile.TemporaryDirectory() as directory:
+		filepath: str = os.path.join(directory, 'capture.bin')
+		write_capture(filepath)
+		megabytes: float = os.path.getsize(filepath) * PASSES / 1024 / 1024
+
+		for name, mapped in (('buffered', False), ('mmap', True)):
+			line_time, iter_time, peek_time = scan(filepath, mapped)
+			print(f'{name:<10} readline {megabytes / line_time:10.1f} MB/s   iterlines {megabytes / iter_time:10.1f} MB/s   peek+seek {megabytes / peek_time:10.1f} MB/s')
@@ -0,0 +1,65 @@
+import time
+import typing
+
+from CustomMethodsVI.Stream import ListStream
+
+
+ITEM_COUNT: int = 10 ** 6
+CHUNK_SIZE: int = 4096
+
+
+def offset(x: int) -> tuple[int]:
+	return (x + 1,)
+
+
+def scale(x: int) -> tuple[int]:
+	return (x * 3,)
+
+
+def mask(x: int) -> tuple[int]:
+	return (x & 0xFFFF,)
+
+
+def offset_batch(items: list[int]) -> list[int]:
+	return [x + 1 for x in items]
+
+
+def scale_batch(items: list[int]) -> list[int]:
+	return [x * 3 for x in items]
+
+
+def mask_batch(items: list[int]) -> list[int]:
+	return [x & 0xFFFF for x in items]
+
+
+def measure(transforms: typing.Iterable[typing.Callable], batch: bool, reader: bool) -> float:
+	stream: ListStream[int] = ListStream()
+
+	for transform in transforms:
+		if reader:
+			stream.add_reader(transform, batch=batch)
+		else:
+			stream.add_writer(transform, batch=batch)
+
+	items: list[int] = list(range(ITEM_COUNT))
+	start: float = time.perf_counter()
+
+	for i in range(0, ITEM_COUNT, CHUNK_SIZE):
+		stream.writelines(items[i:i + CHUNK_SIZE])
+
+	while not stream.empty():
+		stream.read(CHUNK_SIZE)
+
+	return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+	print(f'Three transforms over {ITEM_COUNT} items in chunks of {CHUNK_SIZE}\n')
+	baseline: float = measure((), False, False)
+	print(f'{"no callbacks":<28} {baseline:8.3f}s')
+
+	for stack in ('writer', 'reader'):
+		per_item: float = measure((offset, scale, mask), False, stack == 'reader')
+		batched: float = measure((offset_batch, scale_batch, mask_batch), True, stack == 'reader')
+		print(f'{stack + " per-item":<28} {per_item:8.3f}s')
+		print(f'{stack + " batch":<28} {batched:8.3f}s  ({per_item / batched:.1f}x)')
@@ -0,0 +1,69 @@
+import multiprocessing
+import multiprocessing.connection
+import time
+
+from CustomMethodsVI.Stream import SharedMemoryStream
+
+
+FRAME_SIZE: int = 256 * 1024
+FRAME_COUNT: int = 4096
+
+
+def stream_producer(stream: SharedMemoryStream) -> None:
+	frame: bytes = bytes(FRAME_SIZE)
+
+	for _ in range(FRAME_COUNT):
+		stream.write(frame, timeout=None)
+
+	stream.close()
+
+
+def pipe_producer(connection: multiprocessing.connection.Connection) -> None:
+	frame: bytes = bytes(FRAME_SIZE)
+
+	for _ in range(FRAME_COUNT):
+		connection.send_bytes(frame)
+
+	connection.close()
+
+
+def measure_stream() -> float:
+	stream: SharedMemoryStream = SharedMemoryStream(16 * 1024 * 1024)
+	process: multiprocessing.Process = multiprocessing.Process(target=stream_producer, args=(stream,))
+	process.start()
+	buffer: bytearray = bytearray(FRAME_SIZE)
+	total: int = stream.readinto(buffer, timeout=None)
+	start: float = time.perf_counter()
+
+	while (count := stream.readinto(buffer, timeout=None)) > 0:
+		total += count
+
+	elapsed: float = time.perf_counter() - start
+	process.join()
+	stream.close()
+	return total / elapsed / 1e6
+
+
+def measure_pipe() -> float:
+	receiver, sender = multiprocessing.Pipe(False)
+	process: multiprocessing.Process = multiprocessing.Process(target=pipe_producer, args=(sender,))
+	process.start()
+	sender.close()
+	total: int = len(receiver.recv_bytes())
+	start: float = time.perf_counter()
+
+	try:
+		while True:
+			total += len(receiver.recv_bytes())
+	except EOFError:
+		pass
+
+	elapsed: float = time.perf_counter() - start
+	process.join()
+	return total / elapsed / 1e6
+
+
+if __name__ == '__main__':
+	print(f'Transferring {FRAME_COUNT} frames of {FRAME_SIZE} bytes\n')
+	print(f'{"multiprocessing.Pipe":<24} {measure_pipe():10.1f} MB/s')
+	print(f'{"SharedMemoryStream":<24} {measure_stream():10.1f} MB/s')